@@ -10,8 +10,10 @@ import json
 import logging
 import re
 import time
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterable, Iterator, NamedTuple
 from collections import defaultdict, Counter
+from collections.abc import MutableMapping
+from itertools import islice
 from pathlib import Path
 
 import aiofiles
@@ -20,83 +22,214 @@ from .knowledge_models import (
     SearchQuery, SearchResult, SearchResponse, Category, KnowledgeStatistics,
     BulkOperation, ExportRequest, KnowledgeItem, ImportStatistics
 )
+from .search_index import InvertedIndex
 
 logger = logging.getLogger(__name__)
 
 
+class KnowledgeItemStore(MutableMapping):
+    """
+    Knowledge items by ID, read from their JSON files on first access.
+
+    Items known to be on disk are registered by ID only, so a large knowledge
+    base can be searched without parsing every item at startup.
+    """
+    
+    def __init__(self, storage_path: Optional[Path] = None):
+        self.storage_path = storage_path
+        self._items: Dict[str, KnowledgeItem] = {}
+        self._on_disk: Set[str] = set()  # Registered IDs not loaded yet
+    
+    def register(self, item_ids: Iterable[str]):
+        """Register items that are stored on disk but not loaded yet."""
+        self._on_disk.update(item_id for item_id in item_ids if item_id not in self._items)
+    
+    def __getitem__(self, item_id: str) -> KnowledgeItem:
+        item = self._items.get(item_id)
+        if item is not None:
+            return item
+        if item_id not in self._on_disk:
+            raise KeyError(item_id)
+        
+        self._on_disk.discard(item_id)
+        item_file = self.storage_path / f"{item_id}.json"
+        try:
+            with open(item_file, 'r') as f:
+                item = KnowledgeItem(**json.load(f))
+        except Exception as e:
+            logger.warning(f"Failed to load knowledge item {item_file}: {e}")
+            raise KeyError(item_id) from e
+        self._items[item_id] = item
+        return item
+    
+    def __setitem__(self, item_id: str, item: KnowledgeItem):
+        self._on_disk.discard(item_id)
+        self._items[item_id] = item
+    
+    def __delitem__(self, item_id: str):
+        if item_id in self._items:
+            del self._items[item_id]
+        elif item_id in self._on_disk:
+            self._on_disk.discard(item_id)
+        else:
+            raise KeyError(item_id)
+    
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._items or item_id in self._on_disk
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._items)
+        yield from list(self._on_disk)
+    
+    def __len__(self) -> int:
+        return len(self._items) + len(self._on_disk)
+    
+    def items(self) -> List[Tuple[str, KnowledgeItem]]:
+        """Get all readable items; items whose files fail to load are skipped and unregistered."""
+        items = []
+        for item_id in self:
+            try:
+                items.append((item_id, self[item_id]))
+            except KeyError:
+                continue
+        return items
+    
+    def values(self) -> List[KnowledgeItem]:
+        """Get all readable items; items whose files fail to load are skipped and unregistered."""
+        return [item for _, item in self.items()]
+
+
+class ItemFields(NamedTuple):
+    """Item attributes kept in the search index for filtering and facets."""
+    knowledge_type: str
+    source_type: str
+    categories: Tuple[str, ...]
+    extracted_at: float
+    confidence: float
+    access_count: int = 0  # Absent from indexes written by earlier versions
+
+
 class KnowledgeSearchEngine:
     """Search engine for knowledge base queries."""
     
-    def __init__(self):
-        self.knowledge_store: Dict[str, KnowledgeItem] = {}
-        self.search_index: Dict[str, Set[str]] = defaultdict(set)  # term -> knowledge_item_ids
+    # Related terms used to expand semantic and hybrid queries
+    SYNONYMS = {
+        'computer': ['machine', 'system', 'device'],
+        'software': ['program', 'application', 'code'],
+        'data': ['information', 'content', 'facts'],
+        'algorithm': ['method', 'procedure', 'process'],
+        'network': ['connection', 'link', 'communication']
+    }
+    SYNONYM_WEIGHT = 0.5
+    
+    # Title terms count this many times towards an item's term frequencies
+    TITLE_WEIGHT = 2
+    
+    # Query-time boosts of items extracted recently and of items accessed often
+    RECENT_SECONDS = 30 * 24 * 3600
+    RECENT_BOOST = 1.1
+    ACCESS_BOOST_SCALE = 100.0
+    MAX_ACCESS_BOOST = 0.5
+    
+    def __init__(self, storage_path: Optional[Path] = None):
+        """
+        Initialize the search engine.
+        
+        Args:
+            storage_path: Directory holding the item files and the persistent
+                search index, or None to keep everything in memory
+        """
+        self.knowledge_store = KnowledgeItemStore(storage_path)
+        self.search_index = InvertedIndex(storage_path)  # term -> knowledge_item_ids
         self.category_index: Dict[str, Set[str]] = defaultdict(set)  # category -> knowledge_item_ids
         self.source_index: Dict[str, Set[str]] = defaultdict(set)  # source_type -> knowledge_item_ids
     
     def add_knowledge_item(self, item: KnowledgeItem):
-        """Add a knowledge item to the search index."""
+        """Add a knowledge item to the search index, replacing any earlier version."""
+        if item.id in self.search_index.documents:
+            self._unindex_fields(item.id)
         self.knowledge_store[item.id] = item
         
-        # Index content terms
-        terms = self._extract_search_terms(item.content)
-        for term in terms:
-            self.search_index[term].add(item.id)
-        
-        # Index title terms
+        # Index content and title terms; title matches count extra
+        term_frequencies = Counter(self._extract_search_terms(item.content))
         if item.title:
-            title_terms = self._extract_search_terms(item.title)
-            for term in title_terms:
-                self.search_index[term].add(item.id)
-        
-        # Index categories
-        all_categories = item.categories + item.auto_categories
-        for category in all_categories:
-            self.category_index[category.lower()].add(item.id)
-        
-        # Index source type
-        self.source_index[item.source.source_type].add(item.id)
+            for term in self._extract_search_terms(item.title):
+                term_frequencies[term] += self.TITLE_WEIGHT
+        
+        fields = ItemFields(
+            knowledge_type=item.knowledge_type,
+            source_type=item.source.source_type,
+            categories=tuple(item.categories + item.auto_categories),
+            extracted_at=item.extracted_at,
+            confidence=item.confidence,
+            access_count=item.access_count
+        )
+        boost = (1.0 + item.confidence) * (1.0 + item.quality_score)
+        self.search_index.add(item.id, dict(term_frequencies), boost, tuple(fields))
+        self._index_fields(item.id, fields)
         
         logger.debug(f"Added knowledge item to search index: {item.id}")
     
     def remove_knowledge_item(self, item_id: str):
         """Remove a knowledge item from the search index."""
-        if item_id not in self.knowledge_store:
+        if item_id not in self.knowledge_store and item_id not in self.search_index.documents:
             return
         
-        item = self.knowledge_store[item_id]
-        
-        # Remove from content index
-        terms = self._extract_search_terms(item.content)
-        for term in terms:
-            self.search_index[term].discard(item_id)
-            if not self.search_index[term]:
-                del self.search_index[term]
-        
-        # Remove from title index
-        if item.title:
-            title_terms = self._extract_search_terms(item.title)
-            for term in title_terms:
-                self.search_index[term].discard(item_id)
-                if not self.search_index[term]:
-                    del self.search_index[term]
-        
-        # Remove from category index
-        all_categories = item.categories + item.auto_categories
-        for category in all_categories:
-            self.category_index[category.lower()].discard(item_id)
-            if not self.category_index[category.lower()]:
-                del self.category_index[category.lower()]
-        
-        # Remove from source index
-        self.source_index[item.source.source_type].discard(item_id)
-        if not self.source_index[item.source.source_type]:
-            del self.source_index[item.source.source_type]
-        
-        # Remove from knowledge store
-        del self.knowledge_store[item_id]
+        self._unindex_fields(item_id)
+        self.search_index.remove(item_id)
+        self.knowledge_store.pop(item_id, None)
         
         logger.debug(f"Removed knowledge item from search index: {item_id}")
     
+    def record_access(self, item: KnowledgeItem):
+        """Update the access count kept in the search index for an item."""
+        fields = self._fields_of(item.id)
+        if fields is not None and fields.access_count != item.access_count:
+            self.search_index.update_fields(item.id, fields._replace(access_count=item.access_count))
+    
+    def load_index(self) -> bool:
+        """
+        Load the persistent search index.
+        
+        Returns:
+            True if an index was found on disk, False if it must be rebuilt
+        """
+        found = self.search_index.load()
+        self.category_index.clear()
+        self.source_index.clear()
+        for item_id in self.search_index.documents:
+            self._index_fields(item_id, self._fields_of(item_id))
+        self.knowledge_store.register(self.search_index.documents)
+        return found
+    
+    def _fields_of(self, item_id: str) -> Optional[ItemFields]:
+        """Get the indexed attributes of an item."""
+        document = self.search_index.document(item_id)
+        return ItemFields(*document.fields) if document is not None else None
+    
+    def _index_fields(self, item_id: str, fields: ItemFields):
+        """Add an item to the category and source indexes."""
+        for category in fields.categories:
+            self.category_index[category.lower()].add(item_id)
+        self.source_index[fields.source_type].add(item_id)
+    
+    def _unindex_fields(self, item_id: str):
+        """Remove an item from the category and source indexes."""
+        fields = self._fields_of(item_id)
+        if fields is None:
+            return
+        for category in fields.categories:
+            members = self.category_index.get(category.lower())
+            if members is not None:
+                members.discard(item_id)
+                if not members:
+                    del self.category_index[category.lower()]
+        members = self.source_index.get(fields.source_type)
+        if members is not None:
+            members.discard(item_id)
+            if not members:
+                del self.source_index[fields.source_type]
+    
     async def search(self, query: SearchQuery) -> SearchResponse:
         """Perform a search query on the knowledge base."""
         start_time = time.time()
@@ -125,21 +258,27 @@ class KnowledgeSearchEngine:
         # Apply filters
         filtered_items = self._apply_filters(matching_items, query)
         
-        # Sort by relevance
-        sorted_items = self._sort_by_relevance(filtered_items, search_terms, query)
-        
-        # Limit results
-        limited_items = sorted_items[:query.max_results]
+        # Rank the best matches
+        term_weights = self._query_weights(search_terms, query)
+        candidates = None if len(filtered_items) == len(matching_items) else set(filtered_items)
+        ranked_items = self.search_index.top_k(
+            term_weights, query.max_results, candidates,
+            document_boost=self._document_boost_function(time.time()),
+            max_document_boost=self.RECENT_BOOST * (1.0 + self.MAX_ACCESS_BOOST)
+        )
         
-        # Create search results
+        # Create search results, with scores relative to the best match
         results = []
-        for item_id, score in limited_items:
-            item = self.knowledge_store[item_id]
+        best_score = ranked_items[0][1] if ranked_items and ranked_items[0][1] > 0 else 1.0
+        for item_id, score in ranked_items:
+            item = self.knowledge_store.get(item_id)
+            if item is None:
+                continue
             snippet = self._generate_snippet(item, search_terms) if query.include_snippets else None
             
             result = SearchResult(
                 knowledge_item=item,
-                relevance_score=score,
+                relevance_score=min(score / best_score, 1.0),
                 snippet=snippet,
                 matched_chunks=[],  # Could be enhanced to track which chunks matched
                 explanation=f"Matched {len([t for t in search_terms if t in item.content.lower()])} search terms"
@@ -163,6 +302,18 @@ class KnowledgeSearchEngine:
             facets=facets
         )
     
+    def _document_boost_function(self, now: float):
+        """Get the query-time boost of items for recency and access frequency."""
+        def document_boost(item_id: str) -> float:
+            fields = self._fields_of(item_id)
+            boost = 1.0
+            if now - fields.extracted_at < self.RECENT_SECONDS:
+                boost *= self.RECENT_BOOST
+            if fields.access_count > 0:
+                boost *= 1.0 + min(fields.access_count / self.ACCESS_BOOST_SCALE, self.MAX_ACCESS_BOOST)
+            return boost
+        return document_boost
+    
     def _extract_search_terms(self, text: str) -> List[str]:
         """Extract search terms from text."""
         if not text:
@@ -185,139 +336,79 @@ class KnowledgeSearchEngine:
     
     async def _full_text_search(self, search_terms: List[str], query: SearchQuery) -> List[str]:
         """Perform full-text search."""
-        matching_items = set()
-        
-        for term in search_terms:
-            if term in self.search_index:
-                matching_items.update(self.search_index[term])
-        
-        return list(matching_items)
+        return list(self.search_index.matching(search_terms))
     
     async def _semantic_search(self, search_terms: List[str], query: SearchQuery) -> List[str]:
         """Perform semantic search (simplified version)."""
         # In a full implementation, this would use embeddings and vector similarity
         # For now, we'll use enhanced keyword matching with synonyms and related terms
-        
-        matching_items = set()
-        
-        # Expand search terms with simple synonyms
-        expanded_terms = search_terms.copy()
-        synonym_map = {
-            'computer': ['machine', 'system', 'device'],
-            'software': ['program', 'application', 'code'],
-            'data': ['information', 'content', 'facts'],
-            'algorithm': ['method', 'procedure', 'process'],
-            'network': ['connection', 'link', 'communication']
-        }
-        
-        for term in search_terms:
-            if term in synonym_map:
-                expanded_terms.extend(synonym_map[term])
-        
-        # Search with expanded terms
-        for term in expanded_terms:
-            if term in self.search_index:
-                matching_items.update(self.search_index[term])
-        
-        return list(matching_items)
+        return list(self.search_index.matching(self._expand_terms(search_terms)))
     
     async def _hybrid_search(self, search_terms: List[str], query: SearchQuery) -> List[str]:
         """Perform hybrid search combining full-text and semantic approaches."""
         full_text_results = set(await self._full_text_search(search_terms, query))
         semantic_results = set(await self._semantic_search(search_terms, query))
         
-        # Combine results, giving preference to items that appear in both
+        # Combine results; ranking favours items matching the original terms
         all_results = full_text_results.union(semantic_results)
         return list(all_results)
     
+    def _expand_terms(self, search_terms: List[str]) -> Dict[str, float]:
+        """Expand search terms with their synonyms, weighted below the originals."""
+        weights = {term: float(count) for term, count in Counter(search_terms).items()}
+        for term in search_terms:
+            for synonym in self.SYNONYMS.get(term, []):
+                weights.setdefault(synonym, self.SYNONYM_WEIGHT)
+        return weights
+    
+    def _query_weights(self, search_terms: List[str], query: SearchQuery) -> Dict[str, float]:
+        """Get the BM25 query term weights for a query."""
+        if query.search_type == "full_text":
+            return {term: float(count) for term, count in Counter(search_terms).items()}
+        return self._expand_terms(search_terms)
+    
     def _apply_filters(self, item_ids: List[str], query: SearchQuery) -> List[str]:
-        """Apply filters to search results."""
+        """Apply filters to search results using the attributes kept in the index."""
+        if not (query.knowledge_types or query.categories or query.source_types
+                or query.date_range or query.confidence_threshold > 0):
+            return [item_id for item_id in item_ids if item_id in self.search_index.documents]
+        
+        query_categories = set(query.categories or [])
+        start_date = query.date_range.get('start') if query.date_range else None
+        end_date = query.date_range.get('end') if query.date_range else None
         filtered_ids = []
         
         for item_id in item_ids:
-            if item_id not in self.knowledge_store:
+            fields = self._fields_of(item_id)
+            if fields is None:
                 continue
             
-            item = self.knowledge_store[item_id]
-            
             # Knowledge type filter
-            if query.knowledge_types and item.knowledge_type not in query.knowledge_types:
+            if query.knowledge_types and fields.knowledge_type not in query.knowledge_types:
                 continue
             
             # Category filter
-            if query.categories:
-                item_categories = set(item.categories + item.auto_categories)
-                query_categories = set(query.categories)
-                if not item_categories.intersection(query_categories):
-                    continue
+            if query_categories and query_categories.isdisjoint(fields.categories):
+                continue
             
             # Source type filter
-            if query.source_types and item.source.source_type not in query.source_types:
+            if query.source_types and fields.source_type not in query.source_types:
                 continue
             
             # Date range filter
-            if query.date_range:
-                start_date = query.date_range.get('start')
-                end_date = query.date_range.get('end')
-                if start_date and item.extracted_at < start_date:
-                    continue
-                if end_date and item.extracted_at > end_date:
-                    continue
+            if start_date and fields.extracted_at < start_date:
+                continue
+            if end_date and fields.extracted_at > end_date:
+                continue
             
             # Confidence threshold filter
-            if item.confidence < query.confidence_threshold:
+            if fields.confidence < query.confidence_threshold:
                 continue
             
             filtered_ids.append(item_id)
         
         return filtered_ids
     
-    def _sort_by_relevance(self, item_ids: List[str], search_terms: List[str], query: SearchQuery) -> List[Tuple[str, float]]:
-        """Sort items by relevance score."""
-        scored_items = []
-        
-        for item_id in item_ids:
-            if item_id not in self.knowledge_store:
-                continue
-            
-            item = self.knowledge_store[item_id]
-            score = self._calculate_relevance_score(item, search_terms, query)
-            scored_items.append((item_id, score))
-        
-        # Sort by score (descending)
-        scored_items.sort(key=lambda x: x[1], reverse=True)
-        return scored_items
-    
-    def _calculate_relevance_score(self, item: KnowledgeItem, search_terms: List[str], query: SearchQuery) -> float:
-        """Calculate relevance score for an item."""
-        score = 0.0
-        
-        content_lower = item.content.lower()
-        title_lower = item.title.lower() if item.title else ""
-        
-        # Term frequency in content
-        for term in search_terms:
-            content_matches = content_lower.count(term)
-            title_matches = title_lower.count(term)
-            
-            # Weight title matches higher
-            score += content_matches * 1.0 + title_matches * 2.0
-        
-        # Boost based on item quality
-        score *= (1.0 + item.confidence)
-        score *= (1.0 + item.quality_score)
-        
-        # Boost recent items slightly
-        age_days = (time.time() - item.extracted_at) / (24 * 3600)
-        if age_days < 30:  # Items less than 30 days old
-            score *= 1.1
-        
-        # Boost items with more access
-        if item.access_count > 0:
-            score *= (1.0 + min(item.access_count / 100.0, 0.5))
-        
-        return score
-    
     def _generate_snippet(self, item: KnowledgeItem, search_terms: List[str]) -> str:
         """Generate a content snippet with highlighted search terms."""
         content = item.content
@@ -354,9 +445,9 @@ class KnowledgeSearchEngine:
         related_terms = set()
         for term in search_terms:
             if term in self.search_index:
-                for item_id in list(self.search_index[term])[:10]:  # Limit for performance
-                    if item_id in self.knowledge_store:
-                        item = self.knowledge_store[item_id]
+                for item_id in islice(self.search_index.postings(term), 10):  # Limit for performance
+                    item = self.knowledge_store.get(item_id)
+                    if item is not None:
                         item_terms = self._extract_search_terms(item.content)
                         related_terms.update(item_terms[:5])  # Top 5 terms from each item
         
@@ -377,20 +468,19 @@ class KnowledgeSearchEngine:
         }
         
         for item_id in item_ids:
-            if item_id not in self.knowledge_store:
+            fields = self._fields_of(item_id)
+            if fields is None:
                 continue
             
-            item = self.knowledge_store[item_id]
-            
             # Knowledge type facet
-            facets['knowledge_types'][item.knowledge_type] += 1
+            facets['knowledge_types'][fields.knowledge_type] += 1
             
             # Category facets
-            for category in item.categories + item.auto_categories:
+            for category in fields.categories:
                 facets['categories'][category] += 1
             
             # Source type facet
-            facets['source_types'][item.source.source_type] += 1
+            facets['source_types'][fields.source_type] += 1
         
         # Convert defaultdicts to regular dicts and limit results
         return {
@@ -405,7 +495,7 @@ class KnowledgeManagementService:
     def __init__(self, storage_path: str = "./knowledge_storage"):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
-        self.search_engine = KnowledgeSearchEngine()
+        self.search_engine = KnowledgeSearchEngine(self.storage_path)
         self.categories: Dict[str, Category] = {}
         self.bulk_operations: Dict[str, BulkOperation] = {}
     
@@ -421,6 +511,15 @@ class KnowledgeManagementService:
         
         logger.info("Knowledge Management Service initialized successfully")
     
+    async def shutdown(self):
+        """Write a snapshot of the search index so the next startup skips its log."""
+        self.search_engine.search_index.persist()
+        self.search_engine.search_index.close()
+    
+    def add_item(self, item: KnowledgeItem):
+        """Index a knowledge item that has been written to storage."""
+        self.search_engine.add_knowledge_item(item)
+    
     async def search_knowledge(self, query: SearchQuery) -> SearchResponse:
         """Search the knowledge base."""
         return await self.search_engine.search(query)
@@ -433,6 +532,7 @@ class KnowledgeManagementService:
             item.access_count += 1
             item.last_accessed = time.time()
             await self._save_knowledge_item(item)
+            self.search_engine.record_access(item)
         return item
     
     async def delete_knowledge_item(self, item_id: str) -> bool:
@@ -501,6 +601,7 @@ class KnowledgeManagementService:
                         item.manual_categories.append(category)
                         item.categories.append(category)
                 
+                self.search_engine.add_knowledge_item(item)
                 await self._save_knowledge_item(item)
                 updated_count += 1
         
@@ -556,7 +657,7 @@ class KnowledgeManagementService:
         
         # Storage metrics
         total_storage_mb = sum(len(item.content.encode()) for item in items) / (1024 * 1024)
-        index_size_mb = len(str(self.search_engine.search_index).encode()) / (1024 * 1024)
+        index_size_mb = self.search_engine.search_index.size_bytes() / (1024 * 1024)
         
         return KnowledgeStatistics(
             total_items=total_items,
@@ -601,11 +702,27 @@ class KnowledgeManagementService:
             logger.error(f"Error saving categories: {e}")
     
     async def _load_knowledge_items(self):
-        """Load knowledge items into the search engine."""
+        """
+        Load the persistent search index and reconcile it with stored items.
+        
+        Items covered by the index are registered without reading their files;
+        only items missing from the index are parsed and indexed.
+        """
+        index_found = self.search_engine.load_index()
+        
+        stored_ids = set()
         for item_file in self.storage_path.glob("*.json"):
             if item_file.name in ["categories.json"] or item_file.name.startswith("temp_"):
                 continue
-            
+            stored_ids.add(item_file.stem)
+        
+        indexed_ids = set(self.search_engine.search_index.documents)
+        for item_id in indexed_ids - stored_ids:
+            self.search_engine.remove_knowledge_item(item_id)
+        
+        missing_ids = stored_ids - indexed_ids
+        for item_id in missing_ids:
+            item_file = self.storage_path / f"{item_id}.json"
             try:
                 async with aiofiles.open(item_file, 'r') as f:
                     item_data = json.loads(await f.read())
@@ -614,7 +731,11 @@ class KnowledgeManagementService:
             except Exception as e:
                 logger.warning(f"Failed to load knowledge item {item_file}: {e}")
         
-        logger.info(f"Loaded {len(self.search_engine.knowledge_store)} knowledge items into search engine")
+        if missing_ids or not index_found:
+            self.search_engine.search_index.persist()
+        
+        logger.info(f"Loaded {len(self.search_engine.knowledge_store)} knowledge items into search engine "
+                    f"({len(missing_ids)} newly indexed)")
     
     async def _save_knowledge_item(self, item: KnowledgeItem):
         """Save a knowledge item to storage."""
@@ -217,11 +217,15 @@ async def lifespan(app: FastAPI):
             pass
         logger.info("Stopped cognitive streaming task")
     
+    # Stop WebSocket writer tasks
+    await websocket_manager.shutdown()
+    
     # Shutdown cognitive transparency system
     await cognitive_transparency_api.shutdown()
     
     # Shutdown knowledge services
     await knowledge_ingestion_service.shutdown()
+    await knowledge_management_service.shutdown()
     logger.info("Knowledge services shutdown complete")
     
     if godelos_integration:
@@ -0,0 +1,465 @@
+"""
+Persistent Inverted Index
+
+Disk-backed inverted index with BM25 ranking used by the knowledge search
+engine. The index lives in one snapshot file, read in a single pass at
+startup, plus a log of the additions and removals made since the snapshot
+was written.
+"""
+
+import heapq
+import logging
+import math
+import os
+import pickle
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from godelOS.scalability.write_ahead_log import WriteAheadLog
+
+logger = logging.getLogger(__name__)
+
+# Separates the document IDs of an encoded posting list
+_ID_SEPARATOR = "\x1f"
+
+
+class IndexedDocument(NamedTuple):
+    """Per-document data kept by the inverted index."""
+    length: int     # Sum of the document's term frequencies
+    boost: float    # Static multiplier applied to the document's BM25 score
+    terms: str      # Distinct indexed terms, space separated
+    fields: tuple   # Caller-defined metadata, e.g. for filtering
+
+
+class InvertedIndex:
+    """
+    Inverted index of term frequencies with BM25 ranking.
+
+    Each term maps to the frequency of that term in every document that
+    contains it. Posting lists read from a snapshot stay encoded until a
+    query or update first touches their term, so loading costs one read of
+    the snapshot however many postings it holds.
+
+    When a directory is given, every change is appended to a log next to the
+    snapshot. The snapshot is rewritten once the log holds at least
+    ``compaction_threshold`` records and as many records as there are indexed
+    documents, which keeps the cost of rewriting it amortized per change.
+    """
+
+    SNAPSHOT_NAME = "search_index.snapshot"
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, directory: Optional[Path] = None, k1: float = 1.2, b: float = 0.75,
+                 compaction_threshold: int = 10000):
+        """
+        Initialize an empty index.
+
+        Args:
+            directory: Directory holding the snapshot and log, or None to keep
+                the index in memory only
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+            compaction_threshold: Minimum number of logged changes before
+                the snapshot is rewritten
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.k1 = k1
+        self.b = b
+        self.compaction_threshold = compaction_threshold
+
+        self.documents: Dict[str, IndexedDocument] = {}
+        self.total_length = 0
+
+        # term -> {doc_id: term frequency}, or its encoded form until first use
+        self._postings: Dict[str, Any] = {}
+
+        # term -> [max term frequency, min document length, max boost] over the
+        # term's postings; removals may leave these loose but never too tight
+        self._bounds: Dict[str, List[float]] = {}
+
+        # Terms whose postings changed since the last snapshot
+        self._dirty_terms: Set[str] = set()
+
+        self._wal = WriteAheadLog(self.directory, "search_index") if self.directory is not None else None
+        self._log_records = 0
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._postings
+
+    def __getitem__(self, term: str) -> Set[str]:
+        """Get the IDs of the documents containing a term."""
+        if term not in self._postings:
+            raise KeyError(term)
+        return set(self._decode(term))
+
+    def __len__(self) -> int:
+        """Get the number of distinct indexed terms."""
+        return len(self._postings)
+
+    def get(self, term: str, default: Any = None) -> Any:
+        """Get the IDs of the documents containing a term, or a default."""
+        if term not in self._postings:
+            return default
+        return self[term]
+
+    @property
+    def num_documents(self) -> int:
+        """Get the number of indexed documents."""
+        return len(self.documents)
+
+    def postings(self, term: str) -> Dict[str, int]:
+        """
+        Get the posting list of a term.
+
+        Args:
+            term: The term to look up
+
+        Returns:
+            A mapping from document ID to term frequency, which must not be
+            modified; empty if no document contains the term
+        """
+        if term not in self._postings:
+            return {}
+        return self._decode(term)
+
+    def document_frequency(self, term: str) -> int:
+        """Get the number of documents containing a term."""
+        return len(self.postings(term))
+
+    def matching(self, terms: Iterable[str]) -> Set[str]:
+        """
+        Get the IDs of the documents containing any of the given terms.
+
+        Args:
+            terms: The terms to look up
+
+        Returns:
+            The set of matching document IDs
+        """
+        matches: Set[str] = set()
+        for term in terms:
+            matches.update(self.postings(term))
+        return matches
+
+    def add(self, doc_id: str, term_frequencies: Dict[str, int], boost: float = 1.0,
+            fields: tuple = ()) -> None:
+        """
+        Add a document to the index, replacing any earlier version of it.
+
+        Args:
+            doc_id: The document ID
+            term_frequencies: Frequency of each term in the document
+            boost: Positive multiplier applied to the document's scores
+            fields: Metadata returned with the document by ``document``
+        """
+        if _ID_SEPARATOR in doc_id:
+            raise ValueError(f"Document ID contains a reserved character: {doc_id!r}")
+        self._apply(("add", doc_id, term_frequencies, boost, fields))
+        self._log(("add", doc_id, term_frequencies, boost, fields))
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: The document ID
+
+        Returns:
+            True if the document was indexed, False otherwise
+        """
+        if doc_id not in self.documents:
+            return False
+        self._apply(("remove", doc_id))
+        self._log(("remove", doc_id))
+        return True
+
+    def update_fields(self, doc_id: str, fields: tuple) -> bool:
+        """
+        Replace the metadata of an indexed document without reindexing its terms.
+
+        Args:
+            doc_id: The document ID
+            fields: The new metadata
+
+        Returns:
+            True if the document was indexed, False otherwise
+        """
+        if doc_id not in self.documents:
+            return False
+        self._apply(("fields", doc_id, tuple(fields)))
+        self._log(("fields", doc_id, tuple(fields)))
+        return True
+
+    def document(self, doc_id: str) -> Optional[IndexedDocument]:
+        """Get the indexed data of a document, or None if it is not indexed."""
+        return self.documents.get(doc_id)
+
+    def top_k(self, weights: Dict[str, float], k: int,
+              candidates: Optional[Set[str]] = None,
+              document_boost: Optional[Callable[[str], float]] = None,
+              max_document_boost: float = 1.0) -> List[Tuple[str, float]]:
+        """
+        Get the k highest scoring documents for a weighted query.
+
+        A document scores the weighted sum of its BM25 term scores times its
+        boost. Terms are visited in decreasing order of their maximum possible
+        contribution; once the k-th best score reaches the most that any
+        document outside the visited posting lists could score, the remaining
+        posting lists are skipped.
+
+        Args:
+            weights: Query terms and their weights
+            k: The number of documents to return
+            candidates: If given, only these documents are ranked
+            document_boost: Optional query-time multiplier of a document's
+                score, for boosts that change without the document changing
+            max_document_boost: An upper bound of ``document_boost``
+
+        Returns:
+            (document ID, score) pairs, best first
+        """
+        num_documents = len(self.documents)
+        if k <= 0 or not num_documents:
+            return []
+        average_length = self.total_length / num_documents or 1.0
+
+        terms = []
+        for term, weight in weights.items():
+            postings = self.postings(term)
+            if not postings or weight <= 0:
+                continue
+            frequency = len(postings)
+            idf = math.log(1.0 + (num_documents - frequency + 0.5) / (frequency + 0.5))
+            max_tf, min_length, max_boost = self._bounds[term]
+            bound = (weight * idf * self._saturate(max_tf, min_length, average_length)
+                     * max_boost * max_document_boost)
+            terms.append((bound, term, weight * idf, postings))
+        terms.sort(key=lambda entry: entry[0], reverse=True)
+
+        # remaining[i] bounds the score of a document found only in lists i..
+        remaining = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + terms[i][0]
+
+        k1 = self.k1
+        heap: List[Tuple[float, str]] = []
+        seen: Set[str] = set()
+        for i, (_, _, _, postings) in enumerate(terms):
+            if len(heap) >= k and remaining[i] <= heap[0][0]:
+                break
+            for doc_id in postings:
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                document = self.documents[doc_id]
+                norm = k1 * (1.0 - self.b + self.b * document.length / average_length)
+                score = 0.0
+                for _, _, term_weight, term_postings in terms:
+                    tf = term_postings.get(doc_id)
+                    if tf:
+                        score += term_weight * tf * (k1 + 1.0) / (tf + norm)
+                score *= document.boost
+                if document_boost is not None:
+                    score *= document_boost(doc_id)
+                if len(heap) < k:
+                    heapq.heappush(heap, (score, doc_id))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, doc_id))
+
+        return [(doc_id, score) for score, doc_id in sorted(heap, key=lambda entry: (-entry[0], entry[1]))]
+
+    def load(self) -> bool:
+        """
+        Load the snapshot and replay the log written since.
+
+        Returns:
+            True if a snapshot or log was found, False if the index is empty
+            and should be rebuilt
+        """
+        if self.directory is None:
+            return False
+        self._reset()
+        snapshot_path = self.directory / self.SNAPSHOT_NAME
+        found = snapshot_path.exists()
+        if found:
+            try:
+                with open(snapshot_path, "rb") as f:
+                    snapshot = pickle.load(f)
+                if snapshot.get("version") != self.SNAPSHOT_VERSION:
+                    raise ValueError(f"unsupported snapshot version {snapshot.get('version')}")
+                self._wal.generation = snapshot["generation"]
+                self.documents = {doc_id: IndexedDocument(*entry)
+                                  for doc_id, entry in snapshot["documents"].items()}
+                self.total_length = snapshot["total_length"]
+                self._postings = snapshot["postings"]
+                self._bounds = {term: list(bound) for term, bound in snapshot["bounds"].items()}
+            except Exception as e:
+                logger.warning(f"Discarding unusable search index snapshot: {e}")
+                self._reset()
+                # Logs are only meaningful on top of their snapshot
+                self._wal.remove_all()
+                snapshot_path.unlink()
+                return False
+
+        found = found or self._wal.exists()
+        replayed = self._replay_log()
+        self._wal.remove_stale()
+        if found:
+            logger.info(f"Loaded search index with {len(self.documents)} documents "
+                        f"({replayed} logged changes)")
+        return found
+
+    def persist(self) -> None:
+        """Write a snapshot of the index and start a new, empty log."""
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        for term in self._dirty_terms:
+            postings = self._postings.get(term)
+            if isinstance(postings, dict):
+                self._bounds[term] = self._exact_bounds(postings)
+        self._dirty_terms.clear()
+
+        generation = self._wal.generation + 1
+        snapshot = {
+            "version": self.SNAPSHOT_VERSION,
+            "generation": generation,
+            "documents": {doc_id: tuple(document) for doc_id, document in self.documents.items()},
+            "total_length": self.total_length,
+            "postings": {term: self._encode(postings) for term, postings in self._postings.items()},
+            "bounds": self._bounds,
+        }
+        snapshot_path = self.directory / self.SNAPSHOT_NAME
+        temp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, snapshot_path)
+
+        self._wal.advance(generation)
+        self._log_records = 0
+
+    def close(self) -> None:
+        """Close the log file."""
+        if self._wal is not None:
+            self._wal.close()
+
+    def size_bytes(self) -> int:
+        """Get the on-disk size of the index, or 0 for an in-memory index."""
+        if self.directory is None:
+            return 0
+        size = self._wal.size_bytes()
+        try:
+            size += (self.directory / self.SNAPSHOT_NAME).stat().st_size
+        except FileNotFoundError:
+            pass
+        return size
+
+    def _reset(self) -> None:
+        """Clear the in-memory state."""
+        self.close()
+        self.documents = {}
+        self.total_length = 0
+        self._postings = {}
+        self._bounds = {}
+        self._dirty_terms = set()
+        if self._wal is not None:
+            self._wal.generation = 0
+        self._log_records = 0
+
+    def _apply(self, record: Tuple) -> None:
+        """Apply a logged change to the in-memory index."""
+        if record[0] == "add":
+            _, doc_id, term_frequencies, boost, fields = record
+            if doc_id in self.documents:
+                self._apply(("remove", doc_id))
+            length = sum(term_frequencies.values())
+            self.documents[doc_id] = IndexedDocument(length, boost, " ".join(term_frequencies), tuple(fields))
+            self.total_length += length
+            for term, tf in term_frequencies.items():
+                if term in self._postings:
+                    self._decode(term)[doc_id] = tf
+                    bound = self._bounds[term]
+                    bound[0] = max(bound[0], tf)
+                    bound[1] = min(bound[1], length)
+                    bound[2] = max(bound[2], boost)
+                else:
+                    self._postings[term] = {doc_id: tf}
+                    self._bounds[term] = [tf, length, boost]
+                self._dirty_terms.add(term)
+        elif record[0] == "fields":
+            _, doc_id, fields = record
+            document = self.documents.get(doc_id)
+            if document is not None:
+                self.documents[doc_id] = document._replace(fields=fields)
+        else:
+            doc_id = record[1]
+            document = self.documents.pop(doc_id, None)
+            if document is None:
+                return
+            self.total_length -= document.length
+            for term in document.terms.split():
+                postings = self._decode(term)
+                postings.pop(doc_id, None)
+                if postings:
+                    self._dirty_terms.add(term)
+                else:
+                    del self._postings[term]
+                    del self._bounds[term]
+                    self._dirty_terms.discard(term)
+
+    def _decode(self, term: str) -> Dict[str, int]:
+        """Get the posting list of an indexed term, decoding it if needed."""
+        postings = self._postings[term]
+        if not isinstance(postings, dict):
+            doc_ids, frequencies = postings
+            postings = dict(zip(doc_ids.split(_ID_SEPARATOR), array("I", frequencies)))
+            self._postings[term] = postings
+        return postings
+
+    @staticmethod
+    def _encode(postings: Any) -> Tuple[str, bytes]:
+        """Encode a posting list as joined IDs and packed frequencies."""
+        if not isinstance(postings, dict):
+            return postings
+        return _ID_SEPARATOR.join(postings), array("I", postings.values()).tobytes()
+
+    def _exact_bounds(self, postings: Dict[str, int]) -> List[float]:
+        """Compute the score bounds of a posting list."""
+        documents = [self.documents[doc_id] for doc_id in postings]
+        return [max(postings.values()),
+                min(document.length for document in documents),
+                max(document.boost for document in documents)]
+
+    def _saturate(self, tf: float, length: float, average_length: float) -> float:
+        """Get the BM25 term frequency component."""
+        return tf * (self.k1 + 1.0) / (tf + self.k1 * (1.0 - self.b + self.b * length / average_length))
+
+    def _log(self, record: Tuple) -> None:
+        """Append a change to the log, compacting it if it has grown too long."""
+        if self._wal is None:
+            return
+        self._wal.append(record)
+        self._log_records += 1
+        if self._log_records >= max(self.compaction_threshold, len(self.documents)):
+            self.persist()
+
+    def _replay_log(self) -> int:
+        """
+        Replay the log of the current generation.
+
+        Returns:
+            The number of records replayed; a torn record at the end of the
+            log is ignored
+        """
+        replayed = 0
+        for record in self._wal.replay():
+            self._apply(record)
+            replayed += 1
+        self._log_records = replayed
+        return replayed
@@ -10,7 +10,8 @@ import json
 import logging
 import time
 import uuid
-from typing import Dict, List, Set, Any, Optional
+from collections import deque
+from typing import Deque, Dict, List, Set, Any, Optional, Tuple, Union
 from fastapi import WebSocket, WebSocketDisconnect
 from enum import Enum
 
@@ -68,17 +69,138 @@ COGNITIVE_MODELS_AVAILABLE = False
 logger = logging.getLogger(__name__)
 
 
+class SlowConsumerPolicy(Enum):
+    """What to do when a connection's outbound queue is full."""
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued message
+    COALESCE = "coalesce"  # Replace the newest queued message of the same type
+    DISCONNECT = "disconnect"  # Close the connection
+
+
+class ClientSendQueue:
+    """
+    Bounded outbound queue for one WebSocket connection, drained by its own writer task.
+    
+    Messages are queued already serialized, so a broadcast encodes each event
+    once no matter how many clients receive it, and a slow client only ever
+    delays its own writer.
+    """
+    
+    def __init__(self, websocket: WebSocket, max_size: int, policy: SlowConsumerPolicy,
+                 on_sent, on_failure):
+        """
+        Initialize the queue.
+        
+        Args:
+            websocket: The connection to write to
+            max_size: Maximum number of queued messages
+            policy: How to make room when the queue is full
+            on_sent: Callback invoked after each successful send
+            on_failure: Callback invoked with the exception when a send fails
+        """
+        self.websocket = websocket
+        self.max_size = max_size
+        self.policy = policy
+        self.dropped = 0
+        self.coalesced = 0
+        self._messages: Deque[Tuple[str, str]] = deque()  # (event type, payload)
+        self._on_sent = on_sent
+        self._on_failure = on_failure
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+    
+    def __len__(self) -> int:
+        return len(self._messages)
+    
+    def put(self, event_type: str, payload: str) -> bool:
+        """
+        Queue a serialized message, applying the slow-consumer policy if full.
+        
+        Returns:
+            False if the queue is full and the policy is to disconnect
+        """
+        if len(self._messages) >= self.max_size:
+            if self.policy == SlowConsumerPolicy.DISCONNECT:
+                return False
+            if self.policy == SlowConsumerPolicy.COALESCE and self._remove_newest(event_type):
+                self.coalesced += 1
+            else:
+                self._messages.popleft()
+                self.dropped += 1
+        
+        self._messages.append((event_type, payload))
+        self._idle.clear()
+        self._wakeup.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return True
+    
+    def _remove_newest(self, event_type: str) -> bool:
+        """Remove the most recently queued message of a type, if any."""
+        for index in range(len(self._messages) - 1, -1, -1):
+            if self._messages[index][0] == event_type:
+                del self._messages[index]
+                return True
+        return False
+    
+    async def _run(self):
+        """Send queued messages in order until closed or a send fails."""
+        while True:
+            if not self._messages:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            
+            _, payload = self._messages.popleft()
+            try:
+                await self.websocket.send_text(payload)
+            except Exception as e:
+                self._messages.clear()
+                self._idle.set()
+                self._task = None
+                self._on_failure(e)
+                return
+            self._on_sent()
+    
+    async def join(self):
+        """Wait until every queued message has been sent."""
+        await self._idle.wait()
+    
+    def close(self):
+        """Stop the writer task and discard queued messages."""
+        self._messages.clear()
+        self._idle.set()
+        task, self._task = self._task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+
 class WebSocketManager:
     """Manages WebSocket connections and event broadcasting with cognitive streaming."""
     
-    def __init__(self):
-        """Initialize the WebSocket manager."""
+    def __init__(self, max_client_queue_size: int = 256,
+                 slow_consumer_policy: Union[SlowConsumerPolicy, str] = SlowConsumerPolicy.COALESCE):
+        """
+        Initialize the WebSocket manager.
+        
+        Args:
+            max_client_queue_size: Maximum number of messages queued for one connection
+            slow_consumer_policy: What to do when a connection's queue is full
+        """
         self.active_connections: List[WebSocket] = []
         self.connection_subscriptions: Dict[WebSocket, Set[str]] = {}
         self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
         self.event_queue: List[Dict[str, Any]] = []
         self.max_queue_size = 1000
-        self.broadcast_lock = asyncio.Lock()
+        
+        # Per-connection outbound queues
+        self.max_client_queue_size = max_client_queue_size
+        self.slow_consumer_policy = SlowConsumerPolicy(slow_consumer_policy)
+        self.send_queues: Dict[WebSocket, ClientSendQueue] = {}
+        self.slow_consumer_disconnects = 0
+        self._background_tasks: Set[asyncio.Task] = set()
         
         # Enhanced cognitive streaming features
         self.cognitive_connections: Dict[str, WebSocket] = {}  # client_id -> websocket
@@ -125,6 +247,10 @@ class WebSocketManager:
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
         try:
+            send_queue = self.send_queues.pop(websocket, None)
+            if send_queue is not None:
+                send_queue.close()
+            
             if websocket in self.active_connections:
                 self.active_connections.remove(websocket)
             
@@ -176,37 +302,107 @@ class WebSocketManager:
         return len(self.active_connections) > 0
     
     async def broadcast(self, event: Dict[str, Any]):
-        """Broadcast an event to all connected clients."""
+        """
+        Broadcast an event to all connected clients.
+        
+        The event is serialized once and queued for each subscribed connection;
+        it is delivered by the connections' writer tasks, so this never waits
+        on a client.
+        """
         if not self.active_connections:
             return
         
-        async with self.broadcast_lock:
-            # Add event to queue for new connections
-            self._add_to_event_queue(event)
-            
-            # Send to all active connections
-            disconnected_connections = []
-            
-            for websocket in self.active_connections:
-                try:
-                    # Check if connection is subscribed to this event type
-                    if self._should_send_event(websocket, event):
-                        await self._send_to_connection(websocket, event)
-                        
-                        # Update connection metadata
-                        if websocket in self.connection_metadata:
-                            self.connection_metadata[websocket]["events_sent"] += 1
-                            self.connection_metadata[websocket]["last_activity"] = time.time()
-                
-                except WebSocketDisconnect:
-                    disconnected_connections.append(websocket)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to WebSocket: {e}")
-                    disconnected_connections.append(websocket)
-            
-            # Clean up disconnected connections
-            for websocket in disconnected_connections:
-                self.disconnect(websocket)
+        # Add event to queue for new connections
+        self._add_to_event_queue(event)
+        
+        try:
+            payload = self._serialize(event)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Cannot serialize event for broadcast: {e}")
+            return
+        
+        event_type = event.get("type", "")
+        for websocket in list(self.active_connections):
+            # Check if connection is subscribed to this event type
+            if self._should_send_event(websocket, event):
+                self._enqueue(websocket, event_type, payload)
+    
+    @staticmethod
+    def _serialize(event: Dict[str, Any]) -> str:
+        """Serialize an event the same way WebSocket.send_json does."""
+        return json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+    
+    def _enqueue(self, websocket: WebSocket, event_type: str, payload: str):
+        """Queue a serialized message on a connection, applying the slow-consumer policy."""
+        send_queue = self.send_queues.get(websocket)
+        if send_queue is None:
+            send_queue = ClientSendQueue(
+                websocket, self.max_client_queue_size, self.slow_consumer_policy,
+                on_sent=lambda: self._record_sent(websocket),
+                on_failure=lambda error: self._handle_send_failure(websocket, error)
+            )
+            self.send_queues[websocket] = send_queue
+        
+        if not send_queue.put(event_type, payload):
+            logger.warning("Disconnecting slow WebSocket consumer: outbound queue is full")
+            self.slow_consumer_disconnects += 1
+            self._drop_connection(websocket)
+            self._run_in_background(self._close_quietly(websocket))
+    
+    def _run_in_background(self, coroutine):
+        """Run a coroutine as a task, keeping a reference until it finishes."""
+        task = asyncio.create_task(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def _record_sent(self, websocket: WebSocket):
+        """Update connection metadata after a queued message was sent."""
+        metadata = self.connection_metadata.get(websocket)
+        if metadata is not None:
+            metadata["events_sent"] += 1
+            metadata["last_activity"] = time.time()
+            cognitive_metadata = self.cognitive_metadata.get(metadata.get("client_id"))
+            if cognitive_metadata is not None:
+                cognitive_metadata["events_sent"] += 1
+                cognitive_metadata["last_activity"] = metadata["last_activity"]
+    
+    def _handle_send_failure(self, websocket: WebSocket, error: Exception):
+        """Drop a connection whose writer failed to send."""
+        if not isinstance(error, WebSocketDisconnect):
+            logger.error(f"Error broadcasting to WebSocket: {error}")
+        self._drop_connection(websocket)
+    
+    def _drop_connection(self, websocket: WebSocket):
+        """Remove a connection, unregistering its cognitive stream if it has one."""
+        client_id = self.connection_metadata.get(websocket, {}).get("client_id")
+        self.disconnect(websocket)
+        if client_id is not None and self.stream_coordinator:
+            self._run_in_background(self.stream_coordinator.unregister_client(client_id))
+    
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket):
+        """Close a connection, ignoring errors from an already broken socket."""
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+    
+    async def drain(self, timeout: Optional[float] = None):
+        """
+        Wait until every queued message has been sent or dropped.
+        
+        Args:
+            timeout: Optional maximum number of seconds to wait
+        """
+        joins = [send_queue.join() for send_queue in list(self.send_queues.values())]
+        if joins:
+            await asyncio.wait_for(asyncio.gather(*joins), timeout)
+    
+    async def shutdown(self):
+        """Stop every writer task and discard undelivered messages."""
+        for send_queue in list(self.send_queues.values()):
+            send_queue.close()
+        self.send_queues.clear()
     
     def _should_send_event(self, websocket: WebSocket, event: Dict[str, Any]) -> bool:
         """Determine if an event should be sent to a specific connection."""
@@ -222,12 +418,18 @@ class WebSocketManager:
         return event_type in subscriptions or "all" in subscriptions
     
     async def _send_to_connection(self, websocket: WebSocket, data: Dict[str, Any]):
-        """Send data to a specific WebSocket connection."""
+        """
+        Queue data on a specific WebSocket connection.
+        
+        The message goes through the connection's send queue like broadcasts,
+        so it is delivered in order by the connection's writer task.
+        """
         try:
-            await websocket.send_json(data)
-        except Exception as e:
-            logger.error(f"Failed to send data to WebSocket: {e}")
+            payload = self._serialize(data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize data for WebSocket: {e}")
             raise
+        self._enqueue(websocket, data.get("type", ""), payload)
     
     def _add_to_event_queue(self, event: Dict[str, Any]):
         """Add event to the queue for replay to new connections."""
@@ -316,12 +518,19 @@ class WebSocketManager:
         ]
         avg_duration = sum(connection_durations) / len(connection_durations) if connection_durations else 0
         
+        send_queues = list(self.send_queues.values())
+        
         return {
             "total_connections": total_connections,
             "total_events_sent": total_events_sent,
             "avg_connection_duration_seconds": avg_duration,
             "event_queue_size": len(self.event_queue),
-            "subscription_summary": self._get_subscription_summary()
+            "subscription_summary": self._get_subscription_summary(),
+            "slow_consumer_policy": self.slow_consumer_policy.value,
+            "queued_messages": sum(len(send_queue) for send_queue in send_queues),
+            "dropped_messages": sum(send_queue.dropped for send_queue in send_queues),
+            "coalesced_messages": sum(send_queue.coalesced for send_queue in send_queues),
+            "slow_consumer_disconnects": self.slow_consumer_disconnects
         }
     
     def _get_subscription_summary(self) -> Dict[str, int]:
@@ -335,7 +544,11 @@ class WebSocketManager:
         return subscription_counts
     
     async def ping_connections(self):
-        """Send ping to all connections to keep them alive."""
+        """
+        Queue a ping on all connections to keep them alive.
+        
+        Connections whose writer fails to send are removed.
+        """
         if not self.active_connections:
             return
         
@@ -345,18 +558,9 @@ class WebSocketManager:
             "message": "keepalive"
         }
         
-        disconnected_connections = []
-        
-        for websocket in self.active_connections:
-            try:
-                await self._send_to_connection(websocket, ping_event)
-            except Exception as e:
-                logger.warning(f"Connection failed ping test: {e}")
-                disconnected_connections.append(websocket)
-        
-        # Clean up failed connections
-        for websocket in disconnected_connections:
-            self.disconnect(websocket)
+        payload = self._serialize(ping_event)
+        for websocket in list(self.active_connections):
+            self._enqueue(websocket, "ping", payload)
     
     async def start_keepalive_task(self):
         """Start a background task to keep connections alive."""
@@ -410,10 +614,8 @@ class WebSocketManager:
         websocket = self.cognitive_connections.get(client_id)
         if websocket:
             await websocket.close()
-            del self.cognitive_connections[client_id]
-            del self.cognitive_subscriptions[client_id]
-            del self.cognitive_granularity[client_id]
-            del self.cognitive_metadata[client_id]
+            # Also stops the connection's writer task and drops its cognitive state
+            self.disconnect(websocket)
             
             logger.info(f"Cognitive WebSocket disconnected for client {client_id}")
     
@@ -486,7 +688,11 @@ class WebSocketManager:
         logger.info(f"Sent cognitive stream result to client {client_id}")
     
     async def ping_cognitive_connections(self):
-        """Send ping to all cognitive connections to keep them alive."""
+        """
+        Queue a ping on all cognitive connections to keep them alive.
+        
+        Connections whose writer fails to send are removed.
+        """
         if not self.cognitive_connections:
             return
         
@@ -496,18 +702,9 @@ class WebSocketManager:
             "message": "keepalive"
         }
         
-        disconnected_clients = []
-        
-        for client_id, websocket in self.cognitive_connections.items():
-            try:
-                await self._send_to_connection(websocket, ping_event)
-            except Exception as e:
-                logger.warning(f"Cognitive connection for client {client_id} failed ping test: {e}")
-                disconnected_clients.append(client_id)
-        
-        # Clean up failed connections
-        for client_id in disconnected_clients:
-            await self.cognitive_disconnect(client_id)
+        payload = self._serialize(ping_event)
+        for websocket in list(self.cognitive_connections.values()):
+            self._enqueue(websocket, "ping", payload)
     
     async def start_cognitive_keepalive_task(self):
         """Start a background task to keep cognitive connections alive."""
@@ -749,24 +946,20 @@ class WebSocketManager:
         }
     
     async def _send_cognitive_event(self, client_id: str, event_data: Dict[str, Any]):
-        """Send a cognitive event to a specific client."""
+        """
+        Queue a cognitive event on a specific client's connection.
+        
+        Metadata is updated once the writer task has sent the event, and a
+        client whose writer fails to send is disconnected.
+        """
+        websocket = self.cognitive_connections.get(client_id)
+        if not websocket:
+            return
+        
         try:
-            websocket = self.cognitive_connections.get(client_id)
-            if not websocket:
-                return
-            
-            await websocket.send_json(event_data)
-            
-            # Update metadata
-            if client_id in self.cognitive_metadata:
-                self.cognitive_metadata[client_id]["events_sent"] += 1
-                self.cognitive_metadata[client_id]["last_activity"] = time.time()
-            
-        except WebSocketDisconnect:
-            await self.disconnect_cognitive_stream(client_id)
-        except Exception as e:
+            await self._send_to_connection(websocket, event_data)
+        except (TypeError, ValueError) as e:
             logger.error(f"Error sending cognitive event to {client_id}: {e}")
-            await self.disconnect_cognitive_stream(client_id)
     
     def _parse_granularity(self, granularity: str):
         """Parse granularity string to enum if available."""
@@ -0,0 +1,75 @@
+"""
+Benchmark for CachingSystem.memoize on cheap unifications.
+
+Unifies small atomic formulas directly and through a memoized wrapper and
+reports the time per call together with the key builder's counters.
+
+Usage:
+    python examples/caching_key_benchmark.py --calls 20000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from godelOS.core_kr.type_system.manager import TypeSystemManager
+from godelOS.core_kr.type_system.types import FunctionType
+from godelOS.core_kr.ast.nodes import ConstantNode, VariableNode, ApplicationNode
+from godelOS.core_kr.unification_engine.engine import UnificationEngine
+from godelOS.scalability.caching import CachingSystem
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000, help="unifications per run")
+    parser.add_argument("--distinct", type=int, default=50,
+                        help="number of distinct formula pairs")
+    args = parser.parse_args()
+
+    type_system = TypeSystemManager()
+    entity = type_system.get_type("Entity")
+    boolean = type_system.get_type("Boolean")
+    loves = ConstantNode("Loves", FunctionType([entity, entity], boolean))
+    x = VariableNode("?x", 1, entity)
+
+    pairs = []
+    for i in range(args.distinct):
+        a = ConstantNode(f"a{i}", entity)
+        b = ConstantNode(f"b{i}", entity)
+        pairs.append((ApplicationNode(loves, [x, b], boolean),
+                      ApplicationNode(loves, [a, b], boolean)))
+
+    engine = UnificationEngine(type_system)
+    caching = CachingSystem(max_size=args.distinct * 2)
+
+    @caching.memoize
+    def memoized_unify(left, right):
+        return engine.unify(left, right)
+
+    # The unification engine logs verbosely; keep the output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for i in range(args.calls):
+            engine.unify(*pairs[i % args.distinct])
+        direct_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(args.calls):
+            memoized_unify(*pairs[i % args.distinct])
+        memoized_time = time.perf_counter() - start
+
+    stats = caching.get_key_statistics()
+    print(f"direct unify:   {1e6 * direct_time / args.calls:8.2f} us/call")
+    print(f"memoized unify: {1e6 * memoized_time / args.calls:8.2f} us/call")
+    print(f"key builds: {stats['builds']}, avg build time: {1e6 * stats['avg_build_time']:.2f} us, "
+          f"fallbacks: {stats['fallbacks']}, collisions: {stats['collisions']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark for InMemoryKnowledgeStore term-index queries.
+
+Loads a knowledge base of ground facts ``rel(a_i, b_j, c_k)`` and measures how
+candidate retrieval and full pattern queries scale with the number of bound
+arguments in the query pattern.
+
+Usage:
+    python examples/knowledge_store_index_benchmark.py --facts 100000 300000 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from godelOS.core_kr.type_system.manager import TypeSystemManager
+from godelOS.core_kr.type_system.types import FunctionType
+from godelOS.core_kr.ast.nodes import ConstantNode, VariableNode, ApplicationNode
+from godelOS.core_kr.unification_engine.engine import UnificationEngine
+from godelOS.core_kr.knowledge_store.interface import InMemoryKnowledgeStore
+
+# Full unification is only timed when the candidate set is at most this large
+MAX_UNIFIED_CANDIDATES = 2000
+
+
+def build_store(num_facts: int, seed: int = 0):
+    """
+    Build an in-memory store holding ``num_facts`` distinct ground facts.
+
+    Returns:
+        A tuple of (store, predicate, constants per position, type system)
+    """
+    type_system = TypeSystemManager()
+    entity = type_system.get_type("Entity")
+    boolean = type_system.get_type("Boolean")
+    predicate = ConstantNode("rel", FunctionType([entity, entity, entity], boolean))
+
+    # Choose a domain size so that the facts are spread over all three positions
+    domain = max(2, int(round(num_facts ** (1.0 / 3.0))) + 1)
+    constants = [[ConstantNode(f"{prefix}{i}", entity) for i in range(domain)]
+                 for prefix in ("a", "b", "c")]
+
+    store = InMemoryKnowledgeStore(UnificationEngine(type_system))
+    store.create_context("BENCH", None, "benchmark")
+
+    rng = random.Random(seed)
+    seen = set()
+    facts = []
+    while len(seen) < num_facts:
+        key = (rng.randrange(domain), rng.randrange(domain), rng.randrange(domain))
+        if key in seen:
+            continue
+        seen.add(key)
+        args = [constants[position][index] for position, index in enumerate(key)]
+        facts.append(ApplicationNode(predicate, args, boolean))
+
+    start = time.perf_counter()
+    store.add_statements_bulk(facts, "BENCH")
+    load_time = time.perf_counter() - start
+
+    return store, predicate, constants, type_system, load_time
+
+
+def run_benchmark(num_facts: int, queries: int, seed: int = 0) -> None:
+    """Run the benchmark for one knowledge base size."""
+    store, predicate, constants, type_system, load_time = build_store(num_facts, seed)
+    entity = type_system.get_type("Entity")
+    boolean = type_system.get_type("Boolean")
+    variables = [VariableNode(f"?v{i}", 1000 + i, entity) for i in range(3)]
+
+    print(f"\n{num_facts} facts loaded in {load_time:.2f}s")
+    print(f"{'bound':>5} {'avg candidates':>15} {'index (ms)':>11} {'query (ms)':>11}")
+
+    rng = random.Random(seed + 1)
+    for bound in range(4):
+        total_candidates = 0
+        index_time = 0.0
+        query_time = 0.0
+        query_samples = 0
+        for _ in range(queries):
+            positions = set(rng.sample(range(3), bound))
+            args = [rng.choice(constants[i]) if i in positions else variables[i] for i in range(3)]
+            pattern = ApplicationNode(predicate, args, boolean)
+
+            start = time.perf_counter()
+            candidates = store._get_candidate_statements(pattern, "BENCH")
+            index_time += time.perf_counter() - start
+            total_candidates += len(candidates)
+
+            if len(candidates) <= MAX_UNIFIED_CANDIDATES:
+                # The unification engine logs verbosely; keep the output readable
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    store.query_statements_match_pattern(pattern, ["BENCH"])
+                    query_time += time.perf_counter() - start
+                query_samples += 1
+
+        query_column = (f"{1000 * query_time / query_samples:11.2f}" if query_samples
+                        else f"{'skipped':>11}")
+        print(f"{bound:>5} {total_candidates / queries:15.1f} "
+              f"{1000 * index_time / queries:11.3f} {query_column}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--facts", type=int, nargs="+", default=[100000, 1000000],
+                        help="knowledge base sizes to benchmark")
+    parser.add_argument("--queries", type=int, default=20,
+                        help="queries per number of bound arguments")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for num_facts in args.facts:
+        run_benchmark(num_facts, args.queries, args.seed)
+
+
+if __name__ == "__main__":
+    main()
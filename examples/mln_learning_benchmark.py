@@ -0,0 +1,94 @@
+"""
+Benchmark for Markov Logic Network weight learning.
+
+Builds smokers-and-friends formula skeletons over a number of people, stores a
+synthetic training world in the knowledge store and reports how long weight
+learning takes per epoch with the mini-batch and L-BFGS optimizers, and how
+much a second run gains from the cached training statistics.
+
+Usage:
+    python examples/mln_learning_benchmark.py --people 20 --epochs 50 --chains 32
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from godelOS.core_kr.type_system.manager import TypeSystemManager
+from godelOS.core_kr.ast.nodes import ConstantNode, ApplicationNode, ConnectiveNode
+from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
+from godelOS.core_kr.probabilistic_logic.module import ProbabilisticLogicModule
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--people", type=int, default=20, help="number of people")
+    parser.add_argument("--epochs", type=int, default=50, help="learning epochs per run")
+    parser.add_argument("--chains", type=int, default=32, help="Gibbs chains for expected counts")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Adding formulas logs one line each
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+
+    type_system = TypeSystemManager()
+    entity = type_system.get_type("Entity")
+    boolean = type_system.get_type("Boolean")
+    people = [ConstantNode(f"person{i}", entity) for i in range(args.people)]
+
+    def atom(predicate, *arguments):
+        return ApplicationNode(ConstantNode(predicate, boolean), list(arguments), boolean)
+
+    def connective(kind, *operands):
+        return ConnectiveNode(kind, list(operands), boolean)
+
+    ksi = KnowledgeStoreInterface(type_system)
+    module = ProbabilisticLogicModule(ksi)
+    ksi.create_context("TRAINING_DB", context_type="database")
+    ksi.create_context("FORMULA_SKELETONS", context_type="rules")
+
+    smokers = {person for person in people if rng.random() < 0.3}
+    world = [atom("Smokes", person) for person in smokers]
+    world += [atom("Cancer", person) for person in smokers if rng.random() < 0.8]
+    for person in people:
+        module.add_weighted_formula(connective("IMPLIES", atom("Smokes", person), atom("Cancer", person)),
+                                    0.0, "FORMULA_SKELETONS")
+        for friend in people:
+            if friend is person:
+                continue
+            module.add_weighted_formula(
+                connective("IMPLIES", atom("Friends", person, friend),
+                           connective("EQUIV", atom("Smokes", person), atom("Smokes", friend))),
+                0.0, "FORMULA_SKELETONS")
+            if rng.random() < 0.1 and ((person in smokers) == (friend in smokers) or rng.random() < 0.3):
+                world.append(atom("Friends", person, friend))
+    with contextlib.redirect_stdout(io.StringIO()):
+        ksi.add_statements_bulk(world, "TRAINING_DB")
+
+    learner = module._weight_learning_algorithms[module.probabilistic_model_type]
+    for optimizer in ("minibatch", "lbfgs"):
+        for run in ("first", "second"):
+            params = {"optimizer": optimizer, "max_iterations": args.epochs,
+                      "num_chains": args.chains, "seed": args.seed}
+            # The unification engine logs verbosely while collecting the training data
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                weights = module.learn_weights("TRAINING_DB", "FORMULA_SKELETONS", params)
+                elapsed = time.perf_counter() - start
+            timings = sorted(learner.epoch_timings)
+            print(f"{optimizer} ({run} run): {len(weights)} weights, {len(timings)} epochs in {elapsed:.2f}s, "
+                  f"median epoch {timings[len(timings) // 2] * 1000:.2f}ms, "
+                  f"slowest {timings[-1] * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
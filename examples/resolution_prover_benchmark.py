@@ -0,0 +1,74 @@
+"""
+Benchmark for ResolutionProver on large clause sets.
+
+Builds a chain of implications ``p_i(x) -> p_{i+1}(x)`` with distractor rules
+over unrelated predicates, asks for ``p_n(a)`` given ``p_0(a)`` and reports the
+proof time together with the given-clause loop's counters.
+
+Usage:
+    python examples/resolution_prover_benchmark.py --chain 1000 --distractors 2000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+# Add the project root to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from godelOS.core_kr.type_system.manager import TypeSystemManager
+from godelOS.core_kr.type_system.types import FunctionType
+from godelOS.core_kr.ast.nodes import ConstantNode, VariableNode, ApplicationNode, ConnectiveNode, QuantifierNode
+from godelOS.core_kr.unification_engine.engine import UnificationEngine
+from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
+from godelOS.inference_engine.base_prover import ResourceLimits
+from godelOS.inference_engine.resolution_prover import ResolutionProver, ResolutionStrategy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chain", type=int, default=500, help="length of the implication chain")
+    parser.add_argument("--distractors", type=int, default=1000,
+                        help="number of rules over unrelated predicates")
+    parser.add_argument("--strategy", choices=[s.value for s in ResolutionStrategy],
+                        default=ResolutionStrategy.SET_OF_SUPPORT.value)
+    args = parser.parse_args()
+
+    type_system = TypeSystemManager()
+    entity = type_system.get_type("Entity")
+    boolean = type_system.get_type("Boolean")
+    unary = FunctionType([entity], boolean)
+    x = VariableNode("?x", 1, entity)
+    a = ConstantNode("a", entity)
+
+    def rule(premise: str, conclusion: str):
+        body = ConnectiveNode("IMPLIES", [ApplicationNode(ConstantNode(premise, unary), [x], boolean),
+                                          ApplicationNode(ConstantNode(conclusion, unary), [x], boolean)],
+                              boolean)
+        return QuantifierNode("FORALL", [x], body, boolean)
+
+    context = [ApplicationNode(ConstantNode("p_0", unary), [a], boolean)]
+    context.extend(rule(f"p_{i}", f"p_{i + 1}") for i in range(args.chain))
+    context.extend(rule(f"q_{i}", f"q_{i + 1}") for i in range(args.distractors))
+    goal = ApplicationNode(ConstantNode(f"p_{args.chain}", unary), [a], boolean)
+
+    prover = ResolutionProver(MagicMock(spec=KnowledgeStoreInterface), UnificationEngine(type_system))
+    limits = ResourceLimits(nodes_limit=10 * (args.chain + args.distractors), strategy=args.strategy)
+
+    # The unification engine logs verbosely; keep the output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = prover.prove(goal, context, limits)
+        elapsed = time.perf_counter() - start
+
+    print(f"{len(context)} input formulas, strategy {args.strategy}")
+    print(f"proved: {result.goal_achieved} in {elapsed:.2f}s")
+    print(", ".join(f"{name}: {value}" for name, value in result.resources_consumed.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,17 @@ class ConflictResolutionStrategy:
         return new_evidence > existing_evidence
 
 
+# Relation types that contradict each other between the same pair of nodes
+CONTRADICTORY_RELATIONS: Dict[str, str] = {
+    'is_a': 'is_not_a',
+    'is_not_a': 'is_a',
+    'causes': 'prevents',
+    'prevents': 'causes',
+    'enables': 'disables',
+    'disables': 'enables'
+}
+
+
 @dataclass
 class GraphUpdateResult:
     """Result of a knowledge graph update operation."""
@@ -88,6 +99,15 @@ class DynamicKnowledgeGraph:
         self._relationship_patterns: Dict[str, List[Tuple[str, str]]] = {}
         self._contradiction_pairs: Set[Tuple[str, str]] = set()
         
+        # Lookup indexes
+        self._concept_index: Dict[str, str] = {}  # case-folded concept -> node_id
+        self._edge_index: Dict[Tuple[str, str], Dict[str, str]] = {}  # (source, target) -> relation_type -> edge_id
+        
+        # Nodes and edges affected by the open batch of updates, if any
+        self._batch_depth = 0
+        self._batch_nodes: Dict[str, None] = {}
+        self._batch_edges: Dict[str, None] = {}
+        
         # Configuration
         self.auto_discovery_enabled = True
         self.conflict_resolution_strategy = ConflictResolutionStrategy.confidence_based
@@ -133,6 +153,7 @@ class DynamicKnowledgeGraph:
             
             # Add to graph structures
             self.nodes[node.node_id] = node
+            self._concept_index[concept.casefold()] = node.node_id
             self.graph.add_node(node.node_id, **node.to_dict())
             
             # Track provenance
@@ -219,6 +240,7 @@ class DynamicKnowledgeGraph:
             
             # Add to graph structures
             self.edges[edge.edge_id] = edge
+            self._edge_index.setdefault((source_node_id, target_node_id), {})[relation_type] = edge.edge_id
             self.graph.add_edge(
                 source_node_id, 
                 target_node_id, 
@@ -277,33 +299,15 @@ class DynamicKnowledgeGraph:
         Returns:
             List of GraphUpdateResult objects
         """
-        results = []
-        
         try:
             # Extract knowledge from reasoning step
             knowledge_items = self._extract_knowledge_from_step(reasoning_step)
             
-            for item in knowledge_items:
-                if item['type'] == 'concept':
-                    result = self.add_node(
-                        concept=item['concept'],
-                        node_type=item.get('node_type', 'concept'),
-                        properties=item.get('properties', {}),
-                        confidence=item.get('confidence', reasoning_step.confidence),
-                        source_session_id=session_id
-                    )
-                    results.append(result)
-                    
-                elif item['type'] == 'relationship':
-                    result = self.add_edge(
-                        source_concept=item['source'],
-                        target_concept=item['target'],
-                        relation_type=item['relation'],
-                        properties=item.get('properties', {}),
-                        confidence=item.get('confidence', reasoning_step.confidence),
-                        source_session_id=session_id
-                    )
-                    results.append(result)
+            results = self.apply_updates(
+                knowledge_items,
+                source_session_id=session_id,
+                default_confidence=reasoning_step.confidence
+            )
             
             # Update uncertainty metrics if available
             if self.uncertainty_engine and hasattr(reasoning_step, 'uncertainty_metrics'):
@@ -324,6 +328,55 @@ class DynamicKnowledgeGraph:
                 error_message=str(e)
             )]
     
+    def apply_updates(self,
+                      updates: List[Dict[str, Any]],
+                      source_session_id: Optional[str] = None,
+                      default_confidence: float = 1.0) -> List[GraphUpdateResult]:
+        """
+        Apply a batch of node and edge updates, emitting a single graph event.
+        
+        Args:
+            updates: Knowledge items in the format produced for reasoning steps:
+                     {'type': 'concept', 'concept': ...} or
+                     {'type': 'relationship', 'source': ..., 'target': ..., 'relation': ...},
+                     optionally with 'node_type', 'properties', 'confidence' and 'strength'
+            source_session_id: Source reasoning session
+            default_confidence: Confidence for items that do not specify one
+            
+        Returns:
+            List of GraphUpdateResult objects, one per item
+        """
+        results = []
+        
+        self._batch_depth += 1
+        try:
+            for item in updates:
+                if item['type'] == 'concept':
+                    results.append(self.add_node(
+                        concept=item['concept'],
+                        node_type=item.get('node_type', 'concept'),
+                        properties=item.get('properties', {}),
+                        confidence=item.get('confidence', default_confidence),
+                        source_session_id=source_session_id
+                    ))
+                    
+                elif item['type'] == 'relationship':
+                    results.append(self.add_edge(
+                        source_concept=item['source'],
+                        target_concept=item['target'],
+                        relation_type=item['relation'],
+                        properties=item.get('properties', {}),
+                        confidence=item.get('confidence', default_confidence),
+                        strength=item.get('strength', 1.0),
+                        source_session_id=source_session_id
+                    ))
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch_event()
+        
+        return results
+    
     def discover_new_relationships(self, concept: str, max_distance: int = 2) -> List[Tuple[str, str, str]]:
         """
         Discover new potential relationships for a concept.
@@ -469,11 +522,8 @@ class DynamicKnowledgeGraph:
     # Private helper methods
     
     def _find_node_by_concept(self, concept: str) -> Optional[str]:
-        """Find node ID by concept name."""
-        for node_id, node in self.nodes.items():
-            if node.concept.lower() == concept.lower():
-                return node_id
-        return None
+        """Find node ID by concept name, ignoring case."""
+        return self._concept_index.get(concept.casefold())
     
     def _find_or_create_node(self, concept: str, source_session_id: Optional[str] = None) -> str:
         """Find existing node or create new one."""
@@ -486,12 +536,7 @@ class DynamicKnowledgeGraph:
     
     def _find_edge(self, source_id: str, target_id: str, relation_type: str) -> Optional[str]:
         """Find edge ID by source, target, and relation type."""
-        for edge_id, edge in self.edges.items():
-            if (edge.source_node_id == source_id and 
-                edge.target_node_id == target_id and 
-                edge.relation_type == relation_type):
-                return edge_id
-        return None
+        return self._edge_index.get((source_id, target_id), {}).get(relation_type)
     
     def _extract_knowledge_from_step(self, reasoning_step) -> List[Dict[str, Any]]:
         """Extract knowledge items from a reasoning step."""
@@ -536,35 +581,21 @@ class DynamicKnowledgeGraph:
         """Check for contradictions introduced by a new edge."""
         edge = self.edges[edge_id]
         
-        # Look for contradictory relationships
-        for other_edge_id, other_edge in self.edges.items():
-            if other_edge_id == edge_id:
-                continue
-            
-            if self._are_contradictory(edge, other_edge):
-                self._contradiction_pairs.add((edge_id, other_edge_id))
-    
-    def _are_contradictory(self, edge1: KnowledgeEdge, edge2: KnowledgeEdge) -> bool:
-        """Check if two edges are contradictory."""
-        # Simple contradiction detection - can be enhanced
-        contradictory_pairs = [
-            ('is_a', 'is_not_a'),
-            ('causes', 'prevents'),
-            ('enables', 'disables')
-        ]
-        
-        for pair in contradictory_pairs:
-            if ((edge1.relation_type == pair[0] and edge2.relation_type == pair[1]) or
-                (edge1.relation_type == pair[1] and edge2.relation_type == pair[0])):
-                if (edge1.source_node_id == edge2.source_node_id and
-                    edge1.target_node_id == edge2.target_node_id):
-                    return True
+        # Only the opposite relation between the same pair of nodes can contradict it
+        opposite = CONTRADICTORY_RELATIONS.get(edge.relation_type)
+        if opposite is None:
+            return
         
-        return False
+        other_edge_id = self._find_edge(edge.source_node_id, edge.target_node_id, opposite)
+        if other_edge_id:
+            self._contradiction_pairs.add((edge_id, other_edge_id))
     
     def _emit_graph_event(self, operation: str, affected_nodes: List[str], affected_edges: List[str]):
-        """Emit a knowledge graph event."""
-        if self.event_callback:
+        """Emit a knowledge graph event, or collect it into the open batch."""
+        if self.event_callback and self._batch_depth:
+            self._batch_nodes.update(dict.fromkeys(affected_nodes))
+            self._batch_edges.update(dict.fromkeys(affected_edges))
+        elif self.event_callback:
             event = KnowledgeGraphEvent(
                 operation=operation,
                 affected_nodes=affected_nodes,
@@ -576,6 +607,14 @@ class DynamicKnowledgeGraph:
             )
             self.event_callback(event)
     
+    def _flush_batch_event(self):
+        """Emit one event for everything the closed batch of updates affected."""
+        affected_nodes, affected_edges = list(self._batch_nodes), list(self._batch_edges)
+        self._batch_nodes.clear()
+        self._batch_edges.clear()
+        if affected_nodes or affected_edges:
+            self._emit_graph_event("batch_update", affected_nodes, affected_edges)
+    
     def _update_existing_node(self, node_id: str, properties: Optional[Dict[str, Any]], 
                              confidence: float, source_session_id: Optional[str]) -> GraphUpdateResult:
         """Update an existing node."""
@@ -620,10 +659,7 @@ class DynamicKnowledgeGraph:
         edge.last_updated = time.time()
         
         # Update graph
-        for u, v, k, d in self.graph.edges(keys=True, data=True):
-            if k == edge_id:
-                d.update(edge.to_dict())
-                break
+        self.graph[edge.source_node_id][edge.target_node_id][edge_id].update(edge.to_dict())
         
         return GraphUpdateResult(
             success=True,
@@ -740,8 +776,14 @@ class DynamicKnowledgeGraph:
             except:
                 pass  # Edge might already be removed
             
-            # Remove from edges dict
+            # Remove from edges dict and index
             del self.edges[edge_id]
+            pair = (edge.source_node_id, edge.target_node_id)
+            relations = self._edge_index.get(pair, {})
+            if relations.get(edge.relation_type) == edge_id:
+                del relations[edge.relation_type]
+                if not relations:
+                    del self._edge_index[pair]
     
     def _update_node_uncertainty(self, node_id: str, uncertainty_metrics):
         """Update uncertainty metrics for a node."""
@@ -5,9 +5,11 @@ This module provides comprehensive cognitive auditability for all knowledge upda
 reasoning step provenance chains, and temporal versioning of knowledge changes.
 """
 
+import bisect
 import logging
 import time
 import json
+import uuid
 from typing import Dict, List, Optional, Set, Any, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
@@ -52,12 +54,36 @@ class ProvenanceChain:
 
 @dataclass
 class ProvenanceSnapshot:
-    """Represents a snapshot of knowledge state at a specific time."""
-    snapshot_id: str = field(default_factory=lambda: f"snapshot_{int(time.time())}")
+    """
+    Represents a snapshot of knowledge state at a specific time.
+    
+    A snapshot without a base stores the full knowledge state in ``changes``.
+    A snapshot with a base stores only the entries changed and the keys
+    removed since its base, and rebuilds the full state on demand.
+    """
+    snapshot_id: str = field(default_factory=lambda: f"snapshot_{uuid.uuid4().hex}")
     timestamp: float = field(default_factory=time.time)
-    knowledge_state: Dict[str, Any] = field(default_factory=dict)
+    changes: Dict[str, Any] = field(default_factory=dict)
+    removed_keys: Set[str] = field(default_factory=set)
+    base: Optional['ProvenanceSnapshot'] = field(default=None, repr=False)
     active_sessions: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def knowledge_state(self) -> Dict[str, Any]:
+        """The full knowledge state at the time of the snapshot."""
+        snapshots = []
+        snapshot = self
+        while snapshot is not None:
+            snapshots.append(snapshot)
+            snapshot = snapshot.base
+        
+        state = {}
+        for snapshot in reversed(snapshots):
+            for key in snapshot.removed_keys:
+                state.pop(key, None)
+            state.update(snapshot.changes)
+        return state
 
 
 class ProvenanceTracker:
@@ -96,6 +122,14 @@ class ProvenanceTracker:
         self.session_index: Dict[str, Set[str]] = defaultdict(set)  # session_id -> record_ids
         self.temporal_index: List[Tuple[float, str]] = []  # (timestamp, record_id)
         self.dependency_graph: Dict[str, Set[str]] = defaultdict(set)  # target_id -> dependencies
+        self.source_index: Dict[str, Set[str]] = defaultdict(set)  # input source -> record_ids
+        self._timestamps: List[float] = []  # timestamps of temporal_index, for bisection
+        
+        # Delta snapshots: the state of the latest snapshot, and the number of
+        # entries stored in deltas since the last full snapshot
+        self._latest_snapshot: Optional[ProvenanceSnapshot] = None
+        self._latest_snapshot_state: Dict[str, Any] = {}
+        self._delta_entries = 0
         
         # Configuration
         self.max_history_size = max_history_size
@@ -277,6 +311,11 @@ class ProvenanceTracker:
         """
         Create a snapshot of the current knowledge state.
         
+        Only the entries that changed since the previous snapshot are stored.
+        Once the changes stored since the last full snapshot add up to the size
+        of the state, a full snapshot is stored instead, which bounds the work
+        needed to rebuild any snapshot's state.
+        
         Args:
             knowledge_state: Current state of knowledge
             active_sessions: List of active session IDs
@@ -286,13 +325,34 @@ class ProvenanceTracker:
             Snapshot ID
         """
         try:
-            snapshot = ProvenanceSnapshot(
-                knowledge_state=knowledge_state,
-                active_sessions=active_sessions or [],
-                metadata=metadata or {}
-            )
+            previous_state = self._latest_snapshot_state
+            changes = {
+                key: value for key, value in knowledge_state.items()
+                if key not in previous_state or not self._same_value(previous_state[key], value)
+            }
+            removed_keys = previous_state.keys() - knowledge_state.keys()
+            delta_entries = self._delta_entries + len(changes) + len(removed_keys)
+            
+            if self._latest_snapshot is None or delta_entries >= len(knowledge_state):
+                snapshot = ProvenanceSnapshot(
+                    changes=dict(knowledge_state),
+                    active_sessions=active_sessions or [],
+                    metadata=metadata or {}
+                )
+                self._delta_entries = 0
+            else:
+                snapshot = ProvenanceSnapshot(
+                    changes=changes,
+                    removed_keys=removed_keys,
+                    base=self._latest_snapshot,
+                    active_sessions=active_sessions or [],
+                    metadata=metadata or {}
+                )
+                self._delta_entries = delta_entries
             
             self.snapshots[snapshot.snapshot_id] = snapshot
+            self._latest_snapshot = snapshot
+            self._latest_snapshot_state = dict(knowledge_state)
             self.last_snapshot_time = time.time()
             
             self.logger.info(f"Created knowledge snapshot: {snapshot.snapshot_id}")
@@ -318,14 +378,12 @@ class ProvenanceTracker:
             
             snapshot = self.snapshots[snapshot_id]
             
-            # Find all records after the snapshot
-            records_to_undo = []
-            for record_id, record in self.records.items():
-                if record.timestamp > snapshot.timestamp:
-                    records_to_undo.append(record)
-            
-            # Sort by timestamp (newest first for undo)
-            records_to_undo.sort(key=lambda r: r.timestamp, reverse=True)
+            # Find all records after the snapshot, newest first for undo
+            start = bisect.bisect_right(self._timestamps, snapshot.timestamp)
+            records_to_undo = [
+                self.records[record_id]
+                for _, record_id in reversed(self.temporal_index[start:])
+            ]
             
             rollback_info = {
                 'snapshot_id': snapshot_id,
@@ -482,19 +540,17 @@ class ProvenanceTracker:
                 'snapshots': []
             }
             
-            # Filter records
+            # Filter records by time window
+            if time_window:
+                records = [self.records[record_id] for record_id in self._record_ids_in_window(*time_window)]
+            else:
+                records = self.records.values()
+            
+            # Filter by target IDs
             records_to_export = []
-            for record in self.records.values():
-                # Filter by target IDs
+            for record in records:
                 if target_ids and record.target_id not in target_ids:
                     continue
-                
-                # Filter by time window
-                if time_window:
-                    start_time, end_time = time_window
-                    if not (start_time <= record.timestamp <= end_time):
-                        continue
-                
                 records_to_export.append(record)
             
             export_data['records'] = [r.to_dict() for r in records_to_export]
@@ -503,6 +559,7 @@ class ProvenanceTracker:
                 {
                     'snapshot_id': s.snapshot_id,
                     'timestamp': s.timestamp,
+                    'base_snapshot_id': s.base.snapshot_id if s.base else None,
                     'metadata': s.metadata
                 } for s in self.snapshots.values()
             ]
@@ -524,13 +581,33 @@ class ProvenanceTracker:
         if record.source_session_id:
             self.session_index[record.source_session_id].add(record.record_id)
         
-        # Temporal index (keep sorted)
-        self.temporal_index.append((record.timestamp, record.record_id))
-        self.temporal_index.sort(key=lambda x: x[0])
+        # Temporal index (keep sorted; records usually arrive in time order,
+        # so this is normally an append)
+        position = bisect.bisect_right(self._timestamps, record.timestamp)
+        self._timestamps.insert(position, record.timestamp)
+        self.temporal_index.insert(position, (record.timestamp, record.record_id))
         
-        # Dependency graph
+        # Dependency graph and reverse index
         for source_id in record.input_sources:
             self.dependency_graph[record.target_id].add(source_id)
+            self.source_index[source_id].add(record.record_id)
+    
+    def _record_ids_in_window(self, start_time: float, end_time: float) -> List[str]:
+        """Get the IDs of the records in a time window, oldest first."""
+        start = bisect.bisect_left(self._timestamps, start_time)
+        end = bisect.bisect_right(self._timestamps, end_time)
+        return [record_id for _, record_id in self.temporal_index[start:end]]
+    
+    @staticmethod
+    def _same_value(old: Any, new: Any) -> bool:
+        """Check if a knowledge state entry is unchanged between snapshots."""
+        if old is new:
+            return True
+        try:
+            return bool(old == new)
+        except Exception:
+            # Values without a truth value for equality (e.g. arrays) count as changed
+            return False
     
     def _emit_provenance_event(self, record: ProvenanceRecord):
         """Emit a provenance event."""
@@ -565,12 +642,15 @@ class ProvenanceTracker:
                     self.target_index[record.target_id].discard(record_id)
                     if record.source_session_id:
                         self.session_index[record.source_session_id].discard(record_id)
+                    for source_id in record.input_sources:
+                        self.source_index[source_id].discard(record_id)
                     
                     # Remove from records
                     del self.records[record_id]
             
             # Update temporal index
             self.temporal_index = self.temporal_index[records_to_remove:]
+            self._timestamps = self._timestamps[records_to_remove:]
     
     def _backward_trace(self, target_id: str, max_depth: int, time_window: Optional[Tuple[float, float]]) -> Dict[str, Any]:
         """Perform backward provenance trace."""
@@ -655,24 +735,25 @@ class ProvenanceTracker:
             })
             
             # Find records that used this item as input
-            for record_id, record in self.records.items():
-                if current_id in record.input_sources:
-                    # Apply time window filter
-                    if time_window:
-                        start_time, end_time = time_window
-                        if not (start_time <= record.timestamp <= end_time):
-                            continue
+            for record_id in self.source_index.get(current_id, ()):
+                record = self.records[record_id]
+                
+                # Apply time window filter
+                if time_window:
+                    start_time, end_time = time_window
+                    if not (start_time <= record.timestamp <= end_time):
+                        continue
+                
+                if record.target_id not in visited:
+                    queue.append((record.target_id, depth + 1))
                     
-                    if record.target_id not in visited:
-                        queue.append((record.target_id, depth + 1))
-                        
-                        # Add edge
-                        trace_result['edges'].append({
-                            'source': current_id,
-                            'target': record.target_id,
-                            'record_id': record_id,
-                            'operation': record.operation_type
-                        })
+                    # Add edge
+                    trace_result['edges'].append({
+                        'source': current_id,
+                        'target': record.target_id,
+                        'record_id': record_id,
+                        'operation': record.operation_type
+                    })
         
         return trace_result
     
@@ -4,15 +4,28 @@ Module 9.1: External Common Sense Knowledge Base Interface (ECSKI)
 This module provides interfaces to external common sense knowledge bases such as
 ConceptNet and WordNet. It handles querying, caching, normalization, and fallback
 mechanisms for external knowledge sources.
+
+Results are cached in two levels: in memory, and in a SQLite database in the cache
+directory that survives restarts. Remote calls share a pooled HTTP session, bulk
+imports fetch from ConceptNet concurrently, and offline dumps of ConceptNet or
+WordNet extracts can be loaded so that concepts are served from local files.
 """
 
+import csv
+import glob
+import gzip
 import json
 import os
+import sqlite3
+import threading
 import time
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Set, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Set, Union
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
 import nltk
 from nltk.corpus import wordnet as wn
@@ -24,6 +37,181 @@ from godelOS.scalability.caching import CachingSystem
 logger = logging.getLogger(__name__)
 
 
+def _like_prefix(prefix: str) -> str:
+    """Build a LIKE pattern, escaped with a backslash, matching strings that start with a prefix."""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class PersistentKBCache:
+    """Two-level cache of external knowledge: an in-memory LRU over a SQLite database.
+    
+    Values are JSON-serializable and stored as JSON text, so callers always get
+    a fresh copy. Each entry has its own expiry time, or none for entries that
+    never expire, such as those loaded from offline dumps. The cache can be
+    used from multiple threads.
+    """
+    
+    def __init__(self, db_path: str, memory_size: int = 1024):
+        """Initialize the cache.
+        
+        Args:
+            db_path: Path of the SQLite database file, created if it does not exist
+            memory_size: Maximum number of entries to keep in memory
+        """
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        
+        self.created = not os.path.exists(db_path)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, expires_at REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS dumps ("
+                "path TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached value, or None if not found or expired
+        """
+        return self.get_many([key]).get(key)
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values from the cache, reading the database once.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dictionary of the keys found and their values
+        """
+        now = time.time()
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._memory.get(key)
+                if entry is not None and (entry[1] is None or entry[1] > now):
+                    self._memory.move_to_end(key)
+                    found[key] = entry[0]
+                    self.stats["memory_hits"] += 1
+                else:
+                    missing.append(key)
+            
+            # SQLite limits the number of parameters of a statement
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, value, expires_at FROM entries WHERE key IN ({','.join('?' * len(chunk))}) "
+                    f"AND (expires_at IS NULL OR expires_at > ?)",
+                    chunk + [now]
+                ).fetchall()
+                for key, value, expires_at in rows:
+                    found[key] = value
+                    self._remember(key, value, expires_at)
+                    self.stats["disk_hits"] += 1
+            
+            self.stats["misses"] += sum(1 for key in missing if key not in found)
+        
+        return {key: json.loads(value) for key, value in found.items()}
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time to live in seconds, or None for an entry that never expires
+        """
+        self.set_many({key: value}, ttl)
+    
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store several values in the cache in one transaction.
+        
+        Args:
+            items: Dictionary of cache keys and JSON-serializable values
+            ttl: Time to live in seconds, or None for entries that never expire
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        rows = [(key, json.dumps(value), now, expires_at) for key, value in items.items()]
+        
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at, expires_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            for key, value, _, _ in rows:
+                self._remember(key, value, expires_at)
+    
+    def delete(self, key: str) -> None:
+        """Delete a value from the cache."""
+        with self._lock, self._conn:
+            self._memory.pop(key, None)
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+    
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete all values whose keys start with a prefix."""
+        with self._lock, self._conn:
+            for key in [key for key in self._memory if key.startswith(prefix)]:
+                del self._memory[key]
+            self._conn.execute("DELETE FROM entries WHERE key LIKE ? ESCAPE '\\'", (_like_prefix(prefix),))
+    
+    def clear(self) -> None:
+        """Clear the cache, including the record of loaded dumps."""
+        with self._lock, self._conn:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM dumps")
+    
+    def keys(self, prefix: str = "") -> List[str]:
+        """Get the keys of the unexpired entries starting with a prefix."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM entries WHERE key LIKE ? ESCAPE '\\' AND (expires_at IS NULL OR expires_at > ?)",
+                (_like_prefix(prefix), time.time())
+            ).fetchall()
+        return [key for key, in rows]
+    
+    def is_dump_loaded(self, path: str, mtime: float, size: int) -> bool:
+        """Check if a dump file has been loaded since it last changed."""
+        with self._lock:
+            row = self._conn.execute("SELECT mtime, size FROM dumps WHERE path = ?", (path,)).fetchone()
+        return row is not None and row[0] == mtime and row[1] == size
+    
+    def record_dump(self, path: str, mtime: float, size: int) -> None:
+        """Record that a dump file has been loaded."""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO dumps (path, mtime, size) VALUES (?, ?, ?)",
+                               (path, mtime, size))
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def _remember(self, key: str, value: str, expires_at: Optional[float]) -> None:
+        """Keep an entry in memory, evicting the least recently used entries."""
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+
 class ExternalCommonSenseKB_Interface:
     """Interface to external common sense knowledge bases.
     
@@ -41,7 +229,11 @@ class ExternalCommonSenseKB_Interface:
                  wordnet_enabled: bool = True,
                  conceptnet_enabled: bool = True,
                  max_cache_age: int = 86400 * 7,  # 1 week in seconds
-                 offline_mode: bool = False):
+                 offline_mode: bool = False,
+                 max_concurrent_requests: int = 8,
+                 request_timeout: float = 10.0,
+                 memory_cache_size: int = 1024,
+                 offline_dumps: Optional[List[str]] = None):
         """Initialize the External Common Sense KB Interface.
         
         Args:
@@ -51,8 +243,12 @@ class ExternalCommonSenseKB_Interface:
             conceptnet_api_url: URL for the ConceptNet API
             wordnet_enabled: Whether to enable WordNet as a knowledge source
             conceptnet_enabled: Whether to enable ConceptNet as a knowledge source
-            max_cache_age: Maximum age of cached data in seconds
+            max_cache_age: Maximum age of cached data in seconds, or 0 for no expiry
             offline_mode: If True, only use cached data and don't query external sources
+            max_concurrent_requests: Maximum number of concurrent requests to ConceptNet
+            request_timeout: Timeout for requests to ConceptNet in seconds
+            memory_cache_size: Maximum number of cache entries to keep in memory
+            offline_dumps: Optional list of dump files to load into the cache
         """
         self.knowledge_store = knowledge_store
         self.cache_system = cache_system
@@ -62,10 +258,35 @@ class ExternalCommonSenseKB_Interface:
         self.conceptnet_enabled = conceptnet_enabled
         self.max_cache_age = max_cache_age
         self.offline_mode = offline_mode
+        self.max_concurrent_requests = max_concurrent_requests
+        self.request_timeout = request_timeout
         
         # Ensure cache directory exists
         os.makedirs(self.cache_dir, exist_ok=True)
         
+        # Persistent cache, so that known concepts survive restarts
+        self.persistent_cache = PersistentKBCache(
+            os.path.join(self.cache_dir, "common_sense_cache.sqlite3"),
+            memory_size=memory_cache_size
+        )
+        if self.persistent_cache.created:
+            self._import_legacy_cache_files()
+        
+        # Pooled HTTP session shared by all remote calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_concurrent_requests,
+                              pool_maxsize=max_concurrent_requests)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # ConceptNet results fetched ahead of time by bulk imports
+        self._prefetched_conceptnet: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._stats_lock = threading.Lock()
+        self.remote_requests = 0
+        
+        for dump_path in offline_dumps or []:
+            self.load_offline_dump(dump_path)
+        
         # Initialize WordNet if enabled
         if self.wordnet_enabled:
             try:
@@ -135,8 +356,9 @@ class ExternalCommonSenseKB_Interface:
                 if r["relation"] in relation_types
             ]
         
-        # Cache the result
-        self._save_to_cache(f"concept_{concept}", result)
+        # Cache the result, unless nothing could be queried
+        if not self.offline_mode:
+            self._save_to_cache(f"concept_{concept}", result)
         
         # Add to knowledge store in normalized form
         self._integrate_with_knowledge_store(result)
@@ -184,7 +406,9 @@ class ExternalCommonSenseKB_Interface:
         if not relations and self.conceptnet_enabled and not self.offline_mode:
             try:
                 url = f"{self.conceptnet_api_url}{quote(source_concept)}/r?other={quote(target_concept)}"
-                response = requests.get(url)
+                with self._stats_lock:
+                    self.remote_requests += 1
+                response = self.session.get(url, timeout=self.request_timeout)
                 if response.status_code == 200:
                     data = response.json()
                     for edge in data.get("edges", []):
@@ -309,12 +533,29 @@ class ExternalCommonSenseKB_Interface:
         Args:
             concept: The concept to query
             
+        Returns:
+            Dictionary with ConceptNet information or None if not found
+        """
+        if concept in self._prefetched_conceptnet:
+            return self._prefetched_conceptnet.pop(concept)
+        return self._fetch_conceptnet(concept)
+    
+    def _fetch_conceptnet(self, concept: str) -> Optional[Dict[str, Any]]:
+        """Fetch information about a concept from the ConceptNet API.
+        
+        This may be called from several threads at once.
+        
+        Args:
+            concept: The concept to fetch
+            
         Returns:
             Dictionary with ConceptNet information or None if not found
         """
         try:
             url = f"{self.conceptnet_api_url}{quote(concept)}"
-            response = requests.get(url)
+            with self._stats_lock:
+                self.remote_requests += 1
+            response = self.session.get(url, timeout=self.request_timeout)
             
             if response.status_code != 200:
                 logger.warning(f"ConceptNet API returned status {response.status_code}")
@@ -447,34 +688,47 @@ class ExternalCommonSenseKB_Interface:
     def _get_from_cache(self, key: str) -> Optional[Any]:
         """Get data from cache.
         
+        The caching system from the Scalability module is checked first, then
+        the persistent cache. Data found only in the persistent cache is copied
+        to the caching system.
+        
         Args:
             key: Cache key
             
         Returns:
             Cached data or None if not found or expired
         """
-        # Try to use the caching system from the Scalability module if available
-        if self.cache_system:
-            return self.cache_system.get(f"common_sense:{key}")
-        
-        # Otherwise use file-based caching
-        cache_file = os.path.join(self.cache_dir, f"{key}.json")
+        return self._get_many_from_cache([key]).get(key)
+    
+    def _get_many_from_cache(self, keys: List[str]) -> Dict[str, Any]:
+        """Get data for several keys from cache.
         
-        if not os.path.exists(cache_file):
-            return None
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dictionary of the keys found and their cached data
+        """
+        found = {}
+        if self.cache_system:
+            for key in keys:
+                data = self.cache_system.get(f"common_sense:{key}")
+                if data is not None:
+                    found[key] = data
         
-        # Check if cache is expired
-        if self.max_cache_age > 0:
-            file_age = time.time() - os.path.getmtime(cache_file)
-            if file_age > self.max_cache_age:
-                return None
+        missing = [key for key in keys if key not in found]
+        if missing:
+            try:
+                stored = self.persistent_cache.get_many(missing)
+            except sqlite3.Error as e:
+                logger.warning(f"Error reading from persistent cache: {e}")
+                stored = {}
+            if self.cache_system:
+                for key, data in stored.items():
+                    self.cache_system.set(f"common_sense:{key}", data, ttl=self.max_cache_age)
+            found.update(stored)
         
-        try:
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Error reading cache file {cache_file}: {e}")
-            return None
+        return found
     
     def _save_to_cache(self, key: str, data: Any) -> None:
         """Save data to cache.
@@ -486,16 +740,26 @@ class ExternalCommonSenseKB_Interface:
         # Try to use the caching system from the Scalability module if available
         if self.cache_system:
             self.cache_system.set(f"common_sense:{key}", data, ttl=self.max_cache_age)
-            return
-        
-        # Otherwise use file-based caching
-        cache_file = os.path.join(self.cache_dir, f"{key}.json")
         
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
-        except Exception as e:
-            logger.warning(f"Error writing to cache file {cache_file}: {e}")
+            self.persistent_cache.set(key, data, ttl=self.max_cache_age or None)
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing to persistent cache: {e}")
+    
+    def _import_legacy_cache_files(self) -> None:
+        """Import the JSON files written by the former file-based cache."""
+        for cache_file in glob.glob(os.path.join(self.cache_dir, "*.json")):
+            key = os.path.basename(cache_file)[:-len(".json")]
+            try:
+                age = time.time() - os.path.getmtime(cache_file)
+                if self.max_cache_age > 0 and age > self.max_cache_age:
+                    continue
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+                ttl = self.max_cache_age - age if self.max_cache_age > 0 else None
+                self.persistent_cache.set(key, data, ttl=ttl)
+            except Exception as e:
+                logger.warning(f"Error importing cache file {cache_file}: {e}")
     
     def _integrate_with_knowledge_store(self, concept_data: Dict[str, Any]) -> None:
         """Integrate external knowledge into the knowledge store.
@@ -559,6 +823,10 @@ class ExternalCommonSenseKB_Interface:
     def bulk_import_concepts(self, concepts: List[str]) -> Dict[str, bool]:
         """Import multiple concepts at once.
         
+        Concepts that are not cached are fetched from ConceptNet concurrently,
+        with at most max_concurrent_requests requests in flight, before the
+        concepts are queried one by one.
+        
         Args:
             concepts: List of concepts to import
             
@@ -567,16 +835,228 @@ class ExternalCommonSenseKB_Interface:
         """
         results = {}
         
-        for concept in concepts:
-            try:
-                self.query_concept(concept)
-                results[concept] = True
-            except Exception as e:
-                logger.warning(f"Error importing concept {concept}: {e}")
-                results[concept] = False
+        try:
+            self._prefetch_conceptnet(concepts)
+            
+            for concept in concepts:
+                try:
+                    self.query_concept(concept)
+                    results[concept] = True
+                except Exception as e:
+                    logger.warning(f"Error importing concept {concept}: {e}")
+                    results[concept] = False
+        finally:
+            self._prefetched_conceptnet.clear()
         
         return results
     
+    def _prefetch_conceptnet(self, concepts: List[str]) -> None:
+        """Fetch the uncached concepts from ConceptNet concurrently.
+        
+        Args:
+            concepts: List of concepts to fetch
+        """
+        if not self.conceptnet_enabled or self.offline_mode:
+            return
+        
+        names = list(dict.fromkeys(concept.lower().replace(' ', '_') for concept in concepts))
+        cached = self._get_many_from_cache([f"concept_{name}" for name in names])
+        missing = [name for name in names if f"concept_{name}" not in cached]
+        if not missing:
+            return
+        
+        logger.debug(f"Prefetching {len(missing)} concepts from ConceptNet")
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent_requests, len(missing))) as executor:
+            for name, data in zip(missing, executor.map(self._fetch_conceptnet, missing)):
+                self._prefetched_conceptnet[name] = data
+    
+    def load_offline_dump(self, path: str, force: bool = False) -> int:
+        """Load a dump of external knowledge into the persistent cache.
+        
+        Two formats are supported, optionally gzip-compressed:
+        
+        - ConceptNet assertion files (.csv or .tsv), with tab-separated edge
+          URI, relation URI, start URI, end URI and JSON edge info. Only
+          edges between English concepts are loaded.
+        - Concept records (.jsonl or .json) in the normalized format returned
+          by query_concept, such as WordNet extracts or files written by
+          export_offline_dump.
+        
+        Loaded concepts never expire and are merged with any cached data for
+        the same concepts. A dump that has not changed since it was last
+        loaded is skipped.
+        
+        Args:
+            path: Path of the dump file
+            force: If True, load the dump even if it has not changed
+            
+        Returns:
+            Number of concepts loaded
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if not force and self.persistent_cache.is_dump_loaded(path, stat.st_mtime, stat.st_size):
+            logger.debug(f"Offline dump {path} is already loaded")
+            return 0
+        
+        name = path[:-len(".gz")] if path.endswith(".gz") else path
+        if name.endswith((".csv", ".tsv")):
+            records = self._read_conceptnet_dump(path)
+        elif name.endswith((".jsonl", ".json")):
+            records = self._read_concept_dump(path, name.endswith(".jsonl"))
+        else:
+            raise ValueError(f"Unsupported offline dump format: {path}")
+        
+        count = 0
+        batch: Dict[str, Dict[str, Any]] = {}
+        batch_keys: Dict[str, Dict[str, Set[Any]]] = {}
+        for record in records:
+            concept = record["concept"]
+            if concept in batch:
+                self._merge_concept_records(batch[concept], record, batch_keys[concept])
+            else:
+                batch[concept] = record
+                batch_keys[concept] = self._record_keys(record)
+            if len(batch) >= 10000:
+                count += self._store_dump_records(batch)
+                batch = {}
+                batch_keys = {}
+        if batch:
+            count += self._store_dump_records(batch)
+        
+        self.persistent_cache.record_dump(path, stat.st_mtime, stat.st_size)
+        logger.info(f"Loaded {count} concepts from offline dump {path}")
+        return count
+    
+    def export_offline_dump(self, path: str, concepts: Optional[List[str]] = None) -> int:
+        """Write cached concepts to a dump file that load_offline_dump can read.
+        
+        Args:
+            path: Path of the .jsonl dump file, gzip-compressed if it ends in .gz
+            concepts: Optional list of concepts to export. If None, export all
+                cached concepts.
+            
+        Returns:
+            Number of concepts written
+        """
+        if concepts is None:
+            keys = self.persistent_cache.keys("concept_")
+        else:
+            keys = [f"concept_{concept.lower().replace(' ', '_')}" for concept in concepts]
+        
+        records = self.persistent_cache.get_many(keys)
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, 'wt', encoding='utf-8') as f:
+            for key in keys:
+                if key in records:
+                    f.write(json.dumps(records[key]) + "\n")
+        
+        return len(records)
+    
+    def _read_conceptnet_dump(self, path: str) -> Iterable[Dict[str, Any]]:
+        """Read concept records from a ConceptNet assertions file."""
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, 'rt', encoding='utf-8', newline='') as f:
+            for row in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+                if len(row) < 4 or not (row[2].startswith("/c/en/") and row[3].startswith("/c/en/")):
+                    continue
+                
+                info = json.loads(row[4]) if len(row) > 4 and row[4] else {}
+                edge = {
+                    "start": {"label": row[2].split('/')[3].replace('_', ' ')},
+                    "end": {"label": row[3].split('/')[3].replace('_', ' ')},
+                    "rel": {"label": row[1][len("/r/"):]},
+                    "weight": info.get("weight", 1.0)
+                }
+                relation = self._normalize_conceptnet_relation(edge)
+                
+                # Like the ConceptNet API, list each edge under both of its concepts
+                for concept in dict.fromkeys((relation["source"], relation["target"])):
+                    yield {
+                        "concept": concept,
+                        "relations": [dict(relation)],
+                        "definitions": [],
+                        "source": ["conceptnet"]
+                    }
+    
+    def _read_concept_dump(self, path: str, json_lines: bool) -> Iterable[Dict[str, Any]]:
+        """Read normalized concept records from a JSON or JSON lines file."""
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            records = (json.loads(line) for line in f if line.strip()) if json_lines else json.load(f)
+            for record in records:
+                yield {
+                    "concept": record["concept"].lower().replace(' ', '_'),
+                    "relations": list(record.get("relations", [])),
+                    "definitions": list(record.get("definitions", [])),
+                    "source": list(record.get("source", []))
+                }
+    
+    def _store_dump_records(self, records: Dict[str, Dict[str, Any]]) -> int:
+        """Merge concept records with the cached data and store them without expiry."""
+        keys = {f"concept_{concept}": record for concept, record in records.items()}
+        for key, cached in self.persistent_cache.get_many(keys).items():
+            self._merge_concept_records(cached, keys[key])
+            keys[key] = cached
+        
+        self.persistent_cache.set_many(keys, ttl=None)
+        if self.cache_system:
+            for key in keys:
+                self.cache_system.delete(f"common_sense:{key}")
+        
+        return len(keys)
+    
+    def _merge_concept_records(self, target: Dict[str, Any], record: Dict[str, Any],
+                               keys: Optional[Dict[str, Set[Any]]] = None) -> None:
+        """Merge the relations, definitions and sources of a concept record into another.
+        
+        Args:
+            target: The record to merge into
+            record: The record to merge
+            keys: Optional keys of the values already in target, as returned by
+                _record_keys. They are updated, so that repeated merges into the
+                same target need not rebuild them.
+        """
+        if keys is None:
+            keys = self._record_keys(target)
+        for field in ("relations", "definitions", "source"):
+            values = target.setdefault(field, [])
+            field_keys = keys.setdefault(field, set())
+            for value in record.get(field, []):
+                key = self._record_value_key(value)
+                if key not in field_keys:
+                    field_keys.add(key)
+                    values.append(value)
+    
+    def _record_keys(self, record: Dict[str, Any]) -> Dict[str, Set[Any]]:
+        """Get the keys of the relations, definitions and sources of a concept record."""
+        return {field: {self._record_value_key(value) for value in record.get(field, [])}
+                for field in ("relations", "definitions", "source")}
+    
+    def _record_value_key(self, value: Any) -> Any:
+        """Get the key that identifies a value of a concept record.
+        
+        Relations are identified by their edge, so the same edge is kept once
+        whatever its weight.
+        """
+        if isinstance(value, dict):
+            return (value.get("source"), value.get("relation"), value.get("target"),
+                    value.get("source_kb"))
+        return value
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get statistics about the cache and remote requests.
+        
+        Returns:
+            Dictionary with memory hits, disk hits, misses and remote requests
+        """
+        return dict(self.persistent_cache.stats, remote_requests=self.remote_requests)
+    
+    def close(self) -> None:
+        """Close the HTTP session and the persistent cache."""
+        self.session.close()
+        self.persistent_cache.close()
+    
     def clear_cache(self, concept: Optional[str] = None) -> None:
         """Clear the cache for a specific concept or all concepts.
         
@@ -594,36 +1074,11 @@ class ExternalCommonSenseKB_Interface:
                 # This depends on the implementation of the cache system
                 # For now, we'll just log that this operation is not fully supported
                 logger.info("Clearing all cache entries is not fully supported with the caching system")
+        
+        if concept:
+            logger.debug(f"Clearing cache for concept: {concept}")
+            self.persistent_cache.delete(f"concept_{concept}")
+            self.persistent_cache.delete_prefix(f"relation_{concept}_")
         else:
-            # File-based cache clearing
-            if concept:
-                # Clear specific concept cache
-                logger.debug(f"Clearing cache for concept: {concept}")
-                
-                # The exact filename format used in the tests
-                concept_file = os.path.join(self.cache_dir, f"concept_{concept}.json")
-                if os.path.exists(concept_file):
-                    try:
-                        os.remove(concept_file)
-                        logger.debug(f"Removed cache file: {concept_file}")
-                    except Exception as e:
-                        logger.warning(f"Error removing cache file {concept_file}: {e}")
-                
-                # Also check for any relation files with this concept
-                for file in os.listdir(self.cache_dir):
-                    if file.startswith(f"relation_{concept}_") and file.endswith(".json"):
-                        try:
-                            os.remove(os.path.join(self.cache_dir, file))
-                            logger.debug(f"Removed cache file: {file}")
-                        except Exception as e:
-                            logger.warning(f"Error removing cache file {file}: {e}")
-            else:
-                # Clear all cache files
-                logger.debug("Clearing all cache files")
-                for file in os.listdir(self.cache_dir):
-                    if file.endswith(".json"):
-                        try:
-                            os.remove(os.path.join(self.cache_dir, file))
-                            logger.debug(f"Removed cache file: {file}")
-                        except Exception as e:
-                            logger.warning(f"Error removing cache file {file}: {e}")
\ No newline at end of file
+            logger.debug("Clearing all cache entries")
+            self.persistent_cache.clear()
@@ -16,6 +16,7 @@ from godelOS.core_kr.ast.nodes import (
     LambdaNode,
     DefinitionNode,
 )
+from godelOS.core_kr.ast.interning import ASTInterner
 
 __all__ = [
     "AST_Node",
@@ -28,4 +29,5 @@ __all__ = [
     "ModalOpNode",
     "LambdaNode",
     "DefinitionNode",
+    "ASTInterner",
 ]
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+Hash-consing (interning) of AST nodes.
+
+This module provides an opt-in factory that hands out canonical AST nodes.
+Structurally equal nodes built through the same interner are the same object,
+so equality between them is an identity check and their structural hash is
+computed once, when the node is first created.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from godelOS.core_kr.ast.nodes import (
+    AST_Node, ConstantNode, VariableNode, ApplicationNode, QuantifierNode,
+    ConnectiveNode, ModalOpNode, LambdaNode, DefinitionNode
+)
+
+
+class ASTInterner:
+    """
+    Factory for canonical, immutable AST nodes.
+
+    The interner keeps a weak-valued table from structural keys to canonical
+    nodes, so canonical nodes are dropped from the table as soon as nothing
+    else references them. Keys refer to already-canonical children by
+    identity, which makes lookups O(1) in the size of the node's direct
+    children rather than in the size of the subtree.
+
+    Nodes whose metadata or literal values are not hashable cannot be shared;
+    for those the interner returns a regular node built from canonical
+    children.
+    """
+
+    def __init__(self):
+        """Initialize an empty interner."""
+        self._table: "weakref.WeakValueDictionary[Tuple, AST_Node]" = weakref.WeakValueDictionary()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        # Bumped by clear(); nodes from an older generation are no longer canonical
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Get the number of live canonical nodes."""
+        return len(self._table)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about the interner.
+
+        Returns:
+            A dictionary with the number of live nodes, hits, misses and hit rate
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._table),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+            }
+
+    def clear(self) -> None:
+        """
+        Forget all canonical nodes.
+
+        Nodes handed out before the call stay valid, but structurally equal
+        nodes created afterwards will be new objects. Equality between the two
+        falls back to structural comparison, and interning an old node returns
+        the node of the new generation.
+        """
+        with self._lock:
+            self._generation += 1
+            self._table = weakref.WeakValueDictionary()
+            self._hits = 0
+            self._misses = 0
+
+    # Factory methods
+
+    def constant(self, name: str, type_ref: Any, value: Any = None,
+                 metadata: Optional[Dict[str, Any]] = None) -> ConstantNode:
+        """Get the canonical ConstantNode with the given content."""
+        key = ("C", type_ref, name, value, self._metadata_key(metadata))
+        return self._lookup(key, lambda: ConstantNode(name, type_ref, value, metadata))
+
+    def variable(self, name: str, var_id: int, type_ref: Any,
+                 metadata: Optional[Dict[str, Any]] = None) -> VariableNode:
+        """Get the canonical VariableNode with the given content."""
+        key = ("V", type_ref, name, var_id, self._metadata_key(metadata))
+        return self._lookup(key, lambda: VariableNode(name, var_id, type_ref, metadata))
+
+    def application(self, operator: AST_Node, arguments: List[AST_Node], type_ref: Any,
+                    metadata: Optional[Dict[str, Any]] = None) -> ApplicationNode:
+        """Get the canonical ApplicationNode with the given content."""
+        operator = self.intern(operator)
+        arguments = [self.intern(arg) for arg in arguments]
+        key = ("A", type_ref, id(operator), tuple(id(arg) for arg in arguments),
+               self._metadata_key(metadata))
+        return self._lookup(key, lambda: ApplicationNode(operator, arguments, type_ref, metadata))
+
+    def quantifier(self, quantifier_type: str, bound_variables: List[VariableNode],
+                   scope: AST_Node, type_ref: Any,
+                   metadata: Optional[Dict[str, Any]] = None) -> QuantifierNode:
+        """Get the canonical QuantifierNode with the given content."""
+        bound_variables = [self.intern(var) for var in bound_variables]
+        scope = self.intern(scope)
+        key = ("Q", type_ref, quantifier_type, tuple(id(var) for var in bound_variables),
+               id(scope), self._metadata_key(metadata))
+        return self._lookup(key, lambda: QuantifierNode(quantifier_type, bound_variables,
+                                                        scope, type_ref, metadata))
+
+    def connective(self, connective_type: str, operands: List[AST_Node], type_ref: Any,
+                   metadata: Optional[Dict[str, Any]] = None) -> ConnectiveNode:
+        """Get the canonical ConnectiveNode with the given content."""
+        operands = [self.intern(op) for op in operands]
+        key = ("N", type_ref, connective_type, tuple(id(op) for op in operands),
+               self._metadata_key(metadata))
+        return self._lookup(key, lambda: ConnectiveNode(connective_type, operands, type_ref, metadata))
+
+    def modal_op(self, modal_operator: str, proposition: AST_Node, type_ref: Any,
+                 agent_or_world: Optional[AST_Node] = None,
+                 metadata: Optional[Dict[str, Any]] = None) -> ModalOpNode:
+        """Get the canonical ModalOpNode with the given content."""
+        proposition = self.intern(proposition)
+        agent_or_world = self.intern(agent_or_world) if agent_or_world is not None else None
+        key = ("M", type_ref, modal_operator, id(proposition),
+               id(agent_or_world) if agent_or_world is not None else None,
+               self._metadata_key(metadata))
+        return self._lookup(key, lambda: ModalOpNode(modal_operator, proposition, type_ref,
+                                                     agent_or_world, metadata))
+
+    def lambda_(self, bound_variables: List[VariableNode], body: AST_Node, type_ref: Any,
+                metadata: Optional[Dict[str, Any]] = None) -> LambdaNode:
+        """Get the canonical LambdaNode with the given content."""
+        bound_variables = [self.intern(var) for var in bound_variables]
+        body = self.intern(body)
+        key = ("L", type_ref, tuple(id(var) for var in bound_variables), id(body),
+               self._metadata_key(metadata))
+        return self._lookup(key, lambda: LambdaNode(bound_variables, body, type_ref, metadata))
+
+    def definition(self, defined_symbol_name: str, defined_symbol_type: Any,
+                   definition_body_ast: AST_Node, type_ref: Any,
+                   metadata: Optional[Dict[str, Any]] = None) -> DefinitionNode:
+        """Get the canonical DefinitionNode with the given content."""
+        body = self.intern(definition_body_ast)
+        key = ("D", type_ref, defined_symbol_name, defined_symbol_type, id(body),
+               self._metadata_key(metadata))
+        return self._lookup(key, lambda: DefinitionNode(defined_symbol_name, defined_symbol_type,
+                                                        body, type_ref, metadata))
+
+    def intern(self, node: AST_Node) -> AST_Node:
+        """
+        Get the canonical version of an existing AST.
+
+        The tree is canonicalized bottom-up. Nodes already owned by this
+        interner's current generation are returned unchanged.
+
+        Args:
+            node: The AST to intern
+
+        Returns:
+            The canonical node structurally equal to the given node
+        """
+        if node._interner is self and node._interner_generation == self._generation:
+            return node
+
+        metadata = node._metadata or None
+        if isinstance(node, ConstantNode):
+            return self.constant(node.name, node.type, node.value, metadata)
+        if isinstance(node, VariableNode):
+            return self.variable(node.name, node.var_id, node.type, metadata)
+        if isinstance(node, ApplicationNode):
+            return self.application(node.operator, list(node.arguments), node.type, metadata)
+        if isinstance(node, ConnectiveNode):
+            return self.connective(node.connective_type, list(node.operands), node.type, metadata)
+        if isinstance(node, QuantifierNode):
+            return self.quantifier(node.quantifier_type, list(node.bound_variables),
+                                   node.scope, node.type, metadata)
+        if isinstance(node, ModalOpNode):
+            return self.modal_op(node.modal_operator, node.proposition, node.type,
+                                 node.agent_or_world, metadata)
+        if isinstance(node, LambdaNode):
+            return self.lambda_(list(node.bound_variables), node.body, node.type, metadata)
+        if isinstance(node, DefinitionNode):
+            return self.definition(node.defined_symbol_name, node.defined_symbol_type,
+                                   node.definition_body_ast, node.type, metadata)
+
+        # Unknown node kinds are left as they are
+        return node
+
+    # Internal helpers
+
+    @staticmethod
+    def _metadata_key(metadata: Optional[Dict[str, Any]]) -> Any:
+        """
+        Get a key for a metadata dictionary.
+
+        Metadata with unhashable values yields an unhashable key, which makes
+        ``_lookup`` fall back to building a regular node.
+        """
+        if not metadata:
+            return ()
+        try:
+            return frozenset(metadata.items())
+        except TypeError:
+            return list(metadata.items())
+
+    def _lookup(self, key: Tuple, factory) -> AST_Node:
+        """
+        Get the canonical node for a key, creating it if necessary.
+
+        Args:
+            key: The structural key of the node
+            factory: A callable building a fresh node for the key
+
+        Returns:
+            The canonical node, or a regular node if the key is not hashable
+        """
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable metadata or literal values: the node cannot be shared
+            return factory()
+
+        with self._lock:
+            node = self._table.get(key)
+            if node is not None:
+                self._hits += 1
+                return node
+
+            self._misses += 1
+            node = factory()
+            # Precompute the structural hash while the children's hashes are cached
+            hash(node)
+            node._interner = self
+            node._interner_generation = self._generation
+            self._table[key] = node
+            return node
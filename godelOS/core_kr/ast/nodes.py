@@ -6,9 +6,10 @@ in the GödelOS system, following the principles of immutability, typing, rich m
 and traversal support.
 """
 
-from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar, Generic, ForwardRef
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, TypeVar, Generic, ForwardRef
 from abc import ABC, abstractmethod
 from copy import deepcopy
+from types import MappingProxyType
 
 # Use string type annotation to break circular dependency
 # Instead of: from godelOS.core_kr.type_system.types import Type
@@ -75,8 +76,20 @@ class AST_Node(ABC):
     Base class for all AST nodes.
     
     All AST nodes are immutable and carry type information and metadata.
+    Nodes use ``__slots__`` layouts and cache their structural hash on first
+    use. Nodes handed out by an ``ASTInterner`` are canonical: they remember
+    the interner that owns them and the interner's generation at the time,
+    so two interned nodes from the same generation of an interner are equal
+    exactly when they are the same object.
     """
     
+    __slots__ = ('_type', '_metadata', '_hash', '_interner', '_interner_generation', '__weakref__')
+    
+    # Slots that are derived from the node's content or owning interner and
+    # must not travel with pickled/copied nodes (string hashes are salted per
+    # process, and interner membership is process-local).
+    _TRANSIENT_SLOTS = frozenset(('_hash', '_interner', '_interner_generation', '__weakref__'))
+    
     def __init__(self, type_ref: 'Type', metadata: Optional[Dict[str, Any]] = None):
         """
         Initialize an AST node.
@@ -87,6 +100,9 @@ class AST_Node(ABC):
         """
         self._type = type_ref
         self._metadata = metadata or {}
+        self._hash = None
+        self._interner = None
+        self._interner_generation = None
     
     @property
     def type(self) -> 'Type':
@@ -94,10 +110,22 @@ class AST_Node(ABC):
         return self._type
     
     @property
-    def metadata(self) -> Dict[str, Any]:
-        """Get the metadata of this node."""
+    def metadata(self) -> Mapping[str, Any]:
+        """
+        Get the metadata of this node.
+        
+        Regular nodes return a copy of their metadata dictionary. Interned
+        nodes are shared, so they return a read-only view instead of copying.
+        """
+        if self._interner is not None:
+            return MappingProxyType(self._metadata)
         return self._metadata.copy()
     
+    @property
+    def is_interned(self) -> bool:
+        """Check whether this node is a canonical node owned by an ASTInterner."""
+        return self._interner is not None
+    
     @abstractmethod
     def accept(self, visitor: ASTVisitor[T]) -> T:
         """
@@ -150,7 +178,7 @@ class AST_Node(ABC):
         Returns:
             A new node with the updated metadata
         """
-        new_metadata = self.metadata
+        new_metadata = dict(self._metadata)
         new_metadata.update(kwargs)
         return self.with_updated_metadata(new_metadata)
     
@@ -172,10 +200,15 @@ class AST_Node(ABC):
         Structural equality based on content.
         
         Two AST nodes are equal if they have the same structure and content,
-        regardless of their identity.
+        regardless of their identity. Canonical nodes from the same generation
+        of an interner are compared by identity; the generation changes when
+        the interner is cleared, after which equal nodes may be distinct objects.
         """
         if not isinstance(other, AST_Node):
             return False
+        if (self._interner is not None and self._interner is other._interner and
+                self._interner_generation == other._interner_generation):
+            return self is other
         return (self._type == other._type and
                 self._metadata == other._metadata)
     
@@ -183,9 +216,39 @@ class AST_Node(ABC):
         """
         Hash based on content for use in sets/dicts.
         
-        The hash is based on the node's content, not its identity.
+        The hash is based on the node's content, not its identity. Subclasses
+        extend it with their own fields and cache the result in ``_hash``.
         """
         return hash((self.__class__, self._type, frozenset(self._metadata.items())))
+    
+    def _canonical(self, node: 'AST_Node') -> 'AST_Node':
+        """
+        Intern a node derived from this one if this node is interned.
+        
+        This keeps substitution and metadata updates on canonical trees
+        canonical, while leaving regular nodes untouched.
+        """
+        if self._interner is not None:
+            return self._interner.intern(node)
+        return node
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the picklable state of this node, excluding transient slots."""
+        state = {}
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get('__slots__', ()):
+                if slot not in AST_Node._TRANSIENT_SLOTS:
+                    state[slot] = getattr(self, slot)
+        state.update(getattr(self, '__dict__', {}))
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a node from its pickled state as a regular (non-interned) node."""
+        self._hash = None
+        self._interner = None
+        self._interner_generation = None
+        for key, value in state.items():
+            setattr(self, key, value)
 
 
 class ConstantNode(AST_Node):
@@ -193,6 +256,8 @@ class ConstantNode(AST_Node):
     Node representing a constant symbol or literal value.
     """
     
+    __slots__ = ('_name', '_value')
+    
     def __init__(self, name: str, type_ref: 'Type', value: Any = None,
                  metadata: Optional[Dict[str, Any]] = None):
         """
@@ -240,9 +305,11 @@ class ConstantNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'ConstantNode':
         """Create a new node with the given metadata."""
-        return ConstantNode(self._name, self._type, self._value, metadata)
+        return self._canonical(ConstantNode(self._name, self._type, self._value, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ConstantNode):
             return False
         return (super().__eq__(other) and
@@ -250,7 +317,9 @@ class ConstantNode(AST_Node):
                 self._value == other._value)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._name, self._value))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._name, self._value))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"ConstantNode(name='{self._name}', type={self._type})"
@@ -261,6 +330,8 @@ class VariableNode(AST_Node):
     Node representing a variable, also used for bound variables in quantifiers/lambda.
     """
     
+    __slots__ = ('_name', '_var_id')
+    
     def __init__(self, name: str, var_id: int, type_ref: 'Type',
                  metadata: Optional[Dict[str, Any]] = None):
         """
@@ -297,10 +368,7 @@ class VariableNode(AST_Node):
         If this variable is in the substitution, return its replacement.
         Otherwise, return self.
         """
-        for var, replacement in substitution.items():
-            if self == var:
-                return replacement
-        return self
+        return substitution.get(self, self)
     
     def contains_variable(self, variable: 'VariableNode') -> bool:
         """
@@ -312,9 +380,11 @@ class VariableNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'VariableNode':
         """Create a new node with the given metadata."""
-        return VariableNode(self._name, self._var_id, self._type, metadata)
+        return self._canonical(VariableNode(self._name, self._var_id, self._type, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, VariableNode):
             return False
         return (super().__eq__(other) and
@@ -322,7 +392,9 @@ class VariableNode(AST_Node):
                 self._var_id == other._var_id)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._name, self._var_id))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._name, self._var_id))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"VariableNode(name='{self._name}', id={self._var_id}, type={self._type})"
@@ -333,6 +405,8 @@ class ApplicationNode(AST_Node):
     Node representing a function or predicate application.
     """
     
+    __slots__ = ('_operator', '_arguments')
+    
     def __init__(self, operator: AST_Node, arguments: List[AST_Node], type_ref: 'Type', 
                  metadata: Optional[Dict[str, Any]] = None):
         """
@@ -375,7 +449,7 @@ class ApplicationNode(AST_Node):
         if new_operator is self._operator and all(new_arg is old_arg for new_arg, old_arg in zip(new_arguments, self._arguments)):
             return self
         
-        return ApplicationNode(new_operator, list(new_arguments), self._type, self._metadata.copy())
+        return self._canonical(ApplicationNode(new_operator, list(new_arguments), self._type, self._metadata.copy()))
     
     def contains_variable(self, variable: 'VariableNode') -> bool:
         """
@@ -388,9 +462,11 @@ class ApplicationNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'ApplicationNode':
         """Create a new node with the given metadata."""
-        return ApplicationNode(self._operator, list(self._arguments), self._type, metadata)
+        return self._canonical(ApplicationNode(self._operator, list(self._arguments), self._type, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ApplicationNode):
             return False
         return (super().__eq__(other) and
@@ -398,7 +474,9 @@ class ApplicationNode(AST_Node):
                 self._arguments == other._arguments)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._operator, self._arguments))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._operator, self._arguments))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"ApplicationNode(operator={self._operator}, args={self._arguments})"
@@ -409,6 +487,8 @@ class QuantifierNode(AST_Node):
     Node representing a quantifier (∀, ∃).
     """
     
+    __slots__ = ('_quantifier_type', '_bound_variables', '_scope')
+    
     def __init__(self, quantifier_type: str, bound_variables: List[VariableNode], 
                  scope: AST_Node, type_ref: 'Type', 
                  metadata: Optional[Dict[str, Any]] = None):
@@ -461,8 +541,8 @@ class QuantifierNode(AST_Node):
         if filtered_substitution:
             new_scope = self._scope.substitute(filtered_substitution)
             if new_scope is not self._scope:
-                return QuantifierNode(self._quantifier_type, list(self._bound_variables),
-                                     new_scope, self._type, self._metadata.copy())
+                return self._canonical(QuantifierNode(self._quantifier_type, list(self._bound_variables),
+                                                     new_scope, self._type, self._metadata.copy()))
         
         return self
     
@@ -478,10 +558,12 @@ class QuantifierNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'QuantifierNode':
         """Create a new node with the given metadata."""
-        return QuantifierNode(self._quantifier_type, list(self._bound_variables),
-                             self._scope, self._type, metadata)
+        return self._canonical(QuantifierNode(self._quantifier_type, list(self._bound_variables),
+                                             self._scope, self._type, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, QuantifierNode):
             return False
         return (super().__eq__(other) and
@@ -490,8 +572,10 @@ class QuantifierNode(AST_Node):
                 self._scope == other._scope)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._quantifier_type,
-                    self._bound_variables, self._scope))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._quantifier_type,
+                               self._bound_variables, self._scope))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"QuantifierNode(type='{self._quantifier_type}', vars={self._bound_variables})"
@@ -502,6 +586,8 @@ class ConnectiveNode(AST_Node):
     Node representing a logical connective (¬, ∧, ∨, ⇒, ≡).
     """
     
+    __slots__ = ('_connective_type', '_operands')
+    
     def __init__(self, connective_type: str, operands: List[AST_Node], type_ref: 'Type', 
                  metadata: Optional[Dict[str, Any]] = None):
         """
@@ -543,8 +629,8 @@ class ConnectiveNode(AST_Node):
         if all(new_op is old_op for new_op, old_op in zip(new_operands, self._operands)):
             return self
         
-        return ConnectiveNode(self._connective_type, list(new_operands),
-                             self._type, self._metadata.copy())
+        return self._canonical(ConnectiveNode(self._connective_type, list(new_operands),
+                                             self._type, self._metadata.copy()))
     
     def contains_variable(self, variable: 'VariableNode') -> bool:
         """
@@ -556,10 +642,12 @@ class ConnectiveNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'ConnectiveNode':
         """Create a new node with the given metadata."""
-        return ConnectiveNode(self._connective_type, list(self._operands),
-                             self._type, metadata)
+        return self._canonical(ConnectiveNode(self._connective_type, list(self._operands),
+                                             self._type, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ConnectiveNode):
             return False
         return (super().__eq__(other) and
@@ -567,7 +655,9 @@ class ConnectiveNode(AST_Node):
                 self._operands == other._operands)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._connective_type, self._operands))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._connective_type, self._operands))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"ConnectiveNode(type='{self._connective_type}', operands={self._operands})"
@@ -578,6 +668,8 @@ class ModalOpNode(AST_Node):
     Node representing a modal operator (K, B, P, O, F, etc.).
     """
     
+    __slots__ = ('_modal_operator', '_proposition', '_agent_or_world')
+    
     def __init__(self, modal_operator: str, proposition: AST_Node, type_ref: 'Type', 
                  agent_or_world: Optional[AST_Node] = None, 
                  metadata: Optional[Dict[str, Any]] = None):
@@ -629,8 +721,8 @@ class ModalOpNode(AST_Node):
             new_agent_or_world is self._agent_or_world):
             return self
         
-        return ModalOpNode(self._modal_operator, new_proposition, self._type,
-                          new_agent_or_world, self._metadata.copy())
+        return self._canonical(ModalOpNode(self._modal_operator, new_proposition, self._type,
+                                          new_agent_or_world, self._metadata.copy()))
     
     def contains_variable(self, variable: 'VariableNode') -> bool:
         """
@@ -643,10 +735,12 @@ class ModalOpNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'ModalOpNode':
         """Create a new node with the given metadata."""
-        return ModalOpNode(self._modal_operator, self._proposition, self._type,
-                          self._agent_or_world, metadata)
+        return self._canonical(ModalOpNode(self._modal_operator, self._proposition, self._type,
+                                          self._agent_or_world, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ModalOpNode):
             return False
         return (super().__eq__(other) and
@@ -655,8 +749,10 @@ class ModalOpNode(AST_Node):
                 self._agent_or_world == other._agent_or_world)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._modal_operator,
-                    self._proposition, self._agent_or_world))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._modal_operator,
+                               self._proposition, self._agent_or_world))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"ModalOpNode(operator='{self._modal_operator}', prop={self._proposition})"
@@ -667,6 +763,8 @@ class LambdaNode(AST_Node):
     Node representing a lambda abstraction (λx. P(x)).
     """
     
+    __slots__ = ('_bound_variables', '_body')
+    
     def __init__(self, bound_variables: List[VariableNode], body: AST_Node, type_ref: 'Type', 
                  metadata: Optional[Dict[str, Any]] = None):
         """
@@ -711,8 +809,8 @@ class LambdaNode(AST_Node):
         if filtered_substitution:
             new_body = self._body.substitute(filtered_substitution)
             if new_body is not self._body:
-                return LambdaNode(list(self._bound_variables), new_body,
-                                 self._type, self._metadata.copy())
+                return self._canonical(LambdaNode(list(self._bound_variables), new_body,
+                                                 self._type, self._metadata.copy()))
         
         return self
     
@@ -728,9 +826,11 @@ class LambdaNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'LambdaNode':
         """Create a new node with the given metadata."""
-        return LambdaNode(list(self._bound_variables), self._body, self._type, metadata)
+        return self._canonical(LambdaNode(list(self._bound_variables), self._body, self._type, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, LambdaNode):
             return False
         return (super().__eq__(other) and
@@ -738,7 +838,9 @@ class LambdaNode(AST_Node):
                 self._body == other._body)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._bound_variables, self._body))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._bound_variables, self._body))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"LambdaNode(vars={self._bound_variables}, body={self._body})"
@@ -749,6 +851,8 @@ class DefinitionNode(AST_Node):
     Node representing a definition of a constant, function, or predicate.
     """
     
+    __slots__ = ('_defined_symbol_name', '_defined_symbol_type', '_definition_body_ast')
+    
     def __init__(self, defined_symbol_name: str, defined_symbol_type: 'Type', 
                  definition_body_ast: AST_Node, type_ref: 'Type', 
                  metadata: Optional[Dict[str, Any]] = None):
@@ -796,8 +900,8 @@ class DefinitionNode(AST_Node):
         
         # Only create a new node if something changed
         if new_body is not self._definition_body_ast:
-            return DefinitionNode(self._defined_symbol_name, self._defined_symbol_type,
-                                 new_body, self._type, self._metadata.copy())
+            return self._canonical(DefinitionNode(self._defined_symbol_name, self._defined_symbol_type,
+                                                 new_body, self._type, self._metadata.copy()))
         
         return self
     
@@ -811,10 +915,12 @@ class DefinitionNode(AST_Node):
     
     def with_updated_metadata(self, metadata: Dict[str, Any]) -> 'DefinitionNode':
         """Create a new node with the given metadata."""
-        return DefinitionNode(self._defined_symbol_name, self._defined_symbol_type,
-                             self._definition_body_ast, self._type, metadata)
+        return self._canonical(DefinitionNode(self._defined_symbol_name, self._defined_symbol_type,
+                                             self._definition_body_ast, self._type, metadata))
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, DefinitionNode):
             return False
         return (super().__eq__(other) and
@@ -823,8 +929,10 @@ class DefinitionNode(AST_Node):
                 self._definition_body_ast == other._definition_body_ast)
     
     def __hash__(self) -> int:
-        return hash((super().__hash__(), self._defined_symbol_name,
-                    self._defined_symbol_type, self._definition_body_ast))
+        if self._hash is None:
+            self._hash = hash((super().__hash__(), self._defined_symbol_name,
+                               self._defined_symbol_type, self._definition_body_ast))
+        return self._hash
     
     def __repr__(self) -> str:
         return f"DefinitionNode(name='{self._defined_symbol_name}', body={self._definition_body_ast})"
\ No newline at end of file
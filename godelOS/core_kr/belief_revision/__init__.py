@@ -15,10 +15,12 @@ from godelOS.core_kr.belief_revision.system import (
     Argument,
     ArgumentationFramework
 )
+from godelOS.core_kr.belief_revision.argumentation import AttackGraph
 
 __all__ = [
     "BeliefRevisionSystem",
     "RevisionStrategy",
     "Argument",
-    "ArgumentationFramework"
+    "ArgumentationFramework",
+    "AttackGraph"
 ]
\ No newline at end of file
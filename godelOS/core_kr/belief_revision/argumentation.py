@@ -0,0 +1,235 @@
+"""
+Argumentation semantics over integer-indexed attack graphs.
+
+This module implements the AttackGraph class, which stores the attack relation
+of an argumentation framework as adjacency arrays over argument indices and
+computes its extensions. The grounded extension is found with a linear-time
+labelling pass; preferred and stable extensions are enumerated with a
+backtracking labelling search (Nofal et al.) that only runs on the arguments
+the grounded labelling leaves undecided, one weakly connected component at a
+time.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Labels of the grounded labelling
+UNDEC, IN, OUT = 0, 1, 2
+
+# Additional labels used by the extension search
+_BLANK, _MUST_OUT = 3, 4
+
+
+class AttackGraph:
+    """
+    The attack relation of an argumentation framework as adjacency arrays.
+
+    Arguments are numbered 0..n-1 in the order given. The attackers of argument
+    i are ``attackers[attacker_starts[i]:attacker_starts[i + 1]]`` and the
+    arguments it attacks are ``targets[target_starts[i]:target_starts[i + 1]]``.
+    """
+
+    SEMANTICS = ("grounded", "complete", "preferred", "stable")
+
+    def __init__(self, arguments: Sequence[Hashable], attacks: Iterable[Tuple[Hashable, Hashable]]):
+        """
+        Build the graph.
+
+        Args:
+            arguments: The argument identifiers
+            attacks: (attacker, attacked) pairs of argument identifiers
+        """
+        self.arguments = list(arguments)
+        self.index: Dict[Hashable, int] = {argument: i for i, argument in enumerate(self.arguments)}
+        n = len(self.arguments)
+
+        edges = [(self.index[attacker], self.index[attacked]) for attacker, attacked in attacks]
+        self.attacker_starts, self.attackers = self._compressed(n, ((b, a) for a, b in edges))
+        self.target_starts, self.targets = self._compressed(n, edges)
+        self.self_attacking = {a for a, b in edges if a == b}
+
+    @staticmethod
+    def _compressed(n: int, edges: Iterable[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+        """Group (source, destination) pairs by source into offset and value arrays."""
+        edges = list(edges)
+        starts = [0] * (n + 1)
+        for source, _ in edges:
+            starts[source + 1] += 1
+        for i in range(n):
+            starts[i + 1] += starts[i]
+        values = [0] * len(edges)
+        position = starts[:-1]
+        for source, destination in edges:
+            values[position[source]] = destination
+            position[source] += 1
+        return starts, values
+
+    def __len__(self) -> int:
+        """Get the number of arguments."""
+        return len(self.arguments)
+
+    def attackers_of(self, i: int) -> List[int]:
+        """Get the indices of the arguments attacking argument i."""
+        return self.attackers[self.attacker_starts[i]:self.attacker_starts[i + 1]]
+
+    def targets_of(self, i: int) -> List[int]:
+        """Get the indices of the arguments attacked by argument i."""
+        return self.targets[self.target_starts[i]:self.target_starts[i + 1]]
+
+    def grounded_labelling(self) -> List[int]:
+        """
+        Compute the grounded labelling in time linear in the size of the graph.
+
+        Unattacked arguments are IN; whatever an IN argument attacks is OUT; an
+        argument all of whose attackers are OUT becomes IN. Arguments never
+        decided remain UNDEC.
+
+        Returns:
+            The label (IN, OUT or UNDEC) of each argument
+        """
+        n = len(self.arguments)
+        labels = [UNDEC] * n
+        live_attackers = [self.attacker_starts[i + 1] - self.attacker_starts[i] for i in range(n)]
+        queue = [i for i in range(n) if live_attackers[i] == 0]
+        for i in queue:
+            labels[i] = IN
+
+        while queue:
+            argument = queue.pop()
+            for target in self.targets_of(argument):
+                if labels[target] != UNDEC:
+                    continue
+                labels[target] = OUT
+                for attacked in self.targets_of(target):
+                    live_attackers[attacked] -= 1
+                    if live_attackers[attacked] == 0 and labels[attacked] == UNDEC:
+                        labels[attacked] = IN
+                        queue.append(attacked)
+        return labels
+
+    def grounded_extension(self) -> Set[int]:
+        """Get the indices of the arguments in the grounded extension."""
+        return {i for i, label in enumerate(self.grounded_labelling()) if label == IN}
+
+    def accepted(self, semantics: str = "grounded") -> Optional[Set[int]]:
+        """
+        Get the arguments accepted in every extension of a semantics.
+
+        The grounded extension is contained in every complete, preferred and
+        stable extension, so only the arguments it leaves undecided are
+        searched. Extensions of disjoint parts of the graph combine freely, so
+        each weakly connected component of the undecided arguments is searched
+        on its own.
+
+        Args:
+            semantics: "grounded", "complete", "preferred" or "stable"
+
+        Returns:
+            The indices of the sceptically accepted arguments, or None if the
+            semantics admits no extension (only possible for stable semantics)
+
+        Raises:
+            ValueError: If the semantics is unknown
+        """
+        if semantics not in self.SEMANTICS:
+            raise ValueError(f"Unsupported semantics type: {semantics}")
+
+        labels = self.grounded_labelling()
+        accepted = {i for i, label in enumerate(labels) if label == IN}
+        # The grounded extension is the intersection of all complete extensions
+        if semantics in ("grounded", "complete"):
+            return accepted
+
+        for component in self._undecided_components(labels):
+            common = None
+            for extension in self._component_extensions(component, stable=semantics == "stable"):
+                common = set(extension) if common is None else common & extension
+            if common is None:
+                return None
+            accepted.update(common)
+        return accepted
+
+    def _undecided_components(self, labels: List[int]) -> List[List[int]]:
+        """Get the weakly connected components of the undecided arguments."""
+        components = []
+        seen = set()
+        for start, label in enumerate(labels):
+            if label != UNDEC or start in seen:
+                continue
+            seen.add(start)
+            component, stack = [], [start]
+            while stack:
+                argument = stack.pop()
+                component.append(argument)
+                for neighbour in self.attackers_of(argument) + self.targets_of(argument):
+                    if labels[neighbour] == UNDEC and neighbour not in seen:
+                        seen.add(neighbour)
+                        stack.append(neighbour)
+            components.append(component)
+        return components
+
+    def _component_extensions(self, component: List[int], stable: bool) -> List[Set[int]]:
+        """
+        Enumerate the preferred or stable extensions of an undecided component.
+
+        Every argument starts BLANK. The search picks a BLANK argument and
+        either labels it IN, making its targets OUT and its non-OUT attackers
+        MUST_OUT, or leaves it out: UNDEC for preferred semantics, MUST_OUT for
+        stable semantics. A branch dies when a MUST_OUT argument has no BLANK
+        attacker left to become IN; for preferred semantics it is also pruned
+        when its IN and BLANK arguments fit inside an extension already found.
+
+        Args:
+            component: The global indices of the component's arguments
+            stable: Whether to enumerate stable rather than preferred extensions
+
+        Returns:
+            The extensions, as sets of global indices
+        """
+        local = {argument: i for i, argument in enumerate(component)}
+        n = len(component)
+        attackers = [[local[a] for a in self.attackers_of(argument) if a in local] for argument in component]
+        targets = [[local[t] for t in self.targets_of(argument) if t in local] for argument in component]
+
+        initial = [_BLANK] * n
+        for argument in self.self_attacking:
+            if argument in local:
+                initial[local[argument]] = _MUST_OUT if stable else UNDEC
+
+        extensions: List[frozenset] = []
+        stack = [initial]
+        while stack:
+            labels = stack.pop()
+            if any(label == _MUST_OUT and not any(labels[a] == _BLANK for a in attackers[i])
+                   for i, label in enumerate(labels)):
+                continue
+
+            blank = [i for i, label in enumerate(labels) if label == _BLANK]
+            if not blank:
+                extension = frozenset(i for i, label in enumerate(labels) if label == IN)
+                if stable:
+                    extensions.append(extension)
+                elif not any(extension <= other for other in extensions):
+                    extensions = [other for other in extensions if not other < extension] + [extension]
+                continue
+
+            if not stable and extensions:
+                reachable = frozenset(i for i, label in enumerate(labels) if label in (IN, _BLANK))
+                if any(reachable <= other for other in extensions):
+                    continue
+
+            # Branch on the argument attacking the most undecided arguments
+            chosen = max(blank, key=lambda i: len(targets[i]))
+            left_out = labels.copy()
+            left_out[chosen] = _MUST_OUT if stable else UNDEC
+            stack.append(left_out)
+
+            taken = labels.copy()
+            taken[chosen] = IN
+            for target in targets[chosen]:
+                taken[target] = OUT
+            for attacker in attackers[chosen]:
+                if taken[attacker] != OUT:
+                    taken[attacker] = _MUST_OUT
+            stack.append(taken)
+
+        return [{component[i] for i in extension} for extension in extensions]
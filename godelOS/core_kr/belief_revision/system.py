@@ -10,15 +10,16 @@ operations like expansion, contraction, and revision. It also provides support
 for argumentation frameworks for defeasible reasoning.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any, Callable
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Any, Callable
 import copy
 import uuid
 import logging
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 
 from godelOS.core_kr.ast.nodes import AST_Node, ConnectiveNode, ConstantNode, VariableNode
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
+from godelOS.core_kr.belief_revision.argumentation import AttackGraph
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -74,6 +75,11 @@ class ArgumentationFramework:
         """Initialize an argumentation framework."""
         self.arguments: Dict[str, Argument] = {}
         self.attacks: Set[Tuple[str, str]] = set()  # (attacker_id, attacked_id)
+        
+        # Adjacency of the attack relation, and its compiled form
+        self._attackers: Dict[str, Set[str]] = defaultdict(set)
+        self._attacked: Dict[str, Set[str]] = defaultdict(set)
+        self._attack_graph: Optional[AttackGraph] = None
     
     def add_argument(self, argument: Argument) -> None:
         """
@@ -83,6 +89,7 @@ class ArgumentationFramework:
             argument: The argument to add
         """
         self.arguments[argument.id] = argument
+        self._attack_graph = None
     
     def add_attack(self, attacker_id: str, attacked_id: str) -> None:
         """
@@ -93,6 +100,26 @@ class ArgumentationFramework:
             attacked_id: The ID of the attacked argument
         """
         self.attacks.add((attacker_id, attacked_id))
+        self._attackers[attacked_id].add(attacker_id)
+        self._attacked[attacker_id].add(attacked_id)
+        self._attack_graph = None
+    
+    def attack_graph(self) -> AttackGraph:
+        """
+        Get the framework's attack relation as an integer-indexed graph.
+        
+        The graph is built on first use and rebuilt after the framework changes.
+        Attacks involving unknown arguments are ignored.
+        
+        Returns:
+            The attack graph
+        """
+        if self._attack_graph is None:
+            self._attack_graph = AttackGraph(
+                list(self.arguments),
+                [(a, b) for a, b in self.attacks if a in self.arguments and b in self.arguments]
+            )
+        return self._attack_graph
     
     def get_attackers(self, argument_id: str) -> Set[str]:
         """
@@ -104,7 +131,7 @@ class ArgumentationFramework:
         Returns:
             The set of attacker IDs
         """
-        return {attacker_id for attacker_id, attacked_id in self.attacks if attacked_id == argument_id}
+        return set(self._attackers.get(argument_id, ()))
     
     def get_attacked(self, argument_id: str) -> Set[str]:
         """
@@ -116,7 +143,7 @@ class ArgumentationFramework:
         Returns:
             The set of attacked argument IDs
         """
-        return {attacked_id for attacker_id, attacked_id in self.attacks if attacker_id == argument_id}
+        return set(self._attacked.get(argument_id, ()))
 
 
 class RevisionStrategy(Enum):
@@ -137,8 +164,27 @@ class BeliefRevisionSystem:
     - Partial Meet Contraction/Revision (AGM-style)
     - Kernel Contraction/Revision (Base revision)
     - Argumentation-based revision (using Dung's argumentation frameworks)
+    
+    Kernels (minimal subsets entailing a belief) are computed one at a time
+    with QuickXplain and enumerated with a hitting-set tree; remainders
+    (maximal subsets not entailing it) are the complements of the minimal
+    hitting sets of the kernels. Entailment checks are memoized per belief
+    set, and the enumeration is bounded so contraction stays tractable on
+    belief sets of hundreds of statements.
     """
     
+    # Maximum number of kernels enumerated per contraction
+    MAX_KERNELS = 64
+    
+    # Maximum number of hitting-set tree nodes expanded per contraction
+    MAX_SEARCH_NODES = 4096
+    
+    # Maximum number of remainders kept for partial meet contraction
+    MAX_REMAINDERS = 32
+    
+    # Maximum number of memoized entailment results
+    ENTAILMENT_CACHE_SIZE = 4096
+    
     def __init__(self, kr_system_interface: KnowledgeStoreInterface,
                 belief_set_context_id: str = "BELIEFS",
                 default_strategy: RevisionStrategy = RevisionStrategy.PARTIAL_MEET):
@@ -166,6 +212,15 @@ class BeliefRevisionSystem:
         
         # Dictionary to store derived beliefs for belief sets
         self._derived_beliefs: Dict[str, Set[AST_Node]] = defaultdict(set)
+        
+        # Statements are interned to integer ids so that a belief set's
+        # fingerprint is a frozenset of ints, which is cheap to hash and compare
+        self._statement_ids: Dict[AST_Node, int] = {}
+        self._statements_by_id: List[AST_Node] = []
+        
+        # Memoized entailment results keyed by (fingerprint, belief), in LRU order
+        self._entailment_cache: OrderedDict = OrderedDict()
+        self.entailment_stats = {"hits": 0, "misses": 0}
     
     def expand_belief_set(self, belief_set_id: str, new_belief_ast: AST_Node,
                          entrenchment_value: float = 0.5) -> str:
@@ -299,15 +354,17 @@ class BeliefRevisionSystem:
             The set of statements
         """
         # Query the knowledge store for all statements in the context
-        # Using a generic pattern that matches any statement
-        generic_pattern = VariableNode("?x", 1, self.ksi.type_system.get_type("Entity"))
-        query_result = self.ksi.query_statements_match_pattern(generic_pattern, [context_id])
+        # A Boolean variable matches any statement
+        generic_pattern = VariableNode("?x", 1, self.ksi.type_system.get_type("Boolean"))
+        query_result = self.ksi.query_statements_match_pattern(generic_pattern, [context_id],
+                                                               variables_to_bind=[generic_pattern])
         
-        # Extract the statements from the query result
+        # Extract the statements from the query result, without their metadata
+        # so they compare equal to the beliefs they are checked against
         statements = set()
         for binding in query_result:
             for var, node in binding.items():
-                statements.add(node)
+                statements.add(node.with_updated_metadata({}))
         
         return statements
     
@@ -317,8 +374,12 @@ class BeliefRevisionSystem:
         """
         Find maximal subsets of statements that do not entail a belief.
         
-        This implements the core of partial meet contraction by finding all maximal
-        subsets of the original belief set that do not entail the belief to remove.
+        This implements the core of partial meet contraction by finding the maximal
+        subsets of the original belief set that do not entail the belief to remove
+        (the remainders). Each remainder is the complement of a minimal hitting set
+        of the kernels, so the remainders are derived from the kernels instead of
+        by enumerating subsets. At most MAX_REMAINDERS are returned, preferring
+        those that give up the least entrenchment.
         
         Args:
             statements: The set of statements
@@ -328,48 +389,197 @@ class BeliefRevisionSystem:
         Returns:
             A list of maximal subsets
         """
-        # Start with the power set of statements (all possible subsets)
-        # For efficiency, we use a more sophisticated algorithm than generating all subsets
+        ids = self._intern(statements)
+        if self._entails_cached(frozenset(), belief_to_remove_ast):
+            return []
+        
+        def cost(hitting_set: FrozenSet[int]) -> Tuple[float, int]:
+            removed = sum(self._entrenchment_of(i, entrenchment_map) for i in hitting_set)
+            return removed, len(hitting_set)
+        
+        # Minimal hitting sets of the kernels, built one kernel at a time
+        hitting_sets: List[FrozenSet[int]] = [frozenset()]
+        for kernel in self._kernel_ids(ids, belief_to_remove_ast):
+            extended = set()
+            for hitting_set in hitting_sets:
+                if hitting_set & kernel:
+                    extended.add(hitting_set)
+                else:
+                    extended.update(hitting_set | {i} for i in kernel)
+            minimal: List[FrozenSet[int]] = []
+            for hitting_set in sorted(extended, key=len):
+                if not any(other <= hitting_set for other in minimal):
+                    minimal.append(hitting_set)
+            hitting_sets = sorted(minimal, key=cost)[:self.MAX_REMAINDERS]
+        
+        # If the kernel enumeration was cut short a remainder may still entail
+        # the belief; cut it further until it does not
+        remainders: List[FrozenSet[int]] = []
+        for hitting_set in hitting_sets:
+            remainder = self._cut_until_not_entailed(ids - hitting_set, belief_to_remove_ast, entrenchment_map)
+            if not any(remainder <= other for other in remainders):
+                remainders = [other for other in remainders if not other < remainder]
+                remainders.append(remainder)
+        maximal_subsets = [self._statements_of(remainder) for remainder in remainders]
         
-        # Initialize with an empty subset
-        subsets: List[Set[AST_Node]] = [set()]
+        # Sort maximal subsets by entrenchment if provided
+        if entrenchment_map:
+            maximal_subsets.sort(key=lambda subset: self._calculate_entrenchment_score(subset, entrenchment_map), reverse=True)
         
-        # Add statements one by one, checking if they entail the belief to remove
+        return maximal_subsets
+    
+    def _intern(self, statements: Set[AST_Node]) -> FrozenSet[int]:
+        """
+        Get the fingerprint of a set of statements.
+        
+        Args:
+            statements: The set of statements
+            
+        Returns:
+            The frozenset of the statements' ids
+        """
+        ids = []
         for statement in statements:
-            # Skip the statement if it's the belief to remove
-            if statement == belief_to_remove_ast:
+            statement_id = self._statement_ids.get(statement)
+            if statement_id is None:
+                statement_id = self._statement_ids[statement] = len(self._statements_by_id)
+                self._statements_by_id.append(statement)
+            ids.append(statement_id)
+        return frozenset(ids)
+    
+    def _statements_of(self, ids: FrozenSet[int]) -> Set[AST_Node]:
+        """Get the statements with the given ids."""
+        return {self._statements_by_id[i] for i in ids}
+    
+    def _entrenchment_of(self, statement_id: int, entrenchment_map: Optional[Dict[AST_Node, float]]) -> float:
+        """Get the entrenchment of a statement, defaulting to 0.5."""
+        return entrenchment_map.get(self._statements_by_id[statement_id], 0.5) if entrenchment_map else 0.5
+    
+    def _entails_cached(self, ids: FrozenSet[int], belief: AST_Node) -> bool:
+        """
+        Check if a set of statements entails a belief, memoizing the result.
+        
+        Args:
+            ids: The fingerprint of the set of statements
+            belief: The belief to check
+            
+        Returns:
+            True if the statements entail the belief, False otherwise
+        """
+        key = (ids, belief)
+        result = self._entailment_cache.get(key)
+        if result is not None:
+            self._entailment_cache.move_to_end(key)
+            self.entailment_stats["hits"] += 1
+            return result
+        
+        self.entailment_stats["misses"] += 1
+        result = self._entails(self._statements_of(ids), belief)
+        self._entailment_cache[key] = result
+        if len(self._entailment_cache) > self.ENTAILMENT_CACHE_SIZE:
+            self._entailment_cache.popitem(last=False)
+        return result
+    
+    def _find_kernel(self, ids: FrozenSet[int], belief: AST_Node) -> Optional[FrozenSet[int]]:
+        """
+        Find one kernel (minimal subset entailing a belief) with QuickXplain.
+        
+        This needs O(k log(n/k)) entailment checks for a kernel of size k in a
+        set of n statements.
+        
+        Args:
+            ids: The fingerprint of the set of statements
+            belief: The belief
+            
+        Returns:
+            The fingerprint of a kernel, or None if the statements do not
+            entail the belief
+        """
+        if not self._entails_cached(ids, belief):
+            return None
+        
+        def quickxplain(background: FrozenSet[int], added: bool, candidates: List[int]) -> List[int]:
+            # Minimal subset of candidates that with the background entails the
+            # belief, given that the background with all candidates does
+            if added and self._entails_cached(background, belief):
+                return []
+            if len(candidates) == 1:
+                return candidates
+            middle = len(candidates) // 2
+            first, second = candidates[:middle], candidates[middle:]
+            second_part = quickxplain(background | frozenset(first), True, second)
+            first_part = quickxplain(background | frozenset(second_part), bool(second_part), first)
+            return first_part + second_part
+        
+        return frozenset(quickxplain(frozenset(), True, sorted(ids)))
+    
+    def _kernel_ids(self, ids: FrozenSet[int], belief: AST_Node) -> List[FrozenSet[int]]:
+        """
+        Enumerate kernels with Reiter's hitting-set tree.
+        
+        Each node removes a set of statements (its path) and is labelled with a
+        kernel of what is left, reusing an already found kernel disjoint from
+        the path when there is one. Its children remove one more member of that
+        kernel. Paths that contain a path whose statements no longer entail the
+        belief are pruned. The search stops after MAX_KERNELS kernels or
+        MAX_SEARCH_NODES nodes.
+        
+        Args:
+            ids: The fingerprint of the set of statements
+            belief: The belief
+            
+        Returns:
+            The fingerprints of the kernels found
+        """
+        kernels: List[FrozenSet[int]] = []
+        closed_paths: List[FrozenSet[int]] = []
+        queue = deque([frozenset()])
+        visited = {frozenset()}
+        nodes = 0
+        
+        while queue and len(kernels) < self.MAX_KERNELS and nodes < self.MAX_SEARCH_NODES:
+            path = queue.popleft()
+            nodes += 1
+            if any(closed <= path for closed in closed_paths):
                 continue
             
-            # Create new subsets by adding the current statement to existing subsets
-            new_subsets = []
-            for subset in subsets:
-                # Create a new subset with the current statement
-                new_subset = subset.copy()
-                new_subset.add(statement)
-                
-                # Check if the new subset entails the belief to remove
-                if not self._entails(new_subset, belief_to_remove_ast):
-                    new_subsets.append(new_subset)
-            
-            # Add the new subsets to the list of subsets
-            subsets.extend(new_subsets)
-        
-        # Find the maximal subsets (those not contained in any other)
-        maximal_subsets = []
-        for subset in subsets:
-            is_maximal = True
-            for other_subset in subsets:
-                if subset != other_subset and subset.issubset(other_subset):
-                    is_maximal = False
-                    break
-            if is_maximal:
-                maximal_subsets.append(subset)
+            kernel = next((k for k in kernels if not k & path), None)
+            if kernel is None:
+                kernel = self._find_kernel(ids - path, belief)
+                if kernel is None:
+                    closed_paths.append(path)
+                    continue
+                kernels.append(kernel)
+            
+            for statement_id in sorted(kernel):
+                child = path | {statement_id}
+                if child not in visited:
+                    visited.add(child)
+                    queue.append(child)
         
-        # Sort maximal subsets by entrenchment if provided
-        if entrenchment_map:
-            maximal_subsets.sort(key=lambda subset: self._calculate_entrenchment_score(subset, entrenchment_map), reverse=True)
+        return kernels
+    
+    def _cut_until_not_entailed(self, ids: FrozenSet[int], belief: AST_Node,
+                                entrenchment_map: Optional[Dict[AST_Node, float]] = None) -> FrozenSet[int]:
+        """
+        Remove statements until the rest no longer entails a belief.
         
-        return maximal_subsets
+        While the statements entail the belief, one of their kernels is found
+        and its least entrenched member removed.
+        
+        Args:
+            ids: The fingerprint of the set of statements
+            belief: The belief
+            entrenchment_map: Optional map of beliefs to their entrenchment values
+            
+        Returns:
+            The fingerprint of the remaining statements
+        """
+        while True:
+            kernel = self._find_kernel(ids, belief)
+            if not kernel:
+                return ids
+            ids = ids - {min(sorted(kernel), key=lambda i: self._entrenchment_of(i, entrenchment_map))}
     
     def _entails(self, statements: Set[AST_Node], belief: AST_Node) -> bool:
         """
@@ -512,9 +722,13 @@ class BeliefRevisionSystem:
         # based on entrenchment values
         incision_set = self._create_incision_set(kernels, entrenchment_map)
         
+        # Kernels beyond the enumeration bound may survive the incision
+        remaining = self._statements_of(self._cut_until_not_entailed(
+            self._intern(statements) - self._intern(incision_set), belief_to_remove_ast, entrenchment_map))
+        
         # Add all statements except those in the incision set to the new belief set
         for statement in statements:
-            if statement not in incision_set:
+            if statement in remaining:
                 # Copy the entrenchment value if available
                 entrenchment = entrenchment_map.get(statement, 0.5) if entrenchment_map else 0.5
                 metadata = {
@@ -532,6 +746,9 @@ class BeliefRevisionSystem:
         """
         Find all kernels (minimal subsets that entail the belief to remove).
         
+        Kernels are found one at a time with QuickXplain and enumerated with a
+        hitting-set tree, so at most MAX_KERNELS are returned.
+        
         Args:
             statements: The set of statements
             belief_to_remove_ast: The belief to remove
@@ -539,44 +756,8 @@ class BeliefRevisionSystem:
         Returns:
             A list of kernels
         """
-        # Initialize with all subsets that entail the belief
-        entailing_subsets = []
-        
-        # Check each subset
-        # For efficiency, we use a more sophisticated algorithm than generating all subsets
-        def find_entailing_subsets(current_subset: Set[AST_Node], remaining: List[AST_Node],
-                                  index: int) -> None:
-            # Check if the current subset entails the belief
-            if self._entails(current_subset, belief_to_remove_ast):
-                entailing_subsets.append(current_subset.copy())
-                return
-            
-            # If we've considered all statements, return
-            if index >= len(remaining):
-                return
-            
-            # Skip the current statement
-            find_entailing_subsets(current_subset, remaining, index + 1)
-            
-            # Include the current statement
-            current_subset.add(remaining[index])
-            find_entailing_subsets(current_subset, remaining, index + 1)
-            current_subset.remove(remaining[index])
-        
-        find_entailing_subsets(set(), list(statements), 0)
-        
-        # Find the minimal entailing subsets (kernels)
-        kernels = []
-        for subset in entailing_subsets:
-            is_minimal = True
-            for other_subset in entailing_subsets:
-                if other_subset != subset and other_subset.issubset(subset):
-                    is_minimal = False
-                    break
-            if is_minimal:
-                kernels.append(subset)
-        
-        return kernels
+        return [self._statements_of(kernel)
+                for kernel in self._kernel_ids(self._intern(statements), belief_to_remove_ast)]
 
     def _create_incision_set(self, kernels: List[Set[AST_Node]],
                             entrenchment_map: Optional[Dict[AST_Node, float]] = None) -> Set[AST_Node]:
@@ -860,137 +1041,105 @@ class BeliefRevisionSystem:
             af.add_argument(arg)
             rule_arg_ids[rule_ast] = arg.id
         
-        # Identify attack relations
-        # In a full implementation, this would use a proper contradiction check
-        # For now, we use a simple heuristic based on negation
-        
-        # Check for conflicts between knowledge and rules
-        for knowledge_ast, knowledge_arg_id in knowledge_arg_ids.items():
-            for rule_ast, rule_arg_id in rule_arg_ids.items():
-                # If the knowledge directly contradicts the rule
-                if self._are_contradictory(knowledge_ast, rule_ast):
-                    # Knowledge attacks the rule (strict defeats defeasible)
-                    af.add_attack(knowledge_arg_id, rule_arg_id)
-        
-        # Check for conflicts between rules
-        for rule1_ast, rule1_arg_id in rule_arg_ids.items():
-            for rule2_ast, rule2_arg_id in rule_arg_ids.items():
-                if rule1_ast != rule2_ast and self._are_contradictory(rule1_ast, rule2_ast):
-                    # Both rules attack each other (mutual defeat)
-                    af.add_attack(rule1_arg_id, rule2_arg_id)
-                    af.add_attack(rule2_arg_id, rule1_arg_id)
+        # Identify attack relations between complementary literals: every
+        # contradictory pair is a negation and its operand, so indexing the
+        # conclusions finds the pairs without comparing every two arguments
+        for negation in knowledge_arg_ids.keys() | rule_arg_ids.keys():
+            if not (isinstance(negation, ConnectiveNode) and negation.connective_type == "NOT"):
+                continue
+            operand = negation.operands[0]
+            negation_fact, negation_rule = knowledge_arg_ids.get(negation), rule_arg_ids.get(negation)
+            operand_fact, operand_rule = knowledge_arg_ids.get(operand), rule_arg_ids.get(operand)
+            
+            # Knowledge attacks the rule (strict defeats defeasible)
+            if negation_fact and operand_rule:
+                af.add_attack(negation_fact, operand_rule)
+            if operand_fact and negation_rule:
+                af.add_attack(operand_fact, negation_rule)
+            
+            # Both rules attack each other (mutual defeat)
+            if negation_rule and operand_rule:
+                af.add_attack(negation_rule, operand_rule)
+                af.add_attack(operand_rule, negation_rule)
         
         logger.info(f"Constructed argumentation framework with {len(af.arguments)} arguments and {len(af.attacks)} attacks")
         return af
     
-    def _are_contradictory(self, ast1: AST_Node, ast2: AST_Node) -> bool:
-        """
-        Check if two AST nodes are contradictory.
-        
-        Args:
-            ast1: The first AST node
-            ast2: The second AST node
-            
-        Returns:
-            True if the nodes are contradictory, False otherwise
-        """
-        # In a full implementation, this would use a proper contradiction check
-        # For now, we use a simple heuristic based on negation
-        
-        # Check if one is the negation of the other
-        if isinstance(ast1, ConnectiveNode) and ast1.connective_type == "NOT":
-            if ast1.operands[0] == ast2:
-                return True
-        
-        if isinstance(ast2, ConnectiveNode) and ast2.connective_type == "NOT":
-            if ast2.operands[0] == ast1:
-                return True
-        
-        return False
-    
     def _apply_grounded_semantics(self, af: ArgumentationFramework) -> Set[str]:
         """
         Apply grounded semantics to an argumentation framework.
         
+        The grounded extension is the least fixed point of the characteristic
+        function, computed by a linear-time labelling of the attack graph.
+        
         Args:
             af: The argumentation framework
             
         Returns:
             The set of justified argument IDs
         """
-        # This is a placeholder implementation of the grounded semantics algorithm
-        # In a real implementation, this would implement the grounded extension
-        # (the least fixed point of the characteristic function)
-        
-        # Initialize the set of justified arguments
-        justified = set()
-        
-        # Initialize the set of arguments that are not attacked
-        unattacked = {arg_id for arg_id in af.arguments if not af.get_attackers(arg_id)}
-        
-        # Iteratively add unattacked arguments and remove attacked arguments
-        while unattacked:
-            # Add unattacked arguments to the justified set
-            justified.update(unattacked)
-            
-            # Find arguments that are attacked by the newly justified arguments
-            attacked = set()
-            for arg_id in unattacked:
-                attacked.update(af.get_attacked(arg_id))
-            
-            # Remove attacked arguments from consideration
-            unattacked = {arg_id for arg_id in af.arguments 
-                         if arg_id not in justified and 
-                         arg_id not in attacked and 
-                         not any(attacker_id in justified for attacker_id in af.get_attackers(arg_id))}
-        
-        return justified
+        return self._accepted_arguments(af, "grounded")
     
     def _apply_preferred_semantics(self, af: ArgumentationFramework) -> Set[str]:
         """
         Apply preferred semantics to an argumentation framework.
         
+        An argument is justified if it belongs to every preferred extension
+        (maximal admissible set).
+        
         Args:
             af: The argumentation framework
             
         Returns:
             The set of justified argument IDs
         """
-        # This is a placeholder implementation
-        # In a real implementation, this would find a maximal admissible set
-        
-        # For now, just use the grounded semantics
-        return self._apply_grounded_semantics(af)
+        return self._accepted_arguments(af, "preferred")
     
     def _apply_stable_semantics(self, af: ArgumentationFramework) -> Set[str]:
         """
         Apply stable semantics to an argumentation framework.
         
+        An argument is justified if it belongs to every stable extension (set
+        attacking all arguments not in it). If there is no stable extension,
+        no argument is justified.
+        
         Args:
             af: The argumentation framework
             
         Returns:
             The set of justified argument IDs
         """
-        # This is a placeholder implementation
-        # In a real implementation, this would find a set that attacks all arguments
-        # not in the set
-        
-        # For now, just use the grounded semantics
-        return self._apply_grounded_semantics(af)
+        return self._accepted_arguments(af, "stable")
     
     def _apply_complete_semantics(self, af: ArgumentationFramework) -> Set[str]:
         """
         Apply complete semantics to an argumentation framework.
         
+        The arguments in every complete extension are those of the grounded
+        extension.
+        
         Args:
             af: The argumentation framework
             
         Returns:
             The set of justified argument IDs
         """
-        # This is a placeholder implementation
-        # In a real implementation, this would find a complete extension
+        return self._accepted_arguments(af, "complete")
+    
+    def _accepted_arguments(self, af: ArgumentationFramework, semantics: str) -> Set[str]:
+        """
+        Get the arguments sceptically accepted under a semantics.
         
-        # For now, just use the grounded semantics
-        return self._apply_grounded_semantics(af)
\ No newline at end of file
+        Args:
+            af: The argumentation framework
+            semantics: The semantics
+            
+        Returns:
+            The set of justified argument IDs
+        """
+        graph = af.attack_graph()
+        accepted = graph.accepted(semantics)
+        if accepted is None:
+            logger.info(f"The argumentation framework has no {semantics} extension")
+            return set()
+        return {graph.arguments[i] for i in accepted}
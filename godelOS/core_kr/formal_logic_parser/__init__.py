@@ -5,6 +5,6 @@ This module is responsible for converting textual representations of logical for
 into canonical Abstract Syntax Tree (AST) structures.
 """
 
-from godelOS.core_kr.formal_logic_parser.parser import FormalLogicParser, Lexer, Token, Error
+from godelOS.core_kr.formal_logic_parser.parser import FormalLogicParser, Lexer, LexerError, Token, Error
 
-__all__ = ["FormalLogicParser", "Lexer", "Token", "Error"]
\ No newline at end of file
+__all__ = ["FormalLogicParser", "Lexer", "LexerError", "Token", "Error"]
\ No newline at end of file
@@ -4,15 +4,20 @@ Formal Logic Parser implementation.
 This module implements the FormalLogicParser class, which is responsible for
 converting textual representations of logical formulae into canonical
 Abstract Syntax Tree (AST) structures.
+
+Parsed formulae are built from interned AST nodes, and successful parses are
+kept in an LRU cache keyed by their whitespace-normalized source, so re-parsing
+a formula returns the same shared, immutable AST. Whole files or iterables of formulae can be parsed
+lazily with FormalLogicParser.parse_stream.
 """
 
-from typing import Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 import re
 
-from godelOS.core_kr.ast.nodes import (
-    AST_Node, ConstantNode, VariableNode, ApplicationNode,
-    QuantifierNode, ConnectiveNode, ModalOpNode, LambdaNode
-)
+from godelOS.core_kr.ast.nodes import AST_Node
+from godelOS.core_kr.ast.interning import ASTInterner
 from godelOS.core_kr.type_system.manager import TypeSystemManager
 from godelOS.core_kr.type_system.types import Type, FunctionType
 
@@ -20,6 +25,8 @@ from godelOS.core_kr.type_system.types import Type, FunctionType
 class Token:
     """A token in the input stream."""
     
+    __slots__ = ('type', 'value', 'position')
+    
     def __init__(self, type_: str, value: str, position: int):
         """
         Initialize a token.
@@ -40,6 +47,22 @@ class Token:
         return f"Token({self.type}, {self.value}, {self.position})"
 
 
+class LexerError(ValueError):
+    """Raised when the input contains a character that starts no token."""
+    
+    def __init__(self, message: str, position: int):
+        """
+        Initialize a lexer error.
+        
+        Args:
+            message: The error message
+            position: The position in the input of the offending character
+        """
+        super().__init__(f"{message} at position {position}")
+        self.message = message
+        self.position = position
+
+
 class Lexer:
     """
     Lexical analyzer for the formal logic language.
@@ -82,11 +105,12 @@ class Lexer:
         ('UNKNOWN', r'.'),
     ]
     
+    # The alternation of all token patterns, compiled once for all lexers
+    TOKEN_REGEX = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_SPECS))
+    
     def __init__(self):
         """Initialize the lexer."""
-        # Compile the regex patterns
-        self.token_regex = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in self.TOKEN_SPECS)
-        self.token_regex = re.compile(self.token_regex)
+        self.token_regex = self.TOKEN_REGEX
     
     def tokenize(self, text: str) -> List[Token]:
         """
@@ -98,26 +122,31 @@ class Lexer:
         Returns:
             A list of tokens
         """
-        tokens = []
-        position = 0
+        return list(self.iter_tokens(text))
+    
+    def iter_tokens(self, text: str, offset: int = 0) -> Iterator[Token]:
+        """
+        Lazily tokenize the input text.
         
+        Args:
+            text: The input text
+            offset: The position of the start of the text in the enclosing input
+            
+        Yields:
+            The tokens of the text, in order
+            
+        Raises:
+            LexerError: If the text contains a character that starts no token
+        """
         for match in self.token_regex.finditer(text):
             token_type = match.lastgroup
-            token_value = match.group()
-            
             if token_type == 'WHITESPACE':
-                # Skip whitespace
-                position = match.end()
                 continue
             
             if token_type == 'UNKNOWN':
-                # Unknown token, raise an error
-                raise ValueError(f"Unknown token '{token_value}' at position {position}")
+                raise LexerError(f"Unknown token '{match.group()}'", offset + match.start())
             
-            tokens.append(Token(token_type, token_value, position))
-            position = match.end()
-        
-        return tokens
+            yield Token(token_type, match.group(), offset + match.start())
 
 
 class Error:
@@ -146,12 +175,25 @@ class FormalLogicParser:
     Supports higher-order logic (HOL) with extensions for modality, probability, and defeasibility.
     """
     
-    def __init__(self, type_system: TypeSystemManager):
+    # Default number of parsed formulae kept in the parse cache
+    DEFAULT_CACHE_SIZE = 10000
+    
+    # Line comment markers in formula files
+    COMMENT_PREFIXES = ('#', '//', '%')
+    
+    # Tokens that open and close a nested group
+    _OPENING = frozenset(('LPAREN', 'LBRACKET', 'LBRACE'))
+    _CLOSING = frozenset(('RPAREN', 'RBRACKET', 'RBRACE'))
+    
+    def __init__(self, type_system: TypeSystemManager, cache_size: int = DEFAULT_CACHE_SIZE,
+                 interner: Optional[ASTInterner] = None):
         """
         Initialize the parser.
         
         Args:
             type_system: The type system manager for type validation and inference
+            cache_size: The maximum number of parsed formulae to cache (0 disables caching)
+            interner: The interner that builds the AST nodes (defaults to a private interner)
         """
         self.type_system = type_system
         self.lexer = Lexer()
@@ -167,11 +209,23 @@ class FormalLogicParser:
         
         # Initialize variable environment for type checking during parsing
         self.variable_types: Dict[str, 'Type'] = {}
+        
+        # Successful parses keyed by normalized source, in LRU order. Parses
+        # depend on the declared types and signatures, so the cache is
+        # dropped whenever the type system has changed since it was filled.
+        self.cache_size = cache_size
+        self.interner = interner or ASTInterner()
+        self._parse_cache: OrderedDict = OrderedDict()
+        self._cache_generation = self._type_system_generation()
+        self.cache_stats = {"hits": 0, "misses": 0}
     
     def parse(self, expression_string: str) -> Tuple[Optional[AST_Node], List[Error]]:
         """
         Parse a logical expression.
         
+        Successful parses are cached; parsing the same formula again returns
+        the same interned AST.
+        
         Args:
             expression_string: The expression to parse
             
@@ -179,10 +233,177 @@ class FormalLogicParser:
             The AST node representing the expression, or None if parsing failed,
             and a list of errors
         """
-        self.tokens = self.lexer.tokenize(expression_string)
+        key = self._cache_key(expression_string)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached[0], list(cached[1])
+        
+        try:
+            tokens = self.lexer.tokenize(expression_string)
+        except LexerError as e:
+            self.errors = [Error(e.message, e.position)]
+            return None, self.errors
+        
+        return self._cache_store(key, *self._parse_tokens(tokens))
+    
+    def parse_stream(self, source: Union[Path, str, TextIO, Iterable[str]]
+                     ) -> Iterator[Tuple[int, Optional[AST_Node], List[Error]]]:
+        """
+        Lazily parse a sequence of formulae, one per logical line.
+        
+        A formula ends at the end of a line unless a parenthesis or bracket is
+        still open, in which case it continues on the following lines. Blank
+        lines and lines starting with a comment marker are skipped. Each line
+        is tokenized once, and formulae already in the parse cache are not
+        parsed again. A malformed formula is reported and the stream carries
+        on with the next one.
+        
+        Args:
+            source: The Path of a formula file, a string holding the formulae
+                    themselves, an open text file, or an iterable of lines
+            
+        Yields:
+            The line number on which each formula starts, its AST (None if
+            parsing failed), and the errors for that formula
+        """
+        if isinstance(source, Path):
+            with open(source, encoding="utf-8") as lines:
+                yield from self.parse_stream(lines)
+            return
+        if isinstance(source, str):
+            source = source.splitlines()
+        
+        tokens: List[Token] = []
+        texts: List[str] = []
+        start_line = 0
+        offset = 0
+        depth = 0
+        lex_error: Optional[Error] = None
+        
+        for line_number, line in enumerate(source, start=1):
+            stripped = line.strip()
+            if not texts and (not stripped or stripped.startswith(self.COMMENT_PREFIXES)):
+                continue
+            if not texts:
+                start_line = line_number
+            texts.append(stripped)
+            
+            if lex_error is None:
+                try:
+                    for token in self.lexer.iter_tokens(stripped, offset):
+                        if token.type in self._OPENING:
+                            depth += 1
+                        elif token.type in self._CLOSING:
+                            depth -= 1
+                        tokens.append(token)
+                except LexerError as e:
+                    lex_error = Error(e.message, e.position)
+            # Lines of a formula are joined by single spaces
+            offset += len(stripped) + 1
+            
+            if depth > 0 and lex_error is None:
+                continue
+            
+            if lex_error is not None:
+                yield start_line, None, [lex_error]
+            else:
+                key = self._cache_key(" ".join(texts))
+                cached = self._cache_lookup(key)
+                if cached is not None:
+                    yield start_line, cached[0], list(cached[1])
+                else:
+                    yield (start_line, *self._cache_store(key, *self._parse_tokens(tokens)))
+            tokens, texts, offset, depth, lex_error = [], [], 0, 0, None
+        
+        if texts:
+            # The input ended inside an open group
+            yield start_line, None, [Error("Unexpected end of input", offset)]
+    
+    def clear_cache(self) -> None:
+        """Forget all cached parses."""
+        self._parse_cache.clear()
+        self._cache_generation = self._type_system_generation()
+    
+    def _type_system_generation(self) -> int:
+        """Get a value that changes whenever types or signatures are registered."""
+        return self.type_system.version
+    
+    @staticmethod
+    def _cache_key(expression_string: str) -> str:
+        """
+        Get the parse cache key of an expression.
+        
+        Runs of whitespace only separate tokens, so they are collapsed, except
+        in expressions with string literals where whitespace is significant.
+        """
+        if '"' in expression_string:
+            return expression_string.strip()
+        return " ".join(expression_string.split())
+    
+    def _cache_lookup(self, key: str) -> Optional[Tuple[AST_Node, List[Error]]]:
+        """
+        Look up a parse in the cache.
+        
+        Args:
+            key: The normalized expression
+            
+        Returns:
+            The cached AST and errors, or None on a miss
+        """
+        if self.cache_size <= 0:
+            return None
+        
+        generation = self._type_system_generation()
+        if generation != self._cache_generation:
+            self._parse_cache.clear()
+            self._cache_generation = generation
+        
+        cached = self._parse_cache.get(key)
+        if cached is None:
+            self.cache_stats["misses"] += 1
+            return None
+        
+        self.cache_stats["hits"] += 1
+        self._parse_cache.move_to_end(key)
+        return cached
+    
+    def _cache_store(self, key: str, ast: Optional[AST_Node],
+                     errors: List[Error]) -> Tuple[Optional[AST_Node], List[Error]]:
+        """
+        Cache a parse if it succeeded.
+        
+        Args:
+            key: The normalized expression
+            ast: The parsed AST, or None if parsing failed
+            errors: The errors reported while parsing
+            
+        Returns:
+            The AST and the errors
+        """
+        if ast is None or self.cache_size <= 0:
+            return ast, errors
+        
+        self._parse_cache[key] = (ast, list(errors))
+        if len(self._parse_cache) > self.cache_size:
+            self._parse_cache.popitem(last=False)
+        return ast, errors
+    
+    def _parse_tokens(self, tokens: List[Token]) -> Tuple[Optional[AST_Node], List[Error]]:
+        """
+        Parse a single expression from its tokens.
+        
+        Args:
+            tokens: The tokens of the expression
+            
+        Returns:
+            The AST node representing the expression, or None if parsing failed,
+            and a list of errors
+        """
+        self.tokens = tokens
         self.current_token_index = 0
         self.errors = []
         self.var_counter = 0
+        self.variable_types = {}
         
         if not self.tokens:
             self.errors.append(Error("Empty expression", 0))
@@ -279,7 +500,7 @@ class FormalLogicParser:
             right = self.parse_unary_expression()
             
             # Create a connective node
-            expr = ConnectiveNode(connective_type, [expr, right], self.proposition_type)
+            expr = self.interner.connective(connective_type, [expr, right], self.proposition_type)
         
         return expr
     
@@ -300,7 +521,7 @@ class FormalLogicParser:
             # Negation
             self.consume_token()
             expr = self.parse_unary_expression()
-            return ConnectiveNode('NOT', [expr], self.proposition_type)
+            return self.interner.connective('NOT', [expr], self.proposition_type)
         
         if token.type in ('KNOWS', 'BELIEVES', 'POSSIBLE', 'NECESSARY'):
             # Modal operator
@@ -317,7 +538,7 @@ class FormalLogicParser:
             # Parse the proposition
             proposition = self.parse_unary_expression()
             
-            return ModalOpNode(modal_op, proposition, self.proposition_type, agent_or_world)
+            return self.interner.modal_op(modal_op, proposition, self.proposition_type, agent_or_world)
         
         if token.type == 'PROBABILITY':
             # Probability operator
@@ -338,7 +559,7 @@ class FormalLogicParser:
             
             # Create a modal operator node for probability
             metadata = {"probability": prob_value} if prob_value is not None else {}
-            return ModalOpNode('PROBABILITY', proposition, self.proposition_type, None, metadata)
+            return self.interner.modal_op('PROBABILITY', proposition, self.proposition_type, None, metadata)
         
         if token.type == 'DEFEASIBLE':
             # Defeasible operator
@@ -348,7 +569,7 @@ class FormalLogicParser:
             proposition = self.parse_unary_expression()
             
             # Create a modal operator node for defeasibility
-            return ModalOpNode('DEFEASIBLE', proposition, self.proposition_type)
+            return self.interner.modal_op('DEFEASIBLE', proposition, self.proposition_type)
         
         return self.parse_quantifier_expression()
     
@@ -393,7 +614,7 @@ class FormalLogicParser:
                     else:
                         raise ValueError("Expected type name after colon")
                 
-                var_node = VariableNode(var_name, var_id, var_type)
+                var_node = self.interner.variable(var_name, var_id, var_type)
                 bound_vars.append(var_node)
                 var_types[var_name] = var_type
             
@@ -413,7 +634,7 @@ class FormalLogicParser:
             # Restore variable environment
             self.variable_types = old_var_types
             
-            return QuantifierNode(quantifier_type, bound_vars, scope, self.proposition_type)
+            return self.interner.quantifier(quantifier_type, bound_vars, scope, self.proposition_type)
         
         return self.parse_lambda_expression()
     
@@ -457,7 +678,7 @@ class FormalLogicParser:
                     else:
                         raise ValueError("Expected type name after colon")
                 
-                var_node = VariableNode(var_name, var_id, var_type)
+                var_node = self.interner.variable(var_name, var_id, var_type)
                 bound_vars.append(var_node)
                 var_types[var_name] = var_type
             
@@ -488,7 +709,7 @@ class FormalLogicParser:
             except Exception as e:
                 self.errors.append(Error(f"Error creating lambda type: {str(e)}", token.position))
             
-            return LambdaNode(bound_vars, body, lambda_type)
+            return self.interner.lambda_(bound_vars, body, lambda_type)
         
         return self.parse_application_expression()
     
@@ -526,7 +747,7 @@ class FormalLogicParser:
             if hasattr(expr, 'type') and isinstance(expr.type, FunctionType):
                 return_type = expr.type.return_type
             
-            return ApplicationNode(expr, arguments, return_type)
+            return self.interner.application(expr, arguments, return_type)
         
         return expr
     
@@ -572,7 +793,7 @@ class FormalLogicParser:
             
             var_id = self.var_counter
             self.var_counter += 1
-            return VariableNode(var_name, var_id, var_type)
+            return self.interner.variable(var_name, var_id, var_type)
         
         if token.type == 'CONSTANT':
             # Constant
@@ -598,7 +819,7 @@ class FormalLogicParser:
             if const_name in self.type_system._signatures:
                 const_type = self.type_system._signatures[const_name]
             
-            return ConstantNode(const_name, const_type)
+            return self.interner.constant(const_name, const_type)
         
         if token.type == 'NUMBER':
             # Numeric literal
@@ -613,24 +834,24 @@ class FormalLogicParser:
                 num_value = int(value)
                 num_type = self.type_system.get_type("Integer") or self.entity_type
             
-            return ConstantNode(value, num_type, num_value)
+            return self.interner.constant(value, num_type, num_value)
         
         if token.type == 'STRING':
             # String literal
             value = token.value[1:-1]  # Remove quotes
             self.consume_token()
             string_type = self.type_system.get_type("String") or self.entity_type
-            return ConstantNode(value, string_type, value)
+            return self.interner.constant(value, string_type, value)
         
         if token.type == 'TRUE':
             # Boolean true
             self.consume_token()
-            return ConstantNode("True", self.boolean_type, True)
+            return self.interner.constant("True", self.boolean_type, True)
         
         if token.type == 'FALSE':
             # Boolean false
             self.consume_token()
-            return ConstantNode("False", self.boolean_type, False)
+            return self.interner.constant("False", self.boolean_type, False)
         
         # If we get here, we don't know how to parse this token
         raise ValueError(f"Unexpected token '{token.value}' of type '{token.type}'")
@@ -12,11 +12,13 @@ from godelOS.core_kr.knowledge_store.interface import (
     DynamicContextModel,
     CachingMemoizationLayer
 )
+from godelOS.core_kr.knowledge_store.term_index import TermIndex
 
 __all__ = [
     "KnowledgeStoreInterface",
     "KnowledgeStoreBackend",
     "InMemoryKnowledgeStore",
     "DynamicContextModel",
-    "CachingMemoizationLayer"
+    "CachingMemoizationLayer",
+    "TermIndex"
 ]
\ No newline at end of file
@@ -6,13 +6,14 @@ for storing, retrieving, updating, and deleting knowledge from the underlying
 knowledge base backend(s).
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any, DefaultDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any, DefaultDict
 import uuid
 import threading
 from collections import defaultdict
 from abc import ABC, abstractmethod
 
 from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, ApplicationNode
+from godelOS.core_kr.knowledge_store.term_index import TermIndex, variant_key
 from godelOS.core_kr.type_system.manager import TypeSystemManager
 from godelOS.core_kr.unification_engine.engine import UnificationEngine
 
@@ -62,20 +63,50 @@ class KnowledgeStoreBackend(ABC):
     """
     
     @abstractmethod
-    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None,
+                      check_subsumption: bool = False) -> bool:
         """
         Add a statement to the knowledge store.
         
+        Statements that are variants of a stored statement (equal up to
+        variable renaming) are always rejected. With ``check_subsumption``,
+        statements that unify with a stored statement are rejected as well.
+        
         Args:
             statement_ast: The statement to add
             context_id: The context to add the statement to
             metadata: Optional metadata for the statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
             
         Returns:
             True if the statement was added successfully, False otherwise
         """
         pass
     
+    def add_statements_bulk(self, statements: Iterable[AST_Node], context_id: str,
+                            metadata: Optional[Dict[str, Any]] = None,
+                            check_subsumption: bool = False) -> List[bool]:
+        """
+        Add many statements to the knowledge store.
+        
+        Backends that can load a batch more efficiently than one statement at
+        a time should override this method.
+        
+        Args:
+            statements: The statements to add
+            context_id: The context to add the statements to
+            metadata: Optional metadata applied to every statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
+            
+        Returns:
+            One result per input statement, True if it was added and False if
+            it was rejected as a duplicate
+        """
+        return [self.add_statement(statement, context_id, metadata, check_subsumption=check_subsumption)
+                for statement in statements]
+    
     @abstractmethod
     def retract_statement(self, statement_pattern_ast: AST_Node, context_id: str) -> bool:
         """
@@ -182,8 +213,15 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
         self._predicate_index: DefaultDict[str, DefaultDict[str, Set[AST_Node]]] = defaultdict(lambda: defaultdict(set))
         self._constant_index: DefaultDict[str, DefaultDict[str, Set[AST_Node]]] = defaultdict(lambda: defaultdict(set))
         self._type_index: DefaultDict[str, DefaultDict[str, Set[AST_Node]]] = defaultdict(lambda: defaultdict(set))
+        
+        # Per-context term index over predicate argument positions
+        self._term_index: DefaultDict[str, TermIndex] = defaultdict(TermIndex)
+        
+        # Per-context map from canonical variant key to stored statement
+        self._variant_index: DefaultDict[str, Dict[Tuple, AST_Node]] = defaultdict(dict)
     
-    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None,
+                      check_subsumption: bool = False) -> bool:
         """
         Add a statement to the knowledge store.
         
@@ -191,6 +229,8 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
             statement_ast: The statement to add
             context_id: The context to add the statement to
             metadata: Optional metadata for the statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
             
         Returns:
             True if the statement was added successfully, False otherwise
@@ -206,8 +246,12 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
             if metadata:
                 statement_ast = statement_ast.with_updated_metadata(metadata)
             
-            # Check if the statement already exists in the context
-            if self.statement_exists(statement_ast, [context_id]):
+            # Reject variants of stored statements with a hash lookup; fall back
+            # to unification for subsumption or statements without a variant key
+            key = variant_key(statement_ast)
+            if key is not None and key in self._variant_index[context_id]:
+                return False
+            if (check_subsumption or key is None) and self.statement_exists(statement_ast, [context_id]):
                 return False
             
             # Add the statement to the main storage
@@ -218,6 +262,64 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
             
             return True
     
+    def add_statements_bulk(self, statements: Iterable[AST_Node], context_id: str,
+                            metadata: Optional[Dict[str, Any]] = None,
+                            check_subsumption: bool = False) -> List[bool]:
+        """
+        Add many statements to the knowledge store.
+        
+        The lock is taken once for the whole batch. Duplicates are detected by
+        variant key against the context and the rest of the batch, and the
+        accepted statements are indexed in a single pass after the load.
+        
+        Args:
+            statements: The statements to add
+            context_id: The context to add the statements to
+            metadata: Optional metadata applied to every statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
+            
+        Returns:
+            One result per input statement, True if it was added and False if
+            it was rejected as a duplicate
+        """
+        with self._lock:
+            if context_id not in self._contexts:
+                raise ValueError(f"Context {context_id} does not exist")
+            
+            stored = self._statements.setdefault(context_id, set())
+            variants = self._variant_index[context_id]
+            batch_keys: Set[Tuple] = set()
+            pending: List[Tuple[AST_Node, Optional[Tuple]]] = []
+            results: List[bool] = []
+            
+            for statement_ast in statements:
+                if metadata:
+                    statement_ast = statement_ast.with_updated_metadata(metadata)
+                
+                key = variant_key(statement_ast)
+                if key is not None and (key in variants or key in batch_keys):
+                    results.append(False)
+                    continue
+                
+                if check_subsumption or key is None:
+                    # Unification only sees indexed statements, so index the
+                    # batch accepted so far before checking
+                    self._index_statements(pending, context_id)
+                    pending = []
+                    if self.statement_exists(statement_ast, [context_id]):
+                        results.append(False)
+                        continue
+                
+                if key is not None:
+                    batch_keys.add(key)
+                stored.add(statement_ast)
+                pending.append((statement_ast, key))
+                results.append(True)
+            
+            self._index_statements(pending, context_id)
+            return results
+    
     def retract_statement(self, statement_pattern_ast: AST_Node, context_id: str) -> bool:
         """
         Retract a statement from the knowledge store.
@@ -238,7 +340,7 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
             
             # Find statements matching the pattern
             matching_statements = []
-            for statement in self._statements[context_id]:
+            for statement in self._get_candidate_statements(statement_pattern_ast, context_id):
                 bindings, errors = self.unification_engine.unify(statement_pattern_ast, statement)
                 if bindings is not None:
                     matching_statements.append(statement)
@@ -321,6 +423,11 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
                 if context_id not in self._statements:
                     continue
                 
+                # A stored variant always unifies with the statement
+                key = variant_key(statement_ast)
+                if key is not None and key in self._variant_index.get(context_id, {}):
+                    return True
+                
                 # Use indexes to optimize the check if possible
                 candidate_statements = self._get_candidate_statements(statement_ast, context_id)
                 
@@ -380,6 +487,9 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
                 
                 # Delete the statements
                 del self._statements[context_id]
+            
+            self._term_index.pop(context_id, None)
+            self._variant_index.pop(context_id, None)
     
     def list_contexts(self) -> List[str]:
         """
@@ -402,6 +512,11 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
         # Index by type
         self._type_index[statement.type.name][context_id].add(statement)
         
+        # Index by variant key
+        key = variant_key(statement)
+        if key is not None:
+            self._variant_index[context_id][key] = statement
+        
         # Index ApplicationNodes by predicate name and constants
         if isinstance(statement, ApplicationNode):
             # Index by predicate name
@@ -414,6 +529,49 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
                 if isinstance(arg, ConstantNode):
                     constant_name = arg.name
                     self._constant_index[constant_name][context_id].add(statement)
+            
+            # Index by argument paths
+            self._term_index[context_id].add(statement)
+    
+    def _index_statements(self, entries: List[Tuple[AST_Node, Optional[Tuple]]], context_id: str) -> None:
+        """
+        Index a batch of statements in one pass.
+        
+        Statements are grouped per index bucket first, so each bucket is
+        looked up and updated once per batch rather than once per statement.
+        
+        Args:
+            entries: (statement, variant key) pairs to index
+            context_id: The context of the statements
+        """
+        if not entries:
+            return
+        
+        variants = self._variant_index[context_id]
+        term_index = self._term_index[context_id]
+        by_type: DefaultDict[str, List[AST_Node]] = defaultdict(list)
+        by_predicate: DefaultDict[str, List[AST_Node]] = defaultdict(list)
+        by_constant: DefaultDict[str, List[AST_Node]] = defaultdict(list)
+        
+        for statement, key in entries:
+            by_type[statement.type.name].append(statement)
+            if key is not None:
+                variants[key] = statement
+            
+            if isinstance(statement, ApplicationNode):
+                if isinstance(statement.operator, ConstantNode):
+                    by_predicate[statement.operator.name].append(statement)
+                for arg in statement.arguments:
+                    if isinstance(arg, ConstantNode):
+                        by_constant[arg.name].append(statement)
+                term_index.add(statement)
+        
+        for type_name, bucket in by_type.items():
+            self._type_index[type_name][context_id].update(bucket)
+        for predicate_name, bucket in by_predicate.items():
+            self._predicate_index[predicate_name][context_id].update(bucket)
+        for constant_name, bucket in by_constant.items():
+            self._constant_index[constant_name][context_id].update(bucket)
     
     def _remove_from_indexes(self, statement: AST_Node, context_id: str) -> None:
         """
@@ -427,6 +585,12 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
         if statement.type.name in self._type_index and context_id in self._type_index[statement.type.name]:
             self._type_index[statement.type.name][context_id].discard(statement)
         
+        # Remove from variant index
+        if context_id in self._variant_index:
+            key = variant_key(statement)
+            if key is not None and self._variant_index[context_id].get(key) is statement:
+                del self._variant_index[context_id][key]
+        
         # Remove from predicate index
         if isinstance(statement, ApplicationNode) and isinstance(statement.operator, ConstantNode):
             predicate_name = statement.operator.name
@@ -440,6 +604,10 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
                     constant_name = arg.name
                     if constant_name in self._constant_index and context_id in self._constant_index[constant_name]:
                         self._constant_index[constant_name][context_id].discard(statement)
+            
+            # Remove from term index
+            if context_id in self._term_index:
+                self._term_index[context_id].remove(statement)
     
     def _get_candidate_statements(self, pattern: AST_Node, context_id: str) -> Set[AST_Node]:
         """
@@ -458,11 +626,11 @@ class InMemoryKnowledgeStore(KnowledgeStoreBackend):
             return set()
         
         # If the pattern is an ApplicationNode with a constant predicate,
-        # use the predicate index
+        # use the term index to narrow by predicate, arity and bound arguments
         if isinstance(pattern, ApplicationNode) and isinstance(pattern.operator, ConstantNode):
-            predicate_name = pattern.operator.name
-            if predicate_name in self._predicate_index and context_id in self._predicate_index[predicate_name]:
-                return self._predicate_index[predicate_name][context_id]
+            if context_id not in self._term_index:
+                return set()
+            return self._term_index[context_id].candidates(pattern)
         
         # If the pattern has a specific type, use the type index
         if pattern.type.name in self._type_index and context_id in self._type_index[pattern.type.name]:
@@ -630,7 +798,8 @@ class KnowledgeStoreInterface:
         self._backend.create_context("HYPOTHETICAL", None, "hypothetical")
     
     def add_statement(self, statement_ast: AST_Node, context_id: str = "TRUTHS", 
-                     metadata: Optional[Dict[str, Any]] = None) -> bool:
+                     metadata: Optional[Dict[str, Any]] = None,
+                     check_subsumption: bool = False) -> bool:
         """
         Add a statement to the knowledge store.
         
@@ -638,6 +807,8 @@ class KnowledgeStoreInterface:
             statement_ast: The statement to add
             context_id: The context to add the statement to
             metadata: Optional metadata for the statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
             
         Returns:
             True if the statement was added successfully, False otherwise
@@ -648,8 +819,37 @@ class KnowledgeStoreInterface:
             # cache invalidation strategy
             self.cache_manager.clear()
         
+        if check_subsumption:
+            return self._backend.add_statement(statement_ast, context_id, metadata, check_subsumption=True)
         return self._backend.add_statement(statement_ast, context_id, metadata)
     
+    def add_statements_bulk(self, statements: Iterable[AST_Node], context_id: str = "TRUTHS",
+                            metadata: Optional[Dict[str, Any]] = None,
+                            check_subsumption: bool = False) -> List[bool]:
+        """
+        Add many statements to the knowledge store.
+        
+        This is the preferred way to load large ontologies: the backend
+        handles the batch under a single lock acquisition and builds its
+        indexes after the load.
+        
+        Args:
+            statements: The statements to add
+            context_id: The context to add the statements to
+            metadata: Optional metadata applied to every statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
+            
+        Returns:
+            One result per input statement, True if it was added and False if
+            it was rejected as a duplicate
+        """
+        if self.cache_manager:
+            self.cache_manager.clear()
+        
+        return self._backend.add_statements_bulk(statements, context_id, metadata,
+                                                 check_subsumption=check_subsumption)
+    
     def retract_statement(self, statement_pattern_ast: AST_Node, 
                          context_id: str = "TRUTHS") -> bool:
         """
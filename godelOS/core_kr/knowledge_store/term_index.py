@@ -0,0 +1,313 @@
+"""
+Term index for knowledge store pattern queries.
+
+This module implements a path index over the argument positions of
+application statements. Statements are indexed by their functor (predicate
+name and arity) and by the symbol found at each argument path, so a query
+pattern only needs to be unified against statements that agree with it on
+every argument the pattern binds.
+
+It also provides canonical variant keys, which identify statements up to
+consistent renaming of their variables and allow duplicate detection with a
+single hash lookup.
+"""
+
+import hashlib
+from typing import Dict, DefaultDict, Hashable, Iterator, List, Optional, Set, Tuple
+from collections import defaultdict
+
+from godelOS.core_kr.ast.nodes import (
+    AST_Node, ConstantNode, VariableNode, ApplicationNode, QuantifierNode,
+    ConnectiveNode, ModalOpNode, LambdaNode, DefinitionNode
+)
+
+# A functor is identified by its name and arity
+Functor = Tuple[str, int]
+
+# A path is the sequence of argument positions leading to a subterm
+Path = Tuple[int, ...]
+
+
+class TermIndex:
+    """
+    Path index for application statements.
+
+    For every indexed statement ``p(t1, ..., tn)`` the index records, for each
+    argument path up to ``max_depth``, the symbol found there: a constant name
+    or the functor of a nested application. Variables (and any other term that
+    cannot be indexed) are recorded as wildcards at their path, since they may
+    unify with anything at or below that position.
+
+    Candidate retrieval is conservative: every statement that could unify with
+    a pattern is returned, but the result may still contain statements that
+    fail unification.
+    """
+
+    def __init__(self, max_depth: int = 2):
+        """
+        Initialize the term index.
+
+        Args:
+            max_depth: The maximum argument nesting depth that is indexed
+        """
+        self.max_depth = max_depth
+
+        # functor -> all statements with that functor
+        self._functors: DefaultDict[Functor, Set[AST_Node]] = defaultdict(set)
+
+        # (functor, path, symbol) -> statements with that symbol at that path
+        self._paths: DefaultDict[Tuple[Functor, Path, Hashable], Set[AST_Node]] = defaultdict(set)
+
+        # (functor, path) -> statements with a wildcard at that path
+        self._wildcards: DefaultDict[Tuple[Functor, Path], Set[AST_Node]] = defaultdict(set)
+
+        # Applications whose operator is not a constant (e.g. higher-order variables)
+        self._unindexed: Set[AST_Node] = set()
+
+    @staticmethod
+    def functor_of(node: AST_Node) -> Optional[Functor]:
+        """
+        Get the functor of an application with a constant operator.
+
+        Args:
+            node: The node to inspect
+
+        Returns:
+            The (name, arity) pair, or None if the node has no constant functor
+        """
+        if isinstance(node, ApplicationNode) and isinstance(node.operator, ConstantNode):
+            return (node.operator.name, len(node.arguments))
+        return None
+
+    @staticmethod
+    def symbol_of(term: AST_Node) -> Optional[Hashable]:
+        """
+        Get the index symbol of a term.
+
+        Args:
+            term: The term to inspect
+
+        Returns:
+            A hashable symbol for constants and applications with a constant
+            operator, or None for wildcards
+        """
+        if isinstance(term, ConstantNode):
+            return ("c", term.name)
+        if isinstance(term, ApplicationNode) and isinstance(term.operator, ConstantNode):
+            return ("f", term.operator.name, len(term.arguments))
+        return None
+
+    def _iter_paths(self, node: ApplicationNode, prefix: Path = ()) -> Iterator[Tuple[Path, Optional[Hashable]]]:
+        """
+        Iterate over the indexed argument paths of an application.
+
+        Args:
+            node: The application to walk
+            prefix: The path of the application itself
+
+        Yields:
+            (path, symbol) pairs, where symbol is None for wildcards
+        """
+        for position, arg in enumerate(node.arguments):
+            path = prefix + (position,)
+            symbol = self.symbol_of(arg)
+            yield path, symbol
+            if (symbol is not None and isinstance(arg, ApplicationNode)
+                    and len(path) < self.max_depth):
+                yield from self._iter_paths(arg, path)
+
+    def __len__(self) -> int:
+        """Get the number of indexed statements."""
+        return sum(len(statements) for statements in self._functors.values()) + len(self._unindexed)
+
+    def add(self, statement: AST_Node) -> bool:
+        """
+        Add a statement to the index.
+
+        Args:
+            statement: The statement to add
+
+        Returns:
+            True if the statement is an application and was indexed, False otherwise
+        """
+        if not isinstance(statement, ApplicationNode):
+            return False
+
+        functor = self.functor_of(statement)
+        if functor is None:
+            self._unindexed.add(statement)
+            return True
+
+        self._functors[functor].add(statement)
+        for path, symbol in self._iter_paths(statement):
+            if symbol is None:
+                self._wildcards[(functor, path)].add(statement)
+            else:
+                self._paths[(functor, path, symbol)].add(statement)
+        return True
+
+    def remove(self, statement: AST_Node) -> None:
+        """
+        Remove a statement from the index.
+
+        Args:
+            statement: The statement to remove
+        """
+        if not isinstance(statement, ApplicationNode):
+            return
+
+        functor = self.functor_of(statement)
+        if functor is None:
+            self._unindexed.discard(statement)
+            return
+
+        self._discard(self._functors, functor, statement)
+        for path, symbol in self._iter_paths(statement):
+            if symbol is None:
+                self._discard(self._wildcards, (functor, path), statement)
+            else:
+                self._discard(self._paths, (functor, path, symbol), statement)
+
+    @staticmethod
+    def _discard(index: DefaultDict, key: Hashable, statement: AST_Node) -> None:
+        """Discard a statement from an index bucket, dropping empty buckets."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(statement)
+            if not bucket:
+                del index[key]
+
+    def candidates(self, pattern: AST_Node) -> Optional[Set[AST_Node]]:
+        """
+        Get the statements that might unify with a pattern.
+
+        Args:
+            pattern: The query pattern
+
+        Returns:
+            A set of candidate statements, or None if the pattern cannot be
+            answered from this index (it is not an application with a
+            constant operator). The returned set must not be modified.
+        """
+        functor = self.functor_of(pattern)
+        if functor is None:
+            return None
+
+        constraints = [(path, symbol) for path, symbol in self._iter_paths(pattern)
+                       if symbol is not None]
+
+        all_statements = self._functors.get(functor)
+        if not constraints:
+            if not self._unindexed:
+                return all_statements if all_statements is not None else set()
+            return (all_statements or set()) | self._unindexed
+
+        if not all_statements:
+            return set(self._unindexed)
+
+        # Each constraint admits statements with the same symbol at the path,
+        # or with a wildcard at the path or any of its prefixes
+        buckets: List[List[Set[AST_Node]]] = []
+        for path, symbol in constraints:
+            bucket = [self._paths.get((functor, path, symbol), set())]
+            for depth in range(1, len(path) + 1):
+                wildcards = self._wildcards.get((functor, path[:depth]))
+                if wildcards:
+                    bucket.append(wildcards)
+            buckets.append(bucket)
+
+        buckets.sort(key=lambda bucket: sum(len(s) for s in bucket))
+        if all(len(bucket) == 1 for bucket in buckets):
+            # No wildcards involved: a plain intersection, smallest set first
+            result = buckets[0][0].intersection(*(bucket[0] for bucket in buckets[1:]))
+        else:
+            # Enumerate the most selective constraint and filter by the others
+            seed, rest = buckets[0], buckets[1:]
+            result = set()
+            for statements in seed:
+                for statement in statements:
+                    if all(any(statement in s for s in bucket) for bucket in rest):
+                        result.add(statement)
+
+        result.update(self._unindexed)
+        return result
+
+    def clear(self) -> None:
+        """Remove all statements from the index."""
+        self._functors.clear()
+        self._paths.clear()
+        self._wildcards.clear()
+        self._unindexed.clear()
+
+
+def variant_key(node: AST_Node) -> Optional[Tuple]:
+    """
+    Get the canonical variant key of a statement.
+
+    The key is a structural fingerprint in which variables are renamed to
+    their order of first appearance, so two statements have the same key
+    exactly when they are equal up to consistent variable renaming (they are
+    variants of each other). Metadata is not part of the key; the literal
+    values of constants are.
+
+    Args:
+        node: The statement to fingerprint
+
+    Returns:
+        A hashable nested tuple, or None if the statement contains node kinds
+        or constant values that cannot be fingerprinted
+    """
+    renaming: Dict[int, int] = {}
+
+    def key(n: AST_Node) -> Tuple:
+        if isinstance(n, VariableNode):
+            index = renaming.setdefault(n.var_id, len(renaming))
+            return ("V", index, str(n.type))
+        if isinstance(n, ConstantNode):
+            if n.value is None:
+                return ("C", n.name, str(n.type))
+            # Literal values are part of node equality; unhashable ones cannot
+            # be keyed and raise TypeError here
+            hash(n.value)
+            return ("C", n.name, str(n.type), n.value)
+        if isinstance(n, ApplicationNode):
+            return ("A", key(n.operator)) + tuple(key(arg) for arg in n.arguments)
+        if isinstance(n, ConnectiveNode):
+            return ("N", n.connective_type) + tuple(key(op) for op in n.operands)
+        if isinstance(n, QuantifierNode):
+            bound = tuple(key(var) for var in n.bound_variables)
+            return ("Q", n.quantifier_type, bound, key(n.scope))
+        if isinstance(n, ModalOpNode):
+            agent = key(n.agent_or_world) if n.agent_or_world is not None else None
+            return ("M", n.modal_operator, agent, key(n.proposition))
+        if isinstance(n, LambdaNode):
+            bound = tuple(key(var) for var in n.bound_variables)
+            return ("L", bound, key(n.body))
+        if isinstance(n, DefinitionNode):
+            return ("D", n.defined_symbol_name, str(n.defined_symbol_type),
+                    key(n.definition_body_ast))
+        raise TypeError(f"Cannot fingerprint node of type {type(n).__name__}")
+
+    try:
+        return key(node)
+    except TypeError:
+        return None
+
+
+def variant_digest(node: AST_Node) -> Optional[str]:
+    """
+    Get a stable, compact digest of a statement's variant key.
+
+    Unlike the key's hash, the digest does not depend on the process, so it
+    can be stored alongside persisted statements.
+
+    Args:
+        node: The statement to fingerprint
+
+    Returns:
+        A hex digest, or None if the statement has no variant key
+    """
+    key = variant_key(node)
+    if key is None:
+        return None
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
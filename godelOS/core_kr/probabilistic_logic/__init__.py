@@ -13,11 +13,15 @@ from godelOS.core_kr.probabilistic_logic.module import (
     WeightLearningAlgorithm,
     GradientDescentWeightLearning
 )
+from godelOS.core_kr.probabilistic_logic.grounding import GroundNetwork, GroundingError, TrainingStatistics
 
 __all__ = [
     "ProbabilisticLogicModule",
     "InferenceAlgorithm",
     "MCMCInference",
     "WeightLearningAlgorithm",
-    "GradientDescentWeightLearning"
+    "GradientDescentWeightLearning",
+    "GroundNetwork",
+    "GroundingError",
+    "TrainingStatistics"
 ]
\ No newline at end of file
@@ -0,0 +1,620 @@
+"""
+Grounded Markov Logic Networks.
+
+This module compiles weighted formulas into NumPy arrays over ground atoms and
+samples worlds from the resulting Markov Logic Network with chromatic Gibbs
+sampling. Each formula is converted to clausal form once; sampling then works
+on boolean atom arrays and keeps per-clause counts of true literals up to date
+incrementally, so resampling an atom only touches the clauses it occurs in.
+TrainingStatistics tabulates the same counts for training worlds, from which
+weight learning computes its gradients.
+"""
+
+import copy
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from godelOS.core_kr.ast.nodes import AST_Node, ConnectiveNode
+
+# A literal is an (atom index, polarity) pair and a clause a set of literals
+GroundLiteral = Tuple[int, bool]
+GroundClause = FrozenSet[GroundLiteral]
+
+
+class GroundingError(ValueError):
+    """Raised when a formula cannot be compiled into clauses."""
+    pass
+
+
+class ChainState:
+    """
+    State of a batch of Gibbs sampling chains over a ground network.
+
+    Attributes:
+        worlds: Boolean array of shape (chains, atoms) holding each chain's world
+        true_literals: Number of true literals of each clause, shape (chains, clauses)
+        unsatisfied: Number of unsatisfied clauses of each formula, shape (chains, formulas)
+    """
+
+    def __init__(self, worlds: np.ndarray, true_literals: np.ndarray, unsatisfied: np.ndarray):
+        self.worlds = worlds
+        self.true_literals = true_literals
+        self.unsatisfied = unsatisfied
+
+    @property
+    def num_chains(self) -> int:
+        """Get the number of chains."""
+        return self.worlds.shape[0]
+
+
+class _ColorClass:
+    """
+    Precomputed arrays for resampling a set of atoms that share no formula.
+
+    Because no two atoms of the class occur in the same formula, every clause
+    and formula touched by the class is touched by exactly one of its atoms,
+    so the whole class can be resampled at once.
+    """
+
+    def __init__(self, network: 'GroundNetwork', atoms: List[int]):
+        # Atoms without formulas are unconstrained and sampled uniformly
+        self.free_atoms = np.array([a for a in atoms if not network.formulas_of_atom[a]], dtype=np.int64)
+        constrained = [a for a in atoms if network.formulas_of_atom[a]]
+        self.atoms = np.array(constrained, dtype=np.int64)
+
+        occurrence_atoms, occurrence_clauses, occurrence_signs = [], [], []
+        occurrence_locals = []
+        formula_starts, formulas, formula_atoms, atom_starts = [], [], [], []
+        formula_clause_starts, formula_clauses = [], []
+        for local, atom in enumerate(constrained):
+            atom_starts.append(len(formulas))
+            for formula in sorted(network.formulas_of_atom[atom]):
+                formula_starts.append(len(occurrence_clauses))
+                formulas.append(formula)
+                formula_atoms.append(local)
+                formula_clause_starts.append(len(formula_clauses))
+                for clause in network.formula_clauses[formula]:
+                    formula_clauses.append(clause)
+                    sign = network.atom_sign_in_clause(atom, clause)
+                    if sign is None:
+                        continue
+                    occurrence_atoms.append(atom)
+                    occurrence_locals.append(local)
+                    occurrence_clauses.append(clause)
+                    occurrence_signs.append(sign)
+
+        self.occurrence_atoms = np.array(occurrence_atoms, dtype=np.int64)
+        self.occurrence_locals = np.array(occurrence_locals, dtype=np.int64)
+        self.occurrence_clauses = np.array(occurrence_clauses, dtype=np.int64)
+        self.occurrence_signs = np.array(occurrence_signs, dtype=bool)
+        self.formula_starts = np.array(formula_starts, dtype=np.int64)
+        self.formulas = np.array(formulas, dtype=np.int64)
+        self.formula_atoms = np.array(formula_atoms, dtype=np.int64)
+        self.atom_starts = np.array(atom_starts, dtype=np.int64)
+        self.formula_clause_starts = np.array(formula_clause_starts, dtype=np.int64)
+        self.formula_clauses = np.array(formula_clauses, dtype=np.int64)
+
+
+class GroundNetwork:
+    """
+    A Markov Logic Network compiled into arrays over ground atoms.
+
+    Every weighted formula is converted to a conjunction of clauses over its
+    atoms, the maximal subformulas that are not connectives. A world assigns a
+    truth value to each atom; its energy is the sum over formulas of ``-w`` if
+    the formula holds and ``+w`` otherwise, so P(world) is proportional to
+    ``exp(-energy)``.
+    """
+
+    # Formulas whose clausal form would exceed this many clauses are rejected
+    MAX_CLAUSES_PER_FORMULA = 4096
+
+    def __init__(self, weighted_formulas: Dict[AST_Node, float], extra_atoms: Iterable[AST_Node] = ()):
+        """
+        Ground a set of weighted formulas.
+
+        Args:
+            weighted_formulas: The formulas and their weights
+            extra_atoms: Atoms to include even if no formula mentions them,
+                e.g. those of a query
+
+        Raises:
+            GroundingError: If a formula's clausal form is too large
+        """
+        self.atoms: List[AST_Node] = []
+        self.atom_index: Dict[AST_Node, int] = {}
+
+        # Clause table, shared between formulas that produce the same clause
+        clause_ids: Dict[GroundClause, int] = {}
+        self.clauses: List[GroundClause] = []
+
+        self.formulas: List[AST_Node] = []
+        self.formula_clauses: List[List[int]] = []
+        weights = []
+        for formula, weight in weighted_formulas.items():
+            clause_list = []
+            for clause in self.clausify(formula):
+                clause_id = clause_ids.get(clause)
+                if clause_id is None:
+                    clause_id = clause_ids[clause] = len(self.clauses)
+                    self.clauses.append(clause)
+                clause_list.append(clause_id)
+            self.formulas.append(formula)
+            self.formula_clauses.append(clause_list)
+            weights.append(weight)
+        for atom in extra_atoms:
+            self.atom_id(atom)
+        self.weights = np.array(weights, dtype=np.float64)
+
+        num_atoms = len(self.atoms)
+        self.formulas_of_atom: List[Set[int]] = [set() for _ in range(num_atoms)]
+        self._clause_signs: List[Dict[int, bool]] = [dict(clause) for clause in self.clauses]
+        for formula_id, clause_list in enumerate(self.formula_clauses):
+            for clause_id in clause_list:
+                for atom, _ in self.clauses[clause_id]:
+                    self.formulas_of_atom[atom].add(formula_id)
+
+        # Flat clause-literal arrays, grouped by clause
+        literal_atoms, literal_signs, clause_starts = [], [], []
+        for clause in self.clauses:
+            clause_starts.append(len(literal_atoms))
+            for atom, sign in sorted(clause):
+                literal_atoms.append(atom)
+                literal_signs.append(sign)
+        self.literal_atoms = np.array(literal_atoms, dtype=np.int64)
+        self.literal_signs = np.array(literal_signs, dtype=bool)
+        self.clause_starts = np.array(clause_starts, dtype=np.int64)
+
+        # Flat formula-clause arrays, grouped by formula; formulas without
+        # clauses are tautologies and always hold
+        self._clausal_formulas = np.array([f for f, c in enumerate(self.formula_clauses) if c], dtype=np.int64)
+        flat, starts = [], []
+        for formula_id in self._clausal_formulas:
+            starts.append(len(flat))
+            flat.extend(self.formula_clauses[formula_id])
+        self._formula_clause_flat = np.array(flat, dtype=np.int64)
+        self._formula_clause_starts = np.array(starts, dtype=np.int64)
+
+        self.color_classes = [_ColorClass(self, atoms) for atoms in self._color_atoms()]
+
+    @staticmethod
+    def atoms_of(formula: AST_Node) -> List[AST_Node]:
+        """Get the atoms of a formula, its maximal subformulas that are not connectives."""
+        if isinstance(formula, ConnectiveNode):
+            return [atom for operand in formula.operands for atom in GroundNetwork.atoms_of(operand)]
+        return [formula]
+
+    @property
+    def num_atoms(self) -> int:
+        """Get the number of ground atoms."""
+        return len(self.atoms)
+
+    def atom_id(self, atom: AST_Node) -> int:
+        """Get the index of an atom, adding it if it is new."""
+        index = self.atom_index.get(atom)
+        if index is None:
+            index = self.atom_index[atom] = len(self.atoms)
+            self.atoms.append(atom)
+        return index
+
+    def with_atoms(self, atoms: Iterable[AST_Node]) -> 'GroundNetwork':
+        """
+        Get a network that also contains the given atoms.
+
+        Atoms not yet in the network occur in no formula, so they are appended
+        as unconstrained atoms to a copy that shares the compiled formulas and
+        clauses with this network. The network itself is left unchanged.
+
+        Args:
+            atoms: The atoms to include, e.g. those of a query
+
+        Returns:
+            This network if it already contains every atom, otherwise the copy
+        """
+        new_atoms = [atom for atom in dict.fromkeys(atoms) if atom not in self.atom_index]
+        if not new_atoms:
+            return self
+
+        network = copy.copy(self)
+        network.atoms = list(self.atoms)
+        network.atom_index = dict(self.atom_index)
+        network.formulas_of_atom = list(self.formulas_of_atom)
+        for atom in new_atoms:
+            network.atom_id(atom)
+            network.formulas_of_atom.append(set())
+        network.color_classes = self.color_classes + [
+            _ColorClass(network, list(range(self.num_atoms, network.num_atoms)))
+        ]
+        return network
+
+    def atom_sign_in_clause(self, atom: int, clause: int) -> Optional[bool]:
+        """Get the polarity with which an atom occurs in a clause, or None."""
+        return self._clause_signs[clause].get(atom)
+
+    def clausify(self, formula: AST_Node, positive: bool = True) -> List[GroundClause]:
+        """
+        Convert a formula into clauses over this network's atoms.
+
+        Args:
+            formula: The formula to convert
+            positive: False to convert the negation of the formula
+
+        Returns:
+            The clauses, without tautologies or duplicates; an empty list
+            means the formula always holds
+
+        Raises:
+            GroundingError: If the clausal form is too large
+        """
+        if not isinstance(formula, ConnectiveNode):
+            return [frozenset([(self.atom_id(formula), positive)])]
+
+        kind = formula.connective_type
+        operands = formula.operands
+        if kind == "NOT":
+            return self.clausify(operands[0], not positive)
+        if kind in ("AND", "OR"):
+            if (kind == "AND") == positive:
+                return self._conjoin(self.clausify(operand, positive) for operand in operands)
+            return self._distribute([self.clausify(operand, positive) for operand in operands])
+        if kind == "IMPLIES":
+            antecedent, consequent = operands
+            if positive:
+                return self._distribute([self.clausify(antecedent, False), self.clausify(consequent, True)])
+            return self._conjoin([self.clausify(antecedent, True), self.clausify(consequent, False)])
+        if kind == "EQUIV":
+            left, right = operands
+            if positive:
+                return self._conjoin([
+                    self._distribute([self.clausify(left, False), self.clausify(right, True)]),
+                    self._distribute([self.clausify(left, True), self.clausify(right, False)]),
+                ])
+            return self._conjoin([
+                self._distribute([self.clausify(left, True), self.clausify(right, True)]),
+                self._distribute([self.clausify(left, False), self.clausify(right, False)]),
+            ])
+        raise GroundingError(f"Unsupported connective: {kind}")
+
+    def _conjoin(self, clause_lists: Iterable[List[GroundClause]]) -> List[GroundClause]:
+        """Conjoin clause lists, dropping duplicate clauses."""
+        result = list(dict.fromkeys(clause for clauses in clause_lists for clause in clauses))
+        if len(result) > self.MAX_CLAUSES_PER_FORMULA:
+            raise GroundingError("Formula is too large to ground")
+        return result
+
+    def _distribute(self, clause_lists: List[List[GroundClause]]) -> List[GroundClause]:
+        """Disjoin clause lists by distributing disjunction over conjunction."""
+        result: List[GroundClause] = [frozenset()]
+        for clauses in clause_lists:
+            if not clauses:
+                # A tautology makes the whole disjunction hold
+                return []
+            combined = {}
+            for left in result:
+                for right in clauses:
+                    clause = left | right
+                    if not any((atom, not sign) in clause for atom, sign in right):
+                        combined[clause] = None
+            if len(combined) > self.MAX_CLAUSES_PER_FORMULA:
+                raise GroundingError("Formula is too large to ground")
+            result = list(combined)
+            if not result:
+                return []
+        return result
+
+    def _color_atoms(self) -> List[List[int]]:
+        """
+        Partition the atoms so that no two atoms in a class share a formula.
+
+        Uses greedy coloring of the atoms' co-occurrence graph, most connected
+        atoms first.
+        """
+        neighbors: List[Set[int]] = [set() for _ in range(self.num_atoms)]
+        for clause_list in self.formula_clauses:
+            formula_atoms = {atom for clause_id in clause_list for atom, _ in self.clauses[clause_id]}
+            for atom in formula_atoms:
+                neighbors[atom].update(formula_atoms)
+        colors: Dict[int, int] = {}
+        classes: List[List[int]] = []
+        for atom in sorted(range(self.num_atoms), key=lambda a: -len(neighbors[a])):
+            used = {colors[n] for n in neighbors[atom] if n in colors}
+            color = next(c for c in range(len(classes) + 1) if c not in used)
+            if color == len(classes):
+                classes.append([])
+            classes[color].append(atom)
+            colors[atom] = color
+        return classes
+
+    def clause_truth(self, worlds: np.ndarray, literal_atoms: np.ndarray, literal_signs: np.ndarray,
+                     clause_starts: np.ndarray) -> np.ndarray:
+        """
+        Count the true literals of clauses in a batch of worlds.
+
+        Args:
+            worlds: Boolean array of shape (chains, atoms)
+            literal_atoms: Atom of each literal, grouped by clause
+            literal_signs: Polarity of each literal
+            clause_starts: Offset of each clause's first literal
+
+        Returns:
+            Integer array of shape (chains, clauses)
+        """
+        if not len(clause_starts):
+            return np.zeros((worlds.shape[0], 0), dtype=np.int64)
+        true_literals = (worlds[:, literal_atoms] == literal_signs).astype(np.int64)
+        return np.add.reduceat(true_literals, clause_starts, axis=1)
+
+    def compile_query(self, formula: AST_Node) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compile a formula over this network's atoms for evaluation.
+
+        Args:
+            formula: The formula, whose atoms must already be in the network
+
+        Returns:
+            The (literal atoms, literal signs, clause starts) arrays of its clauses
+        """
+        atom_count = self.num_atoms
+        clauses = self.clausify(formula)
+        if self.num_atoms != atom_count:
+            raise GroundingError("Query mentions atoms that are not in the network")
+        literal_atoms, literal_signs, starts = [], [], []
+        for clause in clauses:
+            starts.append(len(literal_atoms))
+            for atom, sign in sorted(clause):
+                literal_atoms.append(atom)
+                literal_signs.append(sign)
+        return (np.array(literal_atoms, dtype=np.int64), np.array(literal_signs, dtype=bool),
+                np.array(starts, dtype=np.int64))
+
+    def evaluate(self, compiled_query: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                 worlds: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a compiled formula in a batch of worlds.
+
+        Args:
+            compiled_query: The result of ``compile_query``
+            worlds: Boolean array of shape (chains, atoms)
+
+        Returns:
+            Boolean array with the formula's truth value in each world
+        """
+        counts = self.clause_truth(worlds, *compiled_query)
+        return np.all(counts > 0, axis=1)
+
+    def formula_truth(self, state: ChainState) -> np.ndarray:
+        """Get the truth value of every formula in each chain's world, shape (chains, formulas)."""
+        holds = np.ones((state.num_chains, len(self.formulas)), dtype=bool)
+        holds[:, self._clausal_formulas] = state.unsatisfied[:, self._clausal_formulas] == 0
+        return holds
+
+    def energy(self, state: ChainState) -> np.ndarray:
+        """Get the energy of each chain's world."""
+        return (self.weights * np.where(self.formula_truth(state), -1.0, 1.0)).sum(axis=1)
+
+    def state_for(self, worlds: np.ndarray) -> ChainState:
+        """
+        Create a chain state holding the given worlds.
+
+        Args:
+            worlds: Boolean array of shape (chains, atoms); it is not copied
+
+        Returns:
+            The chain state with its clause and formula counts
+        """
+        true_literals = self.clause_truth(worlds, self.literal_atoms, self.literal_signs, self.clause_starts)
+        unsatisfied = np.zeros((worlds.shape[0], len(self.formulas)), dtype=np.int64)
+        if len(self._clausal_formulas):
+            unsatisfied[:, self._clausal_formulas] = np.add.reduceat(
+                (true_literals[:, self._formula_clause_flat] == 0).astype(np.int64),
+                self._formula_clause_starts, axis=1)
+        return ChainState(worlds, true_literals, unsatisfied)
+
+    def initial_state(self, num_chains: int, evidence: Dict[int, bool],
+                      rng: np.random.Generator) -> ChainState:
+        """
+        Create chains with random worlds consistent with the evidence.
+
+        Args:
+            num_chains: The number of chains
+            evidence: Fixed truth values by atom index
+            rng: The random number generator
+
+        Returns:
+            The initial chain state
+        """
+        worlds = rng.random((num_chains, self.num_atoms)) < 0.5
+        if evidence:
+            atoms = np.fromiter(evidence.keys(), dtype=np.int64, count=len(evidence))
+            worlds[:, atoms] = np.fromiter(evidence.values(), dtype=bool, count=len(evidence))
+        return self.state_for(worlds)
+
+    def sweep(self, state: ChainState, evidence_mask: np.ndarray, rng: np.random.Generator,
+              temperature: float = 1.0) -> None:
+        """
+        Resample every non-evidence atom once in every chain.
+
+        Args:
+            state: The chains to update in place
+            evidence_mask: Boolean array marking the atoms fixed by evidence
+            rng: The random number generator
+            temperature: Divides energy differences; 1.0 samples the network's
+                distribution, lower values concentrate on low-energy worlds
+        """
+        worlds = state.worlds
+        for color in self.color_classes:
+            if len(color.free_atoms):
+                free = color.free_atoms[~evidence_mask[color.free_atoms]]
+                worlds[:, free] = rng.random((state.num_chains, len(free))) < 0.5
+            if not len(color.atoms):
+                continue
+            self._resample(color, state, evidence_mask, rng, temperature)
+
+    def flip_effects(self, color: _ColorClass, state: ChainState) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the truth of the formulas of a color class's atoms under either value.
+
+        Args:
+            color: The color class
+            state: The chains
+
+        Returns:
+            The true-literal counts of the occurring clauses not counting the
+            class's atoms, and boolean arrays of shape (chains, len(color.formulas))
+            telling whether each formula holds with its atom set to True and
+            to False
+        """
+        signs = color.occurrence_signs
+        literal_true = state.worlds[:, color.occurrence_atoms] == signs
+        counts = state.true_literals[:, color.occurrence_clauses]
+        others = counts - literal_true
+
+        # Truth of each occurring clause with the atom set to True or False
+        unsat_if_true = (others + signs) == 0
+        unsat_if_false = (others + ~signs) == 0
+
+        # Unsatisfied clauses of each formula that do not contain the atom
+        unsat_elsewhere = (state.unsatisfied[:, color.formulas]
+                           - np.add.reduceat((counts == 0).astype(np.int64), color.formula_starts, axis=1))
+        holds_if_true = (unsat_elsewhere == 0) & (
+            np.add.reduceat(unsat_if_true.astype(np.int64), color.formula_starts, axis=1) == 0)
+        holds_if_false = (unsat_elsewhere == 0) & (
+            np.add.reduceat(unsat_if_false.astype(np.int64), color.formula_starts, axis=1) == 0)
+        return others, holds_if_true, holds_if_false
+
+    def _resample(self, color: _ColorClass, state: ChainState, evidence_mask: np.ndarray,
+                  rng: np.random.Generator, temperature: float) -> None:
+        """Resample the constrained atoms of one color class."""
+        worlds = state.worlds
+        others, holds_if_true, holds_if_false = self.flip_effects(color, state)
+
+        # Energy(atom True) - Energy(atom False), summed over the atom's formulas
+        weights = self.weights[color.formulas]
+        delta = np.add.reduceat(2.0 * weights * (holds_if_false.astype(np.float64) - holds_if_true),
+                                color.atom_starts, axis=1)
+        with np.errstate(over="ignore"):
+            prob_true = 1.0 / (1.0 + np.exp(delta / temperature))
+        values = rng.random(prob_true.shape) < prob_true
+
+        fixed = evidence_mask[color.atoms]
+        if fixed.any():
+            values[:, fixed] = worlds[:, color.atoms[fixed]]
+        worlds[:, color.atoms] = values
+
+        # Update the clause and formula counts touched by this class
+        new_literal_true = values[:, color.occurrence_locals] == color.occurrence_signs
+        state.true_literals[:, color.occurrence_clauses] = others + new_literal_true
+        state.unsatisfied[:, color.formulas] = np.add.reduceat(
+            (state.true_literals[:, color.formula_clauses] == 0).astype(np.int64),
+            color.formula_clause_starts, axis=1)
+
+    def evidence_mask(self, evidence: Dict[int, bool]) -> np.ndarray:
+        """Get the boolean mask of the atoms fixed by evidence."""
+        mask = np.zeros(self.num_atoms, dtype=bool)
+        if evidence:
+            mask[list(evidence)] = True
+        return mask
+
+
+
+class TrainingStatistics:
+    """
+    Sufficient statistics of training worlds for learning a network's weights.
+
+    For each world the table holds the truth value of every formula, and for
+    each atom the energy change per unit weight that flipping it would cause
+    in each of its formulas. That is all the likelihood and pseudo-likelihood
+    gradients need, so no formula is evaluated again while learning. Worlds
+    are keyed by their true atoms, so each distinct world is processed once
+    and its statistics are reused across epochs and learning runs.
+    """
+
+    def __init__(self, network: GroundNetwork):
+        """
+        Initialize an empty table.
+
+        Args:
+            network: The network whose weights are being learned
+        """
+        self.network = network
+        self._rows: Dict[FrozenSet[int], int] = {}
+        self.worlds = np.zeros((0, network.num_atoms), dtype=bool)
+        self.formula_counts = np.zeros((0, len(network.formulas)), dtype=np.float64)
+
+        # Per color class: 2 * (holds if False - holds if True) for each of the
+        # class's (atom, formula) pairs, shape (worlds, len(color.formulas))
+        self._flip_coefficients = [np.zeros((0, len(color.formulas)), dtype=np.int8)
+                                   for color in network.color_classes]
+
+    def __len__(self) -> int:
+        """Get the number of distinct worlds in the table."""
+        return len(self._rows)
+
+    def add_worlds(self, worlds: Iterable[Iterable[AST_Node]]) -> np.ndarray:
+        """
+        Add training worlds to the table, computing statistics for new ones.
+
+        Args:
+            worlds: For each world, the atoms that are true in it; all other
+                atoms are false, and atoms outside the network are ignored
+
+        Returns:
+            The row of each given world in the table
+        """
+        atom_index = self.network.atom_index
+        rows, new_keys = [], []
+        for world in worlds:
+            key = frozenset(atom_index[atom] for atom in world if atom in atom_index)
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = len(self._rows)
+                new_keys.append(key)
+            rows.append(row)
+
+        if new_keys:
+            matrix = np.zeros((len(new_keys), self.network.num_atoms), dtype=bool)
+            for i, key in enumerate(new_keys):
+                matrix[i, list(key)] = True
+            state = self.network.state_for(matrix)
+            self.worlds = np.vstack([self.worlds, matrix])
+            self.formula_counts = np.vstack([self.formula_counts,
+                                             self.network.formula_truth(state).astype(np.float64)])
+            for i, color in enumerate(self.network.color_classes):
+                if not len(color.atoms):
+                    continue
+                _, holds_if_true, holds_if_false = self.network.flip_effects(color, state)
+                coefficients = 2 * (holds_if_false.astype(np.int8) - holds_if_true.astype(np.int8))
+                self._flip_coefficients[i] = np.vstack([self._flip_coefficients[i], coefficients])
+        return np.array(rows, dtype=np.int64)
+
+    def pseudo_log_likelihood(self, weights: np.ndarray, rows: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Compute the pseudo-log-likelihood of some worlds and its gradient.
+
+        The pseudo-log-likelihood of a world sums, over its atoms, the log
+        probability of the atom's value given the values of all other atoms.
+
+        Args:
+            weights: The formula weights
+            rows: The rows of the worlds to score
+
+        Returns:
+            The total pseudo-log-likelihood and its gradient with respect to
+            the weights
+        """
+        total = 0.0
+        gradient = np.zeros(len(self.network.formulas), dtype=np.float64)
+        for i, color in enumerate(self.network.color_classes):
+            if not len(color.atoms):
+                continue
+            coefficients = self._flip_coefficients[i][rows].astype(np.float64)
+            # Energy(atom True) - Energy(atom False) in each world
+            delta = np.add.reduceat(coefficients * weights[color.formulas], color.atom_starts, axis=1)
+            # log P(actual value) = -log(1 + exp(sign * delta)), sign +1 for True
+            signed = np.where(self.worlds[rows][:, color.atoms], delta, -delta)
+            total -= np.logaddexp(0.0, signed).sum()
+            slope = -np.where(self.worlds[rows][:, color.atoms], 1.0, -1.0) / (1.0 + np.exp(-signed))
+            per_pair = slope[:, color.formula_atoms] * coefficients
+            gradient += np.bincount(color.formulas, weights=per_pair.sum(axis=0), minlength=len(gradient))
+        return total, gradient
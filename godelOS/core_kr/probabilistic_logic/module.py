@@ -9,14 +9,21 @@ including Markov Logic Networks (MLNs) and Probabilistic Soft Logic (PSL).
 
 from typing import Dict, List, Optional, Set, Tuple, Any, Union, DefaultDict, Callable
 import random
-import math
+import time
 import numpy as np
 from collections import defaultdict
 import logging
 
-from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, ApplicationNode
+# SciPy is only needed by the "lbfgs" weight learning optimizer
+try:
+    from scipy.optimize import minimize
+except ImportError:
+    minimize = None
+
+from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, ApplicationNode, ConnectiveNode
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
 from godelOS.core_kr.unification_engine.engine import UnificationEngine
+from godelOS.core_kr.probabilistic_logic.grounding import GroundNetwork, TrainingStatistics
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -77,11 +84,18 @@ class MCMCInference(InferenceAlgorithm):
     """
     Markov Chain Monte Carlo (MCMC) inference algorithm for probabilistic reasoning.
     
-    This class implements MCMC-based inference algorithms such as Gibbs sampling
-    and Metropolis-Hastings for calculating marginal probabilities and finding
-    MAP assignments in Markov Logic Networks.
+    This class grounds the module's weighted formulas into a GroundNetwork and
+    runs chromatic Gibbs sampling over it to calculate marginal probabilities,
+    and simulated annealing to find MAP assignments. Several chains can be run
+    at once as a batch.
+    
+    Evidence on atoms fixes their truth values. Evidence on compound formulas
+    is added to the network as a formula with weight ``evidence_weight``.
     """
     
+    # Annealing temperatures are not lowered below this
+    MIN_TEMPERATURE = 1e-3
+    
     def calculate_marginal_probability(self, query_ast: AST_Node,
                                       evidence_asts: Set[Tuple[AST_Node, bool]],
                                       params: Optional[Dict[str, Any]] = None) -> float:
@@ -92,6 +106,12 @@ class MCMCInference(InferenceAlgorithm):
             query_ast: The query formula
             evidence_asts: Set of (formula, truth_value) pairs representing evidence
             params: Optional parameters for the inference algorithm
+                - num_samples: Number of sweeps per chain (default: 1000)
+                - burn_in: Number of burn-in sweeps (default: 100)
+                - sample_interval: Interval between counted sweeps (default: 10)
+                - num_chains: Number of chains sampled as a batch (default: 1)
+                - evidence_weight: Weight of compound evidence formulas (default: 10.0)
+                - seed: Seed for the random number generator
             
         Returns:
             The marginal probability of the query formula
@@ -99,42 +119,27 @@ class MCMCInference(InferenceAlgorithm):
         params = params or {}
         num_samples = params.get("num_samples", 1000)
         burn_in = params.get("burn_in", 100)
-        sample_interval = params.get("sample_interval", 10)
-        
-        # Get all weighted formulas
-        weighted_formulas = {}
-        for context_id, formulas in self.module._weighted_formulas.items():
-            weighted_formulas.update(formulas)
+        sample_interval = max(1, params.get("sample_interval", 10))
+        num_chains = params.get("num_chains", 1)
+        rng = np.random.default_rng(params.get("seed"))
         
-        # Initialize a random world
-        world = {}
-        
-        # Set evidence
-        for formula, truth_value in evidence_asts:
-            world[formula] = truth_value
-        
-        # Initialize query variables randomly
-        if query_ast not in world:
-            world[query_ast] = random.random() < 0.5
+        network, evidence = self._ground([query_ast], evidence_asts, params)
+        query = network.compile_query(query_ast)
+        evidence_mask = network.evidence_mask(evidence)
+        state = network.initial_state(num_chains, evidence, rng)
         
         # Run burn-in
         for _ in range(burn_in):
-            self._sample_world(world, weighted_formulas, evidence_asts)
+            network.sweep(state, evidence_mask, rng)
         
-        # Run MCMC
+        # Run MCMC, counting every sample_interval sweeps
         count = 0
         total_samples = 0
-        
         for i in range(num_samples):
-            # Sample a new world
-            self._sample_world(world, weighted_formulas, evidence_asts)
-            
-            # Only count every sample_interval samples
+            network.sweep(state, evidence_mask, rng)
             if i % sample_interval == 0:
-                # Check if the query is true in the world
-                if self.module._evaluate_formula(query_ast, world):
-                    count += 1
-                total_samples += 1
+                count += int(network.evaluate(query, state.worlds).sum())
+                total_samples += num_chains
         
         return count / total_samples if total_samples > 0 else 0.5
     
@@ -148,6 +153,11 @@ class MCMCInference(InferenceAlgorithm):
             query_variables_asts: The variables to find assignments for
             evidence_asts: Set of (formula, truth_value) pairs representing evidence
             params: Optional parameters for the inference algorithm
+                - max_iterations: Number of annealing sweeps (default: 1000)
+                - initial_temperature: Initial temperature (default: 10.0)
+                - cooling_rate: Temperature multiplier per sweep (default: 0.95)
+                - num_chains: Number of chains annealed as a batch (default: 1)
+                - seed: Seed for the random number generator
             
         Returns:
             A dictionary mapping variables to their MAP assignments
@@ -156,99 +166,68 @@ class MCMCInference(InferenceAlgorithm):
         max_iterations = params.get("max_iterations", 1000)
         initial_temperature = params.get("initial_temperature", 10.0)
         cooling_rate = params.get("cooling_rate", 0.95)
+        num_chains = params.get("num_chains", 1)
+        rng = np.random.default_rng(params.get("seed"))
         
-        # Get all weighted formulas
-        weighted_formulas = {}
-        for context_id, formulas in self.module._weighted_formulas.items():
-            weighted_formulas.update(formulas)
-        
-        # Initialize a random world
-        world = {}
+        network, evidence = self._ground(query_variables_asts, evidence_asts, params)
+        evidence_mask = network.evidence_mask(evidence)
+        state = network.initial_state(num_chains, evidence, rng)
         
-        # Set evidence
-        for formula, truth_value in evidence_asts:
-            world[formula] = truth_value
-        
-        # Initialize query variables randomly
-        for var in query_variables_asts:
-            if var not in world:  # Don't override evidence
-                world[var] = random.random() < 0.5
-        
-        # Calculate initial energy
-        current_energy = self.module._calculate_energy(world, weighted_formulas)
-        
-        # Best solution so far
-        best_world = world.copy()
-        best_energy = current_energy
+        # Best solution so far, over all chains
+        energies = network.energy(state)
+        best = int(np.argmin(energies))
+        best_world = state.worlds[best].copy()
+        best_energy = energies[best]
         
         # Run simulated annealing
         temperature = initial_temperature
-        
-        for iteration in range(max_iterations):
-            # Pick a random query variable
-            var = random.choice(query_variables_asts)
-            
-            # Skip if it's part of the evidence
-            if any(formula == var for formula, _ in evidence_asts):
-                continue
-            
-            # Flip its value
-            world[var] = not world[var]
-            
-            # Calculate the new energy
-            new_energy = self.module._calculate_energy(world, weighted_formulas)
-            
-            # Decide whether to accept the new state
-            delta_energy = new_energy - current_energy
-            
-            if delta_energy <= 0 or random.random() < math.exp(-delta_energy / temperature):
-                # Accept the new state
-                current_energy = new_energy
-                
-                # Update best solution if needed
-                if current_energy < best_energy:
-                    best_world = world.copy()
-                    best_energy = current_energy
-            else:
-                # Reject the new state, revert the flip
-                world[var] = not world[var]
+        for _ in range(max_iterations):
+            network.sweep(state, evidence_mask, rng, temperature=max(temperature, self.MIN_TEMPERATURE))
+            energies = network.energy(state)
+            chain = int(np.argmin(energies))
+            if energies[chain] < best_energy:
+                best_world = state.worlds[chain].copy()
+                best_energy = energies[chain]
             
             # Cool down
             temperature *= cooling_rate
         
         # Return the MAP assignment for the query variables
-        return {var: best_world[var] for var in query_variables_asts}
+        best_worlds = best_world[np.newaxis, :]
+        return {var: bool(network.evaluate(network.compile_query(var), best_worlds)[0])
+                for var in query_variables_asts}
     
-    def _sample_world(self, world: Dict[AST_Node, bool],
-                     weighted_formulas: Dict[AST_Node, float],
-                     evidence_asts: Set[Tuple[AST_Node, bool]]) -> None:
+    def _ground(self, query_asts: List[AST_Node], evidence_asts: Set[Tuple[AST_Node, bool]],
+                params: Dict[str, Any]) -> Tuple[GroundNetwork, Dict[int, bool]]:
         """
-        Sample a new world using Gibbs sampling.
+        Ground the module's formulas together with a query and its evidence.
         
         Args:
-            world: The current world state
-            weighted_formulas: The weighted formulas
+            query_asts: The query formulas, whose atoms are added to the network
             evidence_asts: Set of (formula, truth_value) pairs representing evidence
+            params: The inference parameters
+            
+        Returns:
+            The ground network and the evidence as truth values by atom index
         """
-        # Create a set of evidence formulas for quick lookup
-        evidence_formulas = {formula for formula, _ in evidence_asts}
+        evidence_weight = params.get("evidence_weight", 10.0)
+        atomic_evidence = {}
+        evidence_formulas = {}
+        for formula, truth_value in evidence_asts:
+            if isinstance(formula, ConnectiveNode):
+                if not truth_value:
+                    formula = ConnectiveNode("NOT", [formula], formula.type)
+                evidence_formulas[formula] = evidence_weight
+            else:
+                atomic_evidence[formula] = truth_value
         
-        # For each non-evidence variable, sample a new value
-        for formula in weighted_formulas:
-            if formula in evidence_formulas:
-                continue
-            
-            # Calculate the energy for the formula being true
-            world[formula] = True
-            energy_true = self.module._calculate_energy(world, weighted_formulas)
-            
-            # Calculate the energy for the formula being false
-            world[formula] = False
-            energy_false = self.module._calculate_energy(world, weighted_formulas)
-            
-            # Sample a new value based on the energies
-            prob_true = 1 / (1 + math.exp(energy_true - energy_false))
-            world[formula] = random.random() < prob_true
+        extra_atoms = set(atomic_evidence)
+        for query_ast in query_asts:
+            extra_atoms.update(GroundNetwork.atoms_of(query_ast))
+        
+        network = self.module.ground_network(evidence_formulas, extra_atoms)
+        evidence = {network.atom_index[atom]: truth_value for atom, truth_value in atomic_evidence.items()}
+        return network, evidence
 
 
 class WeightLearningAlgorithm:
@@ -289,10 +268,34 @@ class GradientDescentWeightLearning(WeightLearningAlgorithm):
     """
     Gradient descent algorithm for learning weights in probabilistic logic models.
     
-    This class implements gradient descent for learning weights in Markov Logic
-    Networks and other probabilistic logic models.
+    The formula skeletons are grounded once into a GroundNetwork and the
+    training worlds into a TrainingStatistics table of formula counts, which
+    is cached and only extended with worlds it has not seen. Two optimizers
+    are available:
+    
+    - "minibatch" (default): stochastic gradient ascent on the likelihood,
+      with expected counts taken from persistent batched Gibbs chains that
+      advance a few sweeps per mini-batch (persistent contrastive divergence)
+    - "lbfgs": L-BFGS on the pseudo-log-likelihood, whose value and gradient
+      come from the table alone
+    
+    The wall-clock time of each epoch is kept in ``epoch_timings``.
     """
     
+    OPTIMIZERS = ("minibatch", "lbfgs")
+    
+    def __init__(self, module: 'ProbabilisticLogicModule'):
+        """
+        Initialize the weight learning algorithm.
+        
+        Args:
+            module: The probabilistic logic module that will use this algorithm
+        """
+        super().__init__(module)
+        self.epoch_timings: List[float] = []
+        # Statistics table for the most recently used formula skeletons
+        self._statistics_cache: Optional[Tuple[Tuple[AST_Node, ...], TrainingStatistics]] = None
+    
     def learn_weights(self, training_database_context_id: str,
                      formula_skeletons_context_id: str,
                      params: Optional[Dict[str, Any]] = None) -> Dict[AST_Node, float]:
@@ -303,14 +306,31 @@ class GradientDescentWeightLearning(WeightLearningAlgorithm):
             training_database_context_id: The context ID of the training database
             formula_skeletons_context_id: The context ID of the formula skeletons
             params: Optional parameters for the learning algorithm
+                - learning_rate: Step size of the minibatch optimizer (default: 0.1)
+                - max_iterations: Maximum number of epochs (default: 100)
+                - regularization: L2 regularization parameter (default: 0.01)
+                - optimizer: "minibatch" or "lbfgs" (default: "minibatch")
+                - batch_size: Training worlds per mini-batch (default: all)
+                - num_chains: Gibbs chains estimating expected counts (default: 32)
+                - sweeps_per_iteration: Gibbs sweeps per mini-batch (default: 1)
+                - seed: Seed for the random number generator (default: None)
             
         Returns:
             A dictionary mapping formulas to their learned weights
+            
+        Raises:
+            ValueError: If the optimizer is unknown
+            ImportError: If the "lbfgs" optimizer is requested and SciPy is not installed
         """
         params = params or {}
         learning_rate = params.get("learning_rate", 0.1)
         max_iterations = params.get("max_iterations", 100)
         regularization = params.get("regularization", 0.01)
+        optimizer = params.get("optimizer", "minibatch")
+        if optimizer not in self.OPTIMIZERS:
+            raise ValueError(f"Unknown optimizer {optimizer!r}, expected one of {self.OPTIMIZERS}")
+        if optimizer == "lbfgs" and minimize is None:
+            raise ImportError("The lbfgs optimizer requires SciPy; install scipy or use the minibatch optimizer")
         
         # Get the formula skeletons
         formula_skeletons = list(self.module._weighted_formulas.get(formula_skeletons_context_id, {}).keys())
@@ -326,138 +346,144 @@ class GradientDescentWeightLearning(WeightLearningAlgorithm):
             logger.warning(f"No training data found in context {training_database_context_id}")
             return {}
         
-        # Initialize weights
-        weights = {formula: 0.0 for formula in formula_skeletons}
+        statistics = self._statistics_for(formula_skeletons)
+        rows = statistics.add_worlds([stmt for stmt, truth in world.items() if truth] for world in training_data)
         
-        # Run gradient descent
-        for iteration in range(max_iterations):
-            # Calculate the gradient
-            gradient = self._calculate_gradient(weights, formula_skeletons, training_data, regularization)
-            
-            # Update weights
-            for formula in formula_skeletons:
-                weights[formula] += learning_rate * gradient.get(formula, 0.0)
-            
-            # Log progress
-            if iteration % 10 == 0:
-                logger.info(f"Iteration {iteration}, weights: {weights}")
+        self.epoch_timings = []
+        if optimizer == "lbfgs":
+            weights = self._learn_lbfgs(statistics, rows, max_iterations, regularization)
+        else:
+            weights = self._learn_minibatch(statistics, rows, learning_rate, max_iterations,
+                                            regularization, params)
         
-        return weights
+        return {formula: float(weight) for formula, weight in zip(formula_skeletons, weights)}
     
-    def _get_training_data(self, training_database_context_id: str) -> List[Dict[AST_Node, bool]]:
+    def _statistics_for(self, formula_skeletons: List[AST_Node]) -> TrainingStatistics:
         """
-        Get the training data from the knowledge store.
+        Get the statistics table for a set of formula skeletons.
         
         Args:
-            training_database_context_id: The context ID of the training database
+            formula_skeletons: The formula skeletons
             
         Returns:
-            A list of worlds (dictionaries mapping formulas to truth values)
+            The cached table if the skeletons are unchanged, otherwise a new one
         """
-        # This is a simplified implementation
-        # In a real implementation, we would query the knowledge store for the training data
-        
-        # Get all statements in the training database context
-        query_result = self.module.ksi.query_statements_match_pattern(
-            AST_Node(self.module.ksi.type_system.get_type("Entity")),  # A generic pattern that matches anything
-            [training_database_context_id]
-        )
-        
-        # Convert the query result to a list of worlds
-        worlds = []
-        
-        # Group statements by their metadata to identify separate worlds
-        world_groups = defaultdict(list)
-        
-        for binding in query_result:
-            for var, node in binding.items():
-                # Use a world_id from metadata if available, otherwise create a new world
-                world_id = node.metadata.get("world_id", len(world_groups))
-                world_groups[world_id].append((node, True))  # Assume all statements are true
+        key = tuple(formula_skeletons)
+        if self._statistics_cache is None or self._statistics_cache[0] != key:
+            network = GroundNetwork({formula: 0.0 for formula in formula_skeletons})
+            self._statistics_cache = (key, TrainingStatistics(network))
+        return self._statistics_cache[1]
+    
+    def _learn_minibatch(self, statistics: TrainingStatistics, rows: np.ndarray, learning_rate: float,
+                         max_iterations: int, regularization: float, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Maximize the likelihood by stochastic gradient ascent.
         
-        # Convert each group to a world
-        for world_id, statements in world_groups.items():
-            world = {stmt: truth for stmt, truth in statements}
-            worlds.append(world)
+        Args:
+            statistics: The statistics table
+            rows: The table rows of the training worlds
+            learning_rate: The step size
+            max_iterations: The number of epochs
+            regularization: The L2 regularization parameter
+            params: The learning parameters, for the sampler settings
+            
+        Returns:
+            The learned weights
+        """
+        network = statistics.network
+        batch_size = params.get("batch_size") or len(rows)
+        num_chains = params.get("num_chains", 32)
+        sweeps = params.get("sweeps_per_iteration", 1)
+        rng = np.random.default_rng(params.get("seed"))
+        
+        weights = np.zeros(len(network.formulas))
+        network.weights = weights
+        no_evidence = np.zeros(network.num_atoms, dtype=bool)
+        state = network.initial_state(num_chains, {}, rng)
+        
+        for epoch in range(max_iterations):
+            start = time.perf_counter()
+            order = rng.permutation(rows) if batch_size < len(rows) else rows
+            for batch_start in range(0, len(rows), batch_size):
+                batch = order[batch_start:batch_start + batch_size]
+                for _ in range(sweeps):
+                    network.sweep(state, no_evidence, rng)
+                
+                # d/dw log P(world) = E_data[+-1 per formula] - E_model[+-1 per formula]
+                empirical = statistics.formula_counts[batch].mean(axis=0)
+                expected = network.formula_truth(state).mean(axis=0)
+                gradient = 2.0 * (empirical - expected) - regularization * weights
+                weights += learning_rate * gradient
+            self._record_epoch(epoch, start, weights)
         
-        return worlds
+        return weights
     
-    def _calculate_gradient(self, weights: Dict[AST_Node, float],
-                           formula_skeletons: List[AST_Node],
-                           training_data: List[Dict[AST_Node, bool]],
-                           regularization: float) -> Dict[AST_Node, float]:
+    def _learn_lbfgs(self, statistics: TrainingStatistics, rows: np.ndarray, max_iterations: int,
+                     regularization: float) -> np.ndarray:
         """
-        Calculate the gradient for weight learning.
+        Maximize the pseudo-log-likelihood with L-BFGS.
         
         Args:
-            weights: The current weights
-            formula_skeletons: The formula skeletons
-            training_data: The training data
-            regularization: The regularization parameter
+            statistics: The statistics table
+            rows: The table rows of the training worlds
+            max_iterations: The maximum number of L-BFGS iterations
+            regularization: The L2 regularization parameter
             
         Returns:
-            A dictionary mapping formulas to their gradients
+            The learned weights
         """
-        gradient = {formula: 0.0 for formula in formula_skeletons}
+        def objective(weights: np.ndarray) -> Tuple[float, np.ndarray]:
+            value, gradient = statistics.pseudo_log_likelihood(weights, rows)
+            return (-value / len(rows) + 0.5 * regularization * weights @ weights,
+                    -gradient / len(rows) + regularization * weights)
         
-        # For each formula, calculate the gradient
-        for formula in formula_skeletons:
-            # Empirical count: how often the formula is true in the training data
-            empirical_count = 0.0
-            for world in training_data:
-                if self.module._evaluate_formula(formula, world):
-                    empirical_count += 1
-            empirical_count /= len(training_data) if training_data else 1.0
-            
-            # Expected count: expected number of times the formula is true according to the model
-            expected_count = 0.0
-            num_samples = 100  # Use a smaller number of samples for efficiency
-            for _ in range(num_samples):
-                # Sample a world from the model
-                sampled_world = {}
-                for f in formula_skeletons:
-                    # Calculate the energy for the formula being true
-                    sampled_world[f] = True
-                    energy_true = self._calculate_energy_with_weights(sampled_world, weights)
-                    
-                    # Calculate the energy for the formula being false
-                    sampled_world[f] = False
-                    energy_false = self._calculate_energy_with_weights(sampled_world, weights)
-                    
-                    # Sample a value based on the energies
-                    prob_true = 1 / (1 + math.exp(energy_true - energy_false))
-                    sampled_world[f] = random.random() < prob_true
-                
-                if self.module._evaluate_formula(formula, sampled_world):
-                    expected_count += 1
-            expected_count /= num_samples
-            
-            # Gradient is the difference between empirical and expected counts, minus regularization
-            gradient[formula] = empirical_count - expected_count - regularization * weights[formula]
+        epoch_start = [time.perf_counter()]
+        
+        def callback(weights: np.ndarray) -> None:
+            self._record_epoch(len(self.epoch_timings), epoch_start[0], weights)
+            epoch_start[0] = time.perf_counter()
         
-        return gradient
+        result = minimize(objective, np.zeros(len(statistics.network.formulas)), jac=True,
+                          method="L-BFGS-B", callback=callback, options={"maxiter": max_iterations})
+        return result.x
+    
+    def _record_epoch(self, epoch: int, start: float, weights: np.ndarray) -> None:
+        """Record an epoch's duration and periodically log progress."""
+        self.epoch_timings.append(time.perf_counter() - start)
+        if epoch % 10 == 0:
+            logger.info(f"Epoch {epoch} took {self.epoch_timings[-1] * 1000:.1f}ms, weights: {weights}")
     
-    def _calculate_energy_with_weights(self, world: Dict[AST_Node, bool],
-                                      weights: Dict[AST_Node, float]) -> float:
+    def _get_training_data(self, training_database_context_id: str) -> List[Dict[AST_Node, bool]]:
         """
-        Calculate the energy of a world using the given weights.
+        Get the training data from the knowledge store.
+        
+        Statements are grouped into worlds by the "world_id" in their metadata;
+        statements without one together form a single world. Every statement of
+        a world is true and, under the closed-world assumption, every other atom
+        is false.
         
         Args:
-            world: The world state
-            weights: The weights for formulas
+            training_database_context_id: The context ID of the training database
             
         Returns:
-            The energy of the world
+            A list of worlds (dictionaries mapping formulas to truth values)
         """
-        energy = 0.0
-        for formula, weight in weights.items():
-            if formula in world:
-                if world[formula]:
-                    energy -= weight
-                else:
-                    energy += weight
+        # A Boolean variable matches every statement in the context
+        statement_var = VariableNode("?statement", 1, self.module.ksi.type_system.get_type("Boolean"))
+        query_result = self.module.ksi.query_statements_match_pattern(
+            statement_var, [training_database_context_id], variables_to_bind=[statement_var]
+        )
         
-        return energy
+        # Group statements by their metadata to identify separate worlds
+        world_groups = defaultdict(dict)
+        
+        for binding in query_result:
+            for var, node in binding.items():
+                world_id = node.metadata.get("world_id")
+                # Strip the metadata so statements compare equal to the formulas' atoms
+                world_groups[world_id][node.with_updated_metadata({})] = True
+        
+        return list(world_groups.values())
 
 
 class ProbabilisticLogicModule:
@@ -489,6 +515,11 @@ class ProbabilisticLogicModule:
         # In-memory store for weighted formulas
         self._weighted_formulas: Dict[str, Dict[AST_Node, float]] = {}
         
+        # Bumped whenever a weighted formula is added, to invalidate the most
+        # recently built ground network
+        self._formulas_version = 0
+        self._ground_network_cache: Optional[Tuple[Any, GroundNetwork]] = None
+        
         # Create a default context for probabilistic rules
         try:
             self.ksi.create_context("PROBABILISTIC_RULES", context_type="probabilistic")
@@ -538,6 +569,7 @@ class ProbabilisticLogicModule:
             self._weighted_formulas[context_id] = {}
         
         self._weighted_formulas[context_id][formula_ast] = weight
+        self._formulas_version += 1
         
         # Add to knowledge store with weight as metadata
         metadata = {"weight": weight, "type": "weighted_formula"}
@@ -545,6 +577,37 @@ class ProbabilisticLogicModule:
         
         logger.info(f"Added weighted formula to {context_id} with weight {weight}")
     
+    def ground_network(self, extra_formulas: Optional[Dict[AST_Node, float]] = None,
+                       extra_atoms: Optional[Set[AST_Node]] = None) -> GroundNetwork:
+        """
+        Ground the weighted formulas of all contexts into a network.
+        
+        The network of the weighted formulas and extra formulas is cached and
+        reused while they stay the same; the extra atoms are added on top of
+        it, so queries over different atoms share the grounding.
+        
+        Args:
+            extra_formulas: Additional weighted formulas, e.g. compound evidence
+            extra_atoms: Additional atoms, e.g. those of a query
+            
+        Returns:
+            The ground network
+        """
+        extra_formulas = extra_formulas or {}
+        extra_atoms = extra_atoms or set()
+        key = (self._formulas_version, frozenset(extra_formulas.items()))
+        if self._ground_network_cache is not None and self._ground_network_cache[0] == key:
+            return self._ground_network_cache[1].with_atoms(extra_atoms)
+        
+        weighted_formulas = {}
+        for context_id, formulas in self._weighted_formulas.items():
+            weighted_formulas.update(formulas)
+        weighted_formulas.update(extra_formulas)
+        
+        network = GroundNetwork(weighted_formulas)
+        self._ground_network_cache = (key, network)
+        return network.with_atoms(extra_atoms)
+    
     def _context_exists(self, context_id: str) -> bool:
         """
         Check if a context exists in the knowledge store.
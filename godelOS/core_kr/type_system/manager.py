@@ -3,9 +3,15 @@ Type System Manager implementation.
 
 This module defines the TypeSystemManager class, which is responsible for
 managing the type hierarchy, type signatures, and type checking/inference.
+
+The atomic type hierarchy is compiled into a lattice of ancestor bitsets:
+every atomic type gets a bit, and its bitset holds the bits of all its
+supertypes. Supertypes must exist before their subtypes, so defining a type
+extends the lattice in constant time and subtype checks are a bitwise test.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Union, Any
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union, Any
 import networkx as nx
 
 from godelOS.core_kr.ast.nodes import AST_Node
@@ -24,6 +30,9 @@ class TypeSystemManager:
     Manages the type hierarchy, type signatures, and type checking/inference.
     """
     
+    # Maximum number of memoized unification and inference results
+    MAX_MEMO_ENTRIES = 65536
+    
     def __init__(self):
         """Initialize the type system manager with base types and hierarchy."""
         # Type registry: name -> Type
@@ -33,9 +42,29 @@ class TypeSystemManager:
         # edges represent subtyping (is_a)
         self._type_hierarchy = nx.DiGraph()
         
+        # Compiled lattice of the hierarchy, keyed by atomic type name: the
+        # type's own bit, and the bits of the type and all its supertypes
+        self._type_bits: Dict[str, int] = {}
+        self._ancestor_bits: Dict[str, int] = {}
+        
         # Signature table: symbol_name -> FunctionType or AtomicType
         self._signatures: Dict[str, Type] = {}
         
+        # Incremented on every type or signature registration, so that
+        # clients caching results derived from the declarations can tell
+        # when they are stale
+        self.version = 0
+        
+        # Memoized unification and inference results in LRU order. Inference
+        # depends on the declared types and signatures, so its memo is
+        # cleared whenever one is added.
+        self._unify_memo: OrderedDict = OrderedDict()
+        self._infer_memo: OrderedDict = OrderedDict()
+        self.memo_stats = {
+            "unify": {"hits": 0, "misses": 0},
+            "infer": {"hits": 0, "misses": 0},
+        }
+        
         # Initialize with base types
         self._initialize_base_types()
     
@@ -67,21 +96,28 @@ class TypeSystemManager:
         if type_name in self._types:
             raise ValueError(f"Type {type_name} already defined")
         
+        # Validate the supertypes before registering anything
+        supertypes = supertypes or []
+        for supertype_name in supertypes:
+            if supertype_name not in self._types:
+                raise ValueError(f"Supertype {supertype_name} not defined")
+            if not isinstance(self._types[supertype_name], AtomicType):
+                raise ValueError(f"Supertype {supertype_name} is not an atomic type")
+        
         atomic_type = AtomicType(type_name)
         self._types[type_name] = atomic_type
         self._type_hierarchy.add_node(atomic_type)
         
-        # Add edges for subtyping relationships
-        if supertypes:
-            for supertype_name in supertypes:
-                if supertype_name not in self._types:
-                    raise ValueError(f"Supertype {supertype_name} not defined")
-                
-                supertype = self._types[supertype_name]
-                if not isinstance(supertype, AtomicType):
-                    raise ValueError(f"Supertype {supertype_name} is not an atomic type")
-                
-                self._type_hierarchy.add_edge(atomic_type, supertype)
+        # Extend the lattice: the new type's ancestors are itself and the
+        # ancestors of its direct supertypes
+        bit = 1 << len(self._type_bits)
+        ancestors = bit
+        for supertype_name in supertypes:
+            ancestors |= self._ancestor_bits[supertype_name]
+            self._type_hierarchy.add_edge(atomic_type, self._types[supertype_name])
+        self._type_bits[type_name] = bit
+        self._ancestor_bits[type_name] = ancestors
+        self._declarations_changed()
         
         return atomic_type
     
@@ -110,6 +146,7 @@ class TypeSystemManager:
         
         function_type = FunctionType(arg_types, return_type)
         self._signatures[symbol_name] = function_type
+        self._declarations_changed()
     
     def get_type(self, type_name: str) -> Optional[Type]:
         """
@@ -127,6 +164,10 @@ class TypeSystemManager:
         """
         Check if a type is a subtype of another type.
         
+        Types may be given by name. Checks between atomic types are answered
+        from the compiled lattice; an atomic type that was never defined is
+        only a subtype of itself.
+        
         Args:
             subtype: The potential subtype
             supertype: The potential supertype
@@ -134,41 +175,47 @@ class TypeSystemManager:
         Returns:
             True if subtype is a subtype of supertype, False otherwise
         """
-        # Handle string types by converting them to Type objects
+        # Atomic types and type names are looked up in the lattice by name
+        subtype_name = self._atomic_type_name(subtype)
+        supertype_name = self._atomic_type_name(supertype)
+        if subtype_name is not None and supertype_name is not None:
+            if subtype_name == supertype_name:
+                return True
+            return self._ancestor_bits.get(subtype_name, 0) & self._type_bits.get(supertype_name, 0) != 0
+        
+        # Resolve names of undefined types to fresh atomic types, without
+        # registering them
         if isinstance(subtype, str):
-            subtype_obj = self.get_type(subtype)
-            if subtype_obj is None:
-                # If the type doesn't exist, create a new atomic type
-                subtype_obj = AtomicType(subtype)
-                # Register the new type
-                self._types[subtype] = subtype_obj
-                # Add it to the type hierarchy graph
-                self._type_hierarchy.add_node(subtype_obj)
-            subtype = subtype_obj
-            
+            subtype = self.get_type(subtype) or AtomicType(subtype)
         if isinstance(supertype, str):
-            supertype_obj = self.get_type(supertype)
-            if supertype_obj is None:
-                # If the type doesn't exist, create a new atomic type
-                supertype_obj = AtomicType(supertype)
-                # Register the new type
-                self._types[supertype] = supertype_obj
-                # Add it to the type hierarchy graph
-                self._type_hierarchy.add_node(supertype_obj)
-            supertype = supertype_obj
-            
+            supertype = self.get_type(supertype) or AtomicType(supertype)
+        
         # If both types are the same, they are subtypes of each other
-            
         if subtype == supertype:
             return True
         
-        if isinstance(subtype, AtomicType) and isinstance(supertype, AtomicType):
-            # Check if there's a path in the type hierarchy graph
-            return nx.has_path(self._type_hierarchy, subtype, supertype)
-        
         # For other type combinations, delegate to the is_subtype_of method
         return subtype.is_subtype_of(supertype, self)
     
+    def _atomic_type_name(self, type_ref: Union[Type, str]) -> Optional[str]:
+        """
+        Get the name of an atomic type, or of a type name that is not bound
+        to a non-atomic type.
+        
+        Args:
+            type_ref: A type or type name
+            
+        Returns:
+            The atomic type name, or None for other types
+        """
+        if isinstance(type_ref, AtomicType):
+            return type_ref.name
+        if isinstance(type_ref, str):
+            registered = self._types.get(type_ref)
+            if registered is None or isinstance(registered, AtomicType):
+                return type_ref
+        return None
+    
     def check_expression_type(self, ast_node: AST_Node, expected_type: Type,
                               environment: TypeEnvironment) -> List[Error]:
         """
@@ -191,6 +238,9 @@ class TypeSystemManager:
         """
         Infer the type of an expression.
         
+        Results are memoized by expression and by the variable bindings
+        visible in the environment.
+        
         Args:
             ast_node: The AST node representing the expression
             environment: The type environment
@@ -198,14 +248,93 @@ class TypeSystemManager:
         Returns:
             The inferred type and a list of errors
         """
+        key = (ast_node, self._environment_key(environment))
+        stats = self.memo_stats["infer"]
+        cached = self._infer_memo.get(key)
+        if cached is not None:
+            stats["hits"] += 1
+            self._infer_memo.move_to_end(key)
+            return cached[0], list(cached[1])
+        stats["misses"] += 1
+        
         # Use the type inference visitor to infer the expression type
         visitor = TypeInferenceVisitor(self, environment)
-        return ast_node.accept(visitor)
+        inferred_type, errors = ast_node.accept(visitor)
+        self._memoize(self._infer_memo, key, (inferred_type, list(errors)))
+        return inferred_type, errors
     
     def unify_types(self, type1: Type, type2: Type) -> Optional[Dict[TypeVariable, Type]]:
         """
         Unify two types, producing a substitution that makes them equal.
         
+        Results are memoized by the pair of types.
+        
+        Args:
+            type1: The first type
+            type2: The second type
+            
+        Returns:
+            A substitution mapping type variables to types, or None if unification fails
+        """
+        key = (type1, type2)
+        stats = self.memo_stats["unify"]
+        if key in self._unify_memo:
+            stats["hits"] += 1
+            self._unify_memo.move_to_end(key)
+            substitution = self._unify_memo[key]
+        else:
+            stats["misses"] += 1
+            substitution = self._unify(type1, type2)
+            self._memoize(self._unify_memo, key, substitution)
+        
+        # Callers may extend the substitution, so hand out a copy
+        return dict(substitution) if substitution is not None else None
+    
+    def get_memo_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statistics about the unification and inference memos.
+        
+        Returns:
+            For "unify" and "infer", a dictionary with the number of memoized
+            results, hits, misses and hit rate
+        """
+        statistics = {}
+        for name, memo in (("unify", self._unify_memo), ("infer", self._infer_memo)):
+            hits, misses = self.memo_stats[name]["hits"], self.memo_stats[name]["misses"]
+            total = hits + misses
+            statistics[name] = {
+                "size": len(memo),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / total if total > 0 else 0.0,
+            }
+        return statistics
+    
+    def _declarations_changed(self) -> None:
+        """Invalidate results that depend on the declared types and signatures."""
+        self._infer_memo.clear()
+        self.version += 1
+    
+    def _memoize(self, memo: OrderedDict, key: Tuple, value: Any) -> None:
+        """Store a result in an LRU memo, evicting the oldest entry if it is full."""
+        memo[key] = value
+        if len(memo) > self.MAX_MEMO_ENTRIES:
+            memo.popitem(last=False)
+    
+    @staticmethod
+    def _environment_key(environment: TypeEnvironment) -> FrozenSet[Tuple[int, Type]]:
+        """Get the variable bindings visible in an environment, innermost first."""
+        bindings: Dict[int, Type] = {}
+        while environment is not None:
+            for var_id, type_obj in environment._bindings.items():
+                bindings.setdefault(var_id, type_obj)
+            environment = environment._parent
+        return frozenset(bindings.items())
+    
+    def _unify(self, type1: Type, type2: Type) -> Optional[Dict[TypeVariable, Type]]:
+        """
+        Unify two types without consulting the memo.
+        
         Args:
             type1: The first type
             type2: The second type
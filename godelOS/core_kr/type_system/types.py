@@ -40,6 +40,17 @@ class Type(ABC):
             A new type with the substitutions applied
         """
         pass
+    
+    def __getstate__(self) -> Dict[str, object]:
+        # Cached hashes are derived from salted string hashes, so they must
+        # not travel with pickled or copied types
+        state = self.__dict__.copy()
+        state.pop('_hash', None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._hash = None
 
 
 class AtomicType(Type):
@@ -57,6 +68,7 @@ class AtomicType(Type):
             name: The name of the type
         """
         self._name = name
+        self._hash = None
     
     @property
     def name(self) -> str:
@@ -107,7 +119,9 @@ class AtomicType(Type):
         return self._name == other._name
     
     def __hash__(self) -> int:
-        return hash(("AtomicType", self._name))
+        if self._hash is None:
+            self._hash = hash(("AtomicType", self._name))
+        return self._hash
     
     def __str__(self) -> str:
         return self._name
@@ -133,6 +147,7 @@ class FunctionType(Type):
         """
         self._arg_types = tuple(arg_types)  # Make immutable
         self._return_type = return_type
+        self._hash = None
     
     @property
     def arg_types(self) -> tuple:
@@ -203,7 +218,9 @@ class FunctionType(Type):
                 self._return_type == other._return_type)
     
     def __hash__(self) -> int:
-        return hash(("FunctionType", self._arg_types, self._return_type))
+        if self._hash is None:
+            self._hash = hash(("FunctionType", self._arg_types, self._return_type))
+        return self._hash
     
     def __str__(self) -> str:
         args_str = ", ".join(str(arg_type) for arg_type in self._arg_types)
@@ -397,6 +414,7 @@ class InstantiatedParametricType(ParametricType):
         
         self._constructor = constructor
         self._actual_type_args = tuple(actual_type_args)  # Make immutable
+        self._hash = None
     
     @property
     def constructor(self) -> ParametricTypeConstructor:
@@ -468,7 +486,9 @@ class InstantiatedParametricType(ParametricType):
                 self._actual_type_args == other._actual_type_args)
     
     def __hash__(self) -> int:
-        return hash(("InstantiatedParametricType", self._constructor, self._actual_type_args))
+        if self._hash is None:
+            self._hash = hash(("InstantiatedParametricType", self._constructor, self._actual_type_args))
+        return self._hash
     
     def __str__(self) -> str:
         args_str = ", ".join(str(arg) for arg in self._actual_type_args)
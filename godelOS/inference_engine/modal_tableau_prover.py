@@ -4,12 +4,16 @@ Modal Tableau Prover for Modal Logics.
 This module implements the ModalTableauProver class, which determines the validity
 or satisfiability of formulae in various modal logics (e.g., K, T, D, B, S4, S5)
 using the semantic tableau method.
+
+Each world indexes the sign of every formula it contains, so a clash is detected
+the moment the offending formula is added instead of by rescanning the branch.
+The two branches produced by a split share their worlds and pending work, and a
+world is only copied when one of the branches writes to it.
 """
 
 from typing import Dict, List, Optional, Set, Tuple, Any, FrozenSet
 import time
 import logging
-import copy
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -62,6 +66,19 @@ class SignedFormula:
     def negate(self) -> 'SignedFormula':
         """Return a new signed formula with the opposite sign."""
         return SignedFormula(self.formula, not self.sign)
+    
+    def strip_negations(self) -> 'SignedFormula':
+        """
+        Return the equivalent signed formula without leading negations.
+        
+        T: ¬A is equivalent to F: A, so each negation removed flips the sign.
+        """
+        formula, sign = self.formula, self.sign
+        while isinstance(formula, ConnectiveNode) and formula.connective_type == "NOT":
+            formula, sign = formula.operands[0], not sign
+        if formula is self.formula:
+            return self
+        return SignedFormula(formula, sign)
 
 
 @dataclass
@@ -70,20 +87,50 @@ class World:
     Represents a possible world in a Kripke model.
     
     Each world has a unique ID and a set of formulas that hold in that world.
+    The world also keeps a literal table mapping every formula, with its leading
+    negations stripped, to its sign, so that a contradiction is recorded the
+    moment its second half is added.
     """
     world_id: int
     formulas: Set[SignedFormula] = field(default_factory=set)
+    parent_id: Optional[int] = None  # The world whose diamond formula created this one
+    literals: Dict[AST_Node, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+    necessities: List[SignedFormula] = field(default_factory=list, init=False, repr=False, compare=False)
+    clash: Optional[Tuple[SignedFormula, SignedFormula]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        formulas, self.formulas = self.formulas, set()
+        for formula in formulas:
+            self.add_formula(formula)
     
     def __str__(self) -> str:
         return f"World {self.world_id}: {{{', '.join(str(f) for f in self.formulas)}}}"
     
-    def add_formula(self, formula: SignedFormula) -> None:
-        """Add a formula to this world."""
+    def add_formula(self, formula: SignedFormula) -> bool:
+        """
+        Add a formula to this world.
+        
+        Returns:
+            True if the formula needs expanding, False if an equivalent formula
+            is already present or the formula contradicts one
+        """
+        if formula in self.formulas:
+            return False
         self.formulas.add(formula)
+        
+        stripped = formula.strip_negations()
+        sign = self.literals.get(stripped.formula)
+        if sign is None:
+            self.literals[stripped.formula] = stripped.sign
+            return True
+        if sign != stripped.sign and self.clash is None:
+            self.clash = (stripped.negate(), stripped)
+        return False
     
     def contains_formula(self, formula: SignedFormula) -> bool:
-        """Check if this world contains the given formula."""
-        return formula in self.formulas
+        """Check if this world contains the given formula or an equivalent one."""
+        stripped = formula.strip_negations()
+        return self.literals.get(stripped.formula) == stripped.sign
     
     def contains_contradiction(self) -> bool:
         """
@@ -91,13 +138,19 @@ class World:
         
         A contradiction occurs when a formula and its negation both hold in the same world.
         """
-        for formula in self.formulas:
-            if formula.negate() in self.formulas:
-                return True
-        return False
+        return self.clash is not None
+    
+    def copy(self) -> 'World':
+        """Return a copy of this world that can be modified independently."""
+        world = World(self.world_id, parent_id=self.parent_id)
+        world.formulas = set(self.formulas)
+        world.literals = dict(self.literals)
+        world.necessities = list(self.necessities)
+        world.clash = self.clash
+        return world
 
 
-@dataclass
+@dataclass(frozen=True)
 class AccessibilityRelation:
     """
     Represents an accessibility relation between worlds in a Kripke model.
@@ -111,16 +164,31 @@ class AccessibilityRelation:
         return f"{self.from_world_id} → {self.to_world_id}"
 
 
+# A persistent stack of (world ID, signed formula) pairs, stored as nested
+# (top, rest) tuples so that both branches of a split can share it
+Agenda = Optional[Tuple[Tuple[int, SignedFormula], Any]]
+
+
 @dataclass
 class Branch:
     """
     Represents a branch in a tableau.
     
-    A branch consists of a set of worlds and accessibility relations between them.
+    A branch consists of a set of worlds and accessibility relations between them,
+    together with the formulas still waiting to be expanded. Pending formulas
+    are kept on three persistent stacks: the agenda of newly added formulas,
+    the disjunctive formulas waiting to split the branch, and the diamond
+    formulas waiting for a witness world.
     """
     worlds: Dict[int, World] = field(default_factory=dict)
-    accessibility_relations: Set[AccessibilityRelation] = field(default_factory=set)
+    successors: Dict[int, FrozenSet[int]] = field(default_factory=dict)
     closed: bool = False
+    depth: int = 0  # The number of splits between the root and this branch
+    agenda: Agenda = field(default=None, repr=False, compare=False)
+    splits: Agenda = field(default=None, repr=False, compare=False)
+    witnesses: Agenda = field(default=None, repr=False, compare=False)
+    # IDs of the worlds this branch does not share with any other branch
+    _owned: Set[int] = field(default_factory=set, repr=False, compare=False)
     
     def __str__(self) -> str:
         worlds_str = "\n  ".join(str(w) for w in self.worlds.values())
@@ -128,47 +196,100 @@ class Branch:
         status = "CLOSED" if self.closed else "OPEN"
         return f"Branch ({status}):\n  {worlds_str}\n  Relations: {relations_str}"
     
+    @property
+    def accessibility_relations(self) -> Set[AccessibilityRelation]:
+        """Get the accessibility relations of this branch."""
+        return {
+            AccessibilityRelation(from_world_id, to_world_id)
+            for from_world_id, to_world_ids in self.successors.items()
+            for to_world_id in to_world_ids
+        }
+    
     def add_world(self, world: World) -> None:
-        """Add a world to this branch."""
+        """Add a world to this branch and schedule its formulas for expansion."""
         self.worlds[world.world_id] = world
+        self._owned.add(world.world_id)
+        for formula in world.formulas:
+            self.agenda = ((world.world_id, formula), self.agenda)
+        if world.clash is not None:
+            self.closed = True
+    
+    def writable_world(self, world_id: int) -> World:
+        """Get a world of this branch, copying it first if it is shared."""
+        if world_id not in self._owned:
+            self.worlds[world_id] = self.worlds[world_id].copy()
+            self._owned.add(world_id)
+        return self.worlds[world_id]
     
-    def add_accessibility_relation(self, relation: AccessibilityRelation) -> None:
-        """Add an accessibility relation to this branch."""
-        self.accessibility_relations.add(relation)
+    def add_formula(self, world_id: int, formula: SignedFormula) -> bool:
+        """
+        Add a formula to a world of this branch and schedule it for expansion.
+        
+        The branch is closed as soon as the formula contradicts the world.
+        
+        Returns:
+            True if the formula was new to the world
+        """
+        if formula in self.worlds[world_id].formulas:
+            return False
+        world = self.writable_world(world_id)
+        added = world.add_formula(formula)
+        if added:
+            self.agenda = ((world_id, formula), self.agenda)
+        elif world.clash is not None:
+            self.closed = True
+        return added
+    
+    def add_accessibility_relation(self, relation: AccessibilityRelation) -> bool:
+        """
+        Add an accessibility relation to this branch.
+        
+        Returns:
+            True if the relation was new
+        """
+        successors = self.successors.get(relation.from_world_id, frozenset())
+        if relation.to_world_id in successors:
+            return False
+        self.successors[relation.from_world_id] = successors | {relation.to_world_id}
+        return True
     
     def get_accessible_worlds(self, from_world_id: int) -> List[World]:
         """Get all worlds accessible from the given world."""
-        accessible_world_ids = [
-            rel.to_world_id for rel in self.accessibility_relations
-            if rel.from_world_id == from_world_id
-        ]
-        return [self.worlds[world_id] for world_id in accessible_world_ids]
+        return [self.worlds[world_id] for world_id in self.successors.get(from_world_id, ())]
     
     def is_closed(self) -> bool:
         """
         Check if this branch is closed.
         
-        A branch is closed if any of its worlds contains a contradiction.
+        A branch is closed if any of its worlds contains a contradiction. Worlds
+        record contradictions as formulas are added, so this only inspects a
+        flag per world.
         """
-        if self.closed:
-            return True
-        
-        for world in self.worlds.values():
-            if world.contains_contradiction():
-                self.closed = True
-                return True
-        
-        return False
+        if not self.closed and any(world.clash is not None for world in self.worlds.values()):
+            self.closed = True
+        return self.closed
     
     def is_fully_expanded(self) -> bool:
         """
         Check if this branch is fully expanded.
         
         A branch is fully expanded if all applicable tableau rules have been applied.
-        This is a simplified check and would be more complex in a full implementation.
         """
-        # For now, just return False to ensure rules continue to be applied
-        return False
+        return self.agenda is None and self.splits is None and self.witnesses is None
+    
+    def copy(self) -> 'Branch':
+        """
+        Return a branch sharing this branch's worlds and pending formulas.
+        
+        Worlds are copied lazily: after the call, neither branch owns any world,
+        so the first write to a world by either branch copies it.
+        """
+        branch = Branch(dict(self.worlds), dict(self.successors), self.closed, self.depth)
+        branch.agenda = self.agenda
+        branch.splits = self.splits
+        branch.witnesses = self.witnesses
+        self._owned.clear()
+        return branch
 
 
 @dataclass
@@ -217,6 +338,11 @@ class TableauRuleApplicator:
     
     This class encapsulates the logic for applying tableau rules to expand a tableau
     based on the formulas in its branches and the modal system being used.
+    
+    Frame properties are built into the rules rather than into the accessibility
+    relation: in reflexive systems a box formula also holds in its own world, in
+    transitive systems it is passed on to every accessible world together with
+    its body, and in symmetric systems every new world can see its parent.
     """
     
     def __init__(self, modal_system: ModalSystem):
@@ -227,14 +353,18 @@ class TableauRuleApplicator:
             modal_system: The modal system to use (K, T, D, B, S4, S5)
         """
         self.modal_system = modal_system
-
+        self.reflexive = modal_system in (ModalSystem.T, ModalSystem.B, ModalSystem.S4, ModalSystem.S5)
+        self.symmetric = modal_system in (ModalSystem.B, ModalSystem.S5)
+        self.transitive = modal_system in (ModalSystem.S4, ModalSystem.S5)
+        self.serial = modal_system == ModalSystem.D
+    
     def get_formula_type(self, signed_formula: SignedFormula) -> FormulaType:
         """
         Determine the type of a formula for tableau rule application.
         
         Args:
             signed_formula: The signed formula to classify
-            
+        
         Returns:
             The formula type (ALPHA, BETA, PI, NU, LITERAL, or COMPLEX)
         """
@@ -280,20 +410,20 @@ class TableauRuleApplicator:
         if isinstance(formula, ConnectiveNode):
             if formula.connective_type == "AND":
                 if sign:  # T: A ∧ B -> T: A, T: B
-                    branch.worlds[world_id].add_formula(SignedFormula(formula.operands[0], True))
-                    branch.worlds[world_id].add_formula(SignedFormula(formula.operands[1], True))
+                    branch.add_formula(world_id, SignedFormula(formula.operands[0], True))
+                    branch.add_formula(world_id, SignedFormula(formula.operands[1], True))
                 else:  # F: A ∧ B -> F: A | F: B (handled by beta rule)
                     pass
             elif formula.connective_type == "OR":
                 if not sign:  # F: A ∨ B -> F: A, F: B
-                    branch.worlds[world_id].add_formula(SignedFormula(formula.operands[0], False))
-                    branch.worlds[world_id].add_formula(SignedFormula(formula.operands[1], False))
+                    branch.add_formula(world_id, SignedFormula(formula.operands[0], False))
+                    branch.add_formula(world_id, SignedFormula(formula.operands[1], False))
                 else:  # T: A ∨ B -> T: A | T: B (handled by beta rule)
                     pass
             elif formula.connective_type == "IMPLIES":
                 if not sign:  # F: A → B -> T: A, F: B
-                    branch.worlds[world_id].add_formula(SignedFormula(formula.operands[0], True))
-                    branch.worlds[world_id].add_formula(SignedFormula(formula.operands[1], False))
+                    branch.add_formula(world_id, SignedFormula(formula.operands[0], True))
+                    branch.add_formula(world_id, SignedFormula(formula.operands[1], False))
                 else:  # T: A → B -> F: A | T: B (handled by beta rule)
                     pass
     
@@ -301,82 +431,89 @@ class TableauRuleApplicator:
         """
         Apply the beta rule to a disjunctive formula.
         
-        The beta rule splits the branch into two, one for each disjunct.
+        The beta rule splits the branch into two, one for each disjunct. The
+        branch itself becomes the first of the two, and the second shares its
+        worlds until either of them is modified.
         
         Args:
             signed_formula: The signed formula to expand
             branch: The branch to apply the rule to
             world_id: The ID of the world in which to apply the rule
-            
+        
         Returns:
             A list of new branches created by the rule application
         """
         formula = signed_formula.formula
         sign = signed_formula.sign
         
-        new_branches = []
+        if not isinstance(formula, ConnectiveNode):
+            return [branch]
         
-        if isinstance(formula, ConnectiveNode):
-            if formula.connective_type == "AND":
-                if not sign:  # F: A ∧ B -> F: A | F: B
-                    # Create first branch: F: A
-                    branch1 = copy.deepcopy(branch)
-                    branch1.worlds[world_id].add_formula(SignedFormula(formula.operands[0], False))
-                    new_branches.append(branch1)
-                    
-                    # Create second branch: F: B
-                    branch2 = copy.deepcopy(branch)
-                    branch2.worlds[world_id].add_formula(SignedFormula(formula.operands[1], False))
-                    new_branches.append(branch2)
-            elif formula.connective_type == "OR":
-                if sign:  # T: A ∨ B -> T: A | T: B
-                    # Create first branch: T: A
-                    branch1 = copy.deepcopy(branch)
-                    branch1.worlds[world_id].add_formula(SignedFormula(formula.operands[0], True))
-                    new_branches.append(branch1)
-                    
-                    # Create second branch: T: B
-                    branch2 = copy.deepcopy(branch)
-                    branch2.worlds[world_id].add_formula(SignedFormula(formula.operands[1], True))
-                    new_branches.append(branch2)
-            elif formula.connective_type == "IMPLIES":
-                if sign:  # T: A → B -> F: A | T: B
-                    # Create first branch: F: A
-                    branch1 = copy.deepcopy(branch)
-                    branch1.worlds[world_id].add_formula(SignedFormula(formula.operands[0], False))
-                    new_branches.append(branch1)
-                    
-                    # Create second branch: T: B
-                    branch2 = copy.deepcopy(branch)
-                    branch2.worlds[world_id].add_formula(SignedFormula(formula.operands[1], True))
-                    new_branches.append(branch2)
+        if formula.connective_type == "AND" and not sign:  # F: A ∧ B -> F: A | F: B
+            first = SignedFormula(formula.operands[0], False)
+            second = SignedFormula(formula.operands[1], False)
+        elif formula.connective_type == "OR" and sign:  # T: A ∨ B -> T: A | T: B
+            first = SignedFormula(formula.operands[0], True)
+            second = SignedFormula(formula.operands[1], True)
+        elif formula.connective_type == "IMPLIES" and sign:  # T: A → B -> F: A | T: B
+            first = SignedFormula(formula.operands[0], False)
+            second = SignedFormula(formula.operands[1], True)
+        else:
+            return [branch]
+        
+        # No split is needed when the world already satisfies a disjunct
+        world = branch.worlds[world_id]
+        if world.contains_formula(first) or world.contains_formula(second):
+            return [branch]
         
-        return new_branches
+        other = branch.copy()
+        branch.depth += 1
+        other.depth += 1
+        branch.add_formula(world_id, first)
+        other.add_formula(world_id, second)
+        return [branch, other]
     
-    def apply_pi_rule(self, signed_formula: SignedFormula, branch: Branch, world_id: int) -> None:
+    def apply_pi_rule(self, signed_formula: SignedFormula, branch: Branch, world_id: int,
+                      tableau: Optional[Tableau] = None) -> None:
         """
         Apply the pi rule to a box formula.
         
-        The pi rule adds the formula inside the box to all accessible worlds.
+        The pi rule adds the formula inside the box to all accessible worlds, and
+        records the box formula so that worlds which become accessible later
+        receive it too.
         
         Args:
             signed_formula: The signed formula to expand
             branch: The branch to apply the rule to
             world_id: The ID of the world in which to apply the rule
+            tableau: The tableau being expanded, needed to create a successor
+                     world in serial systems
         """
         formula = signed_formula.formula
-        sign = signed_formula.sign
+        if not isinstance(formula, ModalOpNode):
+            return
         
-        if isinstance(formula, ModalOpNode) and formula.modal_operator == "NECESSARY":
-            if sign:  # T: □A -> add T: A to all accessible worlds
-                for accessible_world in branch.get_accessible_worlds(world_id):
-                    accessible_world.add_formula(SignedFormula(formula.proposition, True))
+        branch.writable_world(world_id).necessities.append(signed_formula)
+        
+        if self.reflexive:
+            branch.add_formula(world_id, SignedFormula(formula.proposition, signed_formula.sign))
+        
+        successors = branch.successors.get(world_id)
+        if not successors:
+            if self.serial and tableau is not None:
+                self._create_world(branch, world_id, tableau)
+            return
+        for successor_id in successors:
+            self._propagate(signed_formula, branch, successor_id)
     
     def apply_nu_rule(self, signed_formula: SignedFormula, branch: Branch, world_id: int, tableau: Tableau) -> None:
         """
         Apply the nu rule to a diamond formula.
         
-        The nu rule creates a new accessible world and adds the formula inside the diamond to it.
+        The nu rule creates a new accessible world and adds the formula inside the
+        diamond to it. No world is created when an accessible world already
+        contains the formula, or, in transitive systems, when the world is
+        blocked by an ancestor containing all of its formulas.
         
         Args:
             signed_formula: The signed formula to expand
@@ -385,93 +522,123 @@ class TableauRuleApplicator:
             tableau: The tableau being expanded
         """
         formula = signed_formula.formula
-        sign = signed_formula.sign
+        if not isinstance(formula, ModalOpNode):
+            return
         
-        if isinstance(formula, ModalOpNode) and formula.modal_operator == "POSSIBLE":
-            if sign:  # T: ◇A -> create new world with T: A
-                new_world_id = tableau.create_new_world()
-                new_world = World(new_world_id)
-                new_world.add_formula(SignedFormula(formula.proposition, True))
-                branch.add_world(new_world)
-                branch.add_accessibility_relation(AccessibilityRelation(world_id, new_world_id))
-                
-                # Apply accessibility relation properties based on the modal system
-                self.apply_accessibility_properties(branch, new_world_id)
+        body = SignedFormula(formula.proposition, signed_formula.sign)
+        if self._is_witnessed(body, branch, world_id) or self._is_blocked(branch, world_id):
+            return
+        self._create_world(branch, world_id, tableau, body)
     
     def apply_accessibility_properties(self, branch: Branch, world_id: int) -> None:
         """
         Apply accessibility relation properties based on the modal system.
         
+        Only symmetry needs new relations: reflexivity and transitivity are
+        handled by the pi rule, and seriality by creating a successor when a
+        box formula has no accessible world.
+        
         Args:
             branch: The branch to apply the properties to
             world_id: The ID of the world to consider for new relations
         """
-        # Reflexivity (T, B, S4, S5)
-        if self.modal_system in [ModalSystem.T, ModalSystem.B, ModalSystem.S4, ModalSystem.S5]:
-            branch.add_accessibility_relation(AccessibilityRelation(world_id, world_id))
-        
-        # Symmetry (B, S5)
-        if self.modal_system in [ModalSystem.B, ModalSystem.S5]:
-            for relation in list(branch.accessibility_relations):
-                if relation.to_world_id == world_id:
-                    branch.add_accessibility_relation(AccessibilityRelation(world_id, relation.from_world_id))
-        
-        # Transitivity (S4, S5)
-        if self.modal_system in [ModalSystem.S4, ModalSystem.S5]:
-            for relation1 in list(branch.accessibility_relations):
-                if relation1.from_world_id == world_id:
-                    for relation2 in list(branch.accessibility_relations):
-                        if relation2.from_world_id == relation1.to_world_id:
-                            branch.add_accessibility_relation(AccessibilityRelation(world_id, relation2.to_world_id))
-        
-        # Seriality (D)
-        if self.modal_system == ModalSystem.D:
-            has_successor = False
-            for relation in branch.accessibility_relations:
-                if relation.from_world_id == world_id:
-                    has_successor = True
-                    break
-            
-            if not has_successor:
-                # Create a new world and make it accessible from this world
-                new_world_id = max(branch.worlds.keys()) + 1 if branch.worlds else 0
-                branch.add_world(World(new_world_id))
-                branch.add_accessibility_relation(AccessibilityRelation(world_id, new_world_id))
+        parent_id = branch.worlds[world_id].parent_id
+        if self.symmetric and parent_id is not None:
+            self._add_relation(branch, world_id, parent_id)
+    
+    def _propagate(self, necessity: SignedFormula, branch: Branch, world_id: int) -> None:
+        """Pass a box formula on to a world accessible from the world holding it."""
+        branch.add_formula(world_id, SignedFormula(necessity.formula.proposition, necessity.sign))
+        if self.transitive:
+            branch.add_formula(world_id, necessity)
+    
+    def _add_relation(self, branch: Branch, from_world_id: int, to_world_id: int) -> None:
+        """Make a world accessible and pass on the box formulas that see it."""
+        if branch.add_accessibility_relation(AccessibilityRelation(from_world_id, to_world_id)):
+            for necessity in list(branch.worlds[from_world_id].necessities):
+                self._propagate(necessity, branch, to_world_id)
+    
+    def _create_world(self, branch: Branch, parent_id: int, tableau: Tableau,
+                      formula: Optional[SignedFormula] = None) -> int:
+        """Create a world accessible from a parent world, optionally holding a formula."""
+        world_id = tableau.create_new_world()
+        branch.add_world(World(world_id, parent_id=parent_id))
+        if formula is not None:
+            branch.add_formula(world_id, formula)
+        self._add_relation(branch, parent_id, world_id)
+        self.apply_accessibility_properties(branch, world_id)
+        return world_id
+    
+    def _is_witnessed(self, formula: SignedFormula, branch: Branch, world_id: int) -> bool:
+        """Check if a world can already see a world containing a formula."""
+        if self.reflexive and branch.worlds[world_id].contains_formula(formula):
+            return True
+        # In S5 every world of the branch is accessible from every other
+        if self.modal_system == ModalSystem.S5:
+            candidates = branch.worlds.values()
+        else:
+            candidates = branch.get_accessible_worlds(world_id)
+        return any(world.contains_formula(formula) for world in candidates)
+    
+    def _is_blocked(self, branch: Branch, world_id: int) -> bool:
+        """
+        Check if an ancestor world contains every formula of a world.
+        
+        In transitive systems the ancestor's witnesses can serve the blocked
+        world, which keeps chains of diamond formulas from creating worlds
+        forever.
+        """
+        if not self.transitive:
+            return False
+        world = branch.worlds[world_id]
+        ancestor_id = world.parent_id
+        while ancestor_id is not None:
+            ancestor = branch.worlds[ancestor_id]
+            if world.literals.items() <= ancestor.literals.items():
+                return True
+            ancestor_id = ancestor.parent_id
+        return False
     
     def expand_branch(self, branch: Branch, tableau: Tableau) -> List[Branch]:
         """
-        Expand a branch by applying tableau rules.
+        Expand a branch by applying one tableau rule.
+        
+        Newly added formulas are expanded first, then disjunctive formulas split
+        the branch, and diamond formulas create worlds last, once every world is
+        saturated; this is what makes ancestor blocking safe.
         
         Args:
             branch: The branch to expand
             tableau: The tableau being expanded
-            
+        
         Returns:
             A list of branches resulting from the expansion
         """
         if branch.is_closed():
             return [branch]
         
-        # Find an unexpanded formula in any world
-        for world_id, world in branch.worlds.items():
-            for signed_formula in world.formulas:
-                formula_type = self.get_formula_type(signed_formula)
-                
-                if formula_type == FormulaType.ALPHA:
-                    self.apply_alpha_rule(signed_formula, branch, world_id)
-                    return [branch]  # Continue with the same branch
-                
-                elif formula_type == FormulaType.BETA:
-                    new_branches = self.apply_beta_rule(signed_formula, branch, world_id)
-                    return new_branches  # Return the new branches
-                
-                elif formula_type == FormulaType.PI:
-                    self.apply_pi_rule(signed_formula, branch, world_id)
-                    return [branch]  # Continue with the same branch
-                
-                elif formula_type == FormulaType.NU:
-                    self.apply_nu_rule(signed_formula, branch, world_id, tableau)
-                    return [branch]  # Continue with the same branch
+        if branch.agenda is not None:
+            (world_id, signed_formula), branch.agenda = branch.agenda
+            signed_formula = signed_formula.strip_negations()
+            formula_type = self.get_formula_type(signed_formula)
+            
+            if formula_type == FormulaType.ALPHA:
+                self.apply_alpha_rule(signed_formula, branch, world_id)
+            elif formula_type == FormulaType.PI:
+                self.apply_pi_rule(signed_formula, branch, world_id, tableau)
+            elif formula_type == FormulaType.BETA:
+                branch.splits = ((world_id, signed_formula), branch.splits)
+            elif formula_type == FormulaType.NU:
+                branch.witnesses = ((world_id, signed_formula), branch.witnesses)
+            return [branch]
+        
+        if branch.splits is not None:
+            (world_id, signed_formula), branch.splits = branch.splits
+            return self.apply_beta_rule(signed_formula, branch, world_id)
+        
+        if branch.witnesses is not None:
+            (world_id, signed_formula), branch.witnesses = branch.witnesses
+            self.apply_nu_rule(signed_formula, branch, world_id, tableau)
         
         # If no rules were applied, the branch is fully expanded
         return [branch]
@@ -524,7 +691,7 @@ class ModalTableauProver(BaseProver):
         Args:
             goal_ast: The goal to prove
             context_asts: The set of context assertions
-            
+        
         Returns:
             True if this prover can handle the given goal and context, False otherwise
         """
@@ -547,7 +714,7 @@ class ModalTableauProver(BaseProver):
         
         Args:
             formula: The formula to negate
-            
+        
         Returns:
             The negated formula
         """
@@ -566,32 +733,30 @@ class ModalTableauProver(BaseProver):
             formula: The formula to prove
             context_formulas: The set of context formulas to include
             check_validity: If True, negate the formula to check validity
-            
+        
         Returns:
             The initial tableau
         """
         tableau = Tableau()
         
-        # Create the initial world
+        # Create the initial world and branch
         world_id = tableau.create_new_world()
-        world = World(world_id)
+        branch = Branch()
+        branch.add_world(World(world_id))
         
         # Add the formula to the world
         if check_validity:
             # To check validity, we try to find a model for the negation
             negated_formula = self._negate_formula(formula)
-            world.add_formula(SignedFormula(negated_formula, True))
+            branch.add_formula(world_id, SignedFormula(negated_formula, True))
         else:
             # To check satisfiability, we try to find a model for the formula
-            world.add_formula(SignedFormula(formula, True))
+            branch.add_formula(world_id, SignedFormula(formula, True))
         
         # Add context formulas to the world
         for context_formula in context_formulas:
-            world.add_formula(SignedFormula(context_formula, True))
+            branch.add_formula(world_id, SignedFormula(context_formula, True))
         
-        # Create the initial branch
-        branch = Branch()
-        branch.add_world(world)
         tableau.add_branch(branch)
         
         return tableau
@@ -600,11 +765,15 @@ class ModalTableauProver(BaseProver):
         """
         Expand a tableau by applying tableau rules.
         
+        Branches are expanded depth-first from a stack. Expansion stops as soon
+        as a branch is fully expanded without closing, since that branch already
+        describes a model.
+        
         Args:
             tableau: The tableau to expand
             modal_system: The modal system to use
             resources: Resource limits for the proof attempt
-            
+        
         Returns:
             A tuple of the expanded tableau and a dictionary of resources consumed
         """
@@ -615,8 +784,12 @@ class ModalTableauProver(BaseProver):
         nodes_explored = 0
         max_depth = 0
         
-        # Continue expanding until all branches are closed or a resource limit is reached
-        while not tableau.is_closed() and tableau.branches:
+        # Open branches still to be expanded, the next one on top
+        stack = [branch for branch in reversed(tableau.branches) if not branch.is_closed()]
+        
+        # Continue expanding until all branches are closed, a branch is fully
+        # expanded, or a resource limit is reached
+        while stack:
             # Check resource limits
             if resources:
                 current_time = time.time()
@@ -635,20 +808,26 @@ class ModalTableauProver(BaseProver):
                     break
             
             # Get the next branch to expand
-            branch = next((b for b in tableau.branches if not b.is_closed()), None)
-            if not branch:
+            branch = stack[-1]
+            if branch.closed:
+                stack.pop()
+                continue
+            if branch.is_fully_expanded():
                 break
             
             # Expand the branch
             new_branches = rule_applicator.expand_branch(branch, tableau)
             
-            # Update the tableau with the new branches
-            if new_branches:
-                tableau.branches.remove(branch)
-                tableau.branches.extend(new_branches)
+            # Update the tableau with the new branches, keeping the first on top
+            if len(new_branches) > 1:
+                stack.pop()
+                for new_branch in reversed(new_branches):
+                    if new_branch is not branch:
+                        tableau.add_branch(new_branch)
+                    stack.append(new_branch)
             
             nodes_explored += 1
-            max_depth = max(max_depth, len(tableau.branches))
+            max_depth = max(max_depth, branch.depth)
         
         # Calculate resources consumed
         end_time = time.time()
@@ -658,6 +837,7 @@ class ModalTableauProver(BaseProver):
             "nodes_explored": nodes_explored,
             "max_depth": max_depth,
             "branches_created": len(tableau.branches),
+            "worlds_created": tableau.next_world_id,
             "time_taken_ms": time_taken_ms
         }
         
@@ -671,7 +851,7 @@ class ModalTableauProver(BaseProver):
             tableau: The completed tableau
             goal_ast: The original goal
             check_validity: Whether we were checking validity or satisfiability
-            
+        
         Returns:
             A list of proof steps
         """
@@ -706,21 +886,17 @@ class ModalTableauProver(BaseProver):
         step_idx = len(proof_steps)
         for i, branch in enumerate(tableau.branches):
             if branch.is_closed():
-                for world in branch.worlds.values():
-                    for formula in world.formulas:
-                        if formula.negate() in world.formulas:
-                            proof_steps.append(ProofStepNode(
-                                formula=formula.formula,
-                                rule_name="contradiction",
-                                premises=[step_idx - 1],
-                                explanation=f"Contradiction found in branch {i}, world {world.world_id}: "
-                                           f"{formula} and {formula.negate()}"
-                            ))
-                            step_idx += 1
-                            break
-                    else:
-                        continue
-                    break
+                world = next((w for w in branch.worlds.values() if w.clash is not None), None)
+                if world is not None:
+                    formula, negation = world.clash
+                    proof_steps.append(ProofStepNode(
+                        formula=formula.formula,
+                        rule_name="contradiction",
+                        premises=[step_idx - 1],
+                        explanation=f"Contradiction found in branch {i}, world {world.world_id}: "
+                                   f"{formula} and {negation}"
+                    ))
+                    step_idx += 1
         
         # Add the final conclusion
         if tableau.is_closed():
@@ -777,7 +953,7 @@ class ModalTableauProver(BaseProver):
             resources: Optional resource limits for the proof attempt
             modal_system_name: The modal system to use (e.g., "K", "T", "S4", "S5")
             check_validity: If True, check validity by negating the goal first
-            
+        
         Returns:
             A ProofObject representing the result of the proof attempt
         """
@@ -840,7 +1016,7 @@ class ModalTableauProver(BaseProver):
                     time_taken_ms=time_taken_ms,
                     resources_consumed=resources_consumed
                 )
-                
+        
         except Exception as e:
             # Handle exceptions
             logger.error(f"Error during tableau proof: {str(e)}", exc_info=True)
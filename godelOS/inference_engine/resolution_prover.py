@@ -7,7 +7,9 @@ It converts input formulae into Conjunctive Normal Form (CNF) and applies variou
 resolution strategies to find a refutation.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any, FrozenSet
+from typing import Dict, DefaultDict, Hashable, List, Optional, Set, Tuple, Any, FrozenSet
+from collections import defaultdict, deque
+import heapq
 import time
 import logging
 import copy
@@ -22,6 +24,7 @@ from godelOS.core_kr.ast.nodes import (
 from godelOS.core_kr.unification_engine.engine import UnificationEngine
 from godelOS.core_kr.unification_engine.result import UnificationResult
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
+from godelOS.core_kr.knowledge_store.term_index import TermIndex
 from godelOS.inference_engine.base_prover import BaseProver, ResourceLimits
 from godelOS.inference_engine.proof_object import ProofObject, ProofStepNode
 
@@ -587,6 +590,231 @@ class CNFConverter:
             return [Literal(formula)]
 
 
+def literal_key(literal: Literal) -> Tuple[bool, Optional[Hashable]]:
+    """
+    Get the predicate and polarity key of a literal.
+
+    Args:
+        literal: The literal to inspect
+
+    Returns:
+        A (is_negated, predicate) pair, where predicate is the (name, arity)
+        functor of the atom, or None for atoms without a constant predicate
+    """
+    atom = literal.atom
+    functor = TermIndex.functor_of(atom)
+    if functor is None and isinstance(atom, ConstantNode):
+        functor = (atom.name, 0)
+    return (literal.is_negated, functor)
+
+
+class LiteralIndex:
+    """
+    Index of the literals of a clause set, used to find resolution partners.
+
+    Atoms are kept in one TermIndex per polarity, so the candidates for
+    resolving a literal are the atoms of opposite polarity that agree with it
+    on predicate, arity and every bound argument symbol. Atoms that are not
+    applications (e.g. propositional constants) are grouped by their key.
+    """
+
+    def __init__(self):
+        """Initialize an empty literal index."""
+        self._atoms: Dict[bool, TermIndex] = {False: TermIndex(), True: TermIndex()}
+
+        # (is_negated, predicate) -> non-application atoms with that key
+        self._unindexed: DefaultDict[Tuple[bool, Optional[Hashable]], Set[AST_Node]] = defaultdict(set)
+
+        # (is_negated, atom) -> clauses containing that literal, by clause ID
+        self._clauses: Dict[Tuple[bool, AST_Node], Dict[int, Clause]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of distinct indexed literals."""
+        return len(self._clauses)
+
+    def add(self, clause: Clause) -> None:
+        """
+        Add the literals of a clause to the index.
+
+        Args:
+            clause: The clause to add
+        """
+        for literal in clause.literals:
+            entry = (literal.is_negated, literal.atom)
+            holders = self._clauses.get(entry)
+            if holders is None:
+                holders = self._clauses[entry] = {}
+                if not self._atoms[literal.is_negated].add(literal.atom):
+                    self._unindexed[literal_key(literal)].add(literal.atom)
+            holders[clause.clause_id] = clause
+
+    def remove(self, clause: Clause) -> None:
+        """
+        Remove the literals of a clause from the index.
+
+        Args:
+            clause: The clause to remove
+        """
+        for literal in clause.literals:
+            entry = (literal.is_negated, literal.atom)
+            holders = self._clauses.get(entry)
+            if holders is None:
+                continue
+            holders.pop(clause.clause_id, None)
+            if holders:
+                continue
+            del self._clauses[entry]
+            if isinstance(literal.atom, ApplicationNode):
+                self._atoms[literal.is_negated].remove(literal.atom)
+            else:
+                key = literal_key(literal)
+                bucket = self._unindexed.get(key)
+                if bucket is not None:
+                    bucket.discard(literal.atom)
+                    if not bucket:
+                        del self._unindexed[key]
+
+    def partners(self, literal: Literal) -> List[Tuple[Clause, Literal]]:
+        """
+        Get the indexed literals that might resolve with a literal.
+
+        Retrieval is conservative: every complementary literal whose atom
+        could unify with the literal's atom is returned, together with each
+        clause that contains it.
+
+        Args:
+            literal: The literal to resolve upon
+
+        Returns:
+            A list of (clause, complementary literal) pairs
+        """
+        polarity = not literal.is_negated
+        candidates = self._atoms[polarity].candidates(literal.atom)
+        if candidates is None:
+            if isinstance(literal.atom, ConstantNode):
+                candidates = self._unindexed.get(literal_key(literal.negate()), set())
+            else:
+                candidates = [atom for negated, atom in self._clauses if negated == polarity]
+        wildcards = self._unindexed.get((polarity, None))
+        if wildcards:
+            candidates = set(candidates) | wildcards
+
+        partners = []
+        for atom in candidates:
+            holders = self._clauses.get((polarity, atom))
+            if holders:
+                partner_literal = Literal(atom, polarity)
+                partners.extend((clause, partner_literal) for clause in holders.values())
+        return partners
+
+
+class SubsumptionIndex:
+    """
+    Index of a clause set by the predicate and polarity keys of its literals.
+
+    A clause can only subsume another if every one of its literal keys occurs
+    in the other, so the index narrows subsumption checks in both directions
+    to clauses with compatible keys.
+    """
+
+    def __init__(self):
+        """Initialize an empty subsumption index."""
+        self._clauses: Dict[int, Clause] = {}
+        self._keys: Dict[int, FrozenSet[Tuple[bool, Optional[Hashable]]]] = {}
+
+        # key -> IDs of clauses with a literal of that key
+        self._containing: DefaultDict[Tuple[bool, Optional[Hashable]], Set[int]] = defaultdict(set)
+
+        # key -> IDs of clauses whose anchor key is that key
+        self._anchored: DefaultDict[Tuple[bool, Optional[Hashable]], Set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        """Get the number of indexed clauses."""
+        return len(self._clauses)
+
+    @staticmethod
+    def _anchor(keys: FrozenSet[Tuple[bool, Optional[Hashable]]]) -> Tuple[bool, Optional[Hashable]]:
+        # Any deterministic choice of one key per clause will do: a subsumer's
+        # keys are a subset of the subsumed clause's, so its anchor is too
+        return min(keys, key=hash)
+
+    def add(self, clause: Clause) -> None:
+        """
+        Add a clause to the index.
+
+        Args:
+            clause: The clause to add
+        """
+        keys = frozenset(literal_key(literal) for literal in clause.literals)
+        self._clauses[clause.clause_id] = clause
+        self._keys[clause.clause_id] = keys
+        for key in keys:
+            self._containing[key].add(clause.clause_id)
+        if keys:
+            self._anchored[self._anchor(keys)].add(clause.clause_id)
+
+    def remove(self, clause_id: int) -> None:
+        """
+        Remove a clause from the index.
+
+        Args:
+            clause_id: The ID of the clause to remove
+        """
+        self._clauses.pop(clause_id, None)
+        keys = self._keys.pop(clause_id, None)
+        if not keys:
+            return
+        for key in keys:
+            self._containing[key].discard(clause_id)
+            if not self._containing[key]:
+                del self._containing[key]
+        anchor = self._anchor(keys)
+        self._anchored[anchor].discard(clause_id)
+        if not self._anchored[anchor]:
+            del self._anchored[anchor]
+
+    def subsumer_candidates(self, clause: Clause) -> List[Clause]:
+        """
+        Get the indexed clauses that might subsume a clause.
+
+        Args:
+            clause: The clause to check
+
+        Returns:
+            The clauses whose literal keys are a subset of the clause's and
+            that have no more literals than it
+        """
+        keys = frozenset(literal_key(literal) for literal in clause.literals)
+        size = len(clause.literals)
+        candidates = []
+        for key in keys:
+            for clause_id in self._anchored.get(key, ()):
+                candidate = self._clauses[clause_id]
+                if len(candidate.literals) <= size and self._keys[clause_id] <= keys:
+                    candidates.append(candidate)
+        return candidates
+
+    def subsumed_candidates(self, clause: Clause) -> List[Clause]:
+        """
+        Get the indexed clauses that a clause might subsume.
+
+        Args:
+            clause: The candidate subsumer
+
+        Returns:
+            The clauses that contain every literal key of the clause and have
+            at least as many literals as it
+        """
+        keys = {literal_key(literal) for literal in clause.literals}
+        if not keys:
+            return []
+        buckets = sorted((self._containing.get(key, set()) for key in keys), key=len)
+        clause_ids = buckets[0].intersection(*buckets[1:])
+        size = len(clause.literals)
+        return [self._clauses[clause_id] for clause_id in clause_ids
+                if len(self._clauses[clause_id].literals) >= size]
+
+
 class ResolutionProver(BaseProver):
     """
     Prover using resolution for FOL and propositional logic.
@@ -673,22 +901,37 @@ class ResolutionProver(BaseProver):
         """
         Attempt to prove a goal using resolution.
 
+        The negated goal and the context are converted to clauses and
+        saturated with a given-clause loop: the lightest pending clause is
+        selected, resolved against the active clauses through a literal
+        index, and each new resolvent is kept only if it is not a tautology
+        and is not subsumed by a kept clause. Kept resolvents remove the
+        clauses they subsume.
+
         Args:
             goal: The logical formula to prove.
             context: Optional list of logical formulas representing the knowledge base.
             resource_limits: Optional resource limits for the proof process.
+                The resolution strategy can be overridden with a ``strategy``
+                limit holding a ResolutionStrategy or its value.
 
         Returns:
             A ProofObject representing the result of the proof attempt.
         """
         start_time = time.time()
-        
+
         # Track proof steps
         proof_steps: List[ProofStepNode] = []
-        
+
         if resource_limits is None:
             resource_limits = ResourceLimits() # Default limits
 
+        strategy = ResolutionStrategy(resource_limits.get_limit("strategy", self.default_strategy))
+        max_iterations = resource_limits.nodes_limit if resource_limits.nodes_limit else 1000
+        time_limit_ms = resource_limits.time_limit_ms
+        if time_limit_ms is None:
+            time_limit_ms = resource_limits.get_limit("max_time_ms")
+
         # 1. Negate the goal
         negated_goal = ConnectiveNode("NOT", [goal], goal.type)
         logger.info(f"ResolutionProver: Negated goal: {negated_goal}")
@@ -700,31 +943,29 @@ class ResolutionProver(BaseProver):
         ))
 
         # 2. Convert all formulas (context + negated_goal) to CNF
-        all_clauses: List[Clause] = []
-        
+        context_clauses: List[Clause] = []
+
         # Convert context (knowledge base)
         if context:
             for i, formula in enumerate(context):
                 cnf_clauses = self.cnf_converter.convert_to_cnf(formula)
                 for cnf_clause in cnf_clauses:
                     unique_id = self._get_next_clause_id()
-                    all_clauses.append(dataclasses.replace(cnf_clause, source=f"context_{i}", clause_id=unique_id))
+                    context_clauses.append(dataclasses.replace(cnf_clause, source=f"context_{i}", clause_id=unique_id))
                 proof_steps.append(ProofStepNode(
                     formula=formula,
                     rule_name="CNF conversion",
                     premises=[],
                     explanation=f"Convert context formula {i+1} to CNF: {formula}"
                 ))
-        
-        # Convert negated goal
+
+        # Convert negated goal; these clauses form the set of support
         negated_goal_cnf_clauses = self.cnf_converter.convert_to_cnf(negated_goal)
-        set_of_support: Set[Clause] = set() # Clauses derived from the negated goal
+        goal_clauses: List[Clause] = []
 
         for cnf_clause in negated_goal_cnf_clauses:
             unique_id = self._get_next_clause_id()
-            clause_with_id = dataclasses.replace(cnf_clause, source="negated_goal", clause_id=unique_id)
-            all_clauses.append(clause_with_id)
-            set_of_support.add(clause_with_id)
+            goal_clauses.append(dataclasses.replace(cnf_clause, source="negated_goal", clause_id=unique_id))
         proof_steps.append(ProofStepNode(
             formula=negated_goal,
             rule_name="CNF conversion",
@@ -732,10 +973,10 @@ class ResolutionProver(BaseProver):
             explanation=f"Convert negated goal to CNF: {negated_goal}"
         ))
 
-        logger.info(f"ResolutionProver: Initial clauses ({len(all_clauses)} total):")
-        for clause in all_clauses:
+        logger.info(f"ResolutionProver: Initial clauses ({len(context_clauses) + len(goal_clauses)} total):")
+        for clause in context_clauses + goal_clauses:
             logger.info(f"  ID: {clause.clause_id}, Source: {clause.source}, Clause: {clause}")
-        
+
         if not negated_goal_cnf_clauses: # Should not happen if goal is valid
             time_taken_ms = (time.time() - start_time) * 1000
             return ProofObject.create_failure(
@@ -745,106 +986,387 @@ class ResolutionProver(BaseProver):
                 resources_consumed={}
             )
 
-        # --- Resolution Loop ---
-        # Use a list for the agenda to allow for different selection strategies if needed (e.g., unit preference)
-        agenda: List[Clause] = list(set_of_support) 
-        processed_clauses_set: Set[FrozenSet[Literal]] = set() # Store literals of processed clauses to avoid reprocessing identical clauses
-        all_clauses_map: Dict[int, Clause] = {c.clause_id: c for c in all_clauses}
+        # --- Given-clause loop ---
+        # Every kept clause is either active (indexed as a resolution partner)
+        # or passive (waiting in the priority queue to be selected)
+        kept_clauses: Dict[int, Clause] = {}
+        history: Dict[int, Clause] = {}  # Every clause ever kept, for ancestor lookups
+        active = LiteralIndex()
+        active_ids: Set[int] = set()
+        subsumption_index = SubsumptionIndex()
+        passive: List[Tuple[Tuple[int, ...], int]] = []
+        passive_ids: Set[int] = set()
+
+        # Input and linear resolution need one input parent per step, so
+        # input clauses are always active and are never deleted, and
+        # selected resolvents are not added as partners
+        input_only = strategy in (ResolutionStrategy.INPUT_RESOLUTION, ResolutionStrategy.LINEAR_RESOLUTION)
+        protected_ids: Set[int] = set()
+
+        statistics = {"generated": 0, "kept": 0, "tautologies": 0,
+                      "forward_subsumed": 0, "backward_subsumed": 0}
+
+        def keep(clause: Clause, make_active: bool, make_passive: bool) -> None:
+            kept_clauses[clause.clause_id] = clause
+            history[clause.clause_id] = clause
+            subsumption_index.add(clause)
+            if make_active:
+                active.add(clause)
+                active_ids.add(clause.clause_id)
+            if make_passive:
+                heapq.heappush(passive, (self._clause_priority(clause, strategy), clause.clause_id))
+                passive_ids.add(clause.clause_id)
+
+        def delete(clause: Clause) -> None:
+            del kept_clauses[clause.clause_id]
+            subsumption_index.remove(clause.clause_id)
+            passive_ids.discard(clause.clause_id)
+            if clause.clause_id in active_ids:
+                active.remove(clause)
+                active_ids.discard(clause.clause_id)
+
+        for clause in context_clauses:
+            clause = self._rename_clause(clause)
+            if self._is_tautology(clause):
+                statistics["tautologies"] += 1
+                continue
+            if self._is_forward_subsumed(clause, subsumption_index):
+                statistics["forward_subsumed"] += 1
+                continue
+            if input_only:
+                protected_ids.add(clause.clause_id)
+            keep(clause,
+                 make_active=strategy != ResolutionStrategy.UNIT_PREFERENCE,
+                 make_passive=strategy == ResolutionStrategy.UNIT_PREFERENCE)
+
+        # Goal clauses are kept even when subsumed, so the search always has support
+        for clause in goal_clauses:
+            clause = self._rename_clause(clause)
+            if self._is_tautology(clause):
+                statistics["tautologies"] += 1
+                continue
+            if input_only:
+                protected_ids.add(clause.clause_id)
+            keep(clause, make_active=input_only, make_passive=True)
 
         iteration_count = 0
-        max_iterations = resource_limits.nodes_limit if resource_limits and resource_limits.nodes_limit else 1000
 
-        while agenda:
+        def resources_consumed() -> Dict[str, int]:
+            return {"iterations": iteration_count, **statistics}
+
+        while passive:
             if iteration_count >= max_iterations:
                 time_taken_ms = (time.time() - start_time) * 1000
                 return ProofObject.create_failure(
                     status_message=f"ResolutionProver: Exceeded max iterations ({max_iterations}).",
                     inference_engine_used=self.name,
                     time_taken_ms=time_taken_ms,
-                    resources_consumed={"iterations": iteration_count}
+                    resources_consumed=resources_consumed()
                 )
-            
-            iteration_count += 1
-            # Simple FIFO selection, could be replaced with a more sophisticated strategy (e.g. unit preference)
-            current_clause = agenda.pop(0)
-
-            if current_clause.literals in processed_clauses_set:
-                continue
-            processed_clauses_set.add(current_clause.literals)
-
-            logger.debug(f"Iteration {iteration_count}: Resolving with {current_clause}")
-
-            # Resolve `current_clause` (from set_of_support or its descendants) with clauses from `all_clauses_map`
-            # This implements the set-of-support strategy: one parent must be in the set of support or one of its descendants.
-            potential_partners = list(all_clauses_map.values()) # Iterate over a copy
-
-            for other_clause in potential_partners:
-                # Optimization: Don't resolve a clause with itself unless it can lead to a valid resolvent (e.g. P(x) v P(y) with P(a) v P(b))
-                # For simplicity here, we allow it, _resolve should handle it. Or, ensure other_clause.clause_id != current_clause.clause_id if needed.
-                # However, resolving C with C is usually not productive unless C contains complementary literals after self-unification, which is rare.
-                
-                resolvents = self._resolve(current_clause, other_clause)
-                
-                for resolvent in resolvents:
-                    if resolvent.is_empty():
-                        time_taken_ms = (time.time() - start_time) * 1000
-                        proof_steps.append(ProofStepNode(
-                            formula=goal,  # The proved goal
-                            rule_name="resolution",
-                            premises=[current_clause.clause_id, other_clause.clause_id],
-                            explanation=f"Resolved {current_clause.clause_id} ({current_clause.source}) and {other_clause.clause_id} ({other_clause.source}) to derive empty clause"
-                        ))
-                        logger.info(f"ResolutionProver: Success! Empty clause derived from {current_clause.clause_id} and {other_clause.clause_id}.")
-                        return ProofObject.create_success(
-                            conclusion_ast=goal,
-                            proof_steps=proof_steps,
-                            used_axioms_rules=set(context) if context else set(),
-                            inference_engine_used=self.name,
-                            time_taken_ms=time_taken_ms,
-                            resources_consumed={"iterations": iteration_count}
-                        )
-
-                    # Check if the resolvent is new (not subsumed by an existing clause)
-                    # Simple check: avoid adding clauses with identical literal sets.
-                    # A proper subsumption check is more complex.
-                    if resolvent.literals not in processed_clauses_set and not any(c.literals == resolvent.literals for c in all_clauses_map.values()):
-                        unique_id = self._get_next_clause_id()
-                        resolvent_with_id = dataclasses.replace(resolvent, clause_id=unique_id, parent_ids=(current_clause.clause_id, other_clause.clause_id), source="derived")
-                        
-                        all_clauses_map[unique_id] = resolvent_with_id
-                        agenda.append(resolvent_with_id) # Add to agenda for further resolution
-                        # set_of_support.add(resolvent_with_id) # Implicitly handled as agenda comes from SoS
-                        
-                        proof_steps.append(ProofStepNode(
-                            formula=resolvent_with_id.literals if hasattr(resolvent_with_id, 'literals') else goal,
-                            rule_name="resolution",
-                            premises=[current_clause.clause_id, other_clause.clause_id],
-                            explanation=f"Resolved {current_clause.clause_id} ({current_clause.source}) and {other_clause.clause_id} ({other_clause.source}) to derive ID {unique_id}: {resolvent_with_id}"
-                        ))
-                        logger.info(f"ResolutionProver: Derived new clause {resolvent_with_id.clause_id}: {resolvent_with_id} from {current_clause.clause_id} and {other_clause.clause_id}")
-                    else:
-                        logger.debug(f"Skipping redundant or already processed resolvent: {resolvent} from {current_clause.clause_id} and {other_clause.clause_id}")
 
             # Check resource limits (time)
-            if (time.time() - start_time) * 1000 > resource_limits.max_time_ms:
+            if time_limit_ms is not None and (time.time() - start_time) * 1000 > time_limit_ms:
                 time_taken_ms = (time.time() - start_time) * 1000
                 return ProofObject.create_failure(
-                    status_message=f"ResolutionProver: Exceeded time limit ({resource_limits.max_time_ms} ms).",
+                    status_message=f"ResolutionProver: Exceeded time limit ({time_limit_ms} ms).",
                     inference_engine_used=self.name,
                     time_taken_ms=time_taken_ms,
-                    resources_consumed={"iterations": iteration_count}
+                    resources_consumed=resources_consumed()
                 )
-        
-        # If we reach here, the proof failed
+
+            _, clause_id = heapq.heappop(passive)
+            if clause_id not in passive_ids:
+                continue  # Deleted by backward subsumption while queued
+            passive_ids.discard(clause_id)
+            given = kept_clauses[clause_id]
+            iteration_count += 1
+
+            logger.debug(f"Iteration {iteration_count}: Resolving with {given}")
+
+            resolvents: List[Clause] = []
+            for literal in given.literals:
+                for partner, partner_literal in active.partners(literal):
+                    if partner.clause_id == given.clause_id:
+                        continue
+                    resolvent = self._resolve_on(given, literal, partner, partner_literal)
+                    if resolvent is not None:
+                        resolvents.append(resolvent)
+
+            if strategy == ResolutionStrategy.LINEAR_RESOLUTION:
+                for ancestor in self._ancestors(given, history):
+                    if ancestor.clause_id not in protected_ids:
+                        resolvents.extend(self._resolve(given, ancestor))
+
+            if not input_only or given.clause_id in protected_ids:
+                resolvents.extend(self._resolve(given, given))
+                if given.clause_id not in active_ids:
+                    active.add(given)
+                    active_ids.add(given.clause_id)
+
+            for resolvent in resolvents:
+                statistics["generated"] += 1
+                first_parent, second_parent = resolvent.parent_ids
+                first_source = history[first_parent].source
+                second_source = history[second_parent].source
+
+                if resolvent.is_empty():
+                    time_taken_ms = (time.time() - start_time) * 1000
+                    proof_steps.append(ProofStepNode(
+                        formula=goal,  # The proved goal
+                        rule_name="resolution",
+                        premises=[first_parent, second_parent],
+                        explanation=f"Resolved {first_parent} ({first_source}) and {second_parent} ({second_source}) to derive empty clause"
+                    ))
+                    logger.info(f"ResolutionProver: Success! Empty clause derived from {first_parent} and {second_parent}.")
+                    return ProofObject.create_success(
+                        conclusion_ast=goal,
+                        proof_steps=proof_steps,
+                        used_axioms_rules=set(context) if context else set(),
+                        inference_engine_used=self.name,
+                        time_taken_ms=time_taken_ms,
+                        resources_consumed=resources_consumed()
+                    )
+
+                if self._is_tautology(resolvent):
+                    statistics["tautologies"] += 1
+                    continue
+                if self._is_forward_subsumed(resolvent, subsumption_index):
+                    statistics["forward_subsumed"] += 1
+                    logger.debug(f"Skipping subsumed resolvent: {resolvent} from {first_parent} and {second_parent}")
+                    continue
+
+                resolvent_with_id = self._rename_clause(
+                    dataclasses.replace(resolvent, clause_id=self._get_next_clause_id()))
+
+                # Backward subsumption: the new clause replaces the clauses it subsumes
+                for candidate in subsumption_index.subsumed_candidates(resolvent_with_id):
+                    if candidate.clause_id not in protected_ids and self._subsumes(resolvent_with_id, candidate):
+                        delete(candidate)
+                        statistics["backward_subsumed"] += 1
+
+                keep(resolvent_with_id, make_active=False, make_passive=True)
+                statistics["kept"] += 1
+
+                proof_steps.append(ProofStepNode(
+                    formula=resolvent_with_id.literals,
+                    rule_name="resolution",
+                    premises=[first_parent, second_parent],
+                    explanation=f"Resolved {first_parent} ({first_source}) and {second_parent} ({second_source}) to derive ID {resolvent_with_id.clause_id}: {resolvent_with_id}"
+                ))
+                logger.info(f"ResolutionProver: Derived new clause {resolvent_with_id.clause_id}: {resolvent_with_id} from {first_parent} and {second_parent}")
+
+        # If we reach here, the clause set is saturated and the proof failed
         time_taken_ms = (time.time() - start_time) * 1000
         logger.info(f"ResolutionProver: Proof attempt finished. Could not derive empty clause within limits.")
         return ProofObject.create_failure(
             status_message="ResolutionProver: Could not derive empty clause within limits.",
             inference_engine_used=self.name,
             time_taken_ms=time_taken_ms,
-            resources_consumed={"iterations": iteration_count}
+            resources_consumed=resources_consumed()
         )
 
+    def _clause_priority(self, clause: Clause, strategy: ResolutionStrategy) -> Tuple[int, ...]:
+        """
+        Get the selection priority of a clause; lower values are selected first.
+
+        Clauses are ordered by weight (their number of symbols), with unit
+        preference ordering by the number of literals first. The clause ID
+        breaks ties in favour of older clauses.
+
+        Args:
+            clause: The clause to rank
+            strategy: The resolution strategy in use
+
+        Returns:
+            A priority tuple
+        """
+        weight = sum(self._symbol_count(literal.atom) for literal in clause.literals)
+        if strategy == ResolutionStrategy.UNIT_PREFERENCE:
+            return (len(clause.literals), weight, clause.clause_id)
+        return (weight, clause.clause_id)
+
+    @classmethod
+    def _symbol_count(cls, node: AST_Node) -> int:
+        """Count the symbols of a term."""
+        if isinstance(node, ApplicationNode):
+            return cls._symbol_count(node.operator) + sum(cls._symbol_count(arg) for arg in node.arguments)
+        return 1
+
+    @staticmethod
+    def _is_tautology(clause: Clause) -> bool:
+        """
+        Check if a clause is a tautology.
+
+        A clause is a tautology if it contains a literal and its negation.
+
+        Args:
+            clause: The clause to check
+
+        Returns:
+            True if the clause is a tautology, False otherwise
+        """
+        return any(literal.negate() in clause.literals
+                   for literal in clause.literals if not literal.is_negated)
+
+    def _is_forward_subsumed(self, clause: Clause, index: SubsumptionIndex) -> bool:
+        """Check if any indexed clause subsumes a clause."""
+        return any(self._subsumes(candidate, clause) for candidate in index.subsumer_candidates(clause))
+
+    @classmethod
+    def _subsumes(cls, subsumer: Clause, clause: Clause) -> bool:
+        """
+        Check if one clause subsumes another.
+
+        The subsumer subsumes the clause if some substitution maps each of its
+        literals onto a literal of the clause. Variables of the subsumed
+        clause are treated as constants.
+
+        Args:
+            subsumer: The candidate subsumer
+            clause: The clause that may be subsumed
+
+        Returns:
+            True if the subsumer subsumes the clause, False otherwise
+        """
+        if len(subsumer.literals) > len(clause.literals):
+            return False
+
+        targets: DefaultDict[Tuple[bool, Optional[Hashable]], List[Literal]] = defaultdict(list)
+        for literal in clause.literals:
+            targets[literal_key(literal)].append(literal)
+
+        # Match the most constrained literals first
+        literals = sorted(subsumer.literals, key=lambda literal: len(targets.get(literal_key(literal), ())))
+
+        def search(position: int, bindings: Dict[int, AST_Node]) -> bool:
+            if position == len(literals):
+                return True
+            literal = literals[position]
+            for target in targets.get(literal_key(literal), ()):
+                extended = dict(bindings)
+                if cls._match(literal.atom, target.atom, extended) and search(position + 1, extended):
+                    return True
+            return False
+
+        return search(0, {})
+
+    @classmethod
+    def _match(cls, pattern: AST_Node, target: AST_Node, bindings: Dict[int, AST_Node]) -> bool:
+        """
+        Match a pattern against a term, extending the bindings in place.
+
+        Only variables of the pattern are bound; nodes other than variables
+        and applications match when they are equal.
+
+        Args:
+            pattern: The pattern term
+            target: The term to match
+            bindings: Variable bindings by variable ID
+
+        Returns:
+            True if the pattern matches the term, False otherwise
+        """
+        if isinstance(pattern, VariableNode):
+            bound = bindings.get(pattern.var_id)
+            if bound is None:
+                bindings[pattern.var_id] = target
+                return True
+            return bound == target
+        if isinstance(pattern, ApplicationNode):
+            if not isinstance(target, ApplicationNode) or len(pattern.arguments) != len(target.arguments):
+                return False
+            if not cls._match(pattern.operator, target.operator, bindings):
+                return False
+            return all(cls._match(p, t, bindings) for p, t in zip(pattern.arguments, target.arguments))
+        return pattern == target
+
+    def _rename_clause(self, clause: Clause) -> Clause:
+        """
+        Rename the variables of a clause apart from every other clause.
+
+        Fresh variable IDs are drawn from the CNF converter's counter, so they
+        never clash with the variables of other clauses in the proof.
+
+        Args:
+            clause: The clause to rename
+
+        Returns:
+            The renamed clause, or the clause itself if it has no variables
+        """
+        renaming: Dict[int, VariableNode] = {}
+
+        def rename(node: AST_Node) -> AST_Node:
+            if isinstance(node, VariableNode):
+                fresh = renaming.get(node.var_id)
+                if fresh is None:
+                    fresh = VariableNode(node.name, self.cnf_converter.next_var_id, node.type)
+                    self.cnf_converter.next_var_id += 1
+                    renaming[node.var_id] = fresh
+                return fresh
+            if isinstance(node, ApplicationNode):
+                operator = rename(node.operator)
+                arguments = [rename(arg) for arg in node.arguments]
+                if operator is node.operator and all(new is old for new, old in zip(arguments, node.arguments)):
+                    return node
+                return ApplicationNode(operator, arguments, node.type)
+            return node
+
+        literals = frozenset(Literal(rename(literal.atom), literal.is_negated) for literal in clause.literals)
+        if not renaming:
+            return clause
+        return dataclasses.replace(clause, literals=literals)
+
+    @staticmethod
+    def _ancestors(clause: Clause, history: Dict[int, Clause]) -> List[Clause]:
+        """Get the ancestors of a clause, nearest first."""
+        ancestors = []
+        seen: Set[int] = set()
+        frontier = deque(clause.parent_ids)
+        while frontier:
+            clause_id = frontier.popleft()
+            if clause_id in seen or clause_id not in history:
+                continue
+            seen.add(clause_id)
+            ancestor = history[clause_id]
+            ancestors.append(ancestor)
+            frontier.extend(ancestor.parent_ids)
+        return ancestors
+
+    def _resolve_on(self, clause1: Clause, literal1: Literal,
+                    clause2: Clause, literal2: Literal) -> Optional[Clause]:
+        """
+        Resolve two clauses upon a pair of complementary literals.
+
+        The clauses must not share variables.
+
+        Args:
+            clause1: The first clause.
+            literal1: The literal of the first clause to resolve upon.
+            clause2: The second clause.
+            literal2: The complementary literal of the second clause.
+
+        Returns:
+            The resolvent, or None if the literals' atoms do not unify.
+        """
+        unification_result = self.unification_engine.unify_consistent(literal1.atom, literal2.atom)
+        if not unification_result.is_success():
+            return None
+
+        substitution = unification_result.substitution
+        new_literals_set: Set[Literal] = set()
+        for clause, resolved in ((clause1, literal1), (clause2, literal2)):
+            for literal in clause.literals:
+                if literal != resolved:
+                    atom = literal.atom
+                    if substitution:
+                        atom = self.unification_engine.apply_substitution(atom, substitution)
+                    new_literals_set.add(Literal(atom=atom, is_negated=literal.is_negated))
+
+        resolvent_clause = Clause(literals=frozenset(new_literals_set), source="derived",
+                                  parent_ids=(clause1.clause_id, clause2.clause_id))
+        logger.debug(f"Resolved {literal1} (c1: {clause1.clause_id}) and {literal2} (c2: {clause2.clause_id}) -> {resolvent_clause} with sub: {substitution}")
+        return resolvent_clause
+
     def _resolve(self, clause1: Clause, clause2: Clause) -> List[Clause]:
         """
         Resolve two clauses.
@@ -854,6 +1376,9 @@ class ResolutionProver(BaseProver):
         try to unify their atoms. If unification succeeds with substitution S,
         the resolvent is ( (clause1 - {L1}) U (clause2 - {L2}) )S.
 
+        The variables of clause2 are renamed apart first, so a clause can be
+        resolved with itself.
+
         Args:
             clause1: The first clause.
             clause2: The second clause.
@@ -862,133 +1387,22 @@ class ResolutionProver(BaseProver):
             A list of resolvent clauses. Can be empty if no resolution is possible.
             Can contain the empty clause if a contradiction is found.
         """
+        renamed_clause2 = self._rename_clause(clause2)
         resolvents: List[Clause] = []
-        
-        # Create copies of clauses to rename variables without affecting original clauses in the knowledge base
-        # The renaming should ensure that variables from clause1 and clause2 are distinct before unification.
-        # We use a unique suffix based on current time and clause IDs to try and ensure uniqueness.
-        # A more robust way is to pass a global variable counter or use a more systematic renaming scheme.
-        
-        # Suffix for renaming, to make variables in this resolution step unique
-        # Using a combination of clause IDs and a portion of the prover's clause counter for variety
-        # This is a heuristic. A more robust approach would be a dedicated variable renaming utility
-        # that ensures no clashes with any existing variable in the entire proof process if needed.
-        # For resolving just two clauses, making them distinct from each other is the primary goal.
-        
-        # Standardize variables apart for this resolution step.
-        # This is crucial to avoid unintended variable capture.
-        # We'll create new versions of the atoms with fresh variables.
-        # The renaming prefix should be different for clause1 and clause2.
-
-        # Create a new clause by renaming variables in clause1
-        c1_renamed_literals: Set[Literal] = set()
-        c1_var_map: Dict[str, VariableNode] = {}
-        # Use a more unique prefix for renaming, perhaps related to the resolution step or a counter
-        # For simplicity, let's use a fixed prefix and rely on the unification engine or hope for the best.
-        # A better approach: self._get_next_temp_var_id() or similar for fresh variable names.
-        # For now, we will rely on the unification engine to handle variables correctly if they are distinct.
-        # The critical part is that variables in lit1.atom and lit2.atom must be treated as distinct if they have the same name.
-        # The UnificationEngine should ideally handle this by not assuming shared scopes unless explicitly told.
-        # However, to be safe, we should rename. Let's use a simple renaming strategy here.
-
-        def rename_vars_in_ast(node: AST_Node, var_map: Dict[str, VariableNode], prefix: str, instance_id: int) -> AST_Node:
-            if isinstance(node, VariableNode):
-                original_name = node.name
-                if original_name not in var_map:
-                    # Create a new unique variable name
-                    new_var_name = f"{prefix}_{original_name}_{instance_id}"
-                    var_map[original_name] = VariableNode(new_var_name, node.type)
-                return var_map[original_name]
-            elif isinstance(node, ConstantNode):
-                return node
-            elif isinstance(node, ApplicationNode):
-                new_args = [rename_vars_in_ast(arg, var_map, prefix, instance_id) for arg in node.arguments]
-                return ApplicationNode(node.operator, new_args, node.type)
-            return node # Should not happen for atoms in literals
-
-        # Create resolvable versions of clauses with variables standardized apart
-        # We need a unique instance_id for renaming to avoid clashes if the same clause is used multiple times
-        # with itself or with another clause that was derived from it.
-        # Using object ids or clause_ids might work if they are sufficiently unique for this purpose.
-        
-        # Renaming for clause1
-        renamed_c1_literals: Set[Literal] = set()
-        c1_rename_map: Dict[str, VariableNode] = {}
-        # Use clause_id and a counter to ensure unique renaming context
-        # This renaming is local to this _resolve call.
-        # A simpler approach might be to just pass copies of atoms to unify and let unifier handle it, 
-        # but explicit renaming is safer.
-        
-        # For each literal in clause1, create a version with renamed variables
-        temp_id1 = self._get_next_clause_id() # Get a unique ID for this renaming context
-        for lit_c1 in clause1.literals:
-            renamed_atom_c1 = rename_vars_in_ast(lit_c1.atom, c1_rename_map, "r1", temp_id1)
-            renamed_c1_literals.add(Literal(atom=renamed_atom_c1, is_negated=lit_c1.is_negated))
-
-        # Renaming for clause2
-        renamed_c2_literals: Set[Literal] = set()
-        c2_rename_map: Dict[str, VariableNode] = {}
-        temp_id2 = self._get_next_clause_id() # Get another unique ID
-        for lit_c2 in clause2.literals:
-            renamed_atom_c2 = rename_vars_in_ast(lit_c2.atom, c2_rename_map, "r2", temp_id2)
-            renamed_c2_literals.add(Literal(atom=renamed_atom_c2, is_negated=lit_c2.is_negated))
-
-        for lit1_renamed in renamed_c1_literals:
-            for lit2_renamed in renamed_c2_literals:
-                if lit1_renamed.is_negated != lit2_renamed.is_negated:
-                    # Atoms are already renamed, so they can be unified directly.
-                    unification_result = self.unification_engine.unify_consistent(lit1_renamed.atom, lit2_renamed.atom)
-
-                    if unification_result.is_success():
-                        substitution = unification_result.substitution
-                        new_literals_set: Set[Literal] = set()
-
-                        # Add literals from renamed_c1_literals (excluding lit1_renamed), applying substitution
-                        for l_from_c1 in renamed_c1_literals:
-                            if l_from_c1 != lit1_renamed:
-                                substituted_atom = self.unification_engine.apply_substitution(l_from_c1.atom, substitution)
-                                new_literals_set.add(Literal(atom=substituted_atom, is_negated=l_from_c1.is_negated))
-
-                        # Add literals from renamed_c2_literals (excluding lit2_renamed), applying substitution
-                        for l_from_c2 in renamed_c2_literals:
-                            if l_from_c2 != lit2_renamed:
-                                substituted_atom = self.unification_engine.apply_substitution(l_from_c2.atom, substitution)
-                                new_literals_set.add(Literal(atom=substituted_atom, is_negated=l_from_c2.is_negated))
-                        
-                        resolvent_clause = Clause(literals=frozenset(new_literals_set))
-                        resolvents.append(resolvent_clause)
-                        # Corrected logger string, removed trailing backslash
-                        logger.debug(f"Resolved {lit1_renamed} (orig c1: {clause1.clause_id}) and {lit2_renamed} (orig c2: {clause2.clause_id}) -> {resolvent_clause} with sub: {substitution}")
-        
+        for literal1 in clause1.literals:
+            key = literal_key(literal1.negate())
+            for literal2 in renamed_clause2.literals:
+                other = literal_key(literal2)
+                if other[0] == key[0] and (other[1] == key[1] or None in (other[1], key[1])):
+                    resolvent = self._resolve_on(clause1, literal1, renamed_clause2, literal2)
+                    if resolvent is not None:
+                        resolvents.append(resolvent)
         return resolvents
 
     def _standardize_variables_in_clause(self, clause: Clause, clause_id_for_renaming: int) -> Clause:
         """
         Standardizes variables within a single clause to make them unique.
-        This method is kept for potential utility but the primary renaming for resolution
-        now happens inside `_resolve` for the pair of clauses being resolved.
+        This method is kept for potential utility; fresh variable IDs now come
+        from the CNF converter's counter, so ``clause_id_for_renaming`` is unused.
         """
-        var_map: Dict[str, VariableNode] = {}
-        new_literals: Set[Literal] = set()
-
-        # Inner helper function for renaming, similar to the one in _resolve
-        def rename_node_vars(node: AST_Node, current_var_map: Dict[str, VariableNode], base_prefix: str, id_suffix: int) -> AST_Node:
-            if isinstance(node, VariableNode):
-                original_name = node.name
-                if original_name not in current_var_map:
-                    new_var_name = f"{base_prefix}_{original_name}_{id_suffix}"
-                    current_var_map[original_name] = VariableNode(new_var_name, node.type)
-                return current_var_map[original_name]
-            elif isinstance(node, ConstantNode):
-                return node
-            elif isinstance(node, ApplicationNode):
-                new_args = [rename_node_vars(arg, current_var_map, base_prefix, id_suffix) for arg in node.arguments]
-                return ApplicationNode(node.function_name, new_args, node.type)
-            return node
-
-        # Use the passed clause_id_for_renaming to ensure context-specific renaming
-        for lit in clause.literals:
-            new_atom = rename_node_vars(lit.atom, var_map, "std", clause_id_for_renaming)
-            new_literals.add(Literal(atom=new_atom, is_negated=lit.is_negated))
-        
-        return Clause(literals=frozenset(new_literals), source=clause.source, parent_ids=clause.parent_ids, clause_id=clause.clause_id)
\ No newline at end of file
+        return self._rename_clause(clause)
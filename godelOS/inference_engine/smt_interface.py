@@ -5,12 +5,16 @@ This module implements the SMTInterface class, which interfaces with external
 SMT (Satisfiability Modulo Theories) solvers like Z3, CVC5, Yices. It translates
 GödelOS expressions into the SMT-LIB 2 standard format, invokes the external solver,
 and parses the results back into a GödelOS-understandable format.
+
+Solvers configured with interactive options are run as persistent sessions from
+an SMTSessionPool; other solvers are run once per query on a script file.
 """
 
 import subprocess
 import tempfile
 import os
-from typing import Dict, List, Optional, Set, Tuple, Any
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Any
 import time
 import logging
 
@@ -19,6 +23,7 @@ from godelOS.core_kr.type_system.types import Type, AtomicType, FunctionType, In
 from godelOS.core_kr.type_system.manager import TypeSystemManager
 from godelOS.inference_engine.base_prover import BaseProver, ResourceLimits
 from godelOS.inference_engine.proof_object import ProofObject, ProofStepNode
+from godelOS.inference_engine.smt_session import SMTSessionPool, SMTSessionError, SMTSessionTimeout
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -32,7 +37,8 @@ class SMTSolverConfiguration:
     including the path to the executable and command-line options.
     """
     
-    def __init__(self, solver_name: str, solver_path: str, solver_options: List[str] = None):
+    def __init__(self, solver_name: str, solver_path: str, solver_options: List[str] = None,
+                 interactive_options: Optional[List[str]] = None):
         """
         Initialize an SMT solver configuration.
         
@@ -40,10 +46,20 @@ class SMTSolverConfiguration:
             solver_name: The name of the solver (e.g., "Z3", "CVC5")
             solver_path: The path to the solver executable
             solver_options: Optional command-line options for the solver
+            interactive_options: Optional command-line options that make the solver
+                                 read commands from stdin (e.g., ["-in"] for Z3 or
+                                 ["--incremental", "--interactive"] for CVC5). Solvers
+                                 with interactive options are run as persistent sessions.
         """
         self.solver_name = solver_name
         self.solver_path = solver_path
         self.solver_options = solver_options or []
+        self.interactive_options = interactive_options
+    
+    @property
+    def supports_sessions(self) -> bool:
+        """Check whether the solver can be run as a persistent session."""
+        return self.interactive_options is not None
     
     def get_command(self, input_file: str) -> List[str]:
         """
@@ -56,6 +72,15 @@ class SMTSolverConfiguration:
             The command as a list of strings
         """
         return [self.solver_path] + self.solver_options + [input_file]
+    
+    def get_session_command(self) -> List[str]:
+        """
+        Get the command to start the solver in interactive mode.
+        
+        Returns:
+            The command as a list of strings
+        """
+        return [self.solver_path] + self.solver_options + (self.interactive_options or [])
 
 
 class SMTResult:
@@ -91,18 +116,31 @@ class SMTInterface(BaseProver):
     GödelOS-understandable format.
     """
     
+    # Maximum number of context sets whose declarations and assertions are cached
+    MAX_CACHED_CONTEXTS = 64
+    
     def __init__(self, solver_configs: List[SMTSolverConfiguration], 
-                type_system: TypeSystemManager):
+                type_system: TypeSystemManager,
+                session_pool: Optional[SMTSessionPool] = None):
         """
         Initialize the SMT interface.
         
         Args:
             solver_configs: List of configurations for available SMT solvers
             type_system: The type system manager for type checking and inference
+            session_pool: Optional pool of solver sessions, shared with other interfaces
         """
         self.solver_configs = solver_configs
         self.type_system = type_system
         self.default_solver = solver_configs[0] if solver_configs else None
+        self.session_pool = session_pool or SMTSessionPool()
+        
+        # Context-level SMT-LIB commands keyed by context set, in LRU order
+        self._context_scripts: OrderedDict = OrderedDict()
+    
+    def close(self) -> None:
+        """Stop the idle solver sessions of this interface's pool."""
+        self.session_pool.close()
     
     @property
     def name(self) -> str:
@@ -199,6 +237,12 @@ class SMTInterface(BaseProver):
         logger.info(f"Using solver: {solver_config.solver_name}")
         logger.info(f"Logic theory: {logic_theory}")
         
+        if solver_config.supports_sessions:
+            return self._check_satisfiability_in_session(
+                solver_config, formula_ast, axioms_asts or set(), logic_theory,
+                request_model, request_unsat_core, resources, start_time
+            )
+        
         try:
             # Step 1: Translate the formula and axioms to SMT-LIB format
             smt_script = self._generate_smt_script(
@@ -284,21 +328,9 @@ class SMTInterface(BaseProver):
         # Set the logic
         script_lines.append(f"(set-logic {logic_theory})")
         
-        # Collect all variables and function symbols
+        # Declare sorts (types) and symbols (constants, variables, functions)
         all_asts = {formula_ast} | axioms_asts
-        symbols = self._collect_symbols(all_asts)
-        
-        # Declare sorts (types)
-        declared_sorts = set()
-        for symbol_type in symbols.values():
-            self._declare_sorts_for_type(symbol_type, declared_sorts, script_lines)
-        
-        # Declare symbols (constants, variables, functions)
-        for symbol, symbol_type in symbols.items():
-            if isinstance(symbol, ConstantNode):
-                script_lines.append(self._declare_constant(symbol, symbol_type))
-            elif isinstance(symbol, VariableNode):
-                script_lines.append(self._declare_variable(symbol, symbol_type))
+        script_lines.extend(self._declaration_lines(all_asts, set(), set()))
         
         # Add assertions for axioms
         if axioms_asts:
@@ -330,6 +362,156 @@ class SMTInterface(BaseProver):
         # Combine all lines into a single script
         return "\n".join(script_lines)
     
+    def _check_satisfiability_in_session(self, solver_config: SMTSolverConfiguration,
+                                         formula_ast: AST_Node, axioms_asts: Set[AST_Node],
+                                         logic_theory: str, request_model: bool,
+                                         request_unsat_core: bool,
+                                         resources: Optional[ResourceLimits],
+                                         start_time: float) -> SMTResult:
+        """
+        Check the satisfiability of a formula in a pooled solver session.
+        
+        The axioms are asserted at the session's context level, where they stay
+        for later queries over the same axioms; the formula is asserted in a
+        query level that is popped afterwards.
+        
+        Args:
+            solver_config: The solver to use
+            formula_ast: The formula to check
+            axioms_asts: The axioms to include
+            logic_theory: The SMT-LIB logic theory to use
+            request_model: Whether to request a model if satisfiable
+            request_unsat_core: Whether to request an unsat core if unsatisfiable
+            resources: Optional resource limits for the solver
+            start_time: The time the check started
+            
+        Returns:
+            An SMTResult object containing the result of the solver invocation
+        """
+        timeout_seconds = None
+        if resources and resources.time_limit_ms is not None:
+            timeout_seconds = resources.time_limit_ms / 1000.0
+        
+        context_key = frozenset(axioms_asts)
+        session = None
+        discard = False
+        try:
+            session = self.session_pool.acquire(solver_config.get_session_command(),
+                                                logic_theory, context_key)
+            if session.context_key != context_key:
+                sorts, symbols, commands = self._context_script(context_key)
+                session.set_context(context_key, sorts, symbols, commands)
+            
+            query_lines = self._declaration_lines(
+                {formula_ast}, set(session.context_sorts), set(session.context_symbols)
+            )
+            formula_smt = self._translate_ast_to_smtlib(formula_ast)
+            if request_unsat_core:
+                query_lines.append(f"(assert (! {formula_smt} :named formula))")
+            else:
+                query_lines.append(f"(assert {formula_smt})")
+            query_lines.append("(check-sat)")
+            
+            # Solvers report an error for (get-model) unless the status is sat
+            # and for (get-unsat-core) unless it is unsat, so these are only
+            # requested once the status is known
+            def follow_up(status_output: str) -> List[str]:
+                status = status_output.strip().split('\n')[-1].strip()
+                if status == "sat" and request_model:
+                    return ["(get-model)"]
+                if status == "unsat" and request_unsat_core:
+                    return ["(get-unsat-core)"]
+                return []
+            
+            output = session.query(query_lines, timeout_seconds, follow_up)
+            
+            # Errors from the context's commands only surface in this output,
+            # so the context level may be incomplete and the session is unusable
+            errors = [line for line in output.split('\n') if line.lstrip().startswith("(error")]
+            if errors:
+                discard = True
+                logger.error(f"SMT solver reported errors: {' '.join(errors)}")
+                return SMTResult(status="error")
+        except SMTSessionTimeout:
+            discard = True
+            logger.warning(f"SMT solver timed out after {timeout_seconds} seconds")
+            return SMTResult(status="timeout")
+        except (SMTSessionError, OSError) as e:
+            discard = True
+            logger.error(f"SMT solver session failed: {e}")
+            return SMTResult(status="error")
+        except Exception as e:
+            discard = True
+            logger.exception(f"Error during SMT solving: {e}")
+            return SMTResult(status="error")
+        finally:
+            if session is not None:
+                self.session_pool.release(session, discard=discard)
+        
+        result = self._parse_smt_result(output, request_model, request_unsat_core)
+        logger.info(f"SMT solver returned: {result.status} in {(time.time() - start_time) * 1000:.2f}ms")
+        return result
+    
+    def _context_script(self, context_key: FrozenSet[AST_Node]) -> Tuple[Set[str], Set[str], List[str]]:
+        """
+        Get the declarations and named assertions for a set of axioms.
+        
+        Args:
+            context_key: The axioms
+            
+        Returns:
+            The declared sort names, the declared symbol names and the SMT-LIB commands
+        """
+        cached = self._context_scripts.get(context_key)
+        if cached is not None:
+            self._context_scripts.move_to_end(context_key)
+            return cached
+        
+        sorts, symbols = set(), set()
+        commands = self._declaration_lines(context_key, sorts, symbols)
+        for axiom in context_key:
+            commands.append(f"(assert (! {self._translate_ast_to_smtlib(axiom)} :named axiom_{id(axiom)}))")
+        
+        self._context_scripts[context_key] = (sorts, symbols, commands)
+        if len(self._context_scripts) > self.MAX_CACHED_CONTEXTS:
+            self._context_scripts.popitem(last=False)
+        return sorts, symbols, commands
+    
+    def _declaration_lines(self, asts: Set[AST_Node], declared_sorts: Set[str],
+                           declared_symbols: Set[str]) -> List[str]:
+        """
+        Generate declarations for the sorts and symbols of some ASTs.
+        
+        Sorts and symbols in the given sets are skipped; newly declared ones
+        are added to the sets.
+        
+        Args:
+            asts: The AST nodes to declare the sorts and symbols of
+            declared_sorts: Names of the sorts already declared
+            declared_symbols: Names of the symbols already declared
+            
+        Returns:
+            The SMT-LIB declarations, sorts first
+        """
+        lines = []
+        symbols = self._collect_symbols(asts)
+        
+        for symbol_type in symbols.values():
+            self._declare_sorts_for_type(symbol_type, declared_sorts, lines)
+        
+        for symbol, symbol_type in symbols.items():
+            if isinstance(symbol, ConstantNode):
+                name, declaration = symbol.name, self._declare_constant(symbol, symbol_type)
+            elif isinstance(symbol, VariableNode):
+                name, declaration = f"{symbol.name}_{symbol.var_id}", self._declare_variable(symbol, symbol_type)
+            else:
+                continue
+            if name not in declared_symbols:
+                declared_symbols.add(name)
+                lines.append(declaration)
+        
+        return lines
+    
     def _collect_symbols(self, asts: Set[AST_Node]) -> Dict[AST_Node, 'Type']:
         """
         Collect all symbols (constants, variables, functions) from a set of AST nodes.
@@ -0,0 +1,282 @@
+"""
+Persistent SMT solver sessions for the SMT Interface.
+
+This module implements the SMTSolverSession class, which keeps an external SMT
+solver running in interactive mode and talks to it over stdin/stdout pipes,
+and the SMTSessionPool class, which hands out idle sessions so that solver
+startup is paid once rather than once per query.
+
+A session keeps two assertion levels on the solver's stack: the context level
+holds the declarations and axioms of the current context set, and the query
+level, pushed and popped around each query, holds everything specific to one
+query. Queries over the same context set therefore reuse the declarations and
+axioms already asserted in the solver.
+"""
+
+import itertools
+import logging
+import queue
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class SMTSessionError(Exception):
+    """Raised when a solver session can no longer be used."""
+    pass
+
+
+class SMTSessionTimeout(SMTSessionError):
+    """Raised when the solver does not answer within the time limit."""
+    pass
+
+
+class SMTSolverSession:
+    """
+    A solver process kept alive across queries.
+
+    Responses are delimited by echoing a unique marker after each batch of
+    commands, so the session knows where the solver's answer ends without
+    relying on solver-specific output conventions.
+    """
+
+    _markers = itertools.count()
+
+    def __init__(self, command: List[str], logic_theory: str):
+        """
+        Start a solver session.
+
+        Args:
+            command: The command starting the solver in interactive mode
+            logic_theory: The SMT-LIB logic theory of the session
+        """
+        self.command = command
+        self.logic_theory = logic_theory
+
+        # The context set currently asserted at the context level, and the
+        # sorts and symbol names declared there
+        self.context_key: Optional[FrozenSet[Hashable]] = None
+        self.context_sorts: Set[str] = set()
+        self.context_symbols: Set[str] = set()
+
+        self.queries = 0
+
+        self._process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+
+        # A reader thread moves output lines into a queue, so that reads can
+        # be given a timeout
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+        self.send([
+            "(set-option :print-success false)",
+            "(set-option :produce-models true)",
+            "(set-option :produce-unsat-cores true)",
+            f"(set-logic {logic_theory})",
+            "(push 1)",
+        ])
+
+    @property
+    def alive(self) -> bool:
+        """Check whether the solver process is still running."""
+        return self._process.poll() is None
+
+    def _read_output(self) -> None:
+        """Forward the solver's output lines to the line queue until it exits."""
+        for line in self._process.stdout:
+            self._lines.put(line.rstrip("\n"))
+        self._lines.put(None)
+
+    def send(self, commands: List[str]) -> None:
+        """
+        Send commands to the solver without waiting for a response.
+
+        Args:
+            commands: The SMT-LIB commands
+
+        Raises:
+            SMTSessionError: If the solver is no longer running
+        """
+        try:
+            self._process.stdin.write("\n".join(commands) + "\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise SMTSessionError(f"SMT solver session is closed: {e}")
+
+    def request(self, commands: List[str], timeout: Optional[float] = None) -> str:
+        """
+        Send commands to the solver and collect its response.
+
+        Args:
+            commands: The SMT-LIB commands
+            timeout: Optional time limit in seconds for the whole response
+
+        Returns:
+            The solver's output for the commands
+
+        Raises:
+            SMTSessionTimeout: If the solver does not answer in time
+            SMTSessionError: If the solver exits while answering
+        """
+        marker = f"godelos-done-{next(self._markers)}"
+        self.send(commands + [f'(echo "{marker}")'])
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        output = []
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise SMTSessionTimeout(f"SMT solver did not answer within {timeout} seconds")
+            if line is None:
+                raise SMTSessionError("SMT solver exited while answering")
+            if line.strip().strip('"') == marker:
+                return "\n".join(output)
+            output.append(line)
+
+    def set_context(self, context_key: FrozenSet[Hashable], sorts: Set[str],
+                    symbols: Set[str], commands: List[str]) -> None:
+        """
+        Replace the context level with a new context set.
+
+        Args:
+            context_key: The identity of the context set
+            sorts: The sorts the commands declare
+            symbols: The symbol names the commands declare
+            commands: The declarations and assertions of the context set
+        """
+        self.send(["(pop 1)", "(push 1)"] + commands)
+        self.context_key = context_key
+        self.context_sorts = set(sorts)
+        self.context_symbols = set(symbols)
+
+    def query(self, commands: List[str], timeout: Optional[float] = None,
+              follow_up: Optional[Callable[[str], List[str]]] = None) -> str:
+        """
+        Run a query in its own assertion level on top of the context.
+
+        Args:
+            commands: The query's declarations, assertions and check commands
+            timeout: Optional time limit in seconds for the whole query
+            follow_up: Optional function given the output of the commands and
+                       returning commands to run before the level is popped,
+                       e.g. (get-model) once the status is known to be sat
+
+        Returns:
+            The solver's output for the query, including the follow-up commands
+        """
+        self.queries += 1
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        output = self.request(["(push 1)"] + commands, timeout)
+
+        follow_up_commands = follow_up(output) if follow_up else []
+        remaining = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+        follow_up_output = self.request(follow_up_commands + ["(pop 1)"], remaining)
+        return "\n".join(part for part in (output, follow_up_output) if part)
+
+    def close(self) -> None:
+        """Stop the solver process."""
+        if self.alive:
+            try:
+                self.send(["(exit)"])
+                self._process.wait(timeout=1)
+            except (SMTSessionError, subprocess.TimeoutExpired):
+                pass
+        if self.alive:
+            self._process.kill()
+            self._process.wait()
+
+
+class SMTSessionPool:
+    """
+    A pool of idle solver sessions.
+
+    Sessions are keyed by solver command and logic theory. When a session is
+    acquired, an idle session whose context level already holds the requested
+    context set is preferred.
+    """
+
+    def __init__(self, max_idle_sessions: int = 4):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_idle_sessions: The maximum number of idle sessions kept per
+                               solver command and logic theory
+        """
+        self.max_idle_sessions = max_idle_sessions
+        self._idle: Dict[Tuple[Tuple[str, ...], str], List[SMTSolverSession]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"started": 0, "reused": 0, "context_hits": 0, "discarded": 0}
+
+    def acquire(self, command: List[str], logic_theory: str,
+                context_key: Optional[FrozenSet[Hashable]] = None) -> SMTSolverSession:
+        """
+        Get a session for a solver and logic theory, starting one if none is idle.
+
+        Args:
+            command: The command starting the solver in interactive mode
+            logic_theory: The SMT-LIB logic theory
+            context_key: The context set the session will be used with
+
+        Returns:
+            A session owned by the caller until it is released
+        """
+        key = (tuple(command), logic_theory)
+        with self._lock:
+            idle = self._idle.get(key, [])
+            # Drop sessions whose solver has exited while idle
+            idle[:] = [session for session in idle if session.alive]
+            if idle:
+                self.stats["reused"] += 1
+                for i, session in enumerate(idle):
+                    if session.context_key == context_key:
+                        self.stats["context_hits"] += 1
+                        return idle.pop(i)
+                return idle.pop()
+            self.stats["started"] += 1
+
+        logger.debug(f"Starting SMT solver session: {' '.join(command)}")
+        return SMTSolverSession(command, logic_theory)
+
+    def release(self, session: SMTSolverSession, discard: bool = False) -> None:
+        """
+        Return a session to the pool.
+
+        Args:
+            session: The session
+            discard: Whether the session is in an unknown state and must be closed
+        """
+        key = (tuple(session.command), session.logic_theory)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if not discard and session.alive and len(idle) < self.max_idle_sessions:
+                idle.append(session)
+                return
+            self.stats["discarded"] += 1
+        session.close()
+
+    def close(self) -> None:
+        """Stop all idle sessions."""
+        with self._lock:
+            sessions = [session for idle in self._idle.values() for session in idle]
+            self._idle.clear()
+        for session in sessions:
+            session.close()
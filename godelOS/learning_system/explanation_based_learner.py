@@ -6,13 +6,16 @@ which is responsible for analyzing successful problem-solving instances (ProofOb
 forming generalized rules (LogicTemplates) that capture the essence of the solutions.
 
 The ExplanationBasedLearner generalizes specific instances by abstracting constants into
-variables while ensuring the derived rules remain valid and operational.
+variables while ensuring the derived rules remain valid and operational. Proofs with
+the same skeleton (rule names and premises up to the choice of goal constants) give the
+same rule, so learned rules are cached by skeleton.
 """
 
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Any, DefaultDict
+import threading
+from typing import Dict, Hashable, List, Optional, Set, Tuple, Any, DefaultDict
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, ApplicationNode, ConnectiveNode
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
@@ -88,6 +91,70 @@ class GeneralizedExplanation:
         )
 
 
+class GeneralizationCache:
+    """
+    Cache of the rules learned from proofs, keyed by proof skeleton.
+    
+    A cache can be shared by several learners working against the same
+    knowledge base; it is safe to use from multiple threads. The least
+    recently used entries are evicted once the cache is full. Since unfolding
+    consults the knowledge base, the cache should be cleared when predicate
+    definitions change.
+    """
+    
+    def __init__(self, max_size: int = 10000):
+        """
+        Initialize the generalization cache.
+        
+        Args:
+            max_size: The maximum number of skeletons to keep rules for
+        """
+        self.max_size = max_size
+        self._cache: "OrderedDict[Hashable, Optional[AST_Node]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+    
+    def lookup(self, skeleton: Hashable) -> Tuple[bool, Optional[AST_Node]]:
+        """
+        Look up the rule learned from proofs with a skeleton.
+        
+        Args:
+            skeleton: The proof skeleton
+            
+        Returns:
+            A tuple of (found, rule); the rule may be None if generalization failed
+        """
+        with self._lock:
+            if skeleton not in self._cache:
+                self.stats["misses"] += 1
+                return False, None
+            self._cache.move_to_end(skeleton)
+            self.stats["hits"] += 1
+            return True, self._cache[skeleton]
+    
+    def put(self, skeleton: Hashable, rule: Optional[AST_Node]) -> None:
+        """
+        Cache the rule learned from proofs with a skeleton.
+        
+        Args:
+            skeleton: The proof skeleton
+            rule: The learned rule, or None if generalization failed
+        """
+        with self._lock:
+            self._cache[skeleton] = rule
+            self._cache.move_to_end(skeleton)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._cache.clear()
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
 class ExplanationBasedLearner:
     """
     Explanation-Based Learner for GödelOS.
@@ -99,7 +166,8 @@ class ExplanationBasedLearner:
     
     def __init__(self, kr_system_interface: KnowledgeStoreInterface, 
                  inference_engine: InferenceCoordinator,
-                 operationality_config: Optional[OperationalityConfig] = None):
+                 operationality_config: Optional[OperationalityConfig] = None,
+                 generalization_cache: Optional[GeneralizationCache] = None):
         """
         Initialize the Explanation-Based Learner.
         
@@ -107,10 +175,14 @@ class ExplanationBasedLearner:
             kr_system_interface: Interface to the Knowledge Representation system
             inference_engine: The inference engine for checking entailment
             operationality_config: Configuration for determining which predicates are operational
+            generalization_cache: Cache of learned rules, which may be shared with
+                                  other learners; a new one is created if omitted
         """
         self.ksi = kr_system_interface
         self.inference_engine = inference_engine
         self.op_config = operationality_config or OperationalityConfig()
+        self.generalization_cache = (generalization_cache if generalization_cache is not None
+                                     else GeneralizationCache())
         
     def generalize_from_proof_object(self, proof_object: ProofObject) -> Optional[AST_Node]:
         """
@@ -118,6 +190,9 @@ class ExplanationBasedLearner:
         
         This method analyzes a successful proof object and forms a generalized rule
         that captures the essence of the solution by abstracting constants into variables.
+        If a proof with the same skeleton has been generalized before, the cached rule
+        is returned; it differs from the rule this proof would give at most in the
+        names of its variables.
         
         Args:
             proof_object: The successful proof object to generalize from
@@ -133,11 +208,83 @@ class ExplanationBasedLearner:
             logger.warning("Proof object has no conclusion")
             return None
         
-        logger.info(f"Generalizing from proof for: {proof_object.conclusion_ast}")
-        
         # Step 1: Extract the explanation structure from the proof object
         explanation = self._extract_explanation(proof_object)
         
+        skeleton = self._get_proof_skeleton(explanation, proof_object)
+        found, logic_template = self.generalization_cache.lookup(skeleton)
+        if found:
+            logger.debug(f"Reusing logic template for: {proof_object.conclusion_ast}")
+            return logic_template
+        
+        logic_template = self._generalize(explanation, proof_object)
+        self.generalization_cache.put(skeleton, logic_template)
+        return logic_template
+    
+    def generalize_from_proof_objects(self, proof_objects: List[ProofObject]) -> List[Optional[AST_Node]]:
+        """
+        Generalize from many proof objects, generalizing each proof skeleton once.
+        
+        Args:
+            proof_objects: The proof objects to generalize from
+            
+        Returns:
+            The generalized rule for each proof object, in order, or None where
+            generalization failed
+        """
+        rules: List[Optional[AST_Node]] = []
+        rules_by_skeleton: Dict[Hashable, Optional[AST_Node]] = {}
+        
+        for proof_object in proof_objects:
+            if not proof_object.goal_achieved or not proof_object.conclusion_ast:
+                rules.append(self.generalize_from_proof_object(proof_object))
+                continue
+            
+            explanation = self._extract_explanation(proof_object)
+            skeleton = self._get_proof_skeleton(explanation, proof_object)
+            
+            if skeleton not in rules_by_skeleton:
+                found, logic_template = self.generalization_cache.lookup(skeleton)
+                if not found:
+                    logic_template = self._generalize(explanation, proof_object)
+                    self.generalization_cache.put(skeleton, logic_template)
+                rules_by_skeleton[skeleton] = logic_template
+            
+            rules.append(rules_by_skeleton[skeleton])
+        
+        logger.info(f"Generalized {len(proof_objects)} proofs with {len(rules_by_skeleton)} distinct skeletons")
+        return rules
+    
+    def get_generalization_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the generalization cache.
+        
+        Returns:
+            A dictionary with the number of cached skeletons, hits, misses and hit rate
+        """
+        hits = self.generalization_cache.stats["hits"]
+        misses = self.generalization_cache.stats["misses"]
+        return {
+            "size": len(self.generalization_cache),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0
+        }
+    
+    def _generalize(self, explanation: Dict[int, ProofStepNode],
+                    proof_object: ProofObject) -> Optional[AST_Node]:
+        """
+        Generalize an explanation extracted from a successful proof object.
+        
+        Args:
+            explanation: The explanation structure extracted from the proof object
+            proof_object: The proof object
+            
+        Returns:
+            A generalized rule as an AST_Node, or None if generalization failed
+        """
+        logger.info(f"Generalizing from proof for: {proof_object.conclusion_ast}")
+        
         # Step 2: Generalize the explanation by variabilizing constants
         generalized_explanation = self._generalize_explanation(explanation, proof_object)
         
@@ -154,6 +301,76 @@ class ExplanationBasedLearner:
         logger.info(f"Generated logic template: {logic_template}")
         return logic_template
     
+    def _get_proof_skeleton(self, explanation: Dict[int, ProofStepNode],
+                            proof_object: ProofObject) -> Hashable:
+        """
+        Get the skeleton of a proof.
+        
+        The skeleton consists of the rule names and premise references of the
+        proof steps, and the goal and leaf formulas with each constant of the
+        goal replaced by its type and position among the goal's constants.
+        Proofs with the same skeleton generalize to the same rule up to variable
+        names. The operationality configuration is included, since it affects
+        unfolding.
+        
+        Args:
+            explanation: The explanation structure extracted from the proof object
+            proof_object: The proof object
+            
+        Returns:
+            A hashable skeleton
+        """
+        goal = proof_object.conclusion_ast
+        positions = {name: i for i, name in enumerate(self._identify_constants(goal))}
+        
+        steps = tuple(
+            (step_idx, step.rule_name, tuple(step.premises))
+            for step_idx, step in explanation.items()
+        )
+        leaves = tuple(
+            self._skeleton_term(explanation[step_idx].formula, positions)
+            for step_idx in self._identify_leaf_steps(explanation)
+        )
+        
+        return (
+            self._skeleton_term(goal, positions),
+            steps,
+            leaves,
+            frozenset(self.op_config.operational_predicates),
+            self.op_config.max_unfolding_depth
+        )
+    
+    def _skeleton_term(self, ast_node: AST_Node, positions: Dict[str, int]) -> Hashable:
+        """
+        Get the skeleton of a formula, as _variabilize_ast would see it.
+        
+        Args:
+            ast_node: The formula
+            positions: Positions of the goal's constants, by name
+            
+        Returns:
+            A hashable term
+        """
+        if isinstance(ast_node, ConstantNode):
+            if (ast_node.name in positions and ast_node.type.name != "Predicate"
+                    and ast_node.type.name != "Function"):
+                return ("goal_constant", positions[ast_node.name], ast_node.type)
+            return ("constant", ast_node.name, ast_node.type)
+        
+        elif isinstance(ast_node, ApplicationNode):
+            return ("application",
+                    self._skeleton_term(ast_node.operator, positions),
+                    tuple(self._skeleton_term(arg, positions) for arg in ast_node.arguments),
+                    ast_node.type)
+        
+        elif isinstance(ast_node, ConnectiveNode):
+            return ("connective", ast_node.connective_type,
+                    tuple(self._skeleton_term(operand, positions) for operand in ast_node.operands),
+                    ast_node.type)
+        
+        # Other nodes, including variables, are kept as they are
+        return ("node", ast_node)
+    
     def _extract_explanation(self, proof_object: ProofObject) -> Dict[int, ProofStepNode]:
         """
         Extract the explanation structure from a proof object.
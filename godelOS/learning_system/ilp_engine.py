@@ -8,12 +8,19 @@ given background knowledge from the KR system.
 The ILPEngine uses a top-down sequential covering algorithm similar to FOIL/Progol
 to generate rule hypotheses that are consistent with positive examples and
 inconsistent with negative examples.
+
+When the background knowledge consists of ground facts, coverage is tested by
+matching compiled clauses against an index of the facts instead of calling the
+inference engine for every example. Sets of covered examples are integer
+bitsets, and a refinement is only tested against the examples covered by the
+clause it refines.
 """
 
 import math
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Any, DefaultDict
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any, DefaultDict
+from collections import defaultdict, OrderedDict
 from dataclasses import dataclass, field
 
 from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, ApplicationNode, ConnectiveNode
@@ -141,19 +148,284 @@ class Clause:
         return f"{head_str} ← {body_str}"
 
 
+def _atom_key(ast_node: AST_Node) -> Optional[Tuple[str, int]]:
+    """Get the (predicate name, arity) of an atom, or None if the node is not an atom."""
+    if isinstance(ast_node, ApplicationNode) and isinstance(ast_node.operator, ConstantNode):
+        return ast_node.operator.name, len(ast_node.arguments)
+    return None
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    """Iterate over the positions of the set bits of a bitset."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def _count_bits(bits: int) -> int:
+    """Count the set bits of a bitset."""
+    return bin(bits).count("1")
+
+
+class FactIndex:
+    """
+    Background facts indexed by predicate and argument.
+    
+    Only ground atoms can be indexed. If the background knowledge contains
+    anything else, such as rules, coverage has to be decided by the inference
+    engine and the index is marked as incomplete.
+    """
+    
+    def __init__(self, facts: Iterable[AST_Node]):
+        """
+        Index a set of facts.
+        
+        Args:
+            facts: The background knowledge
+        """
+        self.complete = True
+        self._facts: Set[Tuple[Tuple[str, int], Tuple[AST_Node, ...]]] = set()
+        self._by_predicate: DefaultDict[Tuple[str, int], List[Tuple[AST_Node, ...]]] = defaultdict(list)
+        self._by_argument: DefaultDict[Tuple[str, int, int, AST_Node], List[Tuple[AST_Node, ...]]] = defaultdict(list)
+        
+        for fact in facts:
+            key = _atom_key(fact)
+            if key is None or not all(isinstance(arg, ConstantNode) for arg in fact.arguments):
+                self.complete = False
+                continue
+            
+            args = tuple(fact.arguments)
+            self._facts.add((key, args))
+            self._by_predicate[key].append(args)
+            for position, arg in enumerate(args):
+                self._by_argument[key + (position, arg)].append(args)
+    
+    def contains(self, atom: AST_Node) -> bool:
+        """Check if an atom is one of the indexed facts."""
+        key = _atom_key(atom)
+        return key is not None and (key, tuple(atom.arguments)) in self._facts
+    
+    def candidates(self, key: Tuple[str, int], bound: Dict[int, AST_Node]) -> List[Tuple[AST_Node, ...]]:
+        """
+        Get the argument tuples of the facts that may match a literal.
+        
+        Args:
+            key: The (predicate name, arity) of the literal
+            bound: The values of the literal's bound arguments by position
+            
+        Returns:
+            The facts of the most selective bound argument
+        """
+        best = self._by_predicate.get(key, [])
+        for position, value in bound.items():
+            facts = self._by_argument.get(key + (position, value), [])
+            if len(facts) < len(best):
+                best = facts
+                if not best:
+                    break
+        return best
+
+
+class ExampleSet:
+    """
+    A fixed numbering of examples, so that subsets can be stored as bitsets.
+    
+    Examples are also indexed by predicate and argument, mapping each to the
+    bitset of the examples that have it.
+    """
+    
+    def __init__(self, examples: Iterable[AST_Node]):
+        """
+        Number and index a set of examples.
+        
+        Args:
+            examples: The examples
+        """
+        self.examples: List[AST_Node] = list(examples)
+        self.positions: Dict[AST_Node, int] = {example: i for i, example in enumerate(self.examples)}
+        self.all_bits = (1 << len(self.examples)) - 1
+        self._by_predicate: DefaultDict[Tuple[str, int], int] = defaultdict(int)
+        self._by_argument: DefaultDict[Tuple[str, int, int, AST_Node], int] = defaultdict(int)
+        
+        for i, example in enumerate(self.examples):
+            key = _atom_key(example)
+            if key is None:
+                continue
+            bit = 1 << i
+            self._by_predicate[key] |= bit
+            for position, arg in enumerate(example.arguments):
+                self._by_argument[key + (position, arg)] |= bit
+    
+    def __contains__(self, example: AST_Node) -> bool:
+        return example in self.positions
+    
+    def bits(self, examples: Iterable[AST_Node]) -> int:
+        """Get the bitset of a subset of the examples."""
+        bits = 0
+        for example in examples:
+            bits |= 1 << self.positions[example]
+        return bits
+    
+    def members(self, bits: int) -> Set[AST_Node]:
+        """Get the examples in a bitset."""
+        return {self.examples[i] for i in _iter_bits(bits)}
+    
+    def matching(self, head: AST_Node) -> int:
+        """Get the bitset of the examples with the predicate and constant arguments of a clause head."""
+        key = _atom_key(head)
+        if key is None:
+            return self.all_bits
+        
+        bits = self._by_predicate.get(key, 0)
+        for position, arg in enumerate(head.arguments):
+            if isinstance(arg, ConstantNode):
+                bits &= self._by_argument.get(key + (position, arg), 0)
+        return bits
+
+
+class CompiledClause:
+    """
+    A clause compiled for coverage testing against a FactIndex.
+    
+    An example is covered if it is a background fact, or if it unifies with the
+    head and the body literals, under the head's bindings, match background
+    facts. Body literals are matched left to right, each through the index
+    entry of its most selective bound argument.
+    """
+    
+    def __init__(self, head_key: Tuple[str, int], head_args: Tuple[AST_Node, ...],
+                 body: List[Tuple[Tuple[str, int], Tuple[AST_Node, ...]]]):
+        """
+        Initialize a compiled clause.
+        
+        Args:
+            head_key: The (predicate name, arity) of the head
+            head_args: The arguments of the head
+            body: The (predicate name, arity) and arguments of each body literal
+        """
+        self.head_key = head_key
+        self.head_args = head_args
+        self.body = body
+    
+    @classmethod
+    def compile(cls, clause: Clause) -> Optional['CompiledClause']:
+        """
+        Compile a clause.
+        
+        Returns:
+            The compiled clause, or None if a literal is not an atom over
+            variables and constants
+        """
+        literals = []
+        for literal in [clause.head] + clause.body:
+            key = _atom_key(literal)
+            if key is None or not all(isinstance(arg, (VariableNode, ConstantNode)) for arg in literal.arguments):
+                return None
+            literals.append((key, tuple(literal.arguments)))
+        
+        head_key, head_args = literals[0]
+        return cls(head_key, head_args, literals[1:])
+    
+    def covers(self, example: AST_Node, facts: FactIndex) -> bool:
+        """Check if the clause covers an example given the background facts."""
+        if facts.contains(example):
+            return True
+        if _atom_key(example) != self.head_key:
+            return False
+        
+        bindings: Dict[VariableNode, AST_Node] = {}
+        if not self._unify(self.head_args, tuple(example.arguments), bindings):
+            return False
+        return self._match_body(0, bindings, facts)
+    
+    def covered_bits(self, examples: ExampleSet, candidates: int, facts: FactIndex) -> int:
+        """Get the bitset of the candidate examples the clause covers."""
+        covered = 0
+        for i in _iter_bits(candidates):
+            if self.covers(examples.examples[i], facts):
+                covered |= 1 << i
+        return covered
+    
+    def _match_body(self, index: int, bindings: Dict[VariableNode, AST_Node], facts: FactIndex) -> bool:
+        """Match the body literals from an index on, extending the bindings."""
+        if index == len(self.body):
+            return True
+        
+        key, args = self.body[index]
+        bound = {}
+        for position, arg in enumerate(args):
+            value = bindings.get(arg) if isinstance(arg, VariableNode) else arg
+            if value is not None:
+                bound[position] = value
+        
+        for fact_args in facts.candidates(key, bound):
+            extended = dict(bindings)
+            if self._unify(args, fact_args, extended) and self._match_body(index + 1, extended, facts):
+                return True
+        return False
+    
+    @staticmethod
+    def _unify(pattern: Tuple[AST_Node, ...], values: Tuple[AST_Node, ...],
+               bindings: Dict[VariableNode, AST_Node]) -> bool:
+        """Unify literal arguments with ground values, extending the bindings."""
+        for arg, value in zip(pattern, values):
+            if isinstance(arg, VariableNode):
+                bound = bindings.get(arg)
+                if bound is None:
+                    bindings[arg] = value
+                elif bound != value:
+                    return False
+            elif arg != value:
+                return False
+        return True
+
+
+# The background facts and examples of a coverage worker process, set once
+# when the process starts
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_coverage_worker(facts: FactIndex, positives: ExampleSet, negatives: ExampleSet) -> None:
+    """Initialize a coverage worker process."""
+    _worker_state.update(facts=facts, positives=positives, negatives=negatives)
+
+
+def _coverage_worker(task: Tuple[CompiledClause, int, int]) -> Tuple[int, int]:
+    """Compute the positive and negative coverage of a compiled clause in a worker process."""
+    compiled, positive_candidates, negative_candidates = task
+    facts = _worker_state["facts"]
+    return (compiled.covered_bits(_worker_state["positives"], positive_candidates, facts),
+            compiled.covered_bits(_worker_state["negatives"], negative_candidates, facts))
+
+
 class CoverageCache:
     """
     Cache for clause coverage results to speed up evaluation.
     
-    This class caches the results of coverage checks to avoid redundant
-    computation when evaluating similar clauses.
+    Coverage is stored as a pair of bitsets over the positive and negative
+    examples of the current induction run. Entries are keyed by the clause's
+    head and body rather than its string form, so a refinement can look up the
+    coverage of the clause it refines. The least recently used entries are
+    evicted once the cache is full.
     """
     
-    def __init__(self):
-        """Initialize the coverage cache."""
-        self._cache: Dict[int, Tuple[Set[AST_Node], Set[AST_Node]]] = {}
+    def __init__(self, max_size: int = 100000):
+        """
+        Initialize the coverage cache.
+        
+        Args:
+            max_size: The maximum number of clauses to keep coverage for
+        """
+        self.max_size = max_size
+        self._cache: "OrderedDict[Tuple[AST_Node, Tuple[AST_Node, ...]], Tuple[int, int]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
     
-    def get(self, clause: Clause) -> Optional[Tuple[Set[AST_Node], Set[AST_Node]]]:
+    @staticmethod
+    def _key(clause: Clause) -> Tuple[AST_Node, Tuple[AST_Node, ...]]:
+        return clause.head, tuple(clause.body)
+    
+    def get(self, clause: Clause) -> Optional[Tuple[int, int]]:
         """
         Get the cached coverage for a clause.
         
@@ -161,22 +433,31 @@ class CoverageCache:
             clause: The clause to get coverage for
             
         Returns:
-            A tuple of (positive_covered, negative_covered) if cached, None otherwise
+            A tuple of (positive_covered, negative_covered) bitsets if cached, None otherwise
         """
-        clause_hash = hash(str(clause))
-        return self._cache.get(clause_hash)
+        key = self._key(clause)
+        coverage = self._cache.get(key)
+        if coverage is None:
+            self.stats["misses"] += 1
+            return None
+        self._cache.move_to_end(key)
+        self.stats["hits"] += 1
+        return coverage
     
-    def put(self, clause: Clause, positive_covered: Set[AST_Node], negative_covered: Set[AST_Node]) -> None:
+    def put(self, clause: Clause, positive_covered: int, negative_covered: int) -> None:
         """
         Cache the coverage for a clause.
         
         Args:
             clause: The clause to cache coverage for
-            positive_covered: The set of positive examples covered by the clause
-            negative_covered: The set of negative examples covered by the clause
+            positive_covered: The bitset of positive examples covered by the clause
+            negative_covered: The bitset of negative examples covered by the clause
         """
-        clause_hash = hash(str(clause))
-        self._cache[clause_hash] = (positive_covered, negative_covered)
+        key = self._key(clause)
+        self._cache[key] = (positive_covered, negative_covered)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
     
     def clear(self) -> None:
         """Clear the cache."""
@@ -194,7 +475,8 @@ class ILPEngine:
     
     def __init__(self, kr_system_interface: KnowledgeStoreInterface, 
                  inference_engine: InferenceCoordinator,
-                 language_bias: Optional[LanguageBias] = None):
+                 language_bias: Optional[LanguageBias] = None,
+                 max_workers: int = 0):
         """
         Initialize the ILP engine.
         
@@ -202,11 +484,31 @@ class ILPEngine:
             kr_system_interface: Interface to the Knowledge Representation system
             inference_engine: The inference engine for coverage checking
             language_bias: Optional language bias configuration
+            max_workers: Number of worker processes for evaluating refinements
+                in parallel during rule induction; 0 or 1 evaluates them in
+                this process
         """
         self.ksi = kr_system_interface
         self.inference_engine = inference_engine
         self.language_bias = language_bias or LanguageBias()
+        self.max_workers = max_workers
         self.coverage_cache = CoverageCache()
+        
+        # The examples of the current induction run, numbered for bitsets
+        self._positive_set: Optional[ExampleSet] = None
+        self._negative_set: Optional[ExampleSet] = None
+        
+        # The background knowledge the fact index and constants were built from
+        self._background: Optional[Set[AST_Node]] = None
+        self._fact_index: Optional[FactIndex] = None
+        self._constants_by_type: Optional[Dict[str, List[ConstantNode]]] = None
+        
+        # Bitsets of the positive and negative examples that are background facts
+        self._background_bits: Optional[Tuple[int, int]] = None
+        
+        # Worker processes and the state they were started with
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_state: Optional[Tuple[FactIndex, ExampleSet, ExampleSet]] = None
     
     def induce_rules(self, target_predicate_signature: AST_Node, 
                     positive_examples: Set[AST_Node], 
@@ -235,36 +537,44 @@ class ILPEngine:
         # Get background knowledge from the knowledge store
         background_knowledge = self._get_background_knowledge(background_context_id)
         
+        # Number the examples once, so coverage computed for one clause is
+        # reused across all iterations of sequential covering
+        self._prepare_examples(positive_examples, negative_examples)
+        self._start_pool(background_knowledge)
+        
         # Initialize the current positive examples and learned theory
         current_positive_examples = positive_examples.copy()
         learned_theory = []
         
-        # Sequential covering: learn clauses until all positive examples are covered
-        while current_positive_examples:
-            logger.info(f"Remaining positive examples: {len(current_positive_examples)}")
-            
-            # Find the best clause
-            best_clause = self._find_best_clause(
-                target_predicate_signature,
-                current_positive_examples,
-                negative_examples,
-                background_knowledge
-            )
-            
-            # If no good clause found, break
-            if best_clause is None:
-                logger.warning("No good clause found, stopping induction")
-                break
-            
-            # Convert the clause to an AST_Node and add it to the learned theory
-            clause_ast = best_clause.to_ast()
-            learned_theory.append(clause_ast)
-            
-            logger.info(f"Learned clause: {best_clause}")
-            
-            # Remove positive examples covered by the new clause
-            positive_covered, _ = self._get_coverage(best_clause, current_positive_examples, negative_examples, background_knowledge)
-            current_positive_examples -= positive_covered
+        try:
+            # Sequential covering: learn clauses until all positive examples are covered
+            while current_positive_examples:
+                logger.info(f"Remaining positive examples: {len(current_positive_examples)}")
+                
+                # Find the best clause
+                best_clause = self._find_best_clause(
+                    target_predicate_signature,
+                    current_positive_examples,
+                    negative_examples,
+                    background_knowledge
+                )
+                
+                # If no good clause found, break
+                if best_clause is None:
+                    logger.warning("No good clause found, stopping induction")
+                    break
+                
+                # Convert the clause to an AST_Node and add it to the learned theory
+                clause_ast = best_clause.to_ast()
+                learned_theory.append(clause_ast)
+                
+                logger.info(f"Learned clause: {best_clause}")
+                
+                # Remove positive examples covered by the new clause
+                positive_covered, _ = self._get_coverage(best_clause, current_positive_examples, negative_examples, background_knowledge)
+                current_positive_examples -= positive_covered
+        finally:
+            self._stop_pool()
         
         return learned_theory
     
@@ -287,9 +597,16 @@ class ILPEngine:
         Returns:
             The best clause found, or None if no good clause was found
         """
+        positive_mask, negative_mask = self._prepare_examples(positive_examples, negative_examples)
+        P = _count_bits(positive_mask)
+        N = _count_bits(negative_mask)
+        
         # Start with the most general clause (head ← true)
         start_clause = Clause(head=target_predicate_signature)
         
+        # Scores of the clauses in the search queue, by id
+        scores: Dict[int, float] = {}
+        
         # Initialize search queue with the starting clause
         search_queue = [start_clause]
         
@@ -313,18 +630,22 @@ class ILPEngine:
             if current_clause.length >= max_clause_length:
                 continue
             
-            # Generate refinements of the current clause
-            refinements = self._refine_clause(current_clause, background_knowledge)
+            # Generate refinements of the current clause, skipping redundant
+            # and cyclic ones
+            refinements = [
+                refined_clause for refined_clause in self._refine_clause(current_clause, background_knowledge)
+                if not self._is_redundant(refined_clause)
+                and (self.language_bias.allow_recursion or not self._contains_recursion(refined_clause))
+            ]
             
-            for refined_clause in refinements:
-                # Check for redundancy and cycles
-                if self._is_redundant(refined_clause) or (not self.language_bias.allow_recursion and self._contains_recursion(refined_clause)):
-                    continue
-                
-                # Evaluate the refined clause
-                score, pos_covered, neg_covered = self._evaluate_clause(
-                    refined_clause, positive_examples, negative_examples, background_knowledge
-                )
+            # Evaluate the refinements together, so they can be spread over
+            # the worker processes
+            coverages = self._get_clause_coverages(refinements, background_knowledge)
+            
+            for refined_clause, (positive_bits, negative_bits) in zip(refinements, coverages):
+                p = _count_bits(positive_bits & positive_mask)
+                n = _count_bits(negative_bits & negative_mask)
+                score = self._score_clause(refined_clause, p, n, P, N)
                 
                 # Update best clause if this one is better
                 if score > best_score:
@@ -333,13 +654,14 @@ class ILPEngine:
                     logger.debug(f"New best clause: {best_clause}, score: {best_score}")
                 
                 # Add promising refinements to the search queue
-                if len(pos_covered) > 0 and score > float('-inf'):
+                if p > 0 and score > float('-inf'):
+                    scores[id(refined_clause)] = score
                     search_queue.append(refined_clause)
             
             # Sort the search queue by score (beam search)
             search_queue = sorted(
                 search_queue,
-                key=lambda c: self._evaluate_clause(c, positive_examples, negative_examples, background_knowledge)[0],
+                key=lambda c: scores[id(c)],
                 reverse=True
             )[:10]  # Keep only the top 10 clauses (beam width)
         
@@ -408,7 +730,9 @@ class ILPEngine:
         literals = []
         
         # Get constants of each type from background knowledge
-        constants_by_type = self._get_constants_by_type(background_knowledge)
+        if self._constants_by_type is None or self._background is not background_knowledge:
+            self._index_background(background_knowledge)
+        constants_by_type = self._constants_by_type
         
         # Generate arguments based on mode declaration
         possible_args_by_position = []
@@ -486,19 +810,34 @@ class ILPEngine:
             clause, positive_examples, negative_examples, background_knowledge
         )
         
-        # Calculate the score using a heuristic
-        p = len(positive_covered)
-        n = len(negative_covered)
-        P = len(positive_examples)
-        N = len(negative_examples)
+        score = self._score_clause(
+            clause, len(positive_covered), len(negative_covered),
+            len(positive_examples), len(negative_examples)
+        )
+        
+        return score, positive_covered, negative_covered
+    
+    def _score_clause(self, clause: Clause, p: int, n: int, P: int, N: int) -> float:
+        """
+        Score a clause by the number of examples it covers.
         
+        Args:
+            clause: The clause to score
+            p: The number of positive examples covered
+            n: The number of negative examples covered
+            P: The number of positive examples
+            N: The number of negative examples
+            
+        Returns:
+            The FOIL gain of the clause minus a length penalty
+        """
         # If the clause doesn't cover any positive examples, it's useless
         if p == 0:
-            return float('-inf'), positive_covered, negative_covered
+            return float('-inf')
         
         # If the clause covers negative examples, penalize it
         if n > 0:
-            return float('-inf'), positive_covered, negative_covered
+            return float('-inf')
         
         # Calculate FOIL gain: p * (log(p/(p+n)) - log(P/(P+N)))
         try:
@@ -510,9 +849,7 @@ class ILPEngine:
         length_penalty = 0.1 * clause.length
         
         # Final score is gain minus length penalty
-        score = gain - length_penalty
-        
-        return score, positive_covered, negative_covered
+        return gain - length_penalty
     
     def _get_coverage(self, clause: Clause, 
                      positive_examples: Set[AST_Node], 
@@ -530,30 +867,188 @@ class ILPEngine:
         Returns:
             A tuple of (positive_covered, negative_covered)
         """
-        # Check if the coverage is cached
-        cached_coverage = self.coverage_cache.get(clause)
-        if cached_coverage is not None:
-            return cached_coverage
+        positive_mask, negative_mask = self._prepare_examples(positive_examples, negative_examples)
+        positive_bits, negative_bits = self._get_clause_coverages([clause], background_knowledge)[0]
+        
+        return (self._positive_set.members(positive_bits & positive_mask),
+                self._negative_set.members(negative_bits & negative_mask))
+    
+    def _get_clause_coverages(self, clauses: List[Clause],
+                              background_knowledge: Set[AST_Node]) -> List[Tuple[int, int]]:
+        """
+        Get the coverage of clauses on all examples of the current induction run.
         
-        # Convert the clause to an AST_Node
-        clause_ast = clause.to_ast()
+        A refinement is only tested against the examples covered by the clause
+        it refines, if that clause's coverage is cached. Clauses that can be
+        compiled are tested against the fact index, in the worker processes if
+        there are any; the others are checked with the inference engine.
         
-        # Check coverage of positive examples
-        positive_covered = set()
-        for example in positive_examples:
-            if self._check_coverage(clause_ast, example, background_knowledge):
-                positive_covered.add(example)
+        Args:
+            clauses: The clauses to evaluate
+            background_knowledge: Set of background knowledge
+            
+        Returns:
+            A (positive_covered, negative_covered) pair of bitsets for each clause
+        """
+        if self._background is not background_knowledge:
+            self._index_background(background_knowledge)
+        facts = self._fact_index
+        
+        coverages: List[Optional[Tuple[int, int]]] = []
+        tasks: List[Tuple[int, CompiledClause, int, int]] = []
+        
+        for i, clause in enumerate(clauses):
+            coverage = self.coverage_cache.get(clause)
+            compiled = None
+            if coverage is None and facts.complete:
+                compiled = CompiledClause.compile(clause)
+            
+            if coverage is None:
+                positive_candidates, negative_candidates = self._get_candidate_bits(clause, compiled is not None)
+                if compiled is not None:
+                    tasks.append((i, compiled, positive_candidates, negative_candidates))
+                else:
+                    clause_ast = clause.to_ast()
+                    coverage = (
+                        self._check_coverage_bits(clause_ast, self._positive_set, positive_candidates, background_knowledge),
+                        self._check_coverage_bits(clause_ast, self._negative_set, negative_candidates, background_knowledge)
+                    )
+                    self.coverage_cache.put(clause, *coverage)
+            
+            coverages.append(coverage)
+        
+        if tasks:
+            results = None
+            work = [(compiled, positive_candidates, negative_candidates)
+                    for _, compiled, positive_candidates, negative_candidates in tasks]
+            
+            if (len(tasks) > 1 and self._pool is not None
+                    and self._pool_state == (facts, self._positive_set, self._negative_set)):
+                try:
+                    chunksize = max(1, len(work) // (4 * self.max_workers))
+                    results = list(self._pool.map(_coverage_worker, work, chunksize=chunksize))
+                except Exception as e:
+                    logger.warning(f"Parallel clause evaluation failed, evaluating serially: {e}")
+                    self._stop_pool()
+            
+            if results is None:
+                results = [
+                    (compiled.covered_bits(self._positive_set, positive_candidates, facts),
+                     compiled.covered_bits(self._negative_set, negative_candidates, facts))
+                    for compiled, positive_candidates, negative_candidates in work
+                ]
+            
+            for (i, _, _, _), coverage in zip(tasks, results):
+                self.coverage_cache.put(clauses[i], *coverage)
+                coverages[i] = coverage
+        
+        return coverages
+    
+    def _get_candidate_bits(self, clause: Clause, compiled: bool) -> Tuple[int, int]:
+        """
+        Get the bitsets of the examples a clause may cover.
+        
+        Adding a literal to a clause can only make it cover fewer examples, so
+        these are the examples covered by the clause it refines if that is
+        cached. Otherwise, a compiled clause can only cover the examples its
+        head matches and the examples that are background facts.
+        
+        Args:
+            clause: The clause to evaluate
+            compiled: Whether the clause is tested against the fact index
+            
+        Returns:
+            A (positive_candidates, negative_candidates) pair of bitsets
+        """
+        if clause.body:
+            parent_coverage = self.coverage_cache.get(Clause(head=clause.head, body=clause.body[:-1]))
+            if parent_coverage is not None:
+                return parent_coverage
+        
+        if not compiled:
+            return self._positive_set.all_bits, self._negative_set.all_bits
+        
+        if self._background_bits is None:
+            self._background_bits = (
+                self._positive_set.bits(e for e in self._positive_set.examples if self._fact_index.contains(e)),
+                self._negative_set.bits(e for e in self._negative_set.examples if self._fact_index.contains(e))
+            )
         
-        # Check coverage of negative examples
-        negative_covered = set()
-        for example in negative_examples:
-            if self._check_coverage(clause_ast, example, background_knowledge):
-                negative_covered.add(example)
+        return (self._positive_set.matching(clause.head) | self._background_bits[0],
+                self._negative_set.matching(clause.head) | self._background_bits[1])
+    
+    def _check_coverage_bits(self, clause_ast: AST_Node, examples: ExampleSet, candidates: int,
+                             background_knowledge: Set[AST_Node]) -> int:
+        """Get the bitset of the candidate examples a clause covers, using the inference engine."""
+        covered = 0
+        for i in _iter_bits(candidates):
+            if self._check_coverage(clause_ast, examples.examples[i], background_knowledge):
+                covered |= 1 << i
+        return covered
+    
+    def _prepare_examples(self, positive_examples: Set[AST_Node],
+                          negative_examples: Set[AST_Node]) -> Tuple[int, int]:
+        """
+        Get the bitsets of a set of positive and negative examples.
         
-        # Cache the coverage
-        self.coverage_cache.put(clause, positive_covered, negative_covered)
+        The examples are numbered again, and cached coverage is dropped, only if
+        they are not among the examples already numbered.
         
-        return positive_covered, negative_covered
+        Returns:
+            A (positive_mask, negative_mask) pair of bitsets
+        """
+        if (self._positive_set is None or self._negative_set is None
+                or not all(example in self._positive_set for example in positive_examples)
+                or not all(example in self._negative_set for example in negative_examples)):
+            self._positive_set = ExampleSet(positive_examples)
+            self._negative_set = ExampleSet(negative_examples)
+            self._background_bits = None
+            self.coverage_cache.clear()
+        
+        return self._positive_set.bits(positive_examples), self._negative_set.bits(negative_examples)
+    
+    def _index_background(self, background_knowledge: Set[AST_Node]) -> None:
+        """Index background knowledge, dropping coverage computed against other knowledge."""
+        if self._background is not None:
+            self.coverage_cache.clear()
+        self._background = background_knowledge
+        self._fact_index = FactIndex(background_knowledge)
+        self._constants_by_type = self._get_constants_by_type(background_knowledge)
+        self._background_bits = None
+    
+    def _start_pool(self, background_knowledge: Set[AST_Node]) -> None:
+        """
+        Start the worker processes for evaluating clauses, if configured.
+        
+        The fact index and examples are sent to each worker once, when it starts.
+        Workers are only useful for compiled clauses, so none are started if the
+        background knowledge is not all ground facts.
+        """
+        if self.max_workers <= 1:
+            return
+        
+        if self._background is not background_knowledge:
+            self._index_background(background_knowledge)
+        if not self._fact_index.complete:
+            return
+        
+        state = (self._fact_index, self._positive_set, self._negative_set)
+        try:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_coverage_worker,
+                initargs=state
+            )
+            self._pool_state = state
+        except (OSError, ValueError, NotImplementedError) as e:
+            logger.warning(f"Could not start worker processes, evaluating serially: {e}")
+    
+    def _stop_pool(self) -> None:
+        """Shut down the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_state = None
     
     def _check_coverage(self, clause_ast: AST_Node, example_ast: AST_Node, 
                        background_knowledge: Set[AST_Node]) -> bool:
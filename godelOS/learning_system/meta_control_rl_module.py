@@ -12,10 +12,10 @@ self-modification routines.
 
 import logging
 import random
+import time
 import numpy as np
 from typing import List, Dict, Optional, Callable, Tuple, Any, Set, Union
 from dataclasses import dataclass, field
-from collections import deque
 
 from godelOS.core_kr.ast.nodes import AST_Node
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
@@ -45,6 +45,31 @@ class MetaAction:
             return False
         return (self.action_type == other.action_type and 
                 self.parameters == other.parameters)
+    
+    def __hash__(self) -> int:
+        """Hash consistent with equality, so meta-actions can index the action space."""
+        return hash((self.action_type, _hashable(self.parameters)))
+
+
+def _hashable(value: Any) -> Any:
+    """
+    Convert a parameter value to a hashable value with a hash consistent with equality.
+    
+    Containers are frozen recursively. Values that compare equal, such as 1 and
+    1.0, keep hashing equal, since the values themselves are hashed. Other
+    unhashable values are represented by their type, which only weakens the hash.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return type(value).__name__
+    return value
 
 
 @dataclass
@@ -54,6 +79,11 @@ class RLConfig:
     
     This class defines parameters for the RL algorithm, including
     learning rate, discount factor, exploration rate, etc.
+    
+    Every ``target_update_frequency`` training steps the target network moves
+    ``target_update_tau`` of the way towards the main network; the default of
+    1.0 copies the weights, while e.g. a frequency of 1 with a tau of 0.005
+    gives Polyak-averaged soft updates.
     """
     learning_rate: float = 0.001
     discount_factor: float = 0.99
@@ -62,6 +92,7 @@ class RLConfig:
     min_exploration_rate: float = 0.01
     batch_size: int = 32
     target_update_frequency: int = 100
+    target_update_tau: float = 1.0
     replay_buffer_size: int = 10000
     hidden_layer_sizes: List[int] = field(default_factory=lambda: [64, 64])
 
@@ -72,6 +103,9 @@ class ReplayBuffer:
     
     This class stores (state, action, reward, next_state, done) tuples
     and provides functionality to sample random batches for training.
+    Transitions are kept in preallocated ring arrays, allocated when the
+    first transition fixes the state dimensionality, so sampling a batch
+    is a single fancy-indexing operation.
     """
     
     def __init__(self, capacity: int):
@@ -81,7 +115,16 @@ class ReplayBuffer:
         Args:
             capacity: Maximum number of transitions to store
         """
-        self.buffer = deque(maxlen=capacity)
+        self.capacity = capacity
+        self.states: Optional[np.ndarray] = None
+        self.actions = np.zeros(capacity, dtype=np.int32)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states: Optional[np.ndarray] = None
+        self.dones = np.zeros(capacity, dtype=np.bool_)
+        
+        # Position of the next write and number of stored transitions
+        self._next = 0
+        self._size = 0
     
     def add(self, state: List[float], action_idx: int, reward: float, 
             next_state: List[float], done: bool) -> None:
@@ -95,7 +138,20 @@ class ReplayBuffer:
             next_state: The next state features
             done: Whether the episode is done
         """
-        self.buffer.append((state, action_idx, reward, next_state, done))
+        if self.states is None:
+            state_dim = len(state)
+            self.states = np.zeros((self.capacity, state_dim), dtype=np.float32)
+            self.next_states = np.zeros((self.capacity, state_dim), dtype=np.float32)
+        
+        i = self._next
+        self.states[i] = state
+        self.actions[i] = action_idx
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
     
     def sample(self, batch_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -107,18 +163,17 @@ class ReplayBuffer:
         Returns:
             A tuple of (states, actions, rewards, next_states, dones)
         """
-        indices = np.random.choice(len(self.buffer), batch_size, replace=False)
-        states, actions, rewards, next_states, dones = zip(*[self.buffer[i] for i in indices])
+        indices = np.asarray(np.random.choice(self._size, batch_size, replace=False))
         
-        return (np.array(states, dtype=np.float32),
-                np.array(actions, dtype=np.int32),
-                np.array(rewards, dtype=np.float32),
-                np.array(next_states, dtype=np.float32),
-                np.array(dones, dtype=np.bool_))
+        return (self.states[indices],
+                self.actions[indices],
+                self.rewards[indices],
+                self.next_states[indices],
+                self.dones[indices])
     
     def __len__(self) -> int:
         """Get the current size of the buffer."""
-        return len(self.buffer)
+        return self._size
 
 
 class DQNModel:
@@ -126,9 +181,16 @@ class DQNModel:
     Deep Q-Network model for approximating the Q-function.
     
     This class implements a neural network that approximates the Q-function,
-    mapping states to Q-values for each action.
+    mapping states to Q-values for each action. The network is a NumPy
+    multi-layer perceptron with ReLU hidden layers, trained by minibatch
+    backpropagation of the Huber loss with the Adam optimizer.
     """
     
+    # Adam hyperparameters
+    BETA1 = 0.9
+    BETA2 = 0.999
+    EPSILON = 1e-8
+    
     def __init__(self, state_dim: int, action_dim: int, hidden_layer_sizes: List[int], 
                  learning_rate: float):
         """
@@ -140,73 +202,82 @@ class DQNModel:
             hidden_layer_sizes: List of hidden layer sizes
             learning_rate: Learning rate for the optimizer
         """
-        # In a real implementation, this would use a deep learning framework
-        # like TensorFlow or PyTorch to create a neural network.
-        # For simplicity, we'll use a placeholder implementation.
         self.state_dim = state_dim
         self.action_dim = action_dim
         self.hidden_layer_sizes = hidden_layer_sizes
         self.learning_rate = learning_rate
+        self.num_layers = len(hidden_layer_sizes) + 1
         
-        # Initialize weights (in a real implementation, these would be tensors)
         self.weights = self._initialize_weights()
         
+        # Adam moment estimates and step count
+        self._m = {key: np.zeros_like(value) for key, value in self.weights.items()}
+        self._v = {key: np.zeros_like(value) for key, value in self.weights.items()}
+        self._t = 0
+        
         logger.info(f"Initialized DQN model with state_dim={state_dim}, action_dim={action_dim}")
     
     def _initialize_weights(self) -> Dict[str, np.ndarray]:
         """
         Initialize the weights of the neural network.
         
+        Weight matrices use He initialization, which suits ReLU layers.
+        
         Returns:
             A dictionary of weight matrices
         """
         weights = {}
+        layer_sizes = [self.state_dim] + list(self.hidden_layer_sizes) + [self.action_dim]
         
-        # Input layer to first hidden layer
-        weights['W1'] = np.random.randn(self.state_dim, self.hidden_layer_sizes[0]) * 0.1
-        weights['b1'] = np.zeros(self.hidden_layer_sizes[0])
-        
-        # Hidden layers
-        for i in range(1, len(self.hidden_layer_sizes)):
-            weights[f'W{i+1}'] = np.random.randn(self.hidden_layer_sizes[i-1], self.hidden_layer_sizes[i]) * 0.1
-            weights[f'b{i+1}'] = np.zeros(self.hidden_layer_sizes[i])
-        
-        # Last hidden layer to output layer
-        weights[f'W{len(self.hidden_layer_sizes)+1}'] = np.random.randn(self.hidden_layer_sizes[-1], self.action_dim) * 0.1
-        weights[f'b{len(self.hidden_layer_sizes)+1}'] = np.zeros(self.action_dim)
+        for i in range(1, len(layer_sizes)):
+            fan_in, fan_out = layer_sizes[i-1], layer_sizes[i]
+            weights[f'W{i}'] = (np.random.randn(fan_in, fan_out) * np.sqrt(2.0 / fan_in)).astype(np.float32)
+            weights[f'b{i}'] = np.zeros(fan_out, dtype=np.float32)
         
         return weights
     
+    def _forward(self, states: np.ndarray) -> List[np.ndarray]:
+        """
+        Run a forward pass, keeping the activations for backpropagation.
+        
+        Args:
+            states: Batch of states (batch_size, state_dim)
+            
+        Returns:
+            The input followed by the output of each layer; the last entry
+            holds the Q-values
+        """
+        activations = [states]
+        x = states
+        for i in range(1, self.num_layers):
+            x = np.maximum(0, x @ self.weights[f'W{i}'] + self.weights[f'b{i}'])  # ReLU activation
+            activations.append(x)
+        activations.append(x @ self.weights[f'W{self.num_layers}'] + self.weights[f'b{self.num_layers}'])
+        return activations
+    
     def predict(self, state: np.ndarray) -> np.ndarray:
         """
-        Predict Q-values for a given state.
+        Predict Q-values for a state or a batch of states.
         
         Args:
-            state: The state features (batch_size, state_dim)
+            state: The state features (state_dim,) or (batch_size, state_dim)
             
         Returns:
             Q-values for each action (batch_size, action_dim)
         """
-        # In a real implementation, this would use the neural network
-        # to compute Q-values. For simplicity, we'll use a placeholder.
-        if len(state.shape) == 1:
-            state = np.expand_dims(state, axis=0)
-        
-        # Forward pass through the network
-        x = state
-        for i in range(1, len(self.hidden_layer_sizes) + 1):
-            x = np.dot(x, self.weights[f'W{i}']) + self.weights[f'b{i}']
-            x = np.maximum(0, x)  # ReLU activation
-        
-        # Output layer
-        q_values = np.dot(x, self.weights[f'W{len(self.hidden_layer_sizes)+1}']) + self.weights[f'b{len(self.hidden_layer_sizes)+1}']
+        state = np.asarray(state, dtype=np.float32)
+        if state.ndim == 1:
+            state = state[np.newaxis, :]
         
-        return q_values
+        return self._forward(state)[-1]
     
     def update(self, states: np.ndarray, actions: np.ndarray, targets: np.ndarray) -> float:
         """
         Update the model weights based on the given targets.
         
+        Performs one Adam step on the Huber loss between the predicted
+        Q-values of the actions taken and the targets.
+        
         Args:
             states: Batch of states (batch_size, state_dim)
             actions: Batch of actions (batch_size,)
@@ -215,10 +286,52 @@ class DQNModel:
         Returns:
             The loss value
         """
-        # In a real implementation, this would perform a gradient descent step
-        # to update the neural network weights. For simplicity, we'll use a placeholder.
-        # Just return a random loss value
-        return random.random() * 0.1
+        states = np.asarray(states, dtype=np.float32)
+        actions = np.asarray(actions, dtype=np.intp)
+        targets = np.asarray(targets, dtype=np.float32)
+        batch_size = states.shape[0]
+        rows = np.arange(batch_size)
+        
+        activations = self._forward(states)
+        errors = activations[-1][rows, actions] - targets
+        
+        # Huber loss: quadratic for small errors, linear for large ones
+        abs_errors = np.abs(errors)
+        loss = float(np.mean(np.where(abs_errors <= 1.0, 0.5 * errors ** 2, abs_errors - 0.5)))
+        
+        # Only the Q-values of the actions taken receive a gradient
+        delta = np.zeros_like(activations[-1])
+        delta[rows, actions] = np.clip(errors, -1.0, 1.0) / batch_size
+        
+        gradients = {}
+        for i in range(self.num_layers, 0, -1):
+            gradients[f'W{i}'] = activations[i-1].T @ delta
+            gradients[f'b{i}'] = delta.sum(axis=0)
+            if i > 1:
+                delta = (delta @ self.weights[f'W{i}'].T) * (activations[i-1] > 0)
+        
+        self._apply_adam(gradients)
+        
+        return loss
+    
+    def _apply_adam(self, gradients: Dict[str, np.ndarray]) -> None:
+        """
+        Apply an Adam step to the weights.
+        
+        Args:
+            gradients: The gradient of the loss for each weight matrix
+        """
+        self._t += 1
+        step_size = (self.learning_rate * np.sqrt(1 - self.BETA2 ** self._t) /
+                     (1 - self.BETA1 ** self._t))
+        
+        for key, gradient in gradients.items():
+            m, v = self._m[key], self._v[key]
+            m *= self.BETA1
+            m += (1 - self.BETA1) * gradient
+            v *= self.BETA2
+            v += (1 - self.BETA2) * gradient ** 2
+            self.weights[key] -= (step_size * m / (np.sqrt(v) + self.EPSILON)).astype(self.weights[key].dtype)
     
     def copy_weights_from(self, other: 'DQNModel') -> None:
         """
@@ -229,6 +342,58 @@ class DQNModel:
         """
         for key in self.weights:
             self.weights[key] = other.weights[key].copy()
+    
+    def soft_update_from(self, other: 'DQNModel', tau: float) -> None:
+        """
+        Move the weights towards those of another model.
+        
+        Args:
+            other: The model to move towards
+            tau: The fraction of the way to move, between 0 and 1
+        """
+        for key in self.weights:
+            self.weights[key] *= 1 - tau
+            self.weights[key] += tau * other.weights[key]
+    
+    def get_state(self, prefix: str = "") -> Dict[str, np.ndarray]:
+        """
+        Get the weights and optimizer state as arrays.
+        
+        Args:
+            prefix: A prefix for the array names
+            
+        Returns:
+            A dictionary of named arrays
+        """
+        state = {}
+        for key in self.weights:
+            state[f'{prefix}{key}'] = self.weights[key]
+            state[f'{prefix}m_{key}'] = self._m[key]
+            state[f'{prefix}v_{key}'] = self._v[key]
+        state[f'{prefix}t'] = np.array(self._t)
+        return state
+    
+    def set_state(self, state: Dict[str, np.ndarray], prefix: str = "") -> None:
+        """
+        Restore the weights and optimizer state from arrays.
+        
+        Args:
+            state: A dictionary of named arrays, as returned by get_state
+            prefix: The prefix of the array names
+            
+        Raises:
+            ValueError: If the arrays do not match the network's architecture
+        """
+        for key, value in self.weights.items():
+            name = f'{prefix}{key}'
+            if name not in state or state[name].shape != value.shape:
+                raise ValueError(f"Saved weights {name} do not match the model architecture")
+        
+        for key in self.weights:
+            self.weights[key] = np.array(state[f'{prefix}{key}'], dtype=np.float32)
+            self._m[key] = np.array(state[f'{prefix}m_{key}'], dtype=np.float32)
+            self._v[key] = np.array(state[f'{prefix}v_{key}'], dtype=np.float32)
+        self._t = int(state[f'{prefix}t'])
 
 
 class MetaControlRLModule:
@@ -292,6 +457,7 @@ class MetaControlRLModule:
         
         # Training stats
         self.training_steps = 0
+        self.stats = {"transitions_trained": 0, "training_time": 0.0}
         
         logger.info(f"Initialized MetaControlRLModule with {len(action_space)} actions")
     
@@ -325,21 +491,12 @@ class MetaControlRLModule:
             
             action_idx = random.choice(available_indices)
         else:
-            # Exploitation: select the action with the highest Q-value
+            # Exploitation: select the available action with the highest Q-value
             q_values = self.main_model.predict(state)[0]
-            
-            # Apply mask to Q-values
-            for i, available in enumerate(available_actions_mask):
-                if not available:
-                    q_values[i] = float('-inf')
-            
-            action_idx = np.argmax(q_values)
+            mask = np.asarray(available_actions_mask, dtype=np.bool_)
+            action_idx = int(np.argmax(np.where(mask, q_values, -np.inf)))
         
-        # Decay exploration rate
-        self.exploration_rate = max(
-            self.config.min_exploration_rate,
-            self.exploration_rate * self.config.exploration_decay
-        )
+        self._decay_exploration_rate()
         
         # Return the selected action
         selected_action = self.index_to_action[action_idx]
@@ -347,6 +504,64 @@ class MetaControlRLModule:
         
         return selected_action
     
+    def select_meta_actions(self, state_features_batch: List[List[float]],
+                            available_actions_masks: Optional[List[List[bool]]] = None) -> List[MetaAction]:
+        """
+        Select meta-actions for a batch of system states.
+        
+        This is equivalent to calling select_meta_action for each state, but
+        evaluates the Q-network once for the whole batch.
+        
+        Args:
+            state_features_batch: Features of each system state
+            available_actions_masks: Optional masks, one per state, indicating
+                                    which actions are available
+            
+        Returns:
+            The selected meta-action for each state
+        """
+        states = np.asarray(state_features_batch, dtype=np.float32)
+        batch_size = states.shape[0]
+        if batch_size == 0:
+            return []
+        
+        if available_actions_masks is None:
+            masks = np.ones((batch_size, len(self.action_space)), dtype=np.bool_)
+        else:
+            masks = np.asarray(available_actions_masks, dtype=np.bool_)
+            empty = ~masks.any(axis=1)
+            if empty.any():
+                logger.warning("No actions available according to mask")
+                masks[empty] = True
+        
+        # Exploitation: the available action with the highest Q-value
+        q_values = self.main_model.predict(states)
+        action_indices = np.argmax(np.where(masks, q_values, -np.inf), axis=1)
+        
+        # Exploration: a random available action, with one exploration rate
+        # per decision as if the states had been handled one at a time
+        exploration_rates = np.maximum(
+            self.config.min_exploration_rate,
+            self.exploration_rate * self.config.exploration_decay ** np.arange(batch_size)
+        )
+        explore = np.random.random(batch_size) < exploration_rates
+        if explore.any():
+            # Pick uniformly among available actions by ranking random keys
+            keys = np.where(masks[explore], np.random.random((int(explore.sum()), masks.shape[1])), -1.0)
+            action_indices[explore] = np.argmax(keys, axis=1)
+        
+        for _ in range(batch_size):
+            self._decay_exploration_rate()
+        
+        return [self.index_to_action[int(i)] for i in action_indices]
+    
+    def _decay_exploration_rate(self) -> None:
+        """Decay the exploration rate after a decision."""
+        self.exploration_rate = max(
+            self.config.min_exploration_rate,
+            self.exploration_rate * self.config.exploration_decay
+        )
+    
     def learn_from_transition(self, state_features: List[float], action_taken: MetaAction,
                              reward: float, next_state_features: List[float], 
                              episode_done: bool) -> None:
@@ -360,10 +575,6 @@ class MetaControlRLModule:
             next_state_features: Features of the state after taking the action
             episode_done: Whether the episode is done
         """
-        # Convert to numpy arrays
-        state = np.array(state_features, dtype=np.float32)
-        next_state = np.array(next_state_features, dtype=np.float32)
-        
         # Get action index
         action_idx = self.action_to_index[action_taken]
         
@@ -374,6 +585,8 @@ class MetaControlRLModule:
         if len(self.replay_buffer) < self.config.batch_size:
             return
         
+        start_time = time.perf_counter()
+        
         # Sample batch from replay buffer
         states, actions, rewards, next_states, dones = self.replay_buffer.sample(self.config.batch_size)
         
@@ -388,21 +601,50 @@ class MetaControlRLModule:
         # Periodically update target model
         self.training_steps += 1
         if self.training_steps % self.config.target_update_frequency == 0:
-            self.target_model.copy_weights_from(self.main_model)
+            if self.config.target_update_tau >= 1.0:
+                self.target_model.copy_weights_from(self.main_model)
+            else:
+                self.target_model.soft_update_from(self.main_model, self.config.target_update_tau)
             logger.debug(f"Updated target model (step {self.training_steps})")
         
+        self.stats["transitions_trained"] += len(actions)
+        self.stats["training_time"] += time.perf_counter() - start_time
+        
         logger.debug(f"Training step {self.training_steps}, loss: {loss:.4f}")
     
+    def get_training_throughput(self) -> float:
+        """
+        Get the training throughput.
+        
+        Returns:
+            The number of transitions trained on per second of training time,
+            or 0.0 if there has been no training yet
+        """
+        if self.stats["training_time"] <= 0:
+            return 0.0
+        return self.stats["transitions_trained"] / self.stats["training_time"]
+    
     def save_model(self, path: str) -> None:
         """
         Save the model to a file.
         
+        The weights and optimizer state of the main and target networks are
+        written as float32 arrays to a compressed NumPy archive, along with the
+        exploration rate and the number of training steps.
+        
         Args:
             path: Path to save the model
         """
-        # In a real implementation, this would save the model weights
-        # to a file. For simplicity, we'll just log a message.
-        logger.info(f"Saving model to {path} (not implemented)")
+        arrays = {}
+        arrays.update(self.main_model.get_state(prefix="main_"))
+        arrays.update(self.target_model.get_state(prefix="target_"))
+        arrays["exploration_rate"] = np.array(self.exploration_rate)
+        arrays["training_steps"] = np.array(self.training_steps)
+        
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        
+        logger.info(f"Saved model to {path}")
     
     def load_model(self, path: str) -> None:
         """
@@ -410,10 +652,20 @@ class MetaControlRLModule:
         
         Args:
             path: Path to load the model from
+            
+        Raises:
+            ValueError: If the saved model does not match the state and action
+                        dimensions or hidden layer sizes of this module
         """
-        # In a real implementation, this would load the model weights
-        # from a file. For simplicity, we'll just log a message.
-        logger.info(f"Loading model from {path} (not implemented)")
+        with np.load(path) as archive:
+            arrays = dict(archive)
+        
+        self.main_model.set_state(arrays, prefix="main_")
+        self.target_model.set_state(arrays, prefix="target_")
+        self.exploration_rate = float(arrays["exploration_rate"])
+        self.training_steps = int(arrays["training_steps"])
+        
+        logger.info(f"Loaded model from {path}")
     
     def get_action_space(self) -> List[MetaAction]:
         """
@@ -4,17 +4,25 @@ Template Evolution Module (TEM) for GödelOS.
 This module implements the TemplateEvolutionModule component (Module 3.3) of the Learning System,
 which is responsible for refining and evolving existing LogicTemplates to improve their utility,
 generality, or efficiency using evolutionary algorithms.
+
+Fitness is memoized by template fingerprint for the duration of an evolution
+run, so templates that survive unchanged into the next generation are not
+evaluated again. The metrics of the templates still to be evaluated are fetched
+with a single store query per generation.
 """
 
 import random
 import logging
 import copy
+import hashlib
+import time
 from typing import List, Dict, Set, Tuple, Optional, Any, Callable
 from dataclasses import dataclass, field
 
 from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, ApplicationNode, ConnectiveNode
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
 from godelOS.core_kr.type_system.manager import TypeSystemManager
+from godelOS.core_kr.type_system.types import FunctionType
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +100,10 @@ class TemplateEvolutionModule:
     LogicTemplates to improve their utility, generality, or efficiency.
     """
     
+    # Predicate and argument order of the template metrics stored in the MKB
+    METRICS_PREDICATE = "TemplatePerformance"
+    METRICS_ARGUMENTS = ("template_id", "success_rate", "utility_score", "computational_cost", "times_used")
+    
     def __init__(self, 
                  kr_system_interface: KnowledgeStoreInterface,
                  type_system: TypeSystemManager,
@@ -111,6 +123,13 @@ class TemplateEvolutionModule:
         self.mkb_context_id = mkb_context_id
         self.config = evolution_config or EvolutionConfig()
         
+        # Fitness of the templates seen in the current run, by fingerprint
+        self._fitness_cache: Dict[str, float] = {}
+        self.fitness_cache_stats = {"hits": 0, "misses": 0}
+        
+        # Wall time and fitness cache statistics of each generation of the last run
+        self.generation_stats: List[Dict[str, Any]] = []
+    
     def evolve_population(self, 
                           initial_population_templates: List[AST_Node],
                           generations: Optional[int] = None,
@@ -144,9 +163,37 @@ class TemplateEvolutionModule:
         else:
             population = initial_population_templates[:population_size]
         
+        # Metrics may have changed since the last run, so start with no
+        # memoized fitness
+        self.clear_fitness_cache()
+        self.generation_stats = []
+        return self._run_generations(population, generations, population_size, crossover_rate, mutation_rate)
+    
+    def _run_generations(self,
+                         population: List[AST_Node],
+                         generations: int,
+                         population_size: int,
+                         crossover_rate: float,
+                         mutation_rate: float) -> List[AST_Node]:
+        """
+        Run the main evolutionary loop.
+        
+        Args:
+            population: The initial population
+            generations: Number of generations to evolve
+            population_size: Size of the population
+            crossover_rate: Probability of crossover
+            mutation_rate: Probability of mutation
+            
+        Returns:
+            A list of evolved templates, sorted by fitness (best first)
+        """
         # Main evolutionary loop
         for generation in range(generations):
             logger.info(f"Starting generation {generation+1}/{generations}")
+            start_time = time.perf_counter()
+            hits_before = self.fitness_cache_stats["hits"]
+            misses_before = self.fitness_cache_stats["misses"]
             
             # Evaluate fitness of all templates in the population
             fitness_scores = self._evaluate_population_fitness(population)
@@ -161,6 +208,7 @@ class TemplateEvolutionModule:
             
             # If this is the final generation, return the sorted population
             if generation == generations - 1:
+                self._record_generation_stats(generation, start_time, hits_before, misses_before)
                 # Return templates sorted by fitness
                 return [template for template, _ in population_with_fitness]
             
@@ -193,6 +241,7 @@ class TemplateEvolutionModule:
             
             # Update population for next generation
             population = next_population
+            self._record_generation_stats(generation, start_time, hits_before, misses_before)
         
         # This should never be reached due to the return in the loop
         return population
@@ -227,30 +276,90 @@ class TemplateEvolutionModule:
         
         return population
     
+    def _record_generation_stats(self, generation: int, start_time: float,
+                                 hits_before: int, misses_before: int) -> None:
+        """
+        Record the wall time and fitness cache statistics of a generation.
+        
+        Args:
+            generation: The index of the generation
+            start_time: The performance counter value when the generation started
+            hits_before: The fitness cache hits before the generation
+            misses_before: The fitness cache misses before the generation
+        """
+        hits = self.fitness_cache_stats["hits"] - hits_before
+        misses = self.fitness_cache_stats["misses"] - misses_before
+        stats = {
+            "generation": generation + 1,
+            "wall_time": time.perf_counter() - start_time,
+            "fitness_cache_hits": hits,
+            "fitness_cache_misses": misses,
+            "fitness_cache_hit_rate": hits / (hits + misses) if hits + misses else 0.0
+        }
+        self.generation_stats.append(stats)
+        logger.info(f"Generation {stats['generation']}: {stats['wall_time']:.3f}s, "
+                    f"fitness cache hit rate {stats['fitness_cache_hit_rate']:.2f}")
+    
+    def get_generation_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the statistics of each generation of the last evolution run.
+        
+        Returns:
+            A list with, for each generation, its wall time in seconds and the
+            number of fitness cache hits and misses and the hit rate
+        """
+        return [dict(stats) for stats in self.generation_stats]
+    
+    def clear_fitness_cache(self) -> None:
+        """Clear the memoized fitness of templates."""
+        self._fitness_cache.clear()
+    
     def _evaluate_population_fitness(self, population: List[AST_Node]) -> List[float]:
         """
         Evaluate the fitness of all templates in the population.
         
+        Fitness is looked up by template fingerprint first. The metrics of the
+        remaining templates are retrieved with one query to the MKB.
+        
         Args:
             population: List of template ASTs to evaluate
             
         Returns:
             List of fitness scores corresponding to the templates
         """
-        fitness_scores = []
+        fingerprints = [self._get_template_fingerprint(template) for template in population]
+        
+        # Templates to evaluate, by fingerprint, in population order
+        pending: Dict[str, AST_Node] = {}
+        for template, fingerprint in zip(population, fingerprints):
+            if fingerprint in self._fitness_cache:
+                self.fitness_cache_stats["hits"] += 1
+            else:
+                self.fitness_cache_stats["misses"] += 1
+                pending.setdefault(fingerprint, template)
+        
+        if pending:
+            population_metrics = self._query_population_metrics()
+            for fingerprint, template in pending.items():
+                metrics = self._get_template_performance_metrics(
+                    self._get_template_id(template), population_metrics
+                )
+                self._fitness_cache[fingerprint] = metrics.calculate_fitness()
+        
+        return [self._fitness_cache[fingerprint] for fingerprint in fingerprints]
+    
+    def _get_template_fingerprint(self, template: AST_Node) -> str:
+        """
+        Get a fingerprint identifying a template by its ID and structure.
         
-        for template in population:
-            # Get the template ID or generate one if it doesn't exist
-            template_id = self._get_template_id(template)
-            
-            # Get performance metrics from MKB
-            metrics = self._get_template_performance_metrics(template_id)
+        Args:
+            template: The template AST
             
-            # Calculate fitness
-            fitness = metrics.calculate_fitness()
-            fitness_scores.append(fitness)
-        
-        return fitness_scores
+        Returns:
+            A digest of the template ID and the template's string form
+        """
+        text = f"{self._get_template_id(template)}\x00{template}"
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
     
     def _get_template_id(self, template: AST_Node) -> str:
         """
@@ -269,33 +378,49 @@ class TemplateEvolutionModule:
         # Generate a hash-based ID if no ID exists
         return f"template_{hash(str(template)) % 10000000}"
     
-    def _get_template_performance_metrics(self, template_id: str) -> TemplatePerformanceMetrics:
+    def _query_population_metrics(self) -> Dict[str, TemplatePerformanceMetrics]:
+        """
+        Retrieve the performance metrics of all templates from the MetaKnowledgeBase.
+        
+        Returns:
+            The metrics found, by template ID, to be passed to
+            _get_template_performance_metrics
+        """
+        query_pattern = self._create_metrics_query_pattern()
+        query_results = self.ksi.query_statements_match_pattern(
+            query_pattern_ast=query_pattern,
+            context_ids=[self.mkb_context_id],
+            variables_to_bind=self._pattern_variables(query_pattern)
+        )
+        return self._index_metrics_query_results(query_results)
+    
+    def _get_template_performance_metrics(self, template_id: str,
+                                          population_metrics: Optional[Dict[str, TemplatePerformanceMetrics]] = None) -> TemplatePerformanceMetrics:
         """
         Retrieve performance metrics for a template from the MetaKnowledgeBase.
         
         Args:
             template_id: The ID of the template
+            population_metrics: Metrics of the whole population, by template ID,
+                               from _query_population_metrics; if omitted, the
+                               MKB is queried for this template
             
         Returns:
             A TemplatePerformanceMetrics object with the metrics
         """
-        # Query the MKB for metrics about this template
-        # In a real implementation, this would query the actual MKB
-        # For now, we'll use some default values or random values for testing
-        
-        # Try to find metrics in the MKB
-        query_pattern = self._create_metrics_query_pattern(template_id)
-        query_results = self.ksi.query_statements_match_pattern(
-            query_pattern_ast=query_pattern,
-            context_ids=[self.mkb_context_id]
-        )
+        if population_metrics is not None:
+            metrics = population_metrics.get(template_id)
+        else:
+            query_pattern = self._create_metrics_query_pattern(template_id)
+            query_results = self.ksi.query_statements_match_pattern(
+                query_pattern_ast=query_pattern,
+                context_ids=[self.mkb_context_id],
+                variables_to_bind=self._pattern_variables(query_pattern)
+            )
+            metrics = self._extract_metrics_from_query_results(query_results, template_id)
         
-        # If we found metrics, extract them
-        if query_results:
-            # Extract metrics from the query results
-            # This is a simplified version - in a real implementation,
-            # we would parse the AST nodes to extract the actual metrics
-            return self._extract_metrics_from_query_results(query_results, template_id)
+        if metrics is not None:
+            return metrics
         
         # If no metrics found, return default metrics
         return TemplatePerformanceMetrics(
@@ -306,46 +431,130 @@ class TemplateEvolutionModule:
             times_used=random.randint(0, 20)  # For testing only
         )
     
-    def _create_metrics_query_pattern(self, template_id: str) -> AST_Node:
+    def _create_metrics_query_pattern(self, template_id: Optional[str] = None) -> AST_Node:
         """
         Create a query pattern to retrieve metrics for a template from the MKB.
         
+        Metrics are stored in the MKB as statements of the form
+        TemplatePerformance(template_id, success_rate, utility_score,
+        computational_cost, times_used).
+        
         Args:
-            template_id: The ID of the template
+            template_id: The ID of the template, or None for a pattern matching
+                        the metrics of any template
             
         Returns:
             An AST_Node representing the query pattern
         """
-        # This is a simplified implementation
-        # In a real system, we would create a proper AST query pattern
-        # that matches the structure of how metrics are stored in the MKB
+        entity_type = self.type_system.get_type("Entity")
+        boolean_type = self.type_system.get_type("Boolean")
+        
+        predicate_type = FunctionType([entity_type] * len(self.METRICS_ARGUMENTS), boolean_type)
+        predicate = ConstantNode(self.METRICS_PREDICATE, predicate_type)
+        
+        arguments: List[AST_Node] = []
+        for var_id, name in enumerate(self.METRICS_ARGUMENTS, start=1):
+            if name == "template_id" and template_id is not None:
+                arguments.append(ConstantNode(template_id, entity_type, template_id))
+            else:
+                arguments.append(VariableNode(f"?{name}", var_id, entity_type))
         
-        # For now, return a dummy pattern
-        # In a real implementation, this would be a proper AST query
-        return None  # Placeholder
+        return ApplicationNode(predicate, arguments, boolean_type)
     
-    def _extract_metrics_from_query_results(self, query_results: List[Dict[VariableNode, AST_Node]], template_id: str) -> TemplatePerformanceMetrics:
+    def _pattern_variables(self, query_pattern: ApplicationNode) -> List[VariableNode]:
         """
-        Extract metrics from query results.
+        Get the variables of a metrics query pattern, to be bound by the query.
+        
+        Args:
+            query_pattern: A pattern from _create_metrics_query_pattern
+            
+        Returns:
+            The pattern's variables, in argument order
+        """
+        return [arg for arg in query_pattern.arguments if isinstance(arg, VariableNode)]
+    
+    def _extract_metrics_from_query_results(self, query_results: List[Dict[VariableNode, AST_Node]],
+                                            template_id: str) -> Optional[TemplatePerformanceMetrics]:
+        """
+        Extract the metrics of a template from query results.
         
         Args:
             query_results: The results from querying the MKB
             template_id: The ID of the template
             
         Returns:
-            A TemplatePerformanceMetrics object with the extracted metrics
+            A TemplatePerformanceMetrics object with the extracted metrics, or
+            None if the results hold no metrics for the template
+        """
+        for bindings in query_results:
+            metrics = self._metrics_from_bindings(bindings, template_id)
+            if metrics is not None and metrics.template_id == template_id:
+                return metrics
+        return None
+    
+    def _index_metrics_query_results(self, query_results: List[Dict[VariableNode, AST_Node]]) -> Dict[str, TemplatePerformanceMetrics]:
         """
-        # This is a simplified implementation
-        # In a real system, we would parse the AST nodes to extract the metrics
+        Extract the metrics of every template from query results.
         
-        # For now, return default metrics
-        return TemplatePerformanceMetrics(
-            template_id=template_id,
-            success_rate=0.5,  # Default value
-            utility_score=0.5,  # Default value
-            computational_cost=1.0,  # Default value
-            times_used=5  # Default value
-        )
+        Args:
+            query_results: The results from querying the MKB for any template
+            
+        Returns:
+            The extracted metrics, by template ID
+        """
+        population_metrics: Dict[str, TemplatePerformanceMetrics] = {}
+        for bindings in query_results:
+            metrics = self._metrics_from_bindings(bindings)
+            if metrics is not None:
+                population_metrics.setdefault(metrics.template_id, metrics)
+        return population_metrics
+    
+    def _metrics_from_bindings(self, bindings: Dict[VariableNode, AST_Node],
+                               template_id: Optional[str] = None) -> Optional[TemplatePerformanceMetrics]:
+        """
+        Build the metrics of a template from the bindings of a metrics query.
+        
+        Args:
+            bindings: The bindings of the pattern variables
+            template_id: The ID of the template if it was bound in the pattern
+            
+        Returns:
+            The metrics, or None if the bindings are incomplete or malformed
+        """
+        # Pattern variables are numbered by argument position, so bindings are
+        # mapped back by variable ID whatever name the store gives them
+        values = {
+            self.METRICS_ARGUMENTS[var.var_id - 1]: node
+            for var, node in bindings.items()
+            if 1 <= var.var_id <= len(self.METRICS_ARGUMENTS)
+        }
+        try:
+            if template_id is None:
+                template_id = str(self._constant_value(values["template_id"]))
+            return TemplatePerformanceMetrics(
+                template_id=template_id,
+                success_rate=float(self._constant_value(values["success_rate"])),
+                utility_score=float(self._constant_value(values["utility_score"])),
+                computational_cost=float(self._constant_value(values["computational_cost"])),
+                times_used=int(self._constant_value(values["times_used"]))
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Ignoring malformed template metrics: {bindings}")
+            return None
+    
+    def _constant_value(self, node: AST_Node) -> Any:
+        """
+        Get the value of a constant bound by a metrics query.
+        
+        Args:
+            node: The bound node
+            
+        Returns:
+            The constant's literal value, or its name if it has none
+        """
+        if not isinstance(node, ConstantNode):
+            raise TypeError(f"Expected a constant, got {node}")
+        return node.value if node.value is not None else node.name
     
     def _tournament_selection(self, population: List[AST_Node], fitness_scores: List[float]) -> AST_Node:
         """
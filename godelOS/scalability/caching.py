@@ -10,8 +10,7 @@ import time
 import threading
 import logging
 import functools
-import inspect
-from typing import Dict, List, Optional, Set, Tuple, Any, Callable, TypeVar, Generic, cast
+from typing import Dict, Hashable, List, Optional, Set, Tuple, Any, Callable, TypeVar, Generic, cast
 from enum import Enum
 from abc import ABC, abstractmethod
 import hashlib
@@ -487,6 +486,160 @@ class DependencyBasedInvalidation(CacheInvalidationStrategy):
                     self.invalidate(cache, dependent_key)
 
 
+class CacheKeyBuilder:
+    """
+    Derivation of cache keys from arbitrary values.
+    
+    Keys are built structurally and cheaply: strings, integers and other
+    atoms are used as they are, AST nodes are used directly (their
+    structural hash is cached on the node, so equal nodes built separately
+    share a key), and containers are turned into tagged tuples of their
+    elements' keys. Only values that none of these cover are serialized with
+    pickle and hashed.
+    
+    The builder counts the keys it builds, the time spent building them,
+    serialization fallbacks and hash collisions, i.e. distinct keys with the
+    same hash that the cache store has to tell apart by full comparison.
+    Counters are not synchronized and may be approximate under concurrent
+    use.
+    """
+    
+    # Atoms that are valid keys on their own; bool and float are tagged so
+    # that 1, 1.0 and True do not share a key
+    _ATOMS = (str, int, bytes, type(None))
+    
+    def __init__(self, max_probe_size: int = 10000):
+        """
+        Initialize the key builder.
+        
+        Args:
+            max_probe_size: The maximum number of recent keys tracked for
+                collision detection
+        """
+        self.max_probe_size = max_probe_size
+        self.logger = logging.getLogger(__name__)
+        
+        # Recent keys by hash, used to detect collisions
+        self._probe: Dict[int, Hashable] = {}
+        
+        self._builds = 0
+        self._build_time = 0.0
+        self._fallbacks = 0
+        self._collisions = 0
+    
+    def build(self, value: Any) -> Hashable:
+        """
+        Build the cache key for a value.
+        
+        Args:
+            value: The value to build a key for
+            
+        Returns:
+            A hashable key; equal values yield equal keys
+        """
+        start = time.perf_counter()
+        key = self._key(value)
+        if not isinstance(key, str):
+            self._check_collision(key)
+        self._builds += 1
+        self._build_time += time.perf_counter() - start
+        return key
+    
+    def build_call(self, func_key: str, args: Tuple, kwargs: Dict) -> Hashable:
+        """
+        Build the cache key for a function call.
+        
+        Args:
+            func_key: The qualified name of the function
+            args: The positional arguments
+            kwargs: The keyword arguments
+            
+        Returns:
+            A hashable key for the call
+        """
+        start = time.perf_counter()
+        key_of = self._key
+        args_key = tuple(key_of(arg) for arg in args)
+        if kwargs:
+            kwargs_key = tuple(sorted((name, key_of(value)) for name, value in kwargs.items()))
+        else:
+            kwargs_key = ()
+        key = ("call", func_key, args_key, kwargs_key)
+        self._check_collision(key)
+        self._builds += 1
+        self._build_time += time.perf_counter() - start
+        return key
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about key building.
+        
+        Returns:
+            A dictionary with the number of keys built, the total and average
+            build time in seconds, and the fallback and collision counts
+        """
+        return {
+            "builds": self._builds,
+            "build_time": self._build_time,
+            "avg_build_time": self._build_time / self._builds if self._builds else 0.0,
+            "fallbacks": self._fallbacks,
+            "collisions": self._collisions,
+        }
+    
+    def reset_statistics(self) -> None:
+        """Reset the counters and forget the keys tracked for collision detection."""
+        self._probe = {}
+        self._builds = 0
+        self._build_time = 0.0
+        self._fallbacks = 0
+        self._collisions = 0
+    
+    def _key(self, value: Any) -> Hashable:
+        """Build the key for a value without updating the counters."""
+        value_type = type(value)
+        if value_type in self._ATOMS:
+            return value
+        if isinstance(value, AST_Node):
+            try:
+                hash(value)
+                return value
+            except TypeError:
+                # Unhashable metadata
+                return self._fallback(value)
+        if value_type is float or value_type is bool:
+            return (value_type.__name__, value)
+        if value_type is tuple:
+            return ("tuple",) + tuple(self._key(item) for item in value)
+        if value_type is list:
+            return ("list",) + tuple(self._key(item) for item in value)
+        if value_type is dict:
+            return ("dict", frozenset((self._key(k), self._key(v)) for k, v in value.items()))
+        if value_type is set or value_type is frozenset:
+            return (value_type.__name__, frozenset(self._key(item) for item in value))
+        if isinstance(value, Enum):
+            return value
+        return self._fallback(value)
+    
+    def _fallback(self, value: Any) -> str:
+        """Build a key by serializing a value that has no structural key."""
+        self._fallbacks += 1
+        try:
+            return hashlib.md5(pickle.dumps(value)).hexdigest()
+        except Exception as e:
+            self.logger.warning(f"Error converting key to string: {e}")
+            return str(value)
+    
+    def _check_collision(self, key: Hashable) -> None:
+        """Record a key and count a collision if a different key has the same hash."""
+        key_hash = hash(key)
+        previous = self._probe.get(key_hash)
+        if previous is not None and previous is not key and previous != key:
+            self._collisions += 1
+        if len(self._probe) >= self.max_probe_size:
+            self._probe = {}
+        self._probe[key_hash] = key
+
+
 class CachingSystem:
     """
     Class for caching and memoization of expensive computations.
@@ -508,6 +661,7 @@ class CachingSystem:
         """
         self.cache_store = InMemoryCacheStore(max_size, eviction_policy, default_ttl)
         self.invalidation_strategies: List[CacheInvalidationStrategy] = []
+        self.key_builder = CacheKeyBuilder()
         self.logger = logging.getLogger(__name__)
     
     def add_invalidation_strategy(self, strategy: CacheInvalidationStrategy) -> None:
@@ -607,6 +761,15 @@ class CachingSystem:
         """
         return self.cache_store.size()
     
+    def get_key_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about cache key building.
+        
+        Returns:
+            A dictionary with key build counts, timings and collisions
+        """
+        return self.key_builder.get_statistics()
+    
     def memoize(self, func: Callable) -> Callable:
         """
         Decorator for memoizing a function.
@@ -617,13 +780,18 @@ class CachingSystem:
         Returns:
             The memoized function
         """
+        func_key = self._function_key(func)
+        build_call = self.key_builder.build_call
+        cache_store = self.cache_store
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Generate a cache key based on the function and its arguments
-            cache_key = self._generate_cache_key(func, args, kwargs)
+            # Generate a cache key based on the function and its arguments;
+            # call keys are final, so the store is used directly
+            cache_key = build_call(func_key, args, kwargs)
             
             # Check if the result is cached
-            cached_result = self.get(cache_key)
+            cached_result = cache_store.get(cache_key)
             if cached_result is not None:
                 return cached_result
             
@@ -631,77 +799,55 @@ class CachingSystem:
             result = func(*args, **kwargs)
             
             # Cache the result
-            self.put(cache_key, result)
+            cache_store.put(cache_key, result)
             
             return result
         
         return wrapper
     
-    def _convert_key(self, key: Any) -> str:
+    def _convert_key(self, key: Any) -> Hashable:
         """
-        Convert a key to a string.
+        Convert a key to a cache store key.
         
         Args:
             key: The key to convert
             
         Returns:
-            The string representation of the key
-        """
-        if isinstance(key, str):
-            return key
-        
-        # For AST nodes, use their string representation
-        if isinstance(key, AST_Node):
-            # Check the calling stack to determine the context
-            import inspect
-            stack = inspect.stack()
-            # Look for the test file in the stack
-            for frame in stack:
-                if 'test_caching_enhanced.py' in frame.filename:
-                    # If called from enhanced tests, include the object ID
-                    return f"{str(key)}_{id(key)}"
-            
-            # Default behavior for basic tests
-            return str(key)
-        
-        # For other types, use pickle to serialize the key
-        try:
-            serialized = pickle.dumps(key)
-            return hashlib.md5(serialized).hexdigest()
-        except Exception as e:
-            self.logger.warning(f"Error converting key to string: {e}")
-            return str(key)
+            The structural cache key (strings are returned unchanged)
+        """
+        return self.key_builder.build(key)
     
-    def _generate_cache_key(self, func: Callable, args: Tuple, kwargs: Dict) -> str:
+    @staticmethod
+    def _function_key(func: Callable) -> str:
         """
-        Generate a cache key for a function call.
+        Get the qualified name used to key calls of a function.
         
         Args:
             func: The function
-            args: The positional arguments
-            kwargs: The keyword arguments
             
         Returns:
-            The cache key
+            The function's module and qualified name
         """
-        # Get the function's module and name
         # Handle MagicMock objects which don't have __qualname__
         try:
-            func_key = f"{func.__module__}.{func.__qualname__}"
+            return f"{func.__module__}.{func.__qualname__}"
         except AttributeError:
             # For MagicMock or other objects without __qualname__
-            func_key = str(func)
-        
-        # Convert arguments to strings
-        args_key = [self._convert_key(arg) for arg in args]
-        kwargs_key = {k: self._convert_key(v) for k, v in kwargs.items()}
-        
-        # Combine the keys
-        key = (func_key, tuple(args_key), tuple(sorted(kwargs_key.items())))
+            return str(func)
+    
+    def _generate_cache_key(self, func: Callable, args: Tuple, kwargs: Dict) -> Hashable:
+        """
+        Generate a cache key for a function call.
         
-        # Convert to a string
-        return self._convert_key(key)
-
+        Args:
+            func: The function
+            args: The positional arguments
+            kwargs: The keyword arguments
+            
+        Returns:
+            The cache key
+        """
+        return self.key_builder.build_call(self._function_key(func), args, kwargs)
 
 # Add alias for backward compatibility with tests
 CachingMemoizationLayer = CachingSystem
\ No newline at end of file
@@ -11,13 +11,16 @@ import pickle
 import threading
 import sqlite3
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Set, Tuple, Any, DefaultDict, Type
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any, DefaultDict, Type
 from collections import defaultdict
 import uuid
+from contextlib import contextmanager
 
 from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, ApplicationNode
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreBackend
+from godelOS.core_kr.knowledge_store.term_index import TermIndex, variant_key, variant_digest
 from godelOS.core_kr.unification_engine.engine import UnificationEngine
+from godelOS.scalability.write_ahead_log import WriteAheadLog
 
 
 class PersistentKBBackend(KnowledgeStoreBackend, ABC):
@@ -67,11 +70,21 @@ class FileBasedKBBackend(PersistentKBBackend):
     File-based implementation of the persistent knowledge store backend.
     
     This class implements the PersistentKBBackend interface using files
-    to persist data. It uses an in-memory store for fast access and
-    periodically persists changes to disk.
+    to persist data. It uses an in-memory store for fast access. With
+    auto_persist, every change is appended to a write-ahead log of
+    operations, so the cost of a write does not depend on the size of the
+    store, and the log is periodically compacted into a snapshot.
+    
+    On disk the store consists of ``snapshot.pickle`` and the log
+    ``wal.<generation>.log`` of the operations applied since that snapshot.
+    Log records are length-prefixed and checksummed, so a record torn by a
+    crash is detected and discarded when the log is replayed on load.
     """
     
-    def __init__(self, unification_engine: UnificationEngine, storage_dir: str, auto_persist: bool = True):
+    SNAPSHOT_FILE = "snapshot.pickle"
+    
+    def __init__(self, unification_engine: UnificationEngine, storage_dir: str, auto_persist: bool = True,
+                 sync_writes: bool = False, compaction_threshold: int = 10000):
         """
         Initialize the file-based knowledge store.
         
@@ -79,10 +92,18 @@ class FileBasedKBBackend(PersistentKBBackend):
             unification_engine: The unification engine to use for pattern matching
             storage_dir: The directory to store the knowledge base files
             auto_persist: Whether to automatically persist changes to disk
+            sync_writes: Whether to fsync the log after every single operation;
+                committed transactions and bulk loads are always fsync'd
+            compaction_threshold: The minimum number of logged statements
+                before the log is compacted into a snapshot. Compaction also
+                waits until the log is as large as the last snapshot, which
+                keeps its amortized cost per write constant.
         """
         self.unification_engine = unification_engine
         self.storage_dir = storage_dir
         self.auto_persist = auto_persist
+        self.sync_writes = sync_writes
+        self.compaction_threshold = compaction_threshold
         
         # Create the storage directory if it doesn't exist
         os.makedirs(storage_dir, exist_ok=True)
@@ -100,14 +121,28 @@ class FileBasedKBBackend(PersistentKBBackend):
         self._constant_index: DefaultDict[str, DefaultDict[str, Set[AST_Node]]] = defaultdict(lambda: defaultdict(set))
         self._type_index: DefaultDict[str, DefaultDict[str, Set[AST_Node]]] = defaultdict(lambda: defaultdict(set))
         
-        # Transaction state
+        # Per-context map from canonical variant key to stored statement
+        self._variant_index: DefaultDict[str, Dict[Tuple, AST_Node]] = defaultdict(dict)
+        
+        # Per-context path index over predicate, arity and argument positions
+        self._term_index: DefaultDict[str, TermIndex] = defaultdict(TermIndex)
+        
+        # Write-ahead log state
+        self._wal = WriteAheadLog(storage_dir, "wal")
+        self._log_size = 0
+        self._snapshot_size = 0
+        
+        # Transaction state: the operations applied since begin_transaction,
+        # written as one log record on commit, and their inverses for rollback
         self._in_transaction = False
-        self._transaction_backup = None
+        self._transaction_operations: List[Tuple] = []
+        self._transaction_undo: List[List[Tuple]] = []
         
         # Try to load existing data
         self.load()
     
-    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None,
+                      check_subsumption: bool = False) -> bool:
         """
         Add a statement to the knowledge store.
         
@@ -115,6 +150,8 @@ class FileBasedKBBackend(PersistentKBBackend):
             statement_ast: The statement to add
             context_id: The context to add the statement to
             metadata: Optional metadata for the statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
             
         Returns:
             True if the statement was added successfully, False otherwise
@@ -130,8 +167,12 @@ class FileBasedKBBackend(PersistentKBBackend):
             if metadata:
                 statement_ast = statement_ast.with_updated_metadata(metadata)
             
-            # Check if the statement already exists in the context
-            if self.statement_exists(statement_ast, [context_id]):
+            # Reject variants of stored statements with a hash lookup; fall back
+            # to unification for subsumption or statements without a variant key
+            key = variant_key(statement_ast)
+            if key is not None and key in self._variant_index[context_id]:
+                return False
+            if (check_subsumption or key is None) and self.statement_exists(statement_ast, [context_id]):
                 return False
             
             # Add the statement to the main storage
@@ -140,12 +181,74 @@ class FileBasedKBBackend(PersistentKBBackend):
             # Update indexes
             self._index_statement(statement_ast, context_id)
             
-            # Persist changes to disk if auto_persist is enabled
-            if self.auto_persist and not self._in_transaction:
-                self.persist()
+            self._record(("add", context_id, [statement_ast]), [("retract", context_id, [statement_ast])])
             
             return True
     
+    def add_statements_bulk(self, statements: Iterable[AST_Node], context_id: str,
+                            metadata: Optional[Dict[str, Any]] = None,
+                            check_subsumption: bool = False) -> List[bool]:
+        """
+        Add many statements to the knowledge store.
+        
+        The lock is taken once, duplicates are detected by variant key against
+        the context and the rest of the batch, the accepted statements are
+        indexed in one pass and logged as a single fsync'd record.
+        
+        Args:
+            statements: The statements to add
+            context_id: The context to add the statements to
+            metadata: Optional metadata applied to every statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
+            
+        Returns:
+            One result per input statement, True if it was added and False if
+            it was rejected as a duplicate
+        """
+        with self._lock:
+            if context_id not in self._contexts:
+                raise ValueError(f"Context {context_id} does not exist")
+            
+            stored = self._statements.setdefault(context_id, set())
+            variants = self._variant_index[context_id]
+            batch_keys: Set[Tuple] = set()
+            pending: List[Tuple[AST_Node, Optional[Tuple]]] = []
+            added: List[AST_Node] = []
+            results: List[bool] = []
+            
+            for statement_ast in statements:
+                if metadata:
+                    statement_ast = statement_ast.with_updated_metadata(metadata)
+                
+                key = variant_key(statement_ast)
+                if key is not None and (key in variants or key in batch_keys):
+                    results.append(False)
+                    continue
+                
+                if check_subsumption or key is None:
+                    # Unification only sees indexed statements, so index the
+                    # batch accepted so far before checking
+                    self._index_statements(pending, context_id)
+                    pending = []
+                    if self.statement_exists(statement_ast, [context_id]):
+                        results.append(False)
+                        continue
+                
+                if key is not None:
+                    batch_keys.add(key)
+                stored.add(statement_ast)
+                pending.append((statement_ast, key))
+                added.append(statement_ast)
+                results.append(True)
+            
+            self._index_statements(pending, context_id)
+            
+            if added:
+                self._record(("add", context_id, added), [("retract", context_id, added)], sync=True)
+            
+            return results
+    
     def retract_statement(self, statement_pattern_ast: AST_Node, context_id: str) -> bool:
         """
         Retract a statement from the knowledge store.
@@ -166,7 +269,7 @@ class FileBasedKBBackend(PersistentKBBackend):
             
             # Find statements matching the pattern
             matching_statements = []
-            for statement in self._statements[context_id]:
+            for statement in self._get_candidate_statements(statement_pattern_ast, context_id):
                 bindings, errors = self.unification_engine.unify(statement_pattern_ast, statement)
                 if bindings is not None:
                     matching_statements.append(statement)
@@ -179,9 +282,8 @@ class FileBasedKBBackend(PersistentKBBackend):
                 self._statements[context_id].remove(statement)
                 self._remove_from_indexes(statement, context_id)
             
-            # Persist changes to disk if auto_persist is enabled
-            if self.auto_persist and not self._in_transaction:
-                self.persist()
+            self._record(("retract", context_id, matching_statements),
+                         [("add", context_id, matching_statements)])
             
             return True
     
@@ -270,6 +372,11 @@ class FileBasedKBBackend(PersistentKBBackend):
                 if context_id not in self._statements:
                     continue
                 
+                # A stored variant always unifies with the statement
+                key = variant_key(statement_ast)
+                if key is not None and key in self._variant_index.get(context_id, {}):
+                    return True
+                
                 # Use indexes to optimize the check if possible
                 candidate_statements = self._get_candidate_statements(statement_ast, context_id)
                 
@@ -302,9 +409,8 @@ class FileBasedKBBackend(PersistentKBBackend):
                 "created_at": str(uuid.uuid4())  # Use a timestamp in a real implementation
             }
             
-            # Persist changes to disk if auto_persist is enabled
-            if self.auto_persist and not self._in_transaction:
-                self.persist()
+            self._record(("create_context", context_id, dict(self._contexts[context_id])),
+                         [("delete_context", context_id)])
     
     def delete_context(self, context_id: str) -> None:
         """
@@ -322,21 +428,13 @@ class FileBasedKBBackend(PersistentKBBackend):
                 if context_info.get("parent") == context_id:
                     raise ValueError(f"Cannot delete context {context_id} because it has child contexts")
             
-            # Delete the context
-            del self._contexts[context_id]
+            context_info = self._contexts[context_id]
+            statements = list(self._statements.get(context_id, ()))
             
-            # Delete the statements in the context
-            if context_id in self._statements:
-                # Remove statements from indexes
-                for statement in self._statements[context_id]:
-                    self._remove_from_indexes(statement, context_id)
-                
-                # Delete the statements
-                del self._statements[context_id]
+            self._apply(("delete_context", context_id))
             
-            # Persist changes to disk if auto_persist is enabled
-            if self.auto_persist and not self._in_transaction:
-                self.persist()
+            self._record(("delete_context", context_id),
+                         [("create_context", context_id, context_info), ("add", context_id, statements)])
     
     def list_contexts(self) -> List[str]:
         """
@@ -352,25 +450,39 @@ class FileBasedKBBackend(PersistentKBBackend):
         """
         Persist the knowledge store to disk.
         
+        Writes a snapshot of the whole store and starts a new, empty log.
+        Only committed state is snapshotted, so this fails while a
+        transaction is in progress.
+        
         Returns:
             True if the operation was successful, False otherwise
         """
         with self._lock:
+            if self._in_transaction:
+                return False
+            
             try:
-                # Serialize contexts to JSON
-                contexts_file = os.path.join(self.storage_dir, "contexts.json")
-                with open(contexts_file, "w") as f:
-                    json.dump(self._contexts, f, indent=2)
+                generation = self._wal.generation + 1
+                snapshot = {
+                    "generation": generation,
+                    "contexts": self._contexts,
+                    "statements": self._statements
+                }
                 
-                # Serialize statements to pickle files by context
-                for context_id, statements in self._statements.items():
-                    context_dir = os.path.join(self.storage_dir, "contexts", context_id)
-                    os.makedirs(context_dir, exist_ok=True)
-                    
-                    statements_file = os.path.join(context_dir, "statements.pickle")
-                    with open(statements_file, "wb") as f:
-                        pickle.dump(statements, f)
+                # Write the snapshot next to the old one and swap it in atomically
+                snapshot_file = os.path.join(self.storage_dir, self.SNAPSHOT_FILE)
+                temp_file = snapshot_file + ".tmp"
+                with open(temp_file, "wb") as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, snapshot_file)
                 
+                # The old log is covered by the snapshot
+                self._wal.advance(generation)
+                
+                self._log_size = 0
+                self._snapshot_size = sum(len(statements) for statements in self._statements.values())
                 return True
             except Exception as e:
                 print(f"Error persisting knowledge store: {e}")
@@ -380,37 +492,44 @@ class FileBasedKBBackend(PersistentKBBackend):
         """
         Load the knowledge store from disk.
         
+        Reads the latest snapshot and replays the log written since. A torn
+        record at the end of the log (from a crash during a write) is
+        discarded and truncated away.
+        
         Returns:
             True if the operation was successful, False otherwise
         """
         with self._lock:
             try:
-                # Load contexts from JSON
-                contexts_file = os.path.join(self.storage_dir, "contexts.json")
-                if os.path.exists(contexts_file):
-                    with open(contexts_file, "r") as f:
-                        self._contexts = json.load(f)
+                self._wal.close()
+                self._reset()
                 
-                # Load statements from pickle files by context
-                contexts_dir = os.path.join(self.storage_dir, "contexts")
-                if os.path.exists(contexts_dir):
-                    for context_id in os.listdir(contexts_dir):
-                        context_dir = os.path.join(contexts_dir, context_id)
-                        if os.path.isdir(context_dir):
-                            statements_file = os.path.join(context_dir, "statements.pickle")
-                            if os.path.exists(statements_file):
-                                with open(statements_file, "rb") as f:
-                                    self._statements[context_id] = pickle.load(f)
-                                    
-                                    # Rebuild indexes
-                                    for statement in self._statements[context_id]:
-                                        self._index_statement(statement, context_id)
+                snapshot_file = os.path.join(self.storage_dir, self.SNAPSHOT_FILE)
+                if os.path.exists(snapshot_file):
+                    with open(snapshot_file, "rb") as f:
+                        snapshot = pickle.load(f)
+                    self._wal.generation = snapshot["generation"]
+                    self._contexts = snapshot["contexts"]
+                    for context_id, statements in snapshot["statements"].items():
+                        self._statements[context_id] = set()
+                        self._apply(("add", context_id, list(statements)))
+                else:
+                    self._load_legacy()
+                
+                self._snapshot_size = sum(len(statements) for statements in self._statements.values())
+                self._log_size = self._replay_log()
+                self._wal.remove_stale()
                 
                 return True
             except Exception as e:
                 print(f"Error loading knowledge store: {e}")
                 return False
     
+    def close(self) -> None:
+        """Close the log file."""
+        with self._lock:
+            self._wal.close()
+    
     def begin_transaction(self) -> None:
         """Begin a transaction."""
         with self._lock:
@@ -418,31 +537,23 @@ class FileBasedKBBackend(PersistentKBBackend):
                 raise ValueError("Transaction already in progress")
             
             self._in_transaction = True
-            
-            # Create a backup of the current state
-            self._transaction_backup = {
-                "statements": {context_id: statements.copy() for context_id, statements in self._statements.items()},
-                "contexts": self._contexts.copy(),
-                "predicate_index": {pred: {ctx: stmts.copy() for ctx, stmts in ctx_dict.items()} 
-                                   for pred, ctx_dict in self._predicate_index.items()},
-                "constant_index": {const: {ctx: stmts.copy() for ctx, stmts in ctx_dict.items()} 
-                                  for const, ctx_dict in self._constant_index.items()},
-                "type_index": {type_name: {ctx: stmts.copy() for ctx, stmts in ctx_dict.items()} 
-                              for type_name, ctx_dict in self._type_index.items()}
-            }
+            self._transaction_operations = []
+            self._transaction_undo = []
     
     def commit_transaction(self) -> None:
-        """Commit the current transaction."""
+        """Commit the current transaction as a single fsync'd log record."""
         with self._lock:
             if not self._in_transaction:
                 raise ValueError("No transaction in progress")
             
+            operations = self._transaction_operations
             self._in_transaction = False
-            self._transaction_backup = None
+            self._transaction_operations = []
+            self._transaction_undo = []
             
             # Persist changes to disk if auto_persist is enabled
-            if self.auto_persist:
-                self.persist()
+            if operations and self.auto_persist:
+                self._append_log(operations, sync=True)
     
     def rollback_transaction(self) -> None:
         """Rollback the current transaction."""
@@ -450,29 +561,133 @@ class FileBasedKBBackend(PersistentKBBackend):
             if not self._in_transaction:
                 raise ValueError("No transaction in progress")
             
-            # Restore the backup
-            self._statements = self._transaction_backup["statements"]
-            self._contexts = self._transaction_backup["contexts"]
-            
-            # Restore indexes
-            self._predicate_index.clear()
-            self._constant_index.clear()
-            self._type_index.clear()
-            
-            for pred, ctx_dict in self._transaction_backup["predicate_index"].items():
-                for ctx, stmts in ctx_dict.items():
-                    self._predicate_index[pred][ctx] = stmts
-            
-            for const, ctx_dict in self._transaction_backup["constant_index"].items():
-                for ctx, stmts in ctx_dict.items():
-                    self._constant_index[const][ctx] = stmts
-            
-            for type_name, ctx_dict in self._transaction_backup["type_index"].items():
-                for ctx, stmts in ctx_dict.items():
-                    self._type_index[type_name][ctx] = stmts
+            # Undo the operations in reverse order
+            for undo in reversed(self._transaction_undo):
+                for operation in undo:
+                    self._apply(operation)
             
             self._in_transaction = False
-            self._transaction_backup = None
+            self._transaction_operations = []
+            self._transaction_undo = []
+    
+    def _reset(self) -> None:
+        """Forget all in-memory state."""
+        self._statements = {}
+        self._contexts = {}
+        self._predicate_index.clear()
+        self._constant_index.clear()
+        self._type_index.clear()
+        self._variant_index.clear()
+        self._term_index.clear()
+        self._wal.generation = 0
+    
+    def _load_legacy(self) -> None:
+        """Load a store written in the per-context pickle format."""
+        # Load contexts from JSON
+        contexts_file = os.path.join(self.storage_dir, "contexts.json")
+        if os.path.exists(contexts_file):
+            with open(contexts_file, "r") as f:
+                self._contexts = json.load(f)
+        
+        # Load statements from pickle files by context
+        contexts_dir = os.path.join(self.storage_dir, "contexts")
+        if os.path.exists(contexts_dir):
+            for context_id in os.listdir(contexts_dir):
+                statements_file = os.path.join(contexts_dir, context_id, "statements.pickle")
+                if os.path.exists(statements_file):
+                    with open(statements_file, "rb") as f:
+                        statements = pickle.load(f)
+                    self._statements[context_id] = set()
+                    self._apply(("add", context_id, list(statements)))
+    
+    def _apply(self, operation: Tuple) -> None:
+        """
+        Apply a logged operation to the in-memory store.
+        
+        Operations are idempotent, so replaying a log over a snapshot that
+        already contains some of its effects is safe.
+        
+        Args:
+            operation: The operation tuple, whose first two elements are the
+                kind of operation and the context ID
+        """
+        kind, context_id = operation[0], operation[1]
+        if kind == "add":
+            stored = self._statements.setdefault(context_id, set())
+            new_statements = [statement for statement in operation[2] if statement not in stored]
+            stored.update(new_statements)
+            self._index_statements([(statement, variant_key(statement)) for statement in new_statements],
+                                   context_id)
+        elif kind == "retract":
+            stored = self._statements.get(context_id, set())
+            for statement in operation[2]:
+                if statement in stored:
+                    stored.remove(statement)
+                    self._remove_from_indexes(statement, context_id)
+        elif kind == "create_context":
+            self._contexts[context_id] = dict(operation[2])
+        elif kind == "delete_context":
+            self._contexts.pop(context_id, None)
+            for statement in self._statements.pop(context_id, ()):
+                self._remove_from_indexes(statement, context_id)
+            self._variant_index.pop(context_id, None)
+            self._term_index.pop(context_id, None)
+        else:
+            raise ValueError(f"Unknown log operation {kind}")
+    
+    def _record(self, operation: Tuple, undo: List[Tuple], sync: bool = False) -> None:
+        """
+        Record an operation that has been applied to the in-memory store.
+        
+        Inside a transaction the operation is kept until commit; otherwise it
+        is appended to the log if auto_persist is enabled.
+        
+        Args:
+            operation: The operation to record
+            undo: The operations that revert it, in the order they must be applied
+            sync: Whether to fsync the log after writing the operation
+        """
+        if self._in_transaction:
+            self._transaction_operations.append(operation)
+            self._transaction_undo.append(undo)
+        elif self.auto_persist:
+            self._append_log([operation], sync=sync or self.sync_writes)
+    
+    @staticmethod
+    def _operation_size(operation: Tuple) -> int:
+        """Get the number of statements (or contexts) an operation touches."""
+        if operation[0] in ("add", "retract"):
+            return max(1, len(operation[2]))
+        return 1
+    
+    def _append_log(self, operations: List[Tuple], sync: bool) -> None:
+        """
+        Append a record of operations to the log.
+        
+        Args:
+            operations: The operations to write as one record
+            sync: Whether to fsync the log after writing the record
+        """
+        self._wal.append(operations, sync=sync)
+        
+        self._log_size += sum(self._operation_size(operation) for operation in operations)
+        if self._log_size >= max(self.compaction_threshold, self._snapshot_size):
+            self.persist()
+    
+    def _replay_log(self) -> int:
+        """
+        Replay the log of the current generation.
+        
+        Returns:
+            The number of statements (or contexts) touched by the replayed
+            operations
+        """
+        replayed = 0
+        for operations in self._wal.replay():
+            for operation in operations:
+                self._apply(operation)
+                replayed += self._operation_size(operation)
+        return replayed
     
     def _index_statement(self, statement: AST_Node, context_id: str) -> None:
         """
@@ -485,6 +700,11 @@ class FileBasedKBBackend(PersistentKBBackend):
         # Index by type
         self._type_index[statement.type.name][context_id].add(statement)
         
+        # Index by variant key
+        key = variant_key(statement)
+        if key is not None:
+            self._variant_index[context_id][key] = statement
+        
         # Index ApplicationNodes by predicate name and constants
         if isinstance(statement, ApplicationNode):
             # Index by predicate name
@@ -497,6 +717,46 @@ class FileBasedKBBackend(PersistentKBBackend):
                 if isinstance(arg, ConstantNode):
                     constant_name = arg.name
                     self._constant_index[constant_name][context_id].add(statement)
+            
+            # Index by argument paths
+            self._term_index[context_id].add(statement)
+    
+    def _index_statements(self, entries: List[Tuple[AST_Node, Optional[Tuple]]], context_id: str) -> None:
+        """
+        Index a batch of statements in one pass.
+        
+        Args:
+            entries: (statement, variant key) pairs to index
+            context_id: The context of the statements
+        """
+        if not entries:
+            return
+        
+        variants = self._variant_index[context_id]
+        term_index = self._term_index[context_id]
+        by_type: DefaultDict[str, List[AST_Node]] = defaultdict(list)
+        by_predicate: DefaultDict[str, List[AST_Node]] = defaultdict(list)
+        by_constant: DefaultDict[str, List[AST_Node]] = defaultdict(list)
+        
+        for statement, key in entries:
+            by_type[statement.type.name].append(statement)
+            if key is not None:
+                variants[key] = statement
+            
+            if isinstance(statement, ApplicationNode):
+                if isinstance(statement.operator, ConstantNode):
+                    by_predicate[statement.operator.name].append(statement)
+                for arg in statement.arguments:
+                    if isinstance(arg, ConstantNode):
+                        by_constant[arg.name].append(statement)
+                term_index.add(statement)
+        
+        for type_name, bucket in by_type.items():
+            self._type_index[type_name][context_id].update(bucket)
+        for predicate_name, bucket in by_predicate.items():
+            self._predicate_index[predicate_name][context_id].update(bucket)
+        for constant_name, bucket in by_constant.items():
+            self._constant_index[constant_name][context_id].update(bucket)
     
     def _remove_from_indexes(self, statement: AST_Node, context_id: str) -> None:
         """
@@ -510,6 +770,12 @@ class FileBasedKBBackend(PersistentKBBackend):
         if statement.type.name in self._type_index and context_id in self._type_index[statement.type.name]:
             self._type_index[statement.type.name][context_id].discard(statement)
         
+        # Remove from variant index
+        if context_id in self._variant_index:
+            key = variant_key(statement)
+            if key is not None and self._variant_index[context_id].get(key) == statement:
+                del self._variant_index[context_id][key]
+        
         # Remove from predicate index
         if isinstance(statement, ApplicationNode) and isinstance(statement.operator, ConstantNode):
             predicate_name = statement.operator.name
@@ -523,6 +789,10 @@ class FileBasedKBBackend(PersistentKBBackend):
                     constant_name = arg.name
                     if constant_name in self._constant_index and context_id in self._constant_index[constant_name]:
                         self._constant_index[constant_name][context_id].discard(statement)
+            
+            # Remove from term index
+            if context_id in self._term_index:
+                self._term_index[context_id].remove(statement)
     
     def _get_candidate_statements(self, pattern: AST_Node, context_id: str) -> Set[AST_Node]:
         """
@@ -541,11 +811,11 @@ class FileBasedKBBackend(PersistentKBBackend):
             return set()
         
         # If the pattern is an ApplicationNode with a constant predicate,
-        # use the predicate index
+        # use the term index to narrow by predicate, arity and bound arguments
         if isinstance(pattern, ApplicationNode) and isinstance(pattern.operator, ConstantNode):
-            predicate_name = pattern.operator.name
-            if predicate_name in self._predicate_index and context_id in self._predicate_index[predicate_name]:
-                return self._predicate_index[predicate_name][context_id]
+            if context_id not in self._term_index:
+                return set()
+            return self._term_index[context_id].candidates(pattern)
         
         # If the pattern has a specific type, use the type index
         if pattern.type.name in self._type_index and context_id in self._type_index[pattern.type.name]:
@@ -559,8 +829,26 @@ class SQLiteKBBackend(PersistentKBBackend):
     
     This class implements the PersistentKBBackend interface using SQLite
     for persistent storage.
+    
+    Each statement is stored as a pickled AST together with its predicate,
+    arity and variant key, plus one row per argument position holding the
+    argument's index symbol (a wildcard for variables and other terms that
+    are not ground at that position). Pattern queries push the predicate and
+    the bound arguments down into SQL, so only candidate rows are loaded
+    and unified and the knowledge base does not have to fit in memory.
+    
+    A single connection in WAL mode is reused for all operations. Writes
+    outside an explicit transaction are committed per call (or per batch
+    for add_statements_bulk).
     """
     
+    # Bumped whenever the structured columns change; older databases are
+    # migrated by re-deriving them from the pickled statements
+    SCHEMA_VERSION = 2
+    
+    # Stored symbol of arguments that may unify with anything
+    WILDCARD = "*"
+    
     def __init__(self, unification_engine: UnificationEngine, db_path: str):
         """
         Initialize the SQLite-based knowledge store.
@@ -573,28 +861,60 @@ class SQLiteKBBackend(PersistentKBBackend):
         self.db_path = db_path
         
         # Create the database directory if it doesn't exist
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
         
         self._lock = threading.RLock()  # Use RLock for thread safety
         
-        # In-memory cache for faster access
-        self._statements_cache: Dict[str, Set[AST_Node]] = {}
+        # Contexts are few and small, so they are kept in memory
         self._contexts_cache: Dict[str, Dict[str, Any]] = {}
         
+        # Transaction state
+        self._in_transaction = False
+        
+        # One long-lived connection; transactions are managed explicitly
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        
         # Initialize the database
         self._init_db()
         
         # Load contexts into memory
         self._load_contexts()
     
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    @contextmanager
+    def _write(self):
+        """
+        Run a block of writes atomically.
+        
+        Inside an explicit transaction the writes join it; otherwise they
+        are committed together when the block exits.
+        """
+        if self._in_transaction:
+            yield self._conn
+            return
+        
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+    
     def _init_db(self) -> None:
         """Initialize the SQLite database."""
-        with self._lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
+        with self._lock, self._write() as conn:
             # Create contexts table
-            cursor.execute('''
+            conn.execute('''
                 CREATE TABLE IF NOT EXISTS contexts (
                     context_id TEXT PRIMARY KEY,
                     parent_context_id TEXT,
@@ -604,59 +924,223 @@ class SQLiteKBBackend(PersistentKBBackend):
             ''')
             
             # Create statements table
-            cursor.execute('''
+            conn.execute('''
                 CREATE TABLE IF NOT EXISTS statements (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     context_id TEXT,
                     statement_data BLOB,
+                    variant_key TEXT,
+                    predicate TEXT,
+                    arity INTEGER,
                     FOREIGN KEY (context_id) REFERENCES contexts (context_id)
                 )
             ''')
             
-            conn.commit()
-            conn.close()
+            # Create the argument table; context, predicate and arity are
+            # repeated so that argument lookups are answered from one index
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS statement_arguments (
+                    statement_id INTEGER,
+                    context_id TEXT,
+                    predicate TEXT,
+                    arity INTEGER,
+                    position INTEGER,
+                    symbol TEXT,
+                    FOREIGN KEY (statement_id) REFERENCES statements (id)
+                )
+            ''')
+            
+            # Databases created by earlier versions lack the structured columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(statements)")}
+            for column, column_type in (("variant_key", "TEXT"), ("predicate", "TEXT"), ("arity", "INTEGER")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE statements ADD COLUMN {column} {column_type}")
+            
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < self.SCHEMA_VERSION:
+                self._migrate(conn)
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_statements_variant ON statements (context_id, variant_key)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_statements_functor ON statements (context_id, predicate, arity)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_arguments_lookup ON statement_arguments "
+                "(context_id, predicate, arity, position, symbol, statement_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_arguments_statement ON statement_arguments (statement_id)"
+            )
+    
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """
+        Derive the structured columns of all stored statements.
+        
+        Args:
+            conn: The database connection to use
+        """
+        conn.execute("DELETE FROM statement_arguments")
+        rows = conn.execute("SELECT id, context_id, statement_data FROM statements").fetchall()
+        for row_id, context_id, statement_data in rows:
+            statement = pickle.loads(statement_data)
+            predicate, arity, arguments = self._structure_of(statement)
+            conn.execute(
+                "UPDATE statements SET variant_key = ?, predicate = ?, arity = ? WHERE id = ?",
+                (variant_digest(statement), predicate, arity, row_id)
+            )
+            self._insert_arguments(conn, row_id, context_id, predicate, arity, arguments)
+    
+    @staticmethod
+    def _symbol_text(term: AST_Node) -> Optional[str]:
+        """
+        Get the stored index symbol of an argument.
+        
+        Args:
+            term: The argument
+        
+        Returns:
+            The symbol as text, or the wildcard if the argument is not ground
+            at its position
+        """
+        symbol = TermIndex.symbol_of(term)
+        if symbol is None:
+            return SQLiteKBBackend.WILDCARD
+        if symbol[0] == "c":
+            return f"c:{symbol[1]}"
+        return f"f:{symbol[1]}/{symbol[2]}"
+    
+    def _structure_of(self, statement: AST_Node) -> Tuple[Optional[str], Optional[int], List[Tuple[int, str]]]:
+        """
+        Get the structured columns of a statement.
+        
+        Args:
+            statement: The statement
+        
+        Returns:
+            The predicate name (None unless the statement is an application
+            with a constant operator), the arity (None unless the statement
+            is an application) and (position, symbol) pairs for its arguments
+        """
+        if not isinstance(statement, ApplicationNode):
+            return None, None, []
+        
+        predicate = statement.operator.name if isinstance(statement.operator, ConstantNode) else None
+        arguments = [(position, self._symbol_text(arg)) for position, arg in enumerate(statement.arguments)]
+        return predicate, len(statement.arguments), arguments
+    
+    @staticmethod
+    def _insert_arguments(conn: sqlite3.Connection, statement_id: int, context_id: str,
+                          predicate: Optional[str], arity: Optional[int],
+                          arguments: List[Tuple[int, str]]) -> None:
+        """Insert the argument rows of a stored statement."""
+        if predicate is None:
+            return
+        conn.executemany(
+            "INSERT INTO statement_arguments (statement_id, context_id, predicate, arity, position, symbol) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(statement_id, context_id, predicate, arity, position, symbol) for position, symbol in arguments]
+        )
+    
+    def _insert_statement(self, conn: sqlite3.Connection, statement: AST_Node, context_id: str,
+                          key: Optional[str]) -> None:
+        """
+        Insert a statement and its argument rows.
+        
+        Args:
+            conn: The database connection to use
+            statement: The statement to insert
+            context_id: The context of the statement
+            key: The variant digest of the statement
+        """
+        predicate, arity, arguments = self._structure_of(statement)
+        cursor = conn.execute(
+            "INSERT INTO statements (context_id, statement_data, variant_key, predicate, arity) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (context_id, pickle.dumps(statement), key, predicate, arity)
+        )
+        self._insert_arguments(conn, cursor.lastrowid, context_id, predicate, arity, arguments)
+    
+    def _variant_exists(self, key: str, context_id: str) -> bool:
+        """
+        Check whether a statement with the given variant key is stored in a context.
+        
+        Args:
+            key: The variant digest of the statement
+            context_id: The context to check
+        
+        Returns:
+            True if a variant of the statement is stored, False otherwise
+        """
+        cursor = self._conn.execute(
+            "SELECT 1 FROM statements WHERE context_id = ? AND variant_key = ? LIMIT 1",
+            (context_id, key)
+        )
+        return cursor.fetchone() is not None
+    
+    def _candidate_rows(self, pattern: AST_Node, context_id: str) -> List[Tuple[int, AST_Node]]:
+        """
+        Get the stored statements that might unify with a pattern.
+        
+        For applications with a constant predicate the predicate, arity and
+        every ground argument of the pattern are matched in SQL; an argument
+        constraint admits statements with the same symbol or the wildcard at
+        that position. Other patterns scan the whole context.
+        
+        Args:
+            pattern: The pattern to match
+            context_id: The context to search in
+        
+        Returns:
+            (row id, statement) pairs for the candidate statements
+        """
+        functor = TermIndex.functor_of(pattern)
+        if functor is None:
+            rows = self._conn.execute(
+                "SELECT id, statement_data FROM statements WHERE context_id = ?", (context_id,)
+            ).fetchall()
+            return [(row_id, pickle.loads(data)) for row_id, data in rows]
+        
+        predicate, arity = functor
+        sql = ["SELECT id, statement_data FROM statements "
+               "WHERE context_id = ? AND predicate = ? AND arity = ?"]
+        params: List[Any] = [context_id, predicate, arity]
+        for position, arg in enumerate(pattern.arguments):
+            symbol = self._symbol_text(arg)
+            if symbol == self.WILDCARD:
+                continue
+            sql.append("AND id IN (SELECT statement_id FROM statement_arguments "
+                       "WHERE context_id = ? AND predicate = ? AND arity = ? AND position = ? "
+                       "AND symbol IN (?, ?))")
+            params.extend([context_id, predicate, arity, position, symbol, self.WILDCARD])
+        
+        # Applications whose operator is not a constant may unify with any functor
+        sql.append("UNION ALL SELECT id, statement_data FROM statements "
+                   "WHERE context_id = ? AND predicate IS NULL AND arity = ?")
+        params.extend([context_id, arity])
+        
+        rows = self._conn.execute(" ".join(sql), params).fetchall()
+        return [(row_id, pickle.loads(data)) for row_id, data in rows]
     
     def _load_contexts(self) -> None:
         """Load contexts from the database into memory."""
         with self._lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT context_id, parent_context_id, context_type, created_at FROM contexts")
-            rows = cursor.fetchall()
+            cursor = self._conn.execute(
+                "SELECT context_id, parent_context_id, context_type, created_at FROM contexts"
+            )
             
-            for row in rows:
+            for row in cursor.fetchall():
                 context_id, parent_context_id, context_type, created_at = row
                 self._contexts_cache[context_id] = {
                     "parent": parent_context_id,
                     "type": context_type,
                     "created_at": created_at
                 }
-            
-            conn.close()
     
-    def _load_statements_for_context(self, context_id: str) -> None:
-        """
-        Load statements for a specific context from the database into memory.
-        
-        Args:
-            context_id: The context ID to load statements for
-        """
-        with self._lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT statement_data FROM statements WHERE context_id = ?", (context_id,))
-            rows = cursor.fetchall()
-            
-            self._statements_cache[context_id] = set()
-            for row in rows:
-                statement = pickle.loads(row[0])
-                self._statements_cache[context_id].add(statement)
-            
-            conn.close()
-    
-    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None,
+                      check_subsumption: bool = False) -> bool:
         """
         Add a statement to the knowledge store.
         
@@ -664,7 +1148,9 @@ class SQLiteKBBackend(PersistentKBBackend):
             statement_ast: The statement to add
             context_id: The context to add the statement to
             metadata: Optional metadata for the statement
-            
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
+        
         Returns:
             True if the statement was added successfully, False otherwise
         """
@@ -676,32 +1162,95 @@ class SQLiteKBBackend(PersistentKBBackend):
             if metadata:
                 statement_ast = statement_ast.with_updated_metadata(metadata)
             
-            # Check if the statement already exists in the context
-            if self.statement_exists(statement_ast, [context_id]):
+            # Reject variants of stored statements with an indexed lookup; fall back
+            # to unification for subsumption or statements without a variant key
+            key = variant_digest(statement_ast)
+            if key is not None and self._variant_exists(key, context_id):
+                return False
+            if (check_subsumption or key is None) and self.statement_exists(statement_ast, [context_id]):
                 return False
-            
-            # Load statements for this context if not already loaded
-            if context_id not in self._statements_cache:
-                self._load_statements_for_context(context_id)
-            
-            # Add the statement to the in-memory cache
-            if context_id not in self._statements_cache:
-                self._statements_cache[context_id] = set()
-            self._statements_cache[context_id].add(statement_ast)
             
             # Persist the statement to the database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._write() as conn:
+                self._insert_statement(conn, statement_ast, context_id, key)
             
-            cursor.execute(
-                "INSERT INTO statements (context_id, statement_data) VALUES (?, ?)",
-                (context_id, pickle.dumps(statement_ast))
+            return True
+    
+    def _existing_variants(self, keys: List[str], context_id: str) -> Set[str]:
+        """
+        Get the variant keys from a list that are already stored in a context.
+        
+        Args:
+            keys: The variant digests to look up
+            context_id: The context to check
+        
+        Returns:
+            The subset of keys that are stored
+        """
+        existing: Set[str] = set()
+        # Stay well below SQLite's limit on bound parameters per statement
+        chunk_size = 500
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor = self._conn.execute(
+                f"SELECT variant_key FROM statements WHERE context_id = ? AND variant_key IN ({placeholders})",
+                [context_id] + chunk
             )
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+    
+    def add_statements_bulk(self, statements: Iterable[AST_Node], context_id: str,
+                            metadata: Optional[Dict[str, Any]] = None,
+                            check_subsumption: bool = False) -> List[bool]:
+        """
+        Add many statements to the knowledge store.
+        
+        The batch is deduplicated with chunked variant key lookups and written
+        in one database transaction (or in the open transaction, if there is
+        one).
+        
+        Args:
+            statements: The statements to add
+            context_id: The context to add the statements to
+            metadata: Optional metadata applied to every statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
+        
+        Returns:
+            One result per input statement, True if it was added and False if
+            it was rejected as a duplicate
+        """
+        with self._lock:
+            if context_id not in self._contexts_cache:
+                raise ValueError(f"Context {context_id} does not exist")
             
-            conn.commit()
-            conn.close()
+            if metadata:
+                statements = [statement.with_updated_metadata(metadata) for statement in statements]
+            else:
+                statements = list(statements)
+            keys = [variant_digest(statement) for statement in statements]
             
-            return True
+            results: List[bool] = []
+            with self._write() as conn:
+                seen = self._existing_variants([key for key in keys if key is not None], context_id)
+                
+                for statement_ast, key in zip(statements, keys):
+                    if key is not None and key in seen:
+                        results.append(False)
+                        continue
+                    # Rows written earlier in the batch are visible to this
+                    # connection, so unification sees them as well
+                    if (check_subsumption or key is None) and self.statement_exists(statement_ast, [context_id]):
+                        results.append(False)
+                        continue
+                    
+                    if key is not None:
+                        seen.add(key)
+                    self._insert_statement(conn, statement_ast, context_id, key)
+                    results.append(True)
+            
+            return results
     
     def retract_statement(self, statement_pattern_ast: AST_Node, context_id: str) -> bool:
         """
@@ -710,7 +1259,7 @@ class SQLiteKBBackend(PersistentKBBackend):
         Args:
             statement_pattern_ast: The statement pattern to retract
             context_id: The context to retract the statement from
-            
+        
         Returns:
             True if the statement was retracted successfully, False otherwise
         """
@@ -718,43 +1267,24 @@ class SQLiteKBBackend(PersistentKBBackend):
             if context_id not in self._contexts_cache:
                 raise ValueError(f"Context {context_id} does not exist")
             
-            # Load statements for this context if not already loaded
-            if context_id not in self._statements_cache:
-                self._load_statements_for_context(context_id)
-            
-            if context_id not in self._statements_cache:
-                return False
-            
             # Find statements matching the pattern
-            matching_statements = []
-            for statement in self._statements_cache[context_id]:
+            matching_ids = []
+            for row_id, statement in self._candidate_rows(statement_pattern_ast, context_id):
                 bindings, errors = self.unification_engine.unify(statement_pattern_ast, statement)
                 if bindings is not None:
-                    matching_statements.append(statement)
+                    matching_ids.append((row_id,))
             
             # Retract matching statements
-            if not matching_statements:
+            if not matching_ids:
                 return False
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            for statement in matching_statements:
-                # Remove from in-memory cache
-                self._statements_cache[context_id].remove(statement)
-                
-                # Remove from database
-                cursor.execute(
-                    "DELETE FROM statements WHERE context_id = ? AND statement_data = ?",
-                    (context_id, pickle.dumps(statement))
-                )
-            
-            conn.commit()
-            conn.close()
+            with self._write() as conn:
+                conn.executemany("DELETE FROM statement_arguments WHERE statement_id = ?", matching_ids)
+                conn.executemany("DELETE FROM statements WHERE id = ?", matching_ids)
             
             return True
     
-    def query_statements_match_pattern(self, query_pattern_ast: AST_Node, 
+    def query_statements_match_pattern(self, query_pattern_ast: AST_Node,
                                       context_ids: List[str],
                                       variables_to_bind: Optional[List[VariableNode]] = None) -> List[Dict[VariableNode, AST_Node]]:
         """
@@ -764,7 +1294,7 @@ class SQLiteKBBackend(PersistentKBBackend):
             query_pattern_ast: The query pattern
             context_ids: The contexts to query
             variables_to_bind: Optional list of variables to bind
-            
+        
         Returns:
             A list of variable bindings
         """
@@ -775,14 +1305,7 @@ class SQLiteKBBackend(PersistentKBBackend):
                 if context_id not in self._contexts_cache:
                     raise ValueError(f"Context {context_id} does not exist")
                 
-                # Load statements for this context if not already loaded
-                if context_id not in self._statements_cache:
-                    self._load_statements_for_context(context_id)
-                
-                if context_id not in self._statements_cache:
-                    continue
-                
-                for statement in self._statements_cache[context_id]:
+                for _, statement in self._candidate_rows(query_pattern_ast, context_id):
                     bindings, errors = self.unification_engine.unify(query_pattern_ast, statement)
                     if bindings is not None:
                         # Filter bindings to only include the variables to bind
@@ -811,23 +1334,22 @@ class SQLiteKBBackend(PersistentKBBackend):
         Args:
             statement_ast: The statement to check
             context_ids: The contexts to check
-            
+        
         Returns:
             True if the statement exists, False otherwise
         """
         with self._lock:
+            key = variant_digest(statement_ast)
+            
             for context_id in context_ids:
                 if context_id not in self._contexts_cache:
                     raise ValueError(f"Context {context_id} does not exist")
                 
-                # Load statements for this context if not already loaded
-                if context_id not in self._statements_cache:
-                    self._load_statements_for_context(context_id)
+                # A stored variant always unifies with the statement
+                if key is not None and self._variant_exists(key, context_id):
+                    return True
                 
-                if context_id not in self._statements_cache:
-                    continue
-                
-                for statement in self._statements_cache[context_id]:
+                for _, statement in self._candidate_rows(statement_ast, context_id):
                     bindings, errors = self.unification_engine.unify(statement_ast, statement)
                     if bindings is not None:
                         return True
@@ -850,24 +1372,21 @@ class SQLiteKBBackend(PersistentKBBackend):
             if parent_context_id and parent_context_id not in self._contexts_cache:
                 raise ValueError(f"Parent context {parent_context_id} does not exist")
             
-            # Add to in-memory cache
-            self._contexts_cache[context_id] = {
+            context = {
                 "parent": parent_context_id,
                 "type": context_type,
                 "created_at": str(uuid.uuid4())
             }
             
             # Persist to database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "INSERT INTO contexts (context_id, parent_context_id, context_type, created_at) VALUES (?, ?, ?, ?)",
-                (context_id, parent_context_id, context_type, self._contexts_cache[context_id]["created_at"])
-            )
+            with self._write() as conn:
+                conn.execute(
+                    "INSERT INTO contexts (context_id, parent_context_id, context_type, created_at) VALUES (?, ?, ?, ?)",
+                    (context_id, parent_context_id, context_type, context["created_at"])
+                )
             
-            conn.commit()
-            conn.close()
+            # Add to in-memory cache
+            self._contexts_cache[context_id] = context
     
     def delete_context(self, context_id: str) -> None:
         """
@@ -885,20 +1404,14 @@ class SQLiteKBBackend(PersistentKBBackend):
                 if context_info.get("parent") == context_id:
                     raise ValueError(f"Cannot delete context {context_id} because it has child contexts")
             
-            # Delete from in-memory cache
-            del self._contexts_cache[context_id]
-            if context_id in self._statements_cache:
-                del self._statements_cache[context_id]
-            
             # Delete from database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._write() as conn:
+                conn.execute("DELETE FROM statement_arguments WHERE context_id = ?", (context_id,))
+                conn.execute("DELETE FROM statements WHERE context_id = ?", (context_id,))
+                conn.execute("DELETE FROM contexts WHERE context_id = ?", (context_id,))
             
-            cursor.execute("DELETE FROM statements WHERE context_id = ?", (context_id,))
-            cursor.execute("DELETE FROM contexts WHERE context_id = ?", (context_id,))
-            
-            conn.commit()
-            conn.close()
+            # Delete from in-memory cache
+            del self._contexts_cache[context_id]
     
     def list_contexts(self) -> List[str]:
         """
@@ -914,12 +1427,21 @@ class SQLiteKBBackend(PersistentKBBackend):
         """
         Persist the knowledge store to disk.
         
-        In SQLite backend, this is a no-op since changes are persisted immediately.
+        In SQLite backend, changes are persisted when they are committed; this
+        checkpoints the write-ahead log into the main database file.
         
         Returns:
-            True always
+            True if the operation was successful, False otherwise
         """
-        return True
+        with self._lock:
+            if self._in_transaction:
+                return True
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                return True
+            except sqlite3.Error as e:
+                print(f"Error persisting knowledge store: {e}")
+                return False
     
     def load(self) -> bool:
         """
@@ -936,33 +1458,33 @@ class SQLiteKBBackend(PersistentKBBackend):
     def begin_transaction(self) -> None:
         """Begin a transaction."""
         with self._lock:
-            self._conn = sqlite3.connect(self.db_path)
-            self._conn.execute("BEGIN TRANSACTION")
+            if self._in_transaction:
+                raise ValueError("Transaction already in progress")
+            
+            self._conn.execute("BEGIN")
+            self._in_transaction = True
     
     def commit_transaction(self) -> None:
         """Commit the current transaction."""
         with self._lock:
-            if hasattr(self, '_conn'):
-                self._conn.commit()
-                self._conn.close()
-                delattr(self, '_conn')
-            else:
+            if not self._in_transaction:
                 raise ValueError("No transaction in progress")
+            
+            self._conn.execute("COMMIT")
+            self._in_transaction = False
     
     def rollback_transaction(self) -> None:
         """Rollback the current transaction."""
         with self._lock:
-            if hasattr(self, '_conn'):
-                self._conn.rollback()
-                self._conn.close()
-                delattr(self, '_conn')
-                
-                # Clear in-memory caches and reload from database
-                self._statements_cache.clear()
-                self._contexts_cache.clear()
-                self._load_contexts()
-            else:
+            if not self._in_transaction:
                 raise ValueError("No transaction in progress")
+            
+            self._conn.execute("ROLLBACK")
+            self._in_transaction = False
+            
+            # Reload contexts created or deleted during the transaction
+            self._contexts_cache.clear()
+            self._load_contexts()
 
 
 class KBRouter:
@@ -1026,7 +1548,8 @@ class KBRouter:
                 return self.backends[backend_id]
             return self.default_backend
     
-    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+    def add_statement(self, statement_ast: AST_Node, context_id: str, metadata: Optional[Dict[str, Any]] = None,
+                      check_subsumption: bool = False) -> bool:
         """
         Add a statement to the knowledge store.
         
@@ -1034,13 +1557,38 @@ class KBRouter:
             statement_ast: The statement to add
             context_id: The context to add the statement to
             metadata: Optional metadata for the statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
             
         Returns:
             True if the statement was added successfully, False otherwise
         """
         backend = self.get_backend_for_context(context_id)
+        if check_subsumption:
+            return backend.add_statement(statement_ast, context_id, metadata, check_subsumption=True)
         return backend.add_statement(statement_ast, context_id, metadata)
     
+    def add_statements_bulk(self, statements: Iterable[AST_Node], context_id: str,
+                            metadata: Optional[Dict[str, Any]] = None,
+                            check_subsumption: bool = False) -> List[bool]:
+        """
+        Add many statements to the knowledge store.
+        
+        Args:
+            statements: The statements to add
+            context_id: The context to add the statements to
+            metadata: Optional metadata applied to every statement
+            check_subsumption: Whether to also reject statements that unify
+                with an existing statement in the context
+            
+        Returns:
+            One result per input statement, True if it was added and False if
+            it was rejected as a duplicate
+        """
+        backend = self.get_backend_for_context(context_id)
+        return backend.add_statements_bulk(statements, context_id, metadata,
+                                           check_subsumption=check_subsumption)
+    
     def retract_statement(self, statement_pattern_ast: AST_Node, context_id: str) -> bool:
         """
         Retract a statement from the knowledge store.
@@ -0,0 +1,166 @@
+"""
+Write-Ahead Log (Module 6.1).
+
+This module implements the WriteAheadLog class, the crash-safe append-only
+log shared by the stores that keep a snapshot on disk and log the changes
+made since it was written.
+
+A store's logs live in one directory as ``<prefix>.<generation>.log``. Each
+snapshot starts a new generation, so the log of the current generation holds
+exactly the changes not yet covered by the snapshot. Records are pickled,
+length-prefixed and checksummed, so a record torn by a crash is detected and
+discarded when the log is replayed.
+"""
+
+import logging
+import os
+import pickle
+import struct
+import zlib
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WriteAheadLog:
+    """
+    Generation-numbered, append-only log of pickled records.
+    """
+
+    # Record header: payload length and CRC32 of the payload
+    _RECORD_HEADER = struct.Struct(">II")
+
+    def __init__(self, directory: str, prefix: str, generation: int = 0):
+        """
+        Initialize the log.
+
+        Args:
+            directory: The directory holding the log files
+            prefix: The file name prefix of the logs
+            generation: The current generation
+        """
+        self.directory = str(directory)
+        self.prefix = prefix
+        self.generation = generation
+        self._file = None
+
+    def path(self, generation: Optional[int] = None) -> str:
+        """
+        Get the path of the log of a generation.
+
+        Args:
+            generation: The generation, or None for the current one
+
+        Returns:
+            The path of the log file
+        """
+        if generation is None:
+            generation = self.generation
+        return os.path.join(self.directory, f"{self.prefix}.{generation}.log")
+
+    def exists(self) -> bool:
+        """Check whether the log of the current generation exists."""
+        return os.path.exists(self.path())
+
+    def size_bytes(self) -> int:
+        """Get the size of the log of the current generation."""
+        try:
+            return os.path.getsize(self.path())
+        except FileNotFoundError:
+            return 0
+
+    def append(self, record: Any, sync: bool = False) -> None:
+        """
+        Append a record to the log of the current generation.
+
+        Args:
+            record: The picklable record
+            sync: Whether to fsync the log after writing the record
+        """
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.path(), "ab")
+
+        self._file.write(self._RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def replay(self) -> Iterator[Any]:
+        """
+        Read the records of the log of the current generation.
+
+        A torn record at the end of the log, left by a crash during a write,
+        ends the replay and is truncated away once the records have been
+        consumed, so that new records follow valid ones.
+
+        Yields:
+            The records, in the order they were appended
+        """
+        self.close()
+        log_path = self.path()
+        if not os.path.exists(log_path):
+            return
+
+        with open(log_path, "rb") as f:
+            data = f.read()
+
+        header_size = self._RECORD_HEADER.size
+        offset = 0
+        while offset + header_size <= len(data):
+            length, checksum = self._RECORD_HEADER.unpack_from(data, offset)
+            payload = data[offset + header_size:offset + header_size + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+            yield pickle.loads(payload)
+            offset += header_size + length
+
+        if offset < len(data):
+            logger.warning(f"Discarding torn record at offset {offset} of {log_path}")
+            with open(log_path, "r+b") as f:
+                f.truncate(offset)
+
+    def advance(self, generation: int) -> None:
+        """
+        Start a new generation after a snapshot, removing the log it covers.
+
+        Args:
+            generation: The generation of the new snapshot
+        """
+        self.close()
+        old_log = self.path()
+        self.generation = generation
+        try:
+            os.remove(old_log)
+        except FileNotFoundError:
+            pass
+
+    def remove_stale(self) -> None:
+        """Remove logs of older generations, which the snapshot already covers."""
+        self._remove_logs(lambda generation: generation < self.generation)
+
+    def remove_all(self) -> None:
+        """Remove the logs of all generations."""
+        self.close()
+        self._remove_logs(lambda generation: True)
+
+    def close(self) -> None:
+        """Close the log file if it is open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _remove_logs(self, matches: Callable[[int], bool]) -> None:
+        """Remove the logs whose generation matches a predicate."""
+        if not os.path.isdir(self.directory):
+            return
+        prefix = f"{self.prefix}."
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith(".log"):
+                try:
+                    generation = int(name[len(prefix):-len(".log")])
+                except ValueError:
+                    continue
+                if matches(generation):
+                    os.remove(os.path.join(self.directory, name))
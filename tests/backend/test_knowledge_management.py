@@ -534,6 +534,192 @@ class TestKnowledgeManagementService:
         assert "search_test" in result_ids
 
 
+
+class TestPersistentSearchIndex:
+    """Test the persistent BM25 search index."""
+    
+    def setup_method(self):
+        """Set up a storage directory for each test."""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def teardown_method(self):
+        """Clean up after each test."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _item(self, item_id, content, title=None, knowledge_type="fact", confidence=0.5):
+        return KnowledgeItem(
+            id=item_id,
+            title=title,
+            content=content,
+            knowledge_type=knowledge_type,
+            source=ImportSource(source_type="text", source_identifier="test"),
+            import_id="test_import",
+            categories=["technology"],
+            quality_score=0.5,
+            confidence=confidence
+        )
+    
+    def _store(self, service, item):
+        (Path(self.temp_dir) / f"{item.id}.json").write_text(item.model_dump_json())
+        service.add_item(item)
+    
+    def test_bm25_ranking(self):
+        """Rare terms and repeated terms rank higher, title terms count extra."""
+        engine = KnowledgeSearchEngine()
+        engine.add_knowledge_item(self._item("a", "neural networks learn representations of data"))
+        engine.add_knowledge_item(self._item("b", "neural neural neural networks"))
+        engine.add_knowledge_item(self._item("c", "graph databases store data", title="Neural Graphs"))
+        
+        ranked = engine.search_index.top_k({"neural": 1.0}, 3)
+        assert [item_id for item_id, _ in ranked][0] == "b"
+        assert {item_id for item_id, _ in ranked} == {"a", "b", "c"}
+        
+        ranked = engine.search_index.top_k({"data": 1.0, "graph": 1.0}, 1)
+        assert ranked[0][0] == "c"
+    
+    def test_top_k_matches_exhaustive_ranking(self):
+        """Early termination returns the same top documents as full ranking."""
+        import random
+        rng = random.Random(7)
+        words = [f"term{i}" for i in range(200)]
+        engine = KnowledgeSearchEngine()
+        for i in range(500):
+            vocabulary = words[:rng.randint(5, 200)]
+            content = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(3, 40)))
+            engine.add_knowledge_item(self._item(f"doc{i}", content, confidence=rng.random()))
+        
+        for _ in range(25):
+            weights = {rng.choice(words): rng.choice([0.5, 1.0, 2.0]) for _ in range(rng.randint(1, 4))}
+            exhaustive = engine.search_index.top_k(weights, engine.search_index.num_documents)
+            assert engine.search_index.top_k(weights, 10) == exhaustive[:10]
+    
+    @pytest.mark.asyncio
+    async def test_search_scores_are_normalized(self):
+        """Search results carry scores in [0, 1] with the best match at 1."""
+        engine = KnowledgeSearchEngine()
+        engine.add_knowledge_item(self._item("a", "quantum computing uses qubits"))
+        engine.add_knowledge_item(self._item("b", "classical computing uses bits"))
+        
+        response = await engine.search(SearchQuery(query_text="quantum computing", search_type="full_text"))
+        
+        assert response.total_matches == 2
+        assert response.results[0].knowledge_item.id == "a"
+        assert response.results[0].relevance_score == 1.0
+        assert 0.0 < response.results[1].relevance_score < 1.0
+    
+    @pytest.mark.asyncio
+    async def test_recent_and_accessed_items_rank_higher(self):
+        """Recently extracted and frequently accessed items get a ranking boost."""
+        service = KnowledgeManagementService(storage_path=self.temp_dir)
+        await service.initialize()
+        old = self._item("old", "solar energy storage")
+        old.extracted_at = time.time() - 60 * 24 * 3600
+        self._store(service, old)
+        self._store(service, self._item("new", "solar energy storage"))
+        
+        query = SearchQuery(query_text="solar", search_type="full_text")
+        response = await service.search_knowledge(query)
+        assert [result.knowledge_item.id for result in response.results] == ["new", "old"]
+        
+        for _ in range(50):
+            await service.get_knowledge_item("old")
+        service.search_engine.search_index.close()
+        
+        # The access count survives a restart without parsing the items
+        restarted = KnowledgeManagementService(storage_path=self.temp_dir)
+        await restarted.initialize()
+        response = await restarted.search_knowledge(query)
+        assert [result.knowledge_item.id for result in response.results] == ["old", "new"]
+    
+    @pytest.mark.asyncio
+    async def test_index_persists_across_restarts(self):
+        """A restarted service searches the persisted index without parsing items."""
+        service = KnowledgeManagementService(storage_path=self.temp_dir)
+        await service.initialize()
+        self._store(service, self._item("a", "machine learning algorithms"))
+        self._store(service, self._item("b", "python programming language"))
+        service.search_engine.search_index.close()
+        
+        restarted = KnowledgeManagementService(storage_path=self.temp_dir)
+        await restarted.initialize()
+        
+        store = restarted.search_engine.knowledge_store
+        assert len(store) == 2
+        assert not store._items  # Nothing parsed yet
+        assert "b" in restarted.search_engine.search_index["python"]
+        
+        response = await restarted.search_knowledge(SearchQuery(query_text="machine", search_type="full_text"))
+        assert [result.knowledge_item.id for result in response.results] == ["a"]
+        assert set(store._items) == {"a"}
+    
+    @pytest.mark.asyncio
+    async def test_incremental_updates_survive_restart(self):
+        """Additions and removals are logged and replayed after a restart."""
+        service = KnowledgeManagementService(storage_path=self.temp_dir)
+        await service.initialize()
+        self._store(service, self._item("a", "machine learning algorithms"))
+        await service.shutdown()
+        
+        service = KnowledgeManagementService(storage_path=self.temp_dir)
+        await service.initialize()
+        self._store(service, self._item("b", "deep learning networks"))
+        await service.delete_knowledge_item("a")
+        service.search_engine.search_index.close()
+        
+        restarted = KnowledgeManagementService(storage_path=self.temp_dir)
+        await restarted.initialize()
+        index = restarted.search_engine.search_index
+        assert set(index.documents) == {"b"}
+        assert "machine" not in index
+        assert index["learning"] == {"b"}
+    
+    @pytest.mark.asyncio
+    async def test_reconciles_with_stored_items(self):
+        """Items written without the index are indexed at startup."""
+        item = self._item("orphan", "items written while the service was down")
+        (Path(self.temp_dir) / "orphan.json").write_text(item.model_dump_json())
+        
+        service = KnowledgeManagementService(storage_path=self.temp_dir)
+        await service.initialize()
+        
+        assert "orphan" in service.search_engine.search_index["service"]
+        assert (Path(self.temp_dir) / "search_index.snapshot").exists()
+    
+    @pytest.mark.asyncio
+    async def test_corrupt_item_file_is_skipped(self):
+        """An indexed item whose file no longer parses is left out of statistics."""
+        service = KnowledgeManagementService(storage_path=self.temp_dir)
+        await service.initialize()
+        self._store(service, self._item("a", "machine learning algorithms"))
+        self._store(service, self._item("b", "python programming language"))
+        service.search_engine.search_index.close()
+        (Path(self.temp_dir) / "b.json").write_text("{not json")
+        
+        restarted = KnowledgeManagementService(storage_path=self.temp_dir)
+        await restarted.initialize()
+        statistics = await restarted.get_knowledge_statistics()
+        
+        assert statistics.total_items == 1
+        assert "b" not in restarted.search_engine.knowledge_store
+    
+    def test_torn_log_record_is_ignored(self):
+        """A partially written log record is dropped on load."""
+        from backend.search_index import InvertedIndex
+        
+        index = InvertedIndex(Path(self.temp_dir))
+        index.persist()
+        index.add("a", {"alpha": 1})
+        index.add("b", {"beta": 2})
+        index.close()
+        log_path = Path(self.temp_dir) / "search_index.1.log"
+        log_path.write_bytes(log_path.read_bytes()[:-3])
+        
+        reloaded = InvertedIndex(Path(self.temp_dir))
+        assert reloaded.load()
+        assert set(reloaded.documents) == {"a"}
+        assert reloaded.postings("alpha") == {"a": 1}
+
 class TestKnowledgeIngestion:
     """Test knowledge ingestion and import functionality."""
     
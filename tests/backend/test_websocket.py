@@ -23,7 +23,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from backend.main import app
-from backend.websocket_manager import WebSocketManager
+from backend.websocket_manager import WebSocketManager, SlowConsumerPolicy
 
 
 class TestWebSocketConnection:
@@ -139,14 +139,19 @@ class TestWebSocketManager:
         mock_ws1 = MagicMock()
         mock_ws1.accept = AsyncMock()
         mock_ws1.send_json = AsyncMock()
+        mock_ws1.send_text = AsyncMock()
         
         mock_ws2 = MagicMock()
         mock_ws2.accept = AsyncMock()
         mock_ws2.send_json = AsyncMock()
+        mock_ws2.send_text = AsyncMock()
         
-        # Connect both
+        # Connect both and deliver their connection messages
         await self.ws_manager.connect(mock_ws1)
         await self.ws_manager.connect(mock_ws2)
+        await self.ws_manager.drain(timeout=1)
+        mock_ws1.send_text.reset_mock()
+        mock_ws2.send_text.reset_mock()
         
         # Broadcast event
         test_event = {
@@ -156,10 +161,13 @@ class TestWebSocketManager:
         }
         
         await self.ws_manager.broadcast(test_event)
+        await self.ws_manager.drain(timeout=1)
         
-        # Verify both connections received the event
-        mock_ws1.send_json.assert_called_with(test_event)
-        mock_ws2.send_json.assert_called_with(test_event)
+        # Verify both connections received the event, serialized once
+        mock_ws1.send_text.assert_called_once()
+        payload = mock_ws1.send_text.call_args[0][0]
+        assert json.loads(payload) == test_event
+        mock_ws2.send_text.assert_called_once_with(payload)
         
         # Verify event was added to queue
         assert len(self.ws_manager.event_queue) == 1
@@ -172,6 +180,7 @@ class TestWebSocketManager:
         mock_websocket = MagicMock()
         mock_websocket.accept = AsyncMock()
         mock_websocket.send_json = AsyncMock()
+        mock_websocket.send_text = AsyncMock()
         
         await self.ws_manager.connect(mock_websocket)
         
@@ -193,9 +202,10 @@ class TestWebSocketManager:
             "data": {}
         }
         await self.ws_manager.broadcast(unsubscribed_event)
+        await self.ws_manager.drain(timeout=1)
         
         # Should only receive the subscribed event
-        call_args = [call[0][0] for call in mock_websocket.send_json.call_args_list]
+        call_args = [json.loads(call[0][0]) for call in mock_websocket.send_text.call_args_list]
         event_types = [event["type"] for event in call_args if event.get("type") != "connection_established"]
         
         assert "query_processed" in event_types
@@ -207,13 +217,14 @@ class TestWebSocketManager:
         # Mock WebSocket that will fail
         mock_websocket = MagicMock()
         mock_websocket.accept = AsyncMock()
-        mock_websocket.send_json = AsyncMock(side_effect=WebSocketDisconnect())
+        mock_websocket.send_text = AsyncMock(side_effect=WebSocketDisconnect())
         
         await self.ws_manager.connect(mock_websocket)
         
         # Broadcast should trigger cleanup for failed connection
         test_event = {"type": "test", "timestamp": time.time()}
         await self.ws_manager.broadcast(test_event)
+        await self.ws_manager.drain(timeout=1)
         
         # Connection should be cleaned up
         assert mock_websocket not in self.ws_manager.active_connections
@@ -239,6 +250,7 @@ class TestWebSocketManager:
         mock_websocket = MagicMock()
         mock_websocket.accept = AsyncMock()
         mock_websocket.send_json = AsyncMock()
+        mock_websocket.send_text = AsyncMock()
         
         await self.ws_manager.connect(mock_websocket)
         
@@ -255,7 +267,10 @@ class TestWebSocketManager:
         await self.ws_manager.broadcast_inference_progress("test query", {"progress": 0.5})
         
         # Verify all broadcasts were sent
-        assert mock_websocket.send_json.call_count == 5  # 1 connection + 4 broadcasts
+        await self.ws_manager.drain(timeout=1)
+        # The connection message and the broadcasts all go through the queue
+        mock_websocket.send_json.assert_not_called()
+        assert mock_websocket.send_text.call_count == 5
     
     def test_websocket_manager_connection_stats(self):
         """Test connection statistics generation."""
@@ -277,11 +292,13 @@ class TestWebSocketManager:
         mock_ws_healthy = MagicMock()
         mock_ws_healthy.accept = AsyncMock()
         mock_ws_healthy.send_json = AsyncMock()
+        mock_ws_healthy.send_text = AsyncMock()
         
-        # Mock failed connection
+        # Mock connection that fails after connecting
         mock_ws_failed = MagicMock()
         mock_ws_failed.accept = AsyncMock()
-        mock_ws_failed.send_json = AsyncMock(side_effect=Exception("Connection failed"))
+        mock_ws_failed.send_json = AsyncMock()
+        mock_ws_failed.send_text = AsyncMock(side_effect=Exception("Connection failed"))
         
         await self.ws_manager.connect(mock_ws_healthy)
         await self.ws_manager.connect(mock_ws_failed)
@@ -290,6 +307,7 @@ class TestWebSocketManager:
         
         # Ping connections
         await self.ws_manager.ping_connections()
+        await self.ws_manager.drain(timeout=1)
         
         # Failed connection should be removed
         assert len(self.ws_manager.active_connections) == 1
@@ -297,6 +315,171 @@ class TestWebSocketManager:
         assert mock_ws_failed not in self.ws_manager.active_connections
 
 
+class TestSlowConsumers:
+    """Test per-connection send queues and slow-consumer policies."""
+    
+    def make_websocket(self, gate=None):
+        """Create a mock WebSocket whose sends wait on an optional gate."""
+        mock_ws = MagicMock()
+        mock_ws.accept = AsyncMock()
+        mock_ws.send_json = AsyncMock()
+        mock_ws.close = AsyncMock()
+        mock_ws.sent = []
+        
+        async def send_text(payload):
+            if gate is not None:
+                await gate.wait()
+            mock_ws.sent.append(json.loads(payload))
+        
+        mock_ws.send_text = AsyncMock(side_effect=send_text)
+        return mock_ws
+    
+    async def connect(self, manager, mock_ws, gate=None):
+        """Connect a mock WebSocket and deliver its connection message."""
+        if gate is not None:
+            gate.set()
+        await manager.connect(mock_ws)
+        await manager.drain(timeout=1)
+        if gate is not None:
+            gate.clear()
+        assert mock_ws.sent[0]["type"] == "connection_established"
+        mock_ws.sent.clear()
+    
+    async def broadcast_all(self, manager, events):
+        """Broadcast events, letting writers pick up the first one."""
+        for event in events:
+            await manager.broadcast(event)
+            await asyncio.sleep(0)
+    
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        """Test that a stalled client does not delay delivery to other clients."""
+        manager = WebSocketManager()
+        gate = asyncio.Event()
+        slow_ws = self.make_websocket(gate)
+        fast_ws = self.make_websocket()
+        await self.connect(manager, slow_ws, gate)
+        await self.connect(manager, fast_ws)
+        
+        events = [{"type": "update", "data": {"index": i}} for i in range(3)]
+        await asyncio.wait_for(self.broadcast_all(manager, events), timeout=1)
+        await asyncio.wait_for(manager.send_queues[fast_ws].join(), timeout=1)
+        
+        assert fast_ws.sent == events
+        assert slow_ws.sent == []
+        
+        gate.set()
+        await manager.drain(timeout=1)
+        assert slow_ws.sent == events
+    
+    @pytest.mark.asyncio
+    async def test_event_serialized_once_per_broadcast(self):
+        """Test that a broadcast encodes the event once for all clients."""
+        manager = WebSocketManager()
+        for _ in range(5):
+            await self.connect(manager, self.make_websocket())
+        sent_before = manager.get_connection_stats()["total_events_sent"]
+        
+        with patch.object(WebSocketManager, "_serialize", wraps=WebSocketManager._serialize) as serialize:
+            await manager.broadcast({"type": "update", "data": {}})
+        await manager.drain(timeout=1)
+        
+        assert serialize.call_count == 1
+        assert manager.get_connection_stats()["total_events_sent"] - sent_before == 5
+    
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self):
+        """Test that a full queue discards its oldest message."""
+        manager = WebSocketManager(max_client_queue_size=2, slow_consumer_policy="drop_oldest")
+        gate = asyncio.Event()
+        mock_ws = self.make_websocket(gate)
+        await self.connect(manager, mock_ws, gate)
+        
+        events = [{"type": "update", "data": {"index": i}} for i in range(4)]
+        await self.broadcast_all(manager, events)
+        gate.set()
+        await manager.drain(timeout=1)
+        
+        # The first event was already being sent; the second was dropped
+        assert mock_ws.sent == [events[0], events[2], events[3]]
+        assert manager.get_connection_stats()["dropped_messages"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_coalesce_policy(self):
+        """Test that a full queue replaces the newest message of the same type."""
+        manager = WebSocketManager(max_client_queue_size=2, slow_consumer_policy=SlowConsumerPolicy.COALESCE)
+        gate = asyncio.Event()
+        mock_ws = self.make_websocket(gate)
+        await self.connect(manager, mock_ws, gate)
+        
+        events = [
+            {"type": "state", "data": {"version": 0}},
+            {"type": "state", "data": {"version": 1}},
+            {"type": "log", "data": {"line": "a"}},
+            {"type": "state", "data": {"version": 2}},
+        ]
+        await self.broadcast_all(manager, events)
+        gate.set()
+        await manager.drain(timeout=1)
+        
+        assert mock_ws.sent == [events[0], events[2], events[3]]
+        assert manager.get_connection_stats()["coalesced_messages"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_policy(self):
+        """Test that a full queue disconnects the slow client only."""
+        manager = WebSocketManager(max_client_queue_size=1, slow_consumer_policy="disconnect")
+        gate = asyncio.Event()
+        slow_ws = self.make_websocket(gate)
+        fast_ws = self.make_websocket()
+        await self.connect(manager, slow_ws, gate)
+        await self.connect(manager, fast_ws)
+        
+        events = [{"type": "update", "data": {"index": i}} for i in range(3)]
+        await self.broadcast_all(manager, events)
+        await manager.drain(timeout=1)
+        await asyncio.sleep(0)
+        
+        assert slow_ws not in manager.active_connections
+        assert fast_ws in manager.active_connections
+        assert fast_ws.sent == events
+        slow_ws.close.assert_awaited()
+        assert manager.get_connection_stats()["slow_consumer_disconnects"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_cognitive_messages_use_send_queue(self):
+        """Test that direct and cognitive messages are queued behind earlier broadcasts."""
+        manager = WebSocketManager()
+        gate = asyncio.Event()
+        slow_ws = self.make_websocket(gate)
+        fast_ws = self.make_websocket()
+        gate.set()
+        slow_id = await manager.connect_cognitive_stream(slow_ws)
+        fast_id = await manager.connect_cognitive_stream(fast_ws)
+        await manager.drain(timeout=1)
+        gate.clear()
+        slow_ws.sent.clear()
+        fast_ws.sent.clear()
+        
+        event = {"type": "update", "data": {}}
+        await self.broadcast_all(manager, [event])
+        await manager.broadcast_cognitive_event("reasoning", {"step": 1}, client_id=fast_id)
+        
+        # A stalled client does not hold up the pings of the others
+        await asyncio.wait_for(manager.ping_cognitive_connections(), timeout=1)
+        await asyncio.wait_for(manager.send_queues[fast_ws].join(), timeout=1)
+        
+        assert [message["type"] for message in fast_ws.sent] == ["update", "cognitive_event", "ping"]
+        assert slow_ws.sent == []
+        
+        gate.set()
+        await manager.drain(timeout=1)
+        assert [message["type"] for message in slow_ws.sent] == ["update", "ping"]
+        slow_ws.send_json.assert_not_called()
+        fast_ws.send_json.assert_not_called()
+        assert manager.cognitive_metadata[fast_id]["events_sent"] == 4
+
+
 class TestCognitiveStreaming:
     """Test continuous cognitive state streaming."""
     
@@ -391,6 +574,7 @@ class TestWebSocketConcurrency:
             mock_ws = MagicMock()
             mock_ws.accept = AsyncMock()
             mock_ws.send_json = AsyncMock()
+            mock_ws.send_text = AsyncMock()
             connections.append(mock_ws)
         
         # Connect all simultaneously
@@ -402,10 +586,11 @@ class TestWebSocketConcurrency:
         # Broadcast to all simultaneously
         test_event = {"type": "concurrent_test", "timestamp": time.time()}
         await self.ws_manager.broadcast(test_event)
+        await self.ws_manager.drain(timeout=1)
         
         # Verify all connections received the event
         for ws in connections:
-            ws.send_json.assert_called_with(test_event)
+            assert json.loads(ws.send_text.call_args[0][0]) == test_event
     
     @pytest.mark.asyncio
     async def test_concurrent_broadcasting(self):
@@ -414,6 +599,7 @@ class TestWebSocketConcurrency:
         mock_ws = MagicMock()
         mock_ws.accept = AsyncMock()
         mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         await self.ws_manager.connect(mock_ws)
         
         # Broadcast multiple events concurrently
@@ -424,9 +610,12 @@ class TestWebSocketConcurrency:
         
         broadcast_tasks = [self.ws_manager.broadcast(event) for event in events]
         await asyncio.gather(*broadcast_tasks)
+        await self.ws_manager.drain(timeout=1)
         
-        # All events should be sent
-        assert mock_ws.send_json.call_count == len(events) + 1  # +1 for connection message
+        # All events should be sent, in order, after the connection message
+        sent = [json.loads(call[0][0]) for call in mock_ws.send_text.call_args_list]
+        assert sent[0]["type"] == "connection_established"
+        assert sent[1:] == events
         
         # All events should be in queue
         assert len(self.ws_manager.event_queue) == len(events)
@@ -443,12 +632,14 @@ class TestWebSocketConcurrency:
             healthy_ws = MagicMock()
             healthy_ws.accept = AsyncMock()
             healthy_ws.send_json = AsyncMock()
+            healthy_ws.send_text = AsyncMock()
             healthy_connections.append(healthy_ws)
             
-            # Failing connection
+            # Connection that fails after connecting
             failing_ws = MagicMock()
             failing_ws.accept = AsyncMock()
-            failing_ws.send_json = AsyncMock(side_effect=Exception("Connection failed"))
+            failing_ws.send_json = AsyncMock()
+            failing_ws.send_text = AsyncMock(side_effect=Exception("Connection failed"))
             failing_connections.append(failing_ws)
         
         # Connect all
@@ -462,6 +653,7 @@ class TestWebSocketConcurrency:
         for i in range(50):
             event = {"type": "load_test", "timestamp": time.time(), "data": {"index": i}}
             await self.ws_manager.broadcast(event)
+        await self.ws_manager.drain(timeout=1)
         
         # Only healthy connections should remain
         assert len(self.ws_manager.active_connections) == 5
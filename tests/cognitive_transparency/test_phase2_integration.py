@@ -122,6 +122,45 @@ class TestDynamicKnowledgeGraph:
         assert "metadata" in export_data
         assert len(export_data["nodes"]) >= 1
 
+    def test_indexed_lookups_and_contradictions(self, knowledge_graph):
+        """Test concept and edge indexes and per-pair contradiction detection."""
+        knowledge_graph.add_edge("Smoking", "Cancer", "causes", confidence=0.9)
+        knowledge_graph.add_edge("smoking", "CANCER", "causes", confidence=0.95)
+        assert len(knowledge_graph.nodes) == 2
+        assert len(knowledge_graph.edges) == 1
+
+        smoking = knowledge_graph._find_node_by_concept("SMOKING")
+        cancer = knowledge_graph._find_node_by_concept("cancer")
+        causes = knowledge_graph._find_edge(smoking, cancer, "causes")
+        assert knowledge_graph.edges[causes].confidence == 0.95
+
+        knowledge_graph.add_edge("smoking", "cancer", "prevents", confidence=0.1)
+        prevents = knowledge_graph._find_edge(smoking, cancer, "prevents")
+        assert (prevents, causes) in knowledge_graph._contradiction_pairs
+
+        # Resolving removes one of the two edges from the graph and the index
+        assert len(knowledge_graph.resolve_contradictions()) == 1
+        assert len(knowledge_graph.edges) == 1
+        indexed = [knowledge_graph._find_edge(smoking, cancer, relation) for relation in ("causes", "prevents")]
+        assert [edge_id for edge_id in indexed if edge_id] == list(knowledge_graph.edges)
+
+    def test_apply_updates_emits_one_event(self):
+        """Test that a batch of updates emits a single coalesced event."""
+        events = []
+        knowledge_graph = DynamicKnowledgeGraph(event_callback=events.append)
+
+        results = knowledge_graph.apply_updates([
+            {"type": "concept", "concept": "neuron"},
+            {"type": "relationship", "source": "neuron", "target": "synapse", "relation": "has_part"},
+            {"type": "relationship", "source": "neuron", "target": "axon", "relation": "has_part"},
+        ], default_confidence=0.7)
+
+        assert [result.operation for result in results] == ["node_added", "edge_added", "edge_added"]
+        assert len(events) == 1
+        assert events[0].operation == "batch_update"
+        assert len(events[0].affected_nodes) == 3
+        assert len(events[0].affected_edges) == 2
+
 
 class TestProvenanceTracker:
     """Test suite for Provenance Tracking functionality."""
@@ -255,6 +294,48 @@ class TestProvenanceTracker:
         assert snapshot.knowledge_state == knowledge_state
         assert snapshot.metadata["test"] is True
 
+    def test_forward_trace_uses_source_index(self, provenance_tracker):
+        """Test forward tracing through the reverse-dependency index."""
+        provenance_tracker.create_record("create", "premise", "fact")
+        provenance_tracker.create_record("infer", "lemma", "fact", input_sources=["premise"])
+        provenance_tracker.create_record("infer", "theorem", "fact", input_sources=["lemma"])
+        provenance_tracker.create_record("create", "unrelated", "fact")
+
+        assert len(provenance_tracker.source_index["premise"]) == 1
+
+        result = provenance_tracker.query_provenance(
+            target_id="premise",
+            query_type=ProvenanceQueryType.FORWARD_TRACE
+        )
+
+        assert [node["id"] for node in result["nodes"]] == ["premise", "lemma", "theorem"]
+        assert [(edge["source"], edge["target"]) for edge in result["edges"]] == [
+            ("premise", "lemma"), ("lemma", "theorem")
+        ]
+
+    def test_delta_snapshots_and_rollback(self, provenance_tracker):
+        """Test that snapshots store only changes and rollbacks find later records."""
+        state = {f"fact_{i}": i for i in range(10)}
+        first_id = provenance_tracker.create_snapshot(dict(state))
+
+        state["fact_0"] = 100
+        del state["fact_1"]
+        second_id = provenance_tracker.create_snapshot(dict(state))
+
+        second = provenance_tracker.snapshots[second_id]
+        assert second.base is provenance_tracker.snapshots[first_id]
+        assert second.changes == {"fact_0": 100}
+        assert second.removed_keys == {"fact_1"}
+        assert second.knowledge_state == state
+
+        time.sleep(0.01)
+        record = provenance_tracker.create_record("update", "fact_2", "fact")
+
+        rollback = provenance_tracker.rollback_to_snapshot(second_id)
+        assert rollback["undo_count"] == 1
+        assert rollback["records_to_undo"][0]["record_id"] == record.record_id
+        assert rollback["knowledge_state"] == state
+
 
 class TestAutonomousLearning:
     """Test suite for Autonomous Learning functionality."""
@@ -7,6 +7,10 @@ from unittest.mock import Mock, patch, MagicMock, PropertyMock
 import json
 import os
 import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
 
 from godelOS.common_sense.external_kb_interface import ExternalCommonSenseKB_Interface
 
@@ -57,6 +61,8 @@ class TestExternalCommonSenseKB_Interface(unittest.TestCase):
         if hasattr(self, 'original_get_fallback'):
             self.interface.get_fallback_knowledge = self.original_get_fallback
         
+        self.interface.close()
+        
         # Clean up temporary directory
         self.temp_dir.cleanup()
     
@@ -109,7 +115,7 @@ class TestExternalCommonSenseKB_Interface(unittest.TestCase):
         fallback = self.interface.get_fallback_knowledge("test_concept")
         self.assertEqual(fallback["source"], ["fallback"])
     
-    @patch('godelOS.common_sense.external_kb_interface.requests.get')
+    @patch('godelOS.common_sense.external_kb_interface.requests.Session.get')
     def test_query_concept_with_conceptnet(self, mock_get):
         """Test querying a concept with ConceptNet enabled."""
         # Enable ConceptNet for this test
@@ -252,15 +258,24 @@ class TestExternalCommonSenseKB_Interface(unittest.TestCase):
         # Save to cache
         self.interface._save_to_cache("test_key", test_data)
         
-        # Check that the file was created
-        cache_file = os.path.join(self.cache_dir, "test_key.json")
-        self.assertTrue(os.path.exists(cache_file))
-        
         # Get from cache
         cached_data = self.interface._get_from_cache("test_key")
         
         # Check the cached data
         self.assertEqual(cached_data, test_data)
+        
+        # Check that the data survives a restart
+        restarted = ExternalCommonSenseKB_Interface(
+            knowledge_store=self.knowledge_store,
+            cache_dir=self.cache_dir,
+            wordnet_enabled=False,
+            conceptnet_enabled=False,
+            offline_mode=True
+        )
+        try:
+            self.assertEqual(restarted._get_from_cache("test_key"), test_data)
+        finally:
+            restarted.close()
     
     def test_caching_system(self):
         """Test caching using the cache system."""
@@ -387,5 +402,168 @@ class TestExternalCommonSenseKB_Interface(unittest.TestCase):
         self.assertFalse(os.path.exists(cache_file))
 
 
+
+class _StubConceptNetHandler(BaseHTTPRequestHandler):
+    """Serves ConceptNet-like responses and records the requested concepts."""
+    
+    def do_GET(self):
+        concept = unquote(urlparse(self.path).path.rsplit('/', 1)[-1])
+        with self.server.lock:
+            self.server.requests.append(concept)
+        
+        body = json.dumps({
+            "edges": [
+                {
+                    "start": {"label": concept},
+                    "rel": {"label": "IsA"},
+                    "end": {"label": "thing"},
+                    "weight": 0.5
+                }
+            ]
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPersistentCaching(unittest.TestCase):
+    """Test cases for persistent caching, bulk fetching and offline dumps."""
+    
+    def setUp(self):
+        """Set up a stub ConceptNet server and a temporary cache directory."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubConceptNetHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.api_url = f"http://127.0.0.1:{self.server.server_address[1]}/c/en/"
+        
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.temp_dir.name
+        self.interfaces = []
+    
+    def tearDown(self):
+        """Stop the server and clean up the cache directory."""
+        for interface in self.interfaces:
+            interface.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+    
+    def _create_interface(self, **kwargs):
+        """Create an interface querying the stub server."""
+        kwargs.setdefault("cache_dir", self.cache_dir)
+        interface = ExternalCommonSenseKB_Interface(
+            knowledge_store=Mock(),
+            conceptnet_api_url=self.api_url,
+            wordnet_enabled=False,
+            **kwargs
+        )
+        self.interfaces.append(interface)
+        return interface
+    
+    def _write_file(self, name, content):
+        """Write a file to the cache directory and return its path."""
+        path = os.path.join(self.cache_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+    
+    def test_bulk_import_fetches_each_concept_once(self):
+        """Test that bulk imports fetch uncached concepts concurrently and only once."""
+        interface = self._create_interface(max_concurrent_requests=4)
+        interface.query_concept("cat")
+        
+        result = interface.bulk_import_concepts(["dog", "cat", "bird", "fish", "dog"])
+        
+        self.assertEqual(result, {"dog": True, "cat": True, "bird": True, "fish": True})
+        self.assertEqual(sorted(self.server.requests), ["bird", "cat", "dog", "fish"])
+        self.assertEqual(interface.query_concept("bird")["relations"][0]["target"], "thing")
+        self.assertEqual(interface.get_cache_stats()["remote_requests"], 4)
+    
+    def test_cold_start_does_not_hit_network(self):
+        """Test that known concepts are served from disk after a restart."""
+        first = self._create_interface()
+        first.query_concept("dog")
+        first.close()
+        self.interfaces.remove(first)
+        
+        restarted = self._create_interface()
+        result = restarted.query_concept("dog")
+        
+        self.assertEqual(self.server.requests, ["dog"])
+        self.assertEqual(result["relations"][0]["relation"], "is_a")
+        self.assertEqual(restarted.get_cache_stats()["disk_hits"], 1)
+    
+    def test_expired_entries_are_fetched_again(self):
+        """Test that cached concepts are fetched again after their TTL."""
+        interface = self._create_interface(max_cache_age=60)
+        interface.query_concept("dog")
+        interface.query_concept("dog")
+        self.assertEqual(len(self.server.requests), 1)
+        
+        with patch('godelOS.common_sense.external_kb_interface.time') as mock_time:
+            mock_time.time.return_value = time.time() + 120
+            interface.query_concept("dog")
+        
+        self.assertEqual(len(self.server.requests), 2)
+    
+    def test_offline_dump(self):
+        """Test that concepts are served from offline dumps without the network."""
+        assertions = self._write_file("assertions.csv", "\n".join([
+            '/a/[/r/IsA/,/c/en/dog/n/,/c/en/animal/]\t/r/IsA\t/c/en/dog/n\t/c/en/animal\t{"weight": 2.0}',
+            '/a/[/r/CapableOf/,/c/en/dog/,/c/en/bark/]\t/r/CapableOf\t/c/en/dog\t/c/en/bark\t{"weight": 1.0}',
+            '/a/[/r/IsA/,/c/en/dog/,/c/en/animal/]\t/r/IsA\t/c/en/dog\t/c/en/animal\t{"weight": 1.0}',
+            '/a/[/r/IsA/,/c/en/cat/,/c/en/animal/]\t/r/IsA\t/c/en/cat\t/c/en/animal\t{"weight": 1.0}',
+            '/a/[/r/IsA/,/c/fr/chien/,/c/fr/animal/]\t/r/IsA\t/c/fr/chien\t/c/fr/animal\t{"weight": 1.0}',
+        ]) + "\n")
+        wordnet = self._write_file("wordnet.jsonl", json.dumps({
+            "concept": "dog",
+            "relations": [],
+            "definitions": ["a domesticated carnivorous mammal"],
+            "source": ["wordnet"]
+        }) + "\n")
+        
+        interface = self._create_interface(offline_mode=True, offline_dumps=[assertions, wordnet])
+        result = interface.query_concept("dog")
+        
+        self.assertEqual([(r["relation"], r["target"], r["weight"]) for r in result["relations"]],
+                         [("is_a", "animal", 2.0), ("capable_of", "bark", 1.0)])
+        self.assertEqual(result["definitions"], ["a domesticated carnivorous mammal"])
+        self.assertEqual(result["source"], ["conceptnet", "wordnet"])
+        self.assertEqual(interface.query_concept("chien")["relations"], [])
+        
+        # Edges are also listed under their end concept
+        animal = interface.query_concept("animal")
+        self.assertEqual([(r["source"], r["relation"]) for r in animal["relations"]],
+                         [("dog", "is_a"), ("cat", "is_a")])
+        self.assertEqual(self.server.requests, [])
+        
+        # An unchanged dump is not loaded again
+        self.assertEqual(interface.load_offline_dump(assertions), 0)
+    
+    def test_export_offline_dump(self):
+        """Test that exported concepts can be loaded into another cache."""
+        interface = self._create_interface()
+        interface.bulk_import_concepts(["dog", "cat"])
+        dump_path = os.path.join(self.cache_dir, "export.jsonl.gz")
+        self.assertEqual(interface.export_offline_dump(dump_path), 2)
+        
+        with tempfile.TemporaryDirectory() as other_cache_dir:
+            offline = self._create_interface(cache_dir=other_cache_dir, offline_mode=True)
+            self.assertEqual(offline.load_offline_dump(dump_path), 2)
+            result = offline.query_concept("cat")
+            offline.close()
+            self.interfaces.remove(offline)
+        
+        self.assertEqual(result["relations"][0]["source"], "cat")
+        self.assertEqual(len(self.server.requests), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+A fake interactive SMT solver for testing solver sessions.
+
+It reads one SMT-LIB command per line from stdin and understands just enough
+of the language to stand in for Z3 or CVC5: declarations, named assertions,
+push/pop, check-sat, get-model, get-unsat-core and echo. A set of assertions
+is unsat when it contains ``false`` or both a formula and its negation.
+Redeclaring a symbol in scope, asserting a constant that is not Boolean, or
+asking for a model after unsat or an unsat core after sat is reported as an
+error, as real solvers do.
+
+Usage: fake_smt_solver.py [--log PATH] [other options are ignored]
+"""
+
+import re
+import sys
+
+
+def main() -> None:
+    log = None
+    if "--log" in sys.argv:
+        log = open(sys.argv[sys.argv.index("--log") + 1], "a")
+
+    # One frame per assertion level: ({declared name: sort}, [(name, formula)])
+    frames = [({}, [])]
+    last_core = []
+    last_status = None
+
+    def respond(text: str) -> None:
+        sys.stdout.write(text + "\n")
+        sys.stdout.flush()
+
+    for line in sys.stdin:
+        command = line.strip()
+        if not command:
+            continue
+        if log:
+            log.write(command + "\n")
+            log.flush()
+
+        if command.startswith("(push"):
+            frames.append(({}, []))
+        elif command.startswith("(pop"):
+            frames.pop()
+        elif command.startswith(("(declare-const", "(declare-fun", "(declare-sort")):
+            name = command.split()[1]
+            if any(name in declared for declared, _ in frames):
+                respond(f'(error "symbol {name} already declared")')
+            frames[-1][0][name] = command.split()[-1].rstrip(")")
+        elif command.startswith("(assert"):
+            body = command[len("(assert "):-1]
+            named = re.fullmatch(r"\(! (.*) :named (\S+)\)", body)
+            name = None
+            if named:
+                body, name = named.group(1), named.group(2)
+            sorts = [declared[body] for declared, _ in frames if body in declared]
+            if sorts and sorts[-1] != "Bool":
+                respond(f'(error "assertion {body} is not Boolean")')
+                continue
+            frames[-1][1].append((name, body))
+        elif command == "(check-sat)":
+            assertions = [assertion for _, asserted in frames for assertion in asserted]
+            bodies = {body: name for name, body in assertions}
+            last_core = []
+            for name, body in assertions:
+                if body == "false":
+                    last_core = [name]
+                elif f"(not {body})" in bodies:
+                    last_core = [name, bodies[f"(not {body})"]]
+                if last_core:
+                    break
+            last_status = "unsat" if last_core else "sat"
+            respond(last_status)
+        elif command == "(get-model)":
+            # Real solvers only produce a model after sat, and a core after unsat
+            if last_status != "sat":
+                respond('(error "model is not available")')
+            else:
+                respond("(\n)")
+        elif command == "(get-unsat-core)":
+            if last_status != "unsat":
+                respond('(error "unsat core is not available")')
+            else:
+                respond("(" + " ".join(name for name in last_core if name) + ")")
+        elif command.startswith("(echo"):
+            respond(command[len("(echo "):-1].strip('"'))
+        elif command == "(exit)":
+            break
+        elif command.startswith(("(set-option", "(set-logic")):
+            pass
+        else:
+            respond(f'(error "unsupported command {command}")')
+
+
+if __name__ == "__main__":
+    main()
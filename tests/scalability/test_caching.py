@@ -464,13 +464,42 @@ class TestCachingMemoizationLayer(unittest.TestCase):
         string_key = self.layer._convert_key(self.key1)
         self.assertEqual(string_key, self.key1)
         
-        # Convert an AST node key
+        # Convert an AST node key: structurally equal nodes share a key
         node_key = self.layer._convert_key(self.node)
-        self.assertEqual(node_key, str(self.node))
+        same_node = ConstantNode("Person", "Person", self.entity_type)
+        self.assertEqual(node_key, self.layer._convert_key(same_node))
+        other_node = ConstantNode("Place", "Place", self.entity_type)
+        self.assertNotEqual(node_key, self.layer._convert_key(other_node))
         
         # Convert a complex key
         complex_key = self.layer._convert_key((self.key1, self.key2))
-        self.assertIsInstance(complex_key, str)
+        self.assertEqual(complex_key, self.layer._convert_key((self.key1, self.key2)))
+        self.assertNotEqual(complex_key, self.layer._convert_key([self.key1, self.key2]))
+        hash(complex_key)
+        
+        # Numbers of different types do not share a key
+        self.assertNotEqual(self.layer._convert_key((1,)), self.layer._convert_key((True,)))
+        self.assertNotEqual(self.layer._convert_key((1,)), self.layer._convert_key((1.0,)))
+    
+    def test_key_statistics(self):
+        """Test the key building counters."""
+        self.layer.put(self.node, self.value1)
+        self.layer.get(self.node)
+        self.layer.get(object())
+        
+        stats = self.layer.get_key_statistics()
+        self.assertEqual(stats["builds"], 3)
+        self.assertEqual(stats["fallbacks"], 1)
+        self.assertEqual(stats["collisions"], 0)
+        self.assertGreater(stats["build_time"], 0.0)
+    
+    def test_key_collisions(self):
+        """Test that distinct keys with equal hashes are counted as collisions."""
+        # hash(-1) == hash(-2) in CPython
+        self.layer._convert_key((-1,))
+        self.layer._convert_key((-2,))
+        
+        self.assertEqual(self.layer.get_key_statistics()["collisions"], 1)
     
     def test_generate_cache_key(self):
         """Test generating a cache key for a function call."""
@@ -386,9 +386,8 @@ class TestCachingEnhanced(unittest.TestCase):
         # Retrieve value with identical AST node
         value_a2 = caching_system.get(p_a2)
         
-        # Verify value (should be None because the string representation is different)
-        # This is a limitation of the current implementation
-        self.assertIsNone(value_a2)
+        # Verify value (keys are structural, so the identical node hits the cache)
+        self.assertEqual(value_a2, "P(a) is true")
         
         # Test with a memoized function that processes AST nodes
         @caching_system.memoize
@@ -417,7 +416,7 @@ class TestCachingEnhanced(unittest.TestCase):
         print(f"Second call (cache hit): {second_call_time * 1000:.2f} ms")
         
         # Cache hit should be faster than cache miss
-        # The actual speedup may vary based on system load and our stack inspection approach
+        # The actual speedup may vary based on system load
         # So we'll just verify that it's at least somewhat faster
         self.assertLess(second_call_time, first_call_time)
     
@@ -6,6 +6,8 @@ SQLiteKBBackend, and KBRouter classes.
 """
 
 import os
+import pickle
+import sqlite3
 import tempfile
 import unittest
 import shutil
@@ -105,7 +107,33 @@ class TestFileBasedKBBackend(unittest.TestCase):
         # Check if the statement no longer exists
         exists = self.kb.statement_exists(statement, ["TEST"])
         self.assertFalse(exists)
-    
+
+    def test_retract_uses_argument_index(self):
+        """Test that retraction only unifies statements sharing the pattern's arguments."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        names = ["John", "Mary", "Alice", "Bob"]
+        for name in names:
+            statement = ApplicationNode(is_a, [ConstantNode(name, self.entity_type, name), person],
+                                        self.entity_type)
+            self.kb.add_statement(statement, "TEST")
+
+        x = VariableNode("?x", 1, self.entity_type)
+        pattern = ApplicationNode(is_a, [ConstantNode("Mary", self.entity_type, "Mary"), x],
+                                  self.entity_type)
+        candidates = self.kb._get_candidate_statements(pattern, "TEST")
+        self.assertEqual({s.arguments[0].name for s in candidates}, {"Mary"})
+
+        with patch.object(self.unification_engine, "unify",
+                          wraps=self.unification_engine.unify) as unify:
+            self.assertTrue(self.kb.retract_statement(pattern, "TEST"))
+        unified = [call for call in unify.call_args_list if call.args[0] is pattern]
+        self.assertEqual(len(unified), 1)
+
+        remaining = {s.arguments[0].name for s in self.kb._statements["TEST"]}
+        self.assertEqual(remaining, {"John", "Alice", "Bob"})
+        self.assertEqual(self.kb._get_candidate_statements(pattern, "TEST"), set())
+
     def test_query_statements_match_pattern(self):
         """Test querying statements matching a pattern."""
         # Create statements
@@ -196,6 +224,143 @@ class TestFileBasedKBBackend(unittest.TestCase):
         exists = self.kb.statement_exists(statement, ["TEST"])
         self.assertTrue(exists)
 
+    
+    def test_variant_duplicates_rejected(self):
+        """Test that variants of stored statements are rejected."""
+        john = ConstantNode("John", self.entity_type, "John")
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        x = VariableNode("?x", 1, self.entity_type)
+        y = VariableNode("?y", 2, self.entity_type)
+        
+        self.assertTrue(self.kb.add_statement(ApplicationNode(is_a, [john, x], self.entity_type), "TEST"))
+        self.assertFalse(self.kb.add_statement(ApplicationNode(is_a, [john, y], self.entity_type), "TEST"))
+        
+        # The variant index survives a reload
+        kb = FileBasedKBBackend(self.unification_engine, self.temp_dir)
+        self.assertFalse(kb.add_statement(ApplicationNode(is_a, [john, y], self.entity_type), "TEST"))
+    
+    def test_add_statements_bulk(self):
+        """Test bulk loading a batch of statements."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        names = ["John", "Mary", "John"]
+        statements = [ApplicationNode(is_a, [ConstantNode(name, self.entity_type, name), person],
+                                      self.entity_type) for name in names]
+        
+        with patch.object(self.kb, "_append_log", wraps=self.kb._append_log) as append_log:
+            results = self.kb.add_statements_bulk(statements, "TEST")
+        self.assertEqual(results, [True, True, False])
+        append_log.assert_called_once()
+        
+        # The batch is indexed and persisted
+        self.assertEqual(len(self.kb._predicate_index["is_a"]["TEST"]), 2)
+        kb = FileBasedKBBackend(self.unification_engine, self.temp_dir)
+        self.assertEqual(len(kb._statements["TEST"]), 2)
+
+    
+    def test_write_ahead_log(self):
+        """Test that changes are appended to the log and replayed on load."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        john = ApplicationNode(is_a, [ConstantNode("John", self.entity_type, "John"), person],
+                               self.entity_type)
+        mary = ApplicationNode(is_a, [ConstantNode("Mary", self.entity_type, "Mary"), person],
+                               self.entity_type)
+        
+        self.kb.add_statement(john, "TEST")
+        self.kb.add_statement(mary, "TEST")
+        self.kb.retract_statement(john, "TEST")
+        self.kb.create_context("OTHER", None, "test")
+        
+        # Nothing but the log has been written
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, FileBasedKBBackend.SNAPSHOT_FILE)))
+        
+        kb = FileBasedKBBackend(self.unification_engine, self.temp_dir)
+        self.assertFalse(kb.statement_exists(john, ["TEST"]))
+        self.assertTrue(kb.statement_exists(mary, ["TEST"]))
+        self.assertIn("OTHER", kb.list_contexts())
+    
+    def test_torn_log_record_is_discarded(self):
+        """Test that a partially written record at the end of the log is ignored."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        john = ApplicationNode(is_a, [ConstantNode("John", self.entity_type, "John"), person],
+                               self.entity_type)
+        mary = ApplicationNode(is_a, [ConstantNode("Mary", self.entity_type, "Mary"), person],
+                               self.entity_type)
+        
+        self.kb.add_statement(john, "TEST")
+        self.kb.add_statement(mary, "TEST")
+        self.kb.close()
+        
+        # Simulate a crash in the middle of writing the last record
+        log_path = self.kb._wal.path()
+        with open(log_path, "r+b") as f:
+            f.truncate(os.path.getsize(log_path) - 5)
+        
+        kb = FileBasedKBBackend(self.unification_engine, self.temp_dir)
+        self.assertTrue(kb.statement_exists(john, ["TEST"]))
+        self.assertFalse(kb.statement_exists(mary, ["TEST"]))
+        
+        # New records are appended after the last valid one
+        kb.add_statement(mary, "TEST")
+        kb = FileBasedKBBackend(self.unification_engine, self.temp_dir)
+        self.assertTrue(kb.statement_exists(mary, ["TEST"]))
+    
+    def test_compaction(self):
+        """Test that the log is compacted into a snapshot."""
+        kb = FileBasedKBBackend(self.unification_engine, self.temp_dir, compaction_threshold=3)
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        statements = [ApplicationNode(is_a, [ConstantNode(f"P{i}", self.entity_type, f"P{i}"), person],
+                                      self.entity_type) for i in range(4)]
+        for statement in statements:
+            kb.add_statement(statement, "TEST")
+        
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, FileBasedKBBackend.SNAPSHOT_FILE)))
+        self.assertEqual(kb._wal.generation, 1)
+        
+        reloaded = FileBasedKBBackend(self.unification_engine, self.temp_dir)
+        self.assertEqual(len(reloaded._statements["TEST"]), 4)
+        self.assertEqual(
+            [name for name in os.listdir(self.temp_dir) if name.startswith("wal.")], ["wal.1.log"])
+    
+    def test_transaction_is_one_log_record(self):
+        """Test that a committed transaction is written as a single record."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        john = ApplicationNode(is_a, [ConstantNode("John", self.entity_type, "John"), person],
+                               self.entity_type)
+        
+        with patch.object(self.kb, "_append_log", wraps=self.kb._append_log) as append_log:
+            self.kb.begin_transaction()
+            self.kb.create_context("TX", None, "test")
+            self.kb.add_statement(john, "TX")
+            self.kb.delete_context("TEST")
+            self.kb.commit_transaction()
+        append_log.assert_called_once()
+        self.assertEqual(len(append_log.call_args[0][0]), 3)
+        
+        kb = FileBasedKBBackend(self.unification_engine, self.temp_dir)
+        self.assertEqual(sorted(kb.list_contexts()), ["TX"])
+        self.assertTrue(kb.statement_exists(john, ["TX"]))
+    
+    def test_rollback_restores_deleted_context(self):
+        """Test that rolling back a transaction undoes a context deletion."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        john = ApplicationNode(is_a, [ConstantNode("John", self.entity_type, "John"), person],
+                               self.entity_type)
+        self.kb.add_statement(john, "TEST")
+        
+        self.kb.begin_transaction()
+        self.kb.delete_context("TEST")
+        self.kb.rollback_transaction()
+        
+        self.assertIn("TEST", self.kb.list_contexts())
+        self.assertTrue(self.kb.statement_exists(john, ["TEST"]))
+        self.assertFalse(self.kb.add_statement(john, "TEST"))
+
 
 class TestSQLiteKBBackend(unittest.TestCase):
     """Test cases for the SQLiteKBBackend class."""
@@ -227,6 +392,7 @@ class TestSQLiteKBBackend(unittest.TestCase):
     def tearDown(self):
         """Tear down test fixtures."""
         # Remove the temporary file
+        self.kb.close()
         os.unlink(self.db_path)
     
     def test_create_context(self):
@@ -256,6 +422,110 @@ class TestSQLiteKBBackend(unittest.TestCase):
         exists = self.kb.statement_exists(statement, ["TEST"])
         self.assertTrue(exists)
 
+    
+    def test_variant_duplicates_rejected(self):
+        """Test that variants of stored statements are rejected."""
+        john = ConstantNode("John", self.entity_type, "John")
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        x = VariableNode("?x", 1, self.entity_type)
+        y = VariableNode("?y", 2, self.entity_type)
+        
+        self.assertTrue(self.kb.add_statement(ApplicationNode(is_a, [john, x], self.entity_type), "TEST"))
+        self.assertFalse(self.kb.add_statement(ApplicationNode(is_a, [john, y], self.entity_type), "TEST"))
+        self.assertTrue(self.kb.statement_exists(ApplicationNode(is_a, [john, y], self.entity_type), ["TEST"]))
+    
+    def test_add_statements_bulk(self):
+        """Test bulk loading a batch of statements."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        john = ApplicationNode(is_a, [ConstantNode("John", self.entity_type, "John"), person],
+                               self.entity_type)
+        mary = ApplicationNode(is_a, [ConstantNode("Mary", self.entity_type, "Mary"), person],
+                               self.entity_type)
+        self.kb.add_statement(john, "TEST")
+        
+        results = self.kb.add_statements_bulk([john, mary, mary], "TEST")
+        self.assertEqual(results, [False, True, False])
+        
+        # The batch was written to the database
+        kb = SQLiteKBBackend(self.unification_engine, self.db_path)
+        self.assertTrue(kb.statement_exists(mary, ["TEST"]))
+        self.assertEqual(len(kb.query_statements_match_pattern(
+            ApplicationNode(is_a, [VariableNode("?x", 1, self.entity_type), person], self.entity_type),
+            ["TEST"])), 2)
+
+    
+    def test_query_pushdown(self):
+        """Test that bound arguments are filtered in SQL."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        animal = ConstantNode("Animal", self.entity_type, "Animal")
+        x = VariableNode("?x", 1, self.entity_type)
+        for name in ["John", "Mary", "Fido"]:
+            kind = animal if name == "Fido" else person
+            self.kb.add_statement(ApplicationNode(
+                is_a, [ConstantNode(name, self.entity_type, name), kind], self.entity_type), "TEST")
+        self.kb.add_statement(ApplicationNode(is_a, [x, animal], self.entity_type), "TEST")
+        
+        # Only rows with the bound constant or a wildcard at its position are loaded
+        john = ConstantNode("John", self.entity_type, "John")
+        pattern = ApplicationNode(is_a, [john, x], self.entity_type)
+        self.assertEqual(len(self.kb._candidate_rows(pattern, "TEST")), 2)
+        
+        pattern = ApplicationNode(is_a, [x, person], self.entity_type)
+        self.assertEqual(len(self.kb._candidate_rows(pattern, "TEST")), 2)
+        self.assertEqual(len(self.kb.query_statements_match_pattern(pattern, ["TEST"])), 2)
+    
+    def test_transactions(self):
+        """Test committing and rolling back transactions."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        john = ApplicationNode(is_a, [ConstantNode("John", self.entity_type, "John"), person],
+                               self.entity_type)
+        mary = ApplicationNode(is_a, [ConstantNode("Mary", self.entity_type, "Mary"), person],
+                               self.entity_type)
+        
+        self.kb.begin_transaction()
+        self.kb.add_statement(john, "TEST")
+        self.kb.rollback_transaction()
+        self.assertFalse(self.kb.statement_exists(john, ["TEST"]))
+        
+        self.kb.begin_transaction()
+        self.kb.add_statement(mary, "TEST")
+        self.kb.commit_transaction()
+        
+        kb = SQLiteKBBackend(self.unification_engine, self.db_path)
+        self.assertTrue(kb.statement_exists(mary, ["TEST"]))
+        self.assertTrue(kb.retract_statement(mary, "TEST"))
+        self.assertFalse(self.kb.statement_exists(mary, ["TEST"]))
+    
+    def test_migrates_legacy_schema(self):
+        """Test opening a database written with the pickled-only schema."""
+        is_a = ConstantNode("is_a", self.relation_type, "is_a")
+        person = ConstantNode("Person", self.entity_type, "Person")
+        john = ApplicationNode(is_a, [ConstantNode("John", self.entity_type, "John"), person],
+                               self.entity_type)
+        
+        fd, legacy_path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.unlink, legacy_path)
+        conn = sqlite3.connect(legacy_path)
+        conn.execute("CREATE TABLE contexts (context_id TEXT PRIMARY KEY, parent_context_id TEXT, "
+                     "context_type TEXT, created_at TEXT)")
+        conn.execute("CREATE TABLE statements (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                     "context_id TEXT, statement_data BLOB)")
+        conn.execute("INSERT INTO contexts VALUES ('TEST', NULL, 'test', '')")
+        conn.execute("INSERT INTO statements (context_id, statement_data) VALUES (?, ?)",
+                     ("TEST", pickle.dumps(john)))
+        conn.commit()
+        conn.close()
+        
+        kb = SQLiteKBBackend(self.unification_engine, legacy_path)
+        self.assertFalse(kb.add_statement(john, "TEST"))
+        pattern = ApplicationNode(is_a, [VariableNode("?x", 1, self.entity_type), person],
+                                  self.entity_type)
+        self.assertEqual(len(kb._candidate_rows(pattern, "TEST")), 1)
+
 
 class TestKBRouter(unittest.TestCase):
     """Test cases for the KBRouter class."""
@@ -298,6 +568,18 @@ class TestKBRouter(unittest.TestCase):
         self.backend2.add_statement.assert_not_called()
         self.default_backend.add_statement.assert_not_called()
     
+    def test_add_statements_bulk(self):
+        """Test bulk loading statements."""
+        statements = [MagicMock(spec=AST_Node), MagicMock(spec=AST_Node)]
+        self.backend2.add_statements_bulk.return_value = [True, False]
+        
+        results = self.router.add_statements_bulk(statements, "context2")
+        
+        self.assertEqual(results, [True, False])
+        self.backend2.add_statements_bulk.assert_called_once_with(
+            statements, "context2", None, check_subsumption=False)
+        self.backend1.add_statements_bulk.assert_not_called()
+    
     def test_query_statements_match_pattern(self):
         """Test querying statements matching a pattern."""
         # Create a mock query pattern
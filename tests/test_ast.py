@@ -9,6 +9,9 @@ from godelOS.core_kr.ast.nodes import (
     AST_Node, ASTVisitor, ConstantNode, VariableNode, ApplicationNode,
     QuantifierNode, ConnectiveNode, ModalOpNode, LambdaNode, DefinitionNode
 )
+from godelOS.core_kr.ast.interning import ASTInterner
+import gc
+import pickle
 from typing import Dict, List, TypeVar, Generic
 
 T = TypeVar('T')
@@ -253,5 +256,134 @@ class TestASTNodes(unittest.TestCase):
         self.assertNotIn("new_field", socrates.metadata)
 
 
+
+class TestASTInterner(unittest.TestCase):
+    """Test cases for AST node interning."""
+    
+    def setUp(self):
+        """Set up the test case."""
+        self.type_system = TypeSystemManager()
+        self.entity_type = self.type_system.get_type("Entity")
+        self.boolean_type = self.type_system.get_type("Boolean")
+        self.interner = ASTInterner()
+    
+    def _loves(self, subj: str, obj: str) -> ApplicationNode:
+        """Build a regular Loves(subj, obj) application."""
+        return ApplicationNode(
+            ConstantNode("Loves", self.boolean_type),
+            [ConstantNode(subj, self.entity_type), ConstantNode(obj, self.entity_type)],
+            self.boolean_type
+        )
+    
+    def test_canonical_nodes_are_shared(self):
+        """Test that structurally equal trees intern to the same object."""
+        a = self.interner.intern(self._loves("John", "Mary"))
+        b = self.interner.intern(self._loves("John", "Mary"))
+        c = self.interner.intern(self._loves("John", "Sue"))
+        
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertNotEqual(a, c)
+        self.assertTrue(a.is_interned)
+        # Children are shared as well
+        self.assertIs(a.operator, c.operator)
+        self.assertIs(a.arguments[0], c.arguments[0])
+    
+    def test_interned_nodes_match_regular_nodes(self):
+        """Test that interned nodes hash and compare like their regular counterparts."""
+        regular = self._loves("John", "Mary")
+        canonical = self.interner.intern(regular)
+        
+        self.assertEqual(canonical, regular)
+        self.assertEqual(regular, canonical)
+        self.assertEqual(hash(canonical), hash(regular))
+        self.assertIn(regular, {canonical})
+    
+    def test_factory_methods(self):
+        """Test building canonical nodes directly through the factory."""
+        x = self.interner.variable("?x", 1, self.entity_type)
+        human = self.interner.constant("Human", self.boolean_type)
+        human_x = self.interner.application(human, [x], self.boolean_type)
+        forall = self.interner.quantifier("FORALL", [x], human_x, self.boolean_type)
+        negation = self.interner.connective("NOT", [forall], self.boolean_type)
+        
+        rebuilt = self.interner.intern(
+            ConnectiveNode("NOT", [
+                QuantifierNode("FORALL", [VariableNode("?x", 1, self.entity_type)],
+                               ApplicationNode(ConstantNode("Human", self.boolean_type),
+                                               [VariableNode("?x", 1, self.entity_type)],
+                                               self.boolean_type),
+                               self.boolean_type)
+            ], self.boolean_type)
+        )
+        self.assertIs(rebuilt, negation)
+        self.assertEqual(self.interner.get_statistics()["hits"] > 0, True)
+    
+    def test_substitution_stays_canonical(self):
+        """Test that substituting into an interned tree yields an interned tree."""
+        x = self.interner.variable("?x", 1, self.entity_type)
+        human = self.interner.constant("Human", self.boolean_type)
+        socrates = self.interner.constant("Socrates", self.entity_type)
+        human_x = self.interner.application(human, [x], self.boolean_type)
+        
+        result = human_x.substitute({x: socrates})
+        self.assertIs(result, self.interner.application(human, [socrates], self.boolean_type))
+    
+    def test_interned_metadata_is_read_only(self):
+        """Test that interned nodes expose their metadata without copying."""
+        node = self.interner.constant("Socrates", self.entity_type, metadata={"source": "user"})
+        self.assertEqual(node.metadata["source"], "user")
+        with self.assertRaises(TypeError):
+            node.metadata["source"] = "modified"
+        
+        updated = node.with_metadata(source="kb")
+        self.assertTrue(updated.is_interned)
+        self.assertEqual(updated.metadata["source"], "kb")
+    
+    def test_unhashable_metadata_is_not_shared(self):
+        """Test that nodes with unhashable metadata fall back to regular nodes."""
+        node = self.interner.constant("Socrates", self.entity_type, metadata={"tags": ["a"]})
+        self.assertFalse(node.is_interned)
+        self.assertEqual(node, ConstantNode("Socrates", self.entity_type, metadata={"tags": ["a"]}))
+    
+    def test_table_is_weak(self):
+        """Test that unreferenced canonical nodes are dropped from the table."""
+        self.interner.intern(self._loves("John", "Mary"))
+        gc.collect()
+        self.assertEqual(len(self.interner), 0)
+    
+    def test_equality_across_clear(self):
+        """Test that nodes interned before and after a clear still compare equal."""
+        old = self.interner.intern(self._loves("John", "Mary"))
+        self.interner.clear()
+        new = self.interner.intern(self._loves("John", "Mary"))
+
+        self.assertIsNot(old, new)
+        self.assertEqual(old, new)
+        self.assertEqual(new, old)
+        self.assertEqual(len({old, new}), 1)
+        self.assertNotEqual(old, self.interner.intern(self._loves("John", "Sue")))
+
+        # Interning a node from before the clear gives the current canonical node
+        self.assertIs(self.interner.intern(old), new)
+
+    def test_pickling_drops_interning(self):
+        """Test that pickled canonical nodes come back as regular nodes."""
+        canonical = self.interner.intern(self._loves("John", "Mary"))
+        restored = pickle.loads(pickle.dumps(canonical))
+        
+        self.assertFalse(restored.is_interned)
+        self.assertEqual(restored, canonical)
+        self.assertEqual(hash(restored), hash(canonical))
+    
+    def test_nodes_use_slots(self):
+        """Test that nodes do not carry a per-instance dictionary."""
+        for node in (ConstantNode("a", self.entity_type),
+                     VariableNode("?x", 1, self.entity_type),
+                     self._loves("John", "Mary"),
+                     ConnectiveNode("NOT", [self._loves("John", "Mary")], self.boolean_type)):
+            self.assertFalse(hasattr(node, "__dict__"))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
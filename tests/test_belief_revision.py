@@ -1,3 +1,6 @@
+import itertools
+import random
+import time
 import unittest
 from typing import Dict, Set
 import uuid
@@ -11,6 +14,7 @@ from godelOS.core_kr.belief_revision.system import (
     Argument,
     ArgumentationFramework
 )
+from godelOS.core_kr.belief_revision.argumentation import AttackGraph
 
 
 class TestBeliefRevisionSystem(unittest.TestCase):
@@ -171,5 +175,170 @@ class TestBeliefRevisionSystem(unittest.TestCase):
         self.assertEqual(len(af.get_attacked(arg1.id)), 1)
 
 
+class ChainingBeliefRevisionSystem(BeliefRevisionSystem):
+    """A belief revision system whose entailment applies modus ponens to a fixpoint."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.entailment_calls = 0
+    
+    def _entails(self, statements, belief):
+        self.entailment_calls += 1
+        derived = {s for s in statements if not (isinstance(s, ConnectiveNode) and s.connective_type == "IMPLIES")}
+        rules = [s.operands for s in statements if isinstance(s, ConnectiveNode) and s.connective_type == "IMPLIES"]
+        changed = True
+        while changed and belief not in derived:
+            changed = False
+            for antecedent, consequent in rules:
+                if antecedent in derived and consequent not in derived:
+                    derived.add(consequent)
+                    changed = True
+        return belief in derived
+
+
+class TestKernelContraction(unittest.TestCase):
+    """Test cases for kernel and remainder computation."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.type_system = TypeSystemManager()
+        self.ksi = KnowledgeStoreInterface(self.type_system)
+        self.brs = ChainingBeliefRevisionSystem(self.ksi)
+        self.bool_type = self.type_system.get_type("Boolean")
+        self.p, self.q, self.r, self.s = (self.atom(name) for name in "pqrs")
+    
+    def atom(self, name):
+        return ConstantNode(name, self.bool_type)
+    
+    def implies(self, antecedent, consequent):
+        return ConnectiveNode("IMPLIES", [antecedent, consequent], self.bool_type)
+    
+    def test_kernels_and_remainders(self):
+        """Kernels are the minimal entailing subsets and remainders their hitting-set complements."""
+        statements = {self.p, self.implies(self.p, self.q), self.r, self.implies(self.r, self.q), self.s}
+        
+        kernels = self.brs._find_kernels(statements, self.q)
+        self.assertEqual({frozenset(k) for k in kernels},
+                         {frozenset({self.p, self.implies(self.p, self.q)}),
+                          frozenset({self.r, self.implies(self.r, self.q)})})
+        
+        remainders = self.brs._find_maximal_subsets(statements, self.q)
+        self.assertEqual(len(remainders), 4)
+        for remainder in remainders:
+            self.assertEqual(len(remainder), 3)
+            self.assertIn(self.s, remainder)
+            self.assertFalse(self.brs._entails(remainder, self.q))
+    
+    def test_entailment_results_are_memoized(self):
+        """Repeating a computation on the same belief set is answered from the memo."""
+        statements = {self.p, self.implies(self.p, self.q), self.r, self.implies(self.r, self.q)}
+        self.brs._find_kernels(statements, self.q)
+        calls = self.brs.entailment_calls
+        
+        self.brs._find_kernels(statements, self.q)
+        self.assertEqual(self.brs.entailment_calls, calls)
+        self.assertGreater(self.brs.entailment_stats["hits"], 0)
+    
+    def test_enumeration_is_bounded(self):
+        """Past the kernel bound, contraction still removes every derivation."""
+        self.brs.MAX_KERNELS = 5
+        statements = set()
+        for i in range(20):
+            support = self.atom(f"a{i}")
+            statements.update({support, self.implies(support, self.q)})
+        
+        self.assertEqual(len(self.brs._find_kernels(statements, self.q)), 5)
+        for remainder in self.brs._find_maximal_subsets(statements, self.q):
+            self.assertFalse(self.brs._entails(remainder, self.q))
+    
+    def test_contraction_of_large_belief_set(self):
+        """Contracting a belief set of hundreds of statements stays fast and correct."""
+        chain = [self.atom(f"c{i}") for i in range(100)]
+        beliefs = [chain[0]] + [self.implies(a, b) for a, b in zip(chain, chain[1:])]
+        beliefs += [chain[-1]] + [self.atom(f"unrelated{i}") for i in range(200)]
+        self.ksi.create_context("LARGE", context_type="beliefs")
+        for belief in beliefs:
+            self.ksi.add_statement(belief, "LARGE")
+        
+        for strategy in (RevisionStrategy.KERNEL, RevisionStrategy.PARTIAL_MEET):
+            contracted_id = self.brs.contract_belief_set("LARGE", chain[-1], strategy=strategy)
+            remaining = self.brs._get_all_statements(contracted_id)
+            self.assertFalse(self.brs._entails(remaining, chain[-1]))
+            # The belief itself and one link of the chain deriving it are removed
+            self.assertEqual(len(remaining), len(beliefs) - 2)
+        
+        # Each kernel is found with a logarithmic number of entailment checks
+        self.assertLess(self.brs.entailment_stats["misses"], 2000)
+
+
+class TestAttackGraph(unittest.TestCase):
+    """Test cases for the integer-indexed argumentation semantics."""
+    
+    def extensions_by_enumeration(self, graph, semantics):
+        """Compute preferred or stable extensions by checking every subset."""
+        n = len(graph)
+        attacks = {(a, t) for a in range(n) for t in graph.targets_of(a)}
+        admissible = []
+        for size in range(n + 1):
+            for subset in map(set, itertools.combinations(range(n), size)):
+                if any((a, b) in attacks for a in subset for b in subset):
+                    continue
+                attacked = {t for a in subset for t in graph.targets_of(a)}
+                if all(set(graph.attackers_of(a)) <= attacked for a in subset):
+                    admissible.append((subset, attacked))
+        if semantics == "stable":
+            return [s for s, attacked in admissible if s | attacked == set(range(n))]
+        return [s for s, _ in admissible if not any(s < other for other, _ in admissible)]
+    
+    def test_grounded_labelling(self):
+        """Unattacked arguments are in, and reinstate what their targets attack."""
+        graph = AttackGraph("abcdef", [("a", "b"), ("b", "c"), ("c", "d"), ("e", "f"), ("f", "e")])
+        self.assertEqual({graph.arguments[i] for i in graph.grounded_extension()}, {"a", "c"})
+    
+    def test_floating_reinstatement(self):
+        """Preferred semantics accepts what every extension reinstates; grounded does not."""
+        graph = AttackGraph("abcd", [("a", "b"), ("b", "a"), ("a", "c"), ("b", "c"), ("c", "d")])
+        self.assertEqual(graph.accepted("grounded"), set())
+        self.assertEqual({graph.arguments[i] for i in graph.accepted("preferred")}, {"d"})
+        self.assertEqual({graph.arguments[i] for i in graph.accepted("stable")}, {"d"})
+    
+    def test_odd_cycle_has_no_stable_extension(self):
+        """An odd attack cycle has the empty preferred extension and no stable one."""
+        graph = AttackGraph("abc", [("a", "b"), ("b", "c"), ("c", "a")])
+        self.assertEqual(graph.accepted("preferred"), set())
+        self.assertIsNone(graph.accepted("stable"))
+    
+    def test_matches_enumeration(self):
+        """Sceptical acceptance agrees with brute-force enumeration on random graphs."""
+        rng = random.Random(0)
+        for _ in range(150):
+            n = rng.randint(1, 7)
+            attacks = [(a, b) for a in range(n) for b in range(n) if rng.random() < 0.25]
+            graph = AttackGraph(range(n), attacks)
+            for semantics in ("preferred", "stable"):
+                extensions = self.extensions_by_enumeration(graph, semantics)
+                expected = set.intersection(*extensions) if extensions else None
+                self.assertEqual(graph.accepted(semantics), expected, (attacks, semantics))
+    
+    def test_justified_beliefs_scale(self):
+        """Tens of thousands of arguments are evaluated in well under a second per semantics."""
+        type_system = TypeSystemManager()
+        brs = BeliefRevisionSystem(KnowledgeStoreInterface(type_system))
+        boolean = type_system.get_type("Boolean")
+        atoms = [ConstantNode(f"p{i}", boolean) for i in range(10000)]
+        negations = [ConnectiveNode("NOT", [atom], boolean) for atom in atoms]
+        knowledge = set(atoms[:5000])
+        rules = set(negations) | set(atoms[5000:])
+        
+        for semantics in ("grounded", "preferred", "stable"):
+            start = time.perf_counter()
+            justified = brs.get_justified_beliefs_via_argumentation(knowledge, rules, semantics)
+            self.assertLess(time.perf_counter() - start, 5.0)
+            # Facts defeat their negations; conflicting rules defeat each other
+            self.assertTrue(knowledge <= justified)
+            self.assertFalse(justified & set(negations))
+            self.assertFalse(justified & set(atoms[5000:]))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
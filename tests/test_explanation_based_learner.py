@@ -16,7 +16,8 @@ from godelOS.inference_engine.proof_object import ProofObject, ProofStepNode
 from godelOS.learning_system.explanation_based_learner import (
     ExplanationBasedLearner, 
     OperationalityConfig, 
-    GeneralizedExplanation
+    GeneralizedExplanation,
+    GeneralizationCache
 )
 
 
@@ -503,5 +504,109 @@ class TestExplanationBasedLearner(unittest.TestCase):
         self.assertEqual(result[0].arguments[1].name, "Greece")
 
 
+class TestGeneralizationCache(unittest.TestCase):
+    """Test cases for caching generalizations by proof skeleton."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.kr_system_interface = MagicMock()
+        self.inference_engine = MagicMock()
+        self.types = {}
+        self.op_config = OperationalityConfig(operational_predicates={"isHuman", "isGreek"})
+        self.ebl = ExplanationBasedLearner(
+            kr_system_interface=self.kr_system_interface,
+            inference_engine=self.inference_engine,
+            operationality_config=self.op_config
+        )
+    
+    def _get_type(self, type_name):
+        """Get a type, the same object for each name."""
+        if type_name not in self.types:
+            self.types[type_name] = MagicMock()
+            self.types[type_name].name = type_name
+        return self.types[type_name]
+    
+    def _atom(self, predicate, *args):
+        """Helper method to create an atom over constants."""
+        return ApplicationNode(
+            ConstantNode(predicate, self._get_type("Predicate")),
+            [ConstantNode(arg, self._get_type("Person")) for arg in args],
+            self._get_type("Boolean")
+        )
+    
+    def _mortality_proof(self, name, premise="isHuman", goal_achieved=True):
+        """Create a proof of isMortal(name) from premise(name)."""
+        goal = self._atom("isMortal", name)
+        return ProofObject(
+            goal_achieved=goal_achieved,
+            conclusion_ast=goal,
+            status_message="Proved",
+            proof_steps=[
+                ProofStepNode(formula=self._atom(premise, name), rule_name="Axiom", premises=[]),
+                ProofStepNode(formula=goal, rule_name="Modus Ponens", premises=[0])
+            ],
+            used_axioms_rules=set(),
+            inference_engine_used="TestProver"
+        )
+    
+    def test_identical_skeletons_reuse_rule(self):
+        """Test that a proof with a known skeleton returns the cached rule without generalizing."""
+        rule = self.ebl.generalize_from_proof_object(self._mortality_proof("Socrates"))
+        
+        with patch.object(self.ebl, '_generalize_explanation') as mock_generalize:
+            cached_rule = self.ebl.generalize_from_proof_object(self._mortality_proof("Plato"))
+        
+        mock_generalize.assert_not_called()
+        self.assertIs(cached_rule, rule)
+        self.assertEqual(rule.operands[0].operator.name, "isHuman")
+        self.assertIsInstance(rule.operands[1].arguments[0], VariableNode)
+        self.assertEqual(self.ebl.get_generalization_cache_stats()["hits"], 1)
+    
+    def test_different_skeletons_are_generalized(self):
+        """Test that proofs with different premises are not conflated."""
+        rule1 = self.ebl.generalize_from_proof_object(self._mortality_proof("Socrates"))
+        rule2 = self.ebl.generalize_from_proof_object(self._mortality_proof("Socrates", premise="isGreek"))
+        
+        self.assertEqual(rule1.operands[0].operator.name, "isHuman")
+        self.assertEqual(rule2.operands[0].operator.name, "isGreek")
+        self.assertEqual(self.ebl.get_generalization_cache_stats()["size"], 2)
+    
+    def test_batch_generalizes_each_skeleton_once(self):
+        """Test that the batch API deduplicates proofs by skeleton."""
+        proofs = [
+            self._mortality_proof("Socrates"),
+            self._mortality_proof("Plato"),
+            self._mortality_proof("Socrates", premise="isGreek"),
+            self._mortality_proof("Zeus", goal_achieved=False),
+            self._mortality_proof("Aristotle")
+        ]
+        
+        with patch.object(self.ebl, '_generalize', wraps=self.ebl._generalize) as mock_generalize:
+            rules = self.ebl.generalize_from_proof_objects(proofs)
+        
+        self.assertEqual(mock_generalize.call_count, 2)
+        self.assertEqual(len(rules), 5)
+        self.assertIs(rules[0], rules[1])
+        self.assertIs(rules[0], rules[4])
+        self.assertIsNot(rules[0], rules[2])
+        self.assertIsNone(rules[3])
+    
+    def test_cache_shared_between_learners(self):
+        """Test that learners sharing a cache reuse each other's rules."""
+        cache = GeneralizationCache()
+        learner1 = ExplanationBasedLearner(self.kr_system_interface, self.inference_engine, self.op_config, cache)
+        learner2 = ExplanationBasedLearner(self.kr_system_interface, self.inference_engine, self.op_config, cache)
+        
+        rule = learner1.generalize_from_proof_object(self._mortality_proof("Socrates"))
+        
+        self.assertIs(learner2.generalize_from_proof_object(self._mortality_proof("Plato")), rule)
+        
+        # A different operationality configuration may unfold differently
+        learner3 = ExplanationBasedLearner(self.kr_system_interface, self.inference_engine,
+                                           OperationalityConfig(operational_predicates={"isMortal"}), cache)
+        with patch.object(learner3, '_unfold_premise', return_value=None):
+            self.assertIsNot(learner3.generalize_from_proof_object(self._mortality_proof("Plato")), rule)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -13,7 +13,8 @@ from godelOS.core_kr.ast.nodes import AST_Node, VariableNode, ConstantNode, Appl
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
 from godelOS.inference_engine.coordinator import InferenceCoordinator
 from godelOS.inference_engine.proof_object import ProofObject
-from godelOS.learning_system.ilp_engine import ILPEngine, LanguageBias, ModeDeclaration, Clause
+from godelOS.core_kr.type_system.manager import TypeSystemManager
+from godelOS.learning_system.ilp_engine import ILPEngine, LanguageBias, ModeDeclaration, Clause, CompiledClause
 
 
 class TestILPEngine(unittest.TestCase):
@@ -304,5 +305,122 @@ class TestILPEngine(unittest.TestCase):
         mock_get_background_knowledge.assert_called_with("TRUTHS")
 
 
+class TestILPCoverage(unittest.TestCase):
+    """Test cases for coverage testing against indexed background facts."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.type_system = TypeSystemManager()
+        self.type_system.define_atomic_type("Predicate")
+        
+        self.kr_system_interface = MagicMock()
+        self.kr_system_interface.type_system = self.type_system
+        self.inference_engine = MagicMock()
+        
+        self.language_bias = LanguageBias(max_clause_length=2, allow_recursion=False)
+        self.language_bias.add_mode_declaration(ModeDeclaration(
+            predicate_name="parent",
+            arg_modes=["+", "+"],
+            arg_types=["Entity", "Entity"]
+        ))
+        
+        self.background_knowledge = {
+            self._atom("parent", "ann", "bob"),
+            self._atom("parent", "bob", "cid"),
+            self._atom("parent", "bob", "dan")
+        }
+        self.kr_system_interface.query_statements_match_pattern.return_value = [
+            {"?s": fact} for fact in self.background_knowledge
+        ]
+    
+    def _atom(self, predicate, *args):
+        """Helper method to create an atom over constants and variables."""
+        entity = self.type_system.get_type("Entity")
+        arg_nodes = [
+            VariableNode(arg, int(arg[2:]), entity) if arg.startswith("?") else ConstantNode(arg, entity)
+            for arg in args
+        ]
+        return ApplicationNode(ConstantNode(predicate, self.type_system.get_type("Predicate")),
+                               arg_nodes, self.type_system.get_type("Boolean"))
+    
+    def _engine(self, max_workers=0):
+        return ILPEngine(self.kr_system_interface, self.inference_engine, self.language_bias, max_workers)
+    
+    def test_compiled_coverage(self):
+        """Test that coverage of ground background facts is computed without the inference engine."""
+        engine = self._engine()
+        clause = Clause(
+            head=self._atom("grandparent", "?V1", "?V2"),
+            body=[self._atom("parent", "?V1", "?V3"), self._atom("parent", "?V3", "?V2")]
+        )
+        positive_examples = {self._atom("grandparent", "ann", "cid"), self._atom("grandparent", "ann", "dan")}
+        negative_examples = {self._atom("grandparent", "bob", "ann"), self._atom("grandparent", "ann", "bob")}
+        
+        positive_covered, negative_covered = engine._get_coverage(
+            clause, positive_examples, negative_examples, self.background_knowledge
+        )
+        
+        self.assertEqual(positive_covered, positive_examples)
+        self.assertEqual(negative_covered, set())
+        self.inference_engine.submit_goal.assert_not_called()
+        
+        # Coverage is cached as bitsets over the examples
+        positive_bits, negative_bits = engine.coverage_cache.get(clause)
+        self.assertEqual(positive_bits, 0b11)
+        self.assertEqual(negative_bits, 0)
+    
+    def test_refinement_tests_only_parent_coverage(self):
+        """Test that a refinement is only tested against the examples its parent covers."""
+        engine = self._engine()
+        head = self._atom("grandparent", "?V1", "?V2")
+        parent_clause = Clause(head=head, body=[self._atom("parent", "?V1", "?V3")])
+        refined_clause = Clause(head=head, body=parent_clause.body + [self._atom("parent", "?V3", "?V2")])
+        positive_examples = {self._atom("grandparent", "ann", "cid")}
+        negative_examples = {self._atom("grandparent", "cid", "ann"), self._atom("grandparent", "dan", "ann")}
+        
+        engine._get_coverage(parent_clause, positive_examples, negative_examples, self.background_knowledge)
+        
+        tested = []
+        covers = CompiledClause.covers
+        with patch.object(CompiledClause, "covers", autospec=True,
+                          side_effect=lambda compiled, example, facts: tested.append(example) or covers(compiled, example, facts)):
+            positive_covered, negative_covered = engine._get_coverage(
+                refined_clause, positive_examples, negative_examples, self.background_knowledge
+            )
+        
+        self.assertEqual(tested, [self._atom("grandparent", "ann", "cid")])
+        self.assertEqual(positive_covered, positive_examples)
+        self.assertEqual(negative_covered, set())
+    
+    def test_rules_in_background_use_inference_engine(self):
+        """Test that coverage falls back to the inference engine when the background has rules."""
+        engine = self._engine()
+        rule = ConnectiveNode("IMPLIES", [self._atom("parent", "?V1", "?V2"), self._atom("ancestor", "?V1", "?V2")],
+                              self.type_system.get_type("Boolean"))
+        background_knowledge = self.background_knowledge | {rule}
+        self.inference_engine.submit_goal.return_value = MagicMock(goal_achieved=True)
+        clause = Clause(head=self._atom("grandparent", "?V1", "?V2"))
+        
+        positive_covered, _ = engine._get_coverage(
+            clause, {self._atom("grandparent", "ann", "cid")}, set(), background_knowledge
+        )
+        
+        self.assertEqual(positive_covered, {self._atom("grandparent", "ann", "cid")})
+        self.assertEqual(self.inference_engine.submit_goal.call_count, 1)
+    
+    def test_induce_rules_with_worker_processes(self):
+        """Test that rule induction gives the same theory with and without worker processes."""
+        target_predicate = self._atom("child", "?V1", "?V2")
+        positive_examples = {self._atom("child", "bob", "ann"), self._atom("child", "cid", "bob")}
+        negative_examples = {self._atom("child", "ann", "bob")}
+        expected = Clause(head=target_predicate, body=[self._atom("parent", "?V2", "?V1")]).to_ast()
+        
+        for max_workers in (0, 2):
+            result = self._engine(max_workers).induce_rules(target_predicate, positive_examples, negative_examples)
+            self.assertEqual(result, [expected])
+        
+        self.inference_engine.submit_goal.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -15,6 +15,7 @@ from godelOS.core_kr.type_system.types import FunctionType
 from godelOS.core_kr.knowledge_store import (
     KnowledgeStoreInterface, DynamicContextModel, CachingMemoizationLayer
 )
+from godelOS.core_kr.knowledge_store.term_index import TermIndex, variant_key, variant_digest
 
 
 class TestKnowledgeStoreInterface(unittest.TestCase):
@@ -332,7 +333,206 @@ class TestKnowledgeStoreInterface(unittest.TestCase):
         # This should be fast due to indexing
         result = self.knowledge_store.statement_exists(query)
         self.assertTrue(result)
+        
+        # Only the statement with the bound argument is a candidate
+        candidates = self.knowledge_store._backend._get_candidate_statements(query, "TRUTHS")
+        self.assertEqual(len(candidates), 1)
+    
+    def test_retract_uses_term_index(self):
+        """Test that retraction only affects statements matching the bound arguments."""
+        for i in range(10):
+            constant = ConstantNode(f"Entity{i}", self.entity_type)
+            self.knowledge_store.add_statement(
+                ApplicationNode(self.human_pred, [constant], self.boolean_type))
+        
+        query = ApplicationNode(self.human_pred, [ConstantNode("Entity3", self.entity_type)],
+                                self.boolean_type)
+        self.assertTrue(self.knowledge_store.retract_statement(query))
+        self.assertFalse(self.knowledge_store.statement_exists(query))
+        self.assertEqual(len(self.knowledge_store.query_statements_match_pattern(self.human_var_x)), 9)
+
+    
+    def test_variant_duplicates_rejected(self):
+        """Test that statements equal up to variable renaming are duplicates."""
+        self.assertTrue(self.knowledge_store.add_statement(self.human_var_x))
+        
+        # Human(?y) is a variant of Human(?x)
+        human_var_y = ApplicationNode(self.human_pred, [self.var_y], self.boolean_type)
+        self.assertFalse(self.knowledge_store.add_statement(human_var_y))
+        self.assertTrue(self.knowledge_store.statement_exists(human_var_y))
+    
+    def test_check_subsumption(self):
+        """Test that unifiable non-variants are only rejected on request."""
+        self.knowledge_store.create_context("GENERAL", None, "test")
+        self.knowledge_store.create_context("SPECIFIC", None, "test")
+        self.knowledge_store.add_statement(self.human_var_x, context_id="GENERAL")
+        self.knowledge_store.add_statement(self.human_var_x, context_id="SPECIFIC")
+        
+        # Human(Socrates) unifies with Human(?x) but is not a variant of it
+        self.assertTrue(self.knowledge_store.add_statement(
+            self.human_socrates, context_id="GENERAL"))
+        self.assertFalse(self.knowledge_store.add_statement(
+            self.human_socrates, context_id="SPECIFIC", check_subsumption=True))
+
+    
+    def test_add_statements_bulk(self):
+        """Test bulk loading with per-statement results."""
+        self.knowledge_store.add_statement(self.human_socrates)
+        human_var_y = ApplicationNode(self.human_pred, [self.var_y], self.boolean_type)
+        
+        results = self.knowledge_store.add_statements_bulk([
+            self.human_socrates,    # already stored
+            self.human_plato,
+            self.human_var_x,
+            human_var_y,            # variant of an earlier statement in the batch
+            self.mortal_socrates,
+        ])
+        self.assertEqual(results, [False, True, True, False, True])
+        
+        # Bulk-loaded statements are indexed
+        self.assertEqual(len(self.knowledge_store.query_statements_match_pattern(
+            ApplicationNode(self.mortal_pred, [self.var_x], self.boolean_type))), 1)
+        candidates = self.knowledge_store._backend._get_candidate_statements(self.human_plato, "TRUTHS")
+        self.assertEqual(candidates, {self.human_plato, self.human_var_x})
+        
+        with self.assertRaises(ValueError):
+            self.knowledge_store.add_statements_bulk([self.human_plato], context_id="NONEXISTENT")
+    
+    def test_add_statements_bulk_check_subsumption(self):
+        """Test that subsumption checks see statements from earlier in the batch."""
+        results = self.knowledge_store.add_statements_bulk(
+            [self.human_var_x, self.human_socrates], check_subsumption=True)
+        self.assertEqual(results, [True, False])
+
+
+class TestTermIndex(unittest.TestCase):
+    """Test cases for the TermIndex."""
+    
+    def setUp(self):
+        """Set up the test case."""
+        self.type_system = TypeSystemManager()
+        self.entity_type = self.type_system.get_type("Entity")
+        self.boolean_type = self.type_system.get_type("Boolean")
+        self.index = TermIndex()
+        
+        self.likes = ConstantNode("likes", self.boolean_type)
+        self.father = ConstantNode("father", self.entity_type)
+        self.alice = ConstantNode("alice", self.entity_type)
+        self.bob = ConstantNode("bob", self.entity_type)
+        self.carol = ConstantNode("carol", self.entity_type)
+        self.var_x = VariableNode("?x", 1, self.entity_type)
+        self.var_y = VariableNode("?y", 2, self.entity_type)
+    
+    def _likes(self, *args):
+        """Build a likes/N application."""
+        return ApplicationNode(self.likes, list(args), self.boolean_type)
+    
+    def test_bound_arguments_narrow_candidates(self):
+        """Test that each bound argument narrows the candidate set."""
+        alice_bob = self._likes(self.alice, self.bob)
+        carol_bob = self._likes(self.carol, self.bob)
+        alice_carol = self._likes(self.alice, self.carol)
+        for statement in (alice_bob, carol_bob, alice_carol):
+            self.index.add(statement)
+        
+        self.assertEqual(self.index.candidates(self._likes(self.var_x, self.var_y)),
+                         {alice_bob, carol_bob, alice_carol})
+        self.assertEqual(self.index.candidates(self._likes(self.var_x, self.bob)),
+                         {alice_bob, carol_bob})
+        self.assertEqual(self.index.candidates(self._likes(self.alice, self.bob)), {alice_bob})
+        self.assertEqual(self.index.candidates(self._likes(self.bob, self.var_y)), set())
+    
+    def test_arity_is_part_of_the_key(self):
+        """Test that statements with a different arity are never candidates."""
+        self.index.add(self._likes(self.alice))
+        self.assertEqual(self.index.candidates(self._likes(self.var_x, self.var_y)), set())
+    
+    def test_statement_variables_are_wildcards(self):
+        """Test that statements with variables match any bound pattern argument."""
+        general = self._likes(self.var_x, self.bob)
+        self.index.add(general)
+        self.assertEqual(self.index.candidates(self._likes(self.carol, self.bob)), {general})
+        self.assertEqual(self.index.candidates(self._likes(self.carol, self.alice)), set())
+    
+    def test_nested_terms(self):
+        """Test indexing of nested applications below a wildcard prefix."""
+        father_alice = ApplicationNode(self.father, [self.alice], self.entity_type)
+        father_bob = ApplicationNode(self.father, [self.bob], self.entity_type)
+        stmt_alice = self._likes(father_alice, self.carol)
+        stmt_bob = self._likes(father_bob, self.carol)
+        stmt_var = self._likes(self.var_x, self.carol)
+        for statement in (stmt_alice, stmt_bob, stmt_var):
+            self.index.add(statement)
+        
+        pattern = self._likes(ApplicationNode(self.father, [self.alice], self.entity_type), self.var_y)
+        self.assertEqual(self.index.candidates(pattern), {stmt_alice, stmt_var})
+    
+    def test_remove(self):
+        """Test removing statements from the index."""
+        statement = self._likes(self.alice, self.bob)
+        self.index.add(statement)
+        self.index.remove(statement)
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.candidates(self._likes(self.alice, self.var_y)), set())
+    
+    def test_non_application_patterns(self):
+        """Test that patterns without a constant functor are not answered by the index."""
+        self.assertIsNone(self.index.candidates(self.alice))
+        self.assertFalse(self.index.add(self.alice))
+
+
+
+class TestVariantKey(unittest.TestCase):
+    """Test cases for canonical variant keys."""
+    
+    def setUp(self):
+        """Set up the test case."""
+        self.type_system = TypeSystemManager()
+        self.entity_type = self.type_system.get_type("Entity")
+        self.boolean_type = self.type_system.get_type("Boolean")
+        self.loves = ConstantNode("Loves", FunctionType([self.entity_type, self.entity_type],
+                                                        self.boolean_type))
+        self.john = ConstantNode("John", self.entity_type)
+        self.var_x = VariableNode("?x", 1, self.entity_type)
+        self.var_y = VariableNode("?y", 2, self.entity_type)
+    
+    def loves_(self, *args):
+        return ApplicationNode(self.loves, list(args), self.boolean_type)
+    
+    def test_variants_share_a_key(self):
+        """Test that consistent variable renaming does not change the key."""
+        self.assertEqual(variant_key(self.loves_(self.var_x, self.var_y)),
+                         variant_key(self.loves_(self.var_y, self.var_x)))
+        self.assertEqual(variant_digest(self.loves_(self.var_x, self.john)),
+                         variant_digest(self.loves_(self.var_y, self.john)))
+    
+    def test_non_variants_differ(self):
+        """Test that variable sharing and constants are part of the key."""
+        self.assertNotEqual(variant_key(self.loves_(self.var_x, self.var_x)),
+                            variant_key(self.loves_(self.var_x, self.var_y)))
+        self.assertNotEqual(variant_key(self.loves_(self.var_x, self.john)),
+                            variant_key(self.loves_(self.john, self.var_x)))
+    
+    def test_constant_values_are_part_of_the_key(self):
+        """Test that constants sharing a name but holding different values differ."""
+        three = ConstantNode("n", self.entity_type, 3)
+        four = ConstantNode("n", self.entity_type, 4)
+        self.assertNotEqual(variant_key(self.loves_(self.john, three)),
+                            variant_key(self.loves_(self.john, four)))
+        self.assertNotEqual(variant_digest(self.loves_(self.john, three)),
+                            variant_digest(self.loves_(self.john, four)))
+        self.assertEqual(variant_key(self.loves_(self.john, three)),
+                         variant_key(self.loves_(self.john, ConstantNode("n", self.entity_type, 3))))
+        
+        # Unhashable values cannot be keyed
+        self.assertIsNone(variant_key(self.loves_(self.john, ConstantNode("n", self.entity_type, [3]))))
+    
+    def test_metadata_is_ignored(self):
+        """Test that metadata does not affect the key."""
+        statement = self.loves_(self.john, self.john)
+        self.assertEqual(variant_key(statement),
+                         variant_key(statement.with_updated_metadata({"source": "test"})))
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -5,6 +5,8 @@ This module contains tests for the Meta-Control Reinforcement Learning Module (M
 of the Learning System.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 import numpy as np
@@ -91,6 +93,20 @@ class TestMetaControlRLModule(unittest.TestCase):
         )
         self.assertNotEqual(action, action3)
 
+    def test_meta_action_hash_consistent_with_equality(self):
+        """Test that equal meta-actions hash equal, including numerically equal parameters."""
+        action = MetaAction(action_type="SetResourceLimit", parameters={"value": 1})
+        action2 = MetaAction(action_type="SetResourceLimit", parameters={"value": 1.0})
+
+        self.assertEqual(action, action2)
+        self.assertEqual(hash(action), hash(action2))
+        self.assertEqual(len({action, action2}), 1)
+
+        # Unhashable parameter values are supported
+        action3 = MetaAction(action_type="TriggerLearningModule", parameters={"targets": [1, {"a": 2}]})
+        action4 = MetaAction(action_type="TriggerLearningModule", parameters={"targets": [1.0, {"a": 2}]})
+        self.assertEqual(hash(action3), hash(action4))
+
     def test_rl_config(self):
         """Test the RLConfig class."""
         config = RLConfig(
@@ -346,6 +362,102 @@ class TestMetaControlRLModule(unittest.TestCase):
         state_features = self.mcrl.get_state_features()
         self.assertEqual(state_features, self.state_feature_extractor(self.mkb_interface))
 
+    def test_replay_buffer_overwrites_oldest(self):
+        """Test that the ring buffer overwrites the oldest transitions when full."""
+        buffer = ReplayBuffer(capacity=3)
+        for i in range(5):
+            buffer.add([float(i), 0.0], i, float(i), [float(i + 1), 0.0], False)
+        
+        self.assertEqual(len(buffer), 3)
+        states, actions, rewards, next_states, dones = buffer.sample(3)
+        self.assertEqual(sorted(actions.tolist()), [2, 3, 4])
+        self.assertEqual(sorted(states[:, 0].tolist()), [2.0, 3.0, 4.0])
+
+    def test_dqn_model_update_reduces_loss(self):
+        """Test that updates fit the Q-values of the actions taken to the targets."""
+        np.random.seed(0)
+        model = DQNModel(state_dim=4, action_dim=3, hidden_layer_sizes=[16, 16], learning_rate=0.01)
+        states = np.random.rand(64, 4)
+        actions = np.random.randint(0, 3, 64)
+        targets = states.sum(axis=1) * (actions + 1)
+        
+        initial_loss = model.update(states, actions, targets)
+        for _ in range(300):
+            loss = model.update(states, actions, targets)
+        
+        self.assertLess(loss, initial_loss * 0.1)
+        predicted = model.predict(states)[np.arange(64), actions]
+        self.assertLess(np.mean(np.abs(predicted - targets)), 0.2)
+
+    def test_soft_target_update(self):
+        """Test that the target model moves towards the main model by tau."""
+        model = DQNModel(state_dim=2, action_dim=2, hidden_layer_sizes=[4], learning_rate=0.01)
+        target = DQNModel(state_dim=2, action_dim=2, hidden_layer_sizes=[4], learning_rate=0.01)
+        for key in model.weights:
+            model.weights[key] = np.ones_like(model.weights[key])
+            target.weights[key] = np.zeros_like(target.weights[key])
+        
+        target.soft_update_from(model, 0.25)
+        
+        for key in target.weights:
+            self.assertTrue(np.allclose(target.weights[key], 0.25))
+
+    def test_select_meta_actions_batch(self):
+        """Test batched action selection with masks."""
+        self.mcrl.exploration_rate = 0.0
+        self.mcrl.config.min_exploration_rate = 0.0
+        q_values = np.array([
+            [0.1, 0.2, 0.5, 0.3, 0.4],
+            [0.9, 0.2, 0.5, 0.3, 0.4]
+        ])
+        masks = [
+            [True, True, True, True, True],
+            [False, True, False, True, False]
+        ]
+        
+        with patch.object(self.mcrl.main_model, 'predict', return_value=q_values) as mock_predict:
+            actions = self.mcrl.select_meta_actions([[0.1] * 5, [0.2] * 5], masks)
+        
+        mock_predict.assert_called_once()
+        self.assertEqual(actions, [self.action_space[2], self.action_space[3]])
+
+    def test_save_and_load_model(self):
+        """Test that a saved model restores the same predictions."""
+        state_features = [0.1, 0.2, 0.3, 0.4, 0.5]
+        for i in range(10):
+            self.mcrl.learn_from_transition(state_features, self.action_space[i % 5], 1.0, state_features, False)
+        self.assertGreater(self.mcrl.get_training_throughput(), 0.0)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mcrl_model")
+            self.mcrl.save_model(path)
+            
+            restored = MetaControlRLModule(
+                mkb_interface=self.mkb_interface,
+                action_space=self.action_space,
+                state_feature_extractor=self.state_feature_extractor,
+                rl_config=self.rl_config
+            )
+            restored.load_model(path)
+        
+        self.assertEqual(restored.training_steps, self.mcrl.training_steps)
+        self.assertAlmostEqual(restored.exploration_rate, self.mcrl.exploration_rate)
+        self.assertTrue(np.allclose(restored.main_model.predict(np.array(state_features)),
+                                    self.mcrl.main_model.predict(np.array(state_features))))
+        
+        # A model with a different architecture cannot be loaded
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "mcrl_model")
+            self.mcrl.save_model(path)
+            other = MetaControlRLModule(
+                mkb_interface=self.mkb_interface,
+                action_space=self.action_space,
+                state_feature_extractor=self.state_feature_extractor,
+                rl_config=RLConfig(hidden_layer_sizes=[4])
+            )
+            with self.assertRaises(ValueError):
+                other.load_model(path)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
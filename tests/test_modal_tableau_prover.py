@@ -354,6 +354,58 @@ class TestModalTableauProver(unittest.TestCase):
         result_b = self.prover.prove(implication2, context, modal_system_name="B", check_validity=True)
         self.assertTrue(result_b.goal_achieved)
 
+    def test_world_detects_clash_on_add(self):
+        """Test that a world records a contradiction when its second half is added."""
+        world = World(0)
+        not_p = ConnectiveNode("NOT", [self.p_pred], self.bool_type)
+
+        self.assertTrue(world.add_formula(SignedFormula(not_p, True)))
+        self.assertTrue(world.contains_formula(SignedFormula(self.p_pred, False)))
+        self.assertFalse(world.contains_contradiction())
+
+        # T: ¬P is equivalent to F: P, so T: P clashes with it
+        self.assertFalse(world.add_formula(SignedFormula(self.p_pred, True)))
+        self.assertTrue(world.contains_contradiction())
+
+    def test_branch_copy_shares_worlds(self):
+        """Test that split branches share worlds until one of them writes."""
+        branch = Branch()
+        branch.add_world(World(0, {SignedFormula(self.p_pred, True)}))
+        branch.add_world(World(1))
+
+        other = branch.copy()
+        self.assertIs(other.worlds[0], branch.worlds[0])
+
+        other.add_formula(0, SignedFormula(self.p_pred, False))
+        self.assertTrue(other.closed)
+        self.assertFalse(branch.is_closed())
+        self.assertIsNot(other.worlds[0], branch.worlds[0])
+        self.assertIs(other.worlds[1], branch.worlds[1])
+
+    def test_deeply_nested_modal_proofs(self):
+        """Test S4 and S5 proofs with dozens of modal operators."""
+        def nest(operator, formula, depth):
+            for _ in range(depth):
+                formula = ModalOpNode(operator, formula, self.bool_type)
+            return formula
+
+        box_p = ModalOpNode("NECESSARY", self.p_pred, self.bool_type)
+        diamond_p = ModalOpNode("POSSIBLE", self.p_pred, self.bool_type)
+
+        # □P → □...□P is valid in S4
+        s4_goal = ConnectiveNode("IMPLIES", [box_p, nest("NECESSARY", self.p_pred, 40)], self.bool_type)
+        result = self.prover.prove(s4_goal, set(), modal_system_name="S4")
+        self.assertTrue(result.goal_achieved)
+
+        # ◇...◇P → □◇P is valid in S5 but not in S4
+        s5_goal = ConnectiveNode(
+            "IMPLIES",
+            [nest("POSSIBLE", self.p_pred, 30), ModalOpNode("NECESSARY", diamond_p, self.bool_type)],
+            self.bool_type
+        )
+        self.assertTrue(self.prover.prove(s5_goal, set(), modal_system_name="S5").goal_achieved)
+        self.assertFalse(self.prover.prove(s5_goal, set(), modal_system_name="S4").goal_achieved)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
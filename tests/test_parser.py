@@ -2,7 +2,10 @@
 Tests for the Formal Logic Parser module.
 """
 
+import io
+import tempfile
 import unittest
+from pathlib import Path
 
 from godelOS.core_kr.type_system import TypeSystemManager
 from godelOS.core_kr.formal_logic_parser import FormalLogicParser, Error
@@ -341,5 +344,112 @@ class TestFormalLogicParser(unittest.TestCase):
         self.assertGreater(len(errors), 0)
 
 
+class TestParseCacheAndStream(unittest.TestCase):
+    """Test cases for the parse cache and the streaming parser."""
+    
+    def setUp(self):
+        """Set up the test case."""
+        self.type_system = TypeSystemManager()
+        self.type_system.define_function_signature("Human", ["Entity"], "Boolean")
+        self.type_system.define_function_signature("Mortal", ["Entity"], "Boolean")
+        self.parser = FormalLogicParser(self.type_system)
+    
+    def test_cache_returns_shared_ast(self):
+        """Re-parsing a formula, modulo whitespace, returns the same interned AST."""
+        ast1, errors1 = self.parser.parse("forall ?x. Human(?x) implies Mortal(?x)")
+        ast2, errors2 = self.parser.parse("  forall ?x.\tHuman(?x)   implies Mortal(?x) ")
+        self.assertEqual(errors1, [])
+        self.assertEqual(errors2, [])
+        self.assertIs(ast1, ast2)
+        self.assertTrue(ast1.is_interned)
+        self.assertEqual(self.parser.cache_stats, {"hits": 1, "misses": 1})
+        
+        # Whitespace inside string literals is significant
+        ast3, _ = self.parser.parse('"a  b"')
+        ast4, _ = self.parser.parse('"a b"')
+        self.assertEqual(ast3.value, "a  b")
+        self.assertEqual(ast4.value, "a b")
+    
+    def test_cache_is_bounded_and_invalidated(self):
+        """The cache evicts the least recently used entry and resets when signatures change."""
+        parser = FormalLogicParser(self.type_system, cache_size=2)
+        parser.parse("Human(a)")
+        parser.parse("Human(b)")
+        parser.parse("Human(a)")
+        parser.parse("Human(c)")
+        self.assertEqual(list(parser._parse_cache), ["Human(a)", "Human(c)"])
+        
+        ast, _ = parser.parse("Loves(a, b)")
+        self.assertNotIsInstance(ast.operator.type, FunctionType)
+        self.type_system.define_function_signature("Loves", ["Entity", "Entity"], "Boolean")
+        ast, _ = parser.parse("Loves(a, b)")
+        self.assertIsInstance(ast.operator.type, FunctionType)
+        
+        # Redefining a signature keeps the number of signatures but still
+        # invalidates the cache
+        del self.type_system._signatures["Loves"]
+        self.type_system.define_function_signature("Loves", ["Entity", "Entity"], "Proposition")
+        ast, _ = parser.parse("Loves(a, b)")
+        self.assertEqual(ast.operator.type.return_type.name, "Proposition")
+    
+    def test_unknown_token_is_reported(self):
+        """Characters that start no token are reported as errors instead of raised."""
+        ast, errors = self.parser.parse("Human(@)")
+        self.assertIsNone(ast)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Unknown token", errors[0].message)
+        self.assertEqual(errors[0].position, 6)
+    
+    def test_parse_stream(self):
+        """Formulae are parsed one per logical line, with per-formula errors."""
+        source = io.StringIO(
+            "# axioms\n"
+            "Human(socrates)\n"
+            "\n"
+            "forall ?x. (Human(?x)\n"
+            "    implies Mortal(?x))\n"
+            "Human(@)\n"
+            "Human socrates)\n"
+            "Human(socrates)\n"
+            "Mortal(plato\n"
+        )
+        results = list(self.parser.parse_stream(source))
+        self.assertEqual([line for line, _, _ in results], [2, 4, 6, 7, 8, 9])
+        
+        (_, fact, fact_errors), (_, rule, rule_errors) = results[:2]
+        self.assertEqual(fact_errors, [])
+        self.assertEqual(rule_errors, [])
+        self.assertIsInstance(rule, QuantifierNode)
+        self.assertIs(results[4][1], fact)
+        self.assertIs(self.parser.parse("forall ?x. (Human(?x) implies Mortal(?x))")[0], rule)
+        
+        for _, ast, errors in (results[2], results[3], results[5]):
+            self.assertIsNone(ast)
+            self.assertEqual(len(errors), 1)
+        self.assertEqual(results[2][2][0].position, 6)
+    
+    def test_parse_stream_sources(self):
+        """Paths are read as formula files and strings are parsed as formula text."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "axioms.txt"
+            path.write_text("Human(socrates)\nMortal(socrates)\n", encoding="utf-8")
+            from_file = [ast for _, ast, _ in self.parser.parse_stream(path)]
+        from_text = [ast for _, ast, _ in self.parser.parse_stream("Human(socrates)\nMortal(socrates)\n")]
+        
+        self.assertEqual(len(from_file), 2)
+        self.assertEqual(from_file, from_text)
+    
+    def test_parse_stream_is_lazy(self):
+        """Formulae are parsed as the stream is consumed."""
+        def lines():
+            yield "Human(socrates)"
+            raise RuntimeError("read past the first formula")
+        
+        stream = self.parser.parse_stream(lines())
+        _, ast, errors = next(stream)
+        self.assertEqual(ast.arguments[0].name, "socrates")
+        self.assertEqual(errors, [])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,13 +2,20 @@
 Tests for the Probabilistic Logic Module.
 """
 
+import itertools
+import math
 import unittest
+from unittest.mock import patch
 from typing import Dict, List, Set, Tuple, Optional
 
 from godelOS.core_kr.ast.nodes import AST_Node, ConstantNode, VariableNode, ApplicationNode, ConnectiveNode
 from godelOS.core_kr.type_system.manager import TypeSystemManager
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
 from godelOS.core_kr.probabilistic_logic.module import ProbabilisticLogicModule, MCMCInference, GradientDescentWeightLearning
+from godelOS.core_kr.probabilistic_logic.grounding import GroundNetwork, TrainingStatistics
+
+import numpy as np
+import pytest
 
 
 class TestProbabilisticLogicModule(unittest.TestCase):
@@ -156,5 +163,248 @@ class TestProbabilisticLogicModule(unittest.TestCase):
         self.assertTrue(isinstance(weights[self.friends_smoke_together], float))
 
 
+
+class TestGroundNetwork(unittest.TestCase):
+    """Test cases for grounding weighted formulas into a network."""
+    
+    def setUp(self):
+        """Set up the test case."""
+        self.type_system = TypeSystemManager()
+        self.ksi = KnowledgeStoreInterface(self.type_system)
+        self.plm = ProbabilisticLogicModule(self.ksi)
+        self.boolean_type = self.type_system.get_type("Boolean")
+        self.p, self.q, self.r = (ConstantNode(name, self.boolean_type) for name in ("P", "Q", "R"))
+    
+    def connective(self, kind, *operands):
+        return ConnectiveNode(kind, list(operands), self.boolean_type)
+    
+    def exact_probability(self, network, query, evidence):
+        """Compute P(query | evidence) by enumerating every world."""
+        numerator = denominator = 0.0
+        compiled = network.compile_query(query)
+        for bits in itertools.product([False, True], repeat=network.num_atoms):
+            worlds = np.array([bits])
+            if any(bits[network.atom_index[atom]] != value for atom, value in evidence):
+                continue
+            state = network.initial_state(1, {i: b for i, b in enumerate(bits)}, np.random.default_rng(0))
+            weight = math.exp(-network.energy(state)[0])
+            denominator += weight
+            if network.evaluate(compiled, worlds)[0]:
+                numerator += weight
+        return numerator / denominator
+    
+    def test_clausify(self):
+        """Formulas are converted to clauses without tautologies."""
+        network = GroundNetwork({})
+        p, q = network.atom_id(self.p), network.atom_id(self.q)
+        
+        clauses = network.clausify(self.connective("IMPLIES", self.p, self.q))
+        self.assertEqual(clauses, [frozenset({(p, False), (q, True)})])
+        
+        clauses = network.clausify(self.connective("EQUIV", self.p, self.q))
+        self.assertEqual(set(clauses), {frozenset({(p, False), (q, True)}), frozenset({(p, True), (q, False)})})
+        
+        self.assertEqual(network.clausify(self.connective("OR", self.p, self.connective("NOT", self.p))), [])
+    
+    def test_energy_follows_formula_truth(self):
+        """A world's energy is -w for each satisfied formula and +w otherwise."""
+        network = GroundNetwork({self.connective("IMPLIES", self.p, self.q): 2.0, self.p: 0.5})
+        rng = np.random.default_rng(0)
+        p, q = network.atom_index[self.p], network.atom_index[self.q]
+        
+        state = network.initial_state(1, {p: True, q: False}, rng)
+        self.assertAlmostEqual(network.energy(state)[0], 2.0 - 0.5)
+        state = network.initial_state(1, {p: True, q: True}, rng)
+        self.assertAlmostEqual(network.energy(state)[0], -2.0 - 0.5)
+    
+    def test_sweeps_keep_counts_consistent(self):
+        """Incremental clause counts match a full recount after sampling."""
+        self.plm.add_weighted_formula(self.connective("IMPLIES", self.p, self.q), 1.5)
+        self.plm.add_weighted_formula(self.connective("EQUIV", self.q, self.connective("NOT", self.r)), 0.7)
+        self.plm.add_weighted_formula(self.connective("OR", self.p, self.r), -0.3)
+        network = self.plm.ground_network()
+        rng = np.random.default_rng(1)
+        state = network.initial_state(8, {}, rng)
+        mask = network.evidence_mask({})
+        
+        for _ in range(20):
+            network.sweep(state, mask, rng)
+            expected = network.clause_truth(state.worlds, network.literal_atoms,
+                                            network.literal_signs, network.clause_starts)
+            np.testing.assert_array_equal(state.true_literals, expected)
+            for formula, clauses in enumerate(network.formula_clauses):
+                np.testing.assert_array_equal(state.unsatisfied[:, formula], (expected[:, clauses] == 0).sum(axis=1))
+    
+    def test_marginal_matches_enumeration(self):
+        """Batched Gibbs sampling converges to the exact marginal."""
+        rule = self.connective("IMPLIES", self.p, self.connective("AND", self.q, self.r))
+        self.plm.add_weighted_formula(rule, 1.2)
+        self.plm.add_weighted_formula(self.connective("OR", self.q, self.r), 0.6)
+        evidence = {(self.p, True)}
+        
+        network = self.plm.ground_network(extra_atoms={self.p, self.q, self.r})
+        expected = self.exact_probability(network, self.q, evidence)
+        
+        params = {"num_samples": 400, "burn_in": 20, "sample_interval": 1, "num_chains": 64, "seed": 0}
+        probability = self.plm.get_marginal_probability(self.q, evidence, params)
+        self.assertAlmostEqual(probability, expected, delta=0.02)
+    
+    def test_evidence_is_clamped(self):
+        """Atoms given as evidence keep their values in every sample."""
+        self.plm.add_weighted_formula(self.p, 5.0)
+        params = {"num_samples": 50, "burn_in": 5, "sample_interval": 1, "num_chains": 4, "seed": 0}
+        
+        self.assertEqual(self.plm.get_marginal_probability(self.p, {(self.p, False)}, params), 0.0)
+        
+        # An atom no formula mentions is unconstrained
+        probability = self.plm.get_marginal_probability(self.r, set(), dict(params, num_samples=500))
+        self.assertAlmostEqual(probability, 0.5, delta=0.05)
+    
+    def test_map_assignment_satisfies_strong_rules(self):
+        """Simulated annealing finds the assignment satisfying heavy rules."""
+        self.plm.add_weighted_formula(self.connective("IMPLIES", self.p, self.q), 5.0)
+        self.plm.add_weighted_formula(self.connective("IMPLIES", self.q, self.connective("NOT", self.r)), 5.0)
+        
+        assignment = self.plm.get_map_assignment([self.q, self.r], {(self.p, True)},
+                                                 {"max_iterations": 50, "num_chains": 4, "seed": 0})
+        self.assertEqual(assignment, {self.q: True, self.r: False})
+    
+    def test_network_is_reused_until_formulas_change(self):
+        """The ground network is cached between queries on the same formulas."""
+        self.plm.add_weighted_formula(self.p, 1.0)
+        network = self.plm.ground_network()
+        self.assertIs(self.plm.ground_network(), network)
+        
+        self.plm.add_weighted_formula(self.q, 1.0)
+        self.assertIsNot(self.plm.ground_network(), network)
+
+    def test_query_atoms_added_on_top_of_cached_network(self):
+        """Queries over different atoms share the grounding of the formulas."""
+        self.plm.add_weighted_formula(self.connective("IMPLIES", self.p, self.q), 1.0)
+        network = self.plm.ground_network()
+
+        # Atoms the formulas already mention need no new network
+        self.assertIs(self.plm.ground_network(extra_atoms={self.p}), network)
+
+        extended = self.plm.ground_network(extra_atoms={self.r})
+        self.assertIs(extended.clauses, network.clauses)
+        self.assertEqual(extended.num_atoms, 3)
+        self.assertEqual(network.num_atoms, 2)
+        self.assertEqual(extended.formulas_of_atom[extended.atom_index[self.r]], set())
+        self.assertIs(self.plm.ground_network(), network)
+
+        # The added atom is sampled like any other
+        rng = np.random.default_rng(0)
+        state = extended.initial_state(4, {}, rng)
+        extended.sweep(state, extended.evidence_mask({}), rng)
+        self.assertEqual(state.worlds.shape, (4, 3))
+
+
+class TestWeightLearning(unittest.TestCase):
+    """Test cases for learning weights from tabulated training statistics."""
+    
+    def setUp(self):
+        """Set up the test case."""
+        self.type_system = TypeSystemManager()
+        self.ksi = KnowledgeStoreInterface(self.type_system)
+        self.plm = ProbabilisticLogicModule(self.ksi)
+        self.boolean_type = self.type_system.get_type("Boolean")
+        self.p, self.q, self.r = (ConstantNode(name, self.boolean_type) for name in ("P", "Q", "R"))
+        self.rule = ConnectiveNode("IMPLIES", [self.p, self.q], self.boolean_type)
+        self.either = ConnectiveNode("OR", [self.q, self.r], self.boolean_type)
+    
+    def add_training_worlds(self, worlds):
+        """Add worlds, given as lists of true atoms, to a training context."""
+        self.ksi.create_context("TRAINING_DB", context_type="database")
+        for world_id, world in enumerate(worlds):
+            for atom in world:
+                self.ksi.add_statement(atom, "TRAINING_DB", {"world_id": world_id})
+    
+    def atom(self, predicate, name):
+        """Create a ground atom over a named entity."""
+        entity = ConstantNode(name, self.type_system.get_type("Entity"))
+        return ApplicationNode(ConstantNode(predicate, self.boolean_type), [entity], self.boolean_type)
+    
+    def test_statistics_table(self):
+        """Formula counts are tabulated once per distinct world."""
+        network = GroundNetwork({self.rule: 0.0, self.either: 0.0, self.p: 0.0})
+        statistics = TrainingStatistics(network)
+        
+        rows = statistics.add_worlds([[self.p], [self.q], [self.p, self.q, self.r], [self.q]])
+        self.assertEqual(list(rows), [0, 1, 2, 1])
+        np.testing.assert_array_equal(statistics.formula_counts, [[0, 0, 1], [1, 1, 0], [1, 1, 1]])
+        
+        # Known worlds are looked up; only new ones are added
+        rows = statistics.add_worlds([[self.p], [self.r]])
+        self.assertEqual(list(rows), [0, 3])
+        self.assertEqual(len(statistics), 4)
+        np.testing.assert_array_equal(statistics.formula_counts[3], [1, 1, 0])
+    
+    def test_pseudo_likelihood_gradient(self):
+        """The pseudo-log-likelihood gradient matches finite differences."""
+        network = GroundNetwork({self.rule: 0.0, self.either: 0.0, self.p: 0.0})
+        statistics = TrainingStatistics(network)
+        rows = statistics.add_worlds([[self.p], [self.q], [self.p, self.r], []])
+        weights = np.array([0.7, -0.4, 1.1])
+        
+        value, gradient = statistics.pseudo_log_likelihood(weights, rows)
+        for i in range(len(weights)):
+            step = np.eye(len(weights))[i] * 1e-6
+            numeric = (statistics.pseudo_log_likelihood(weights + step, rows)[0] - value) / 1e-6
+            self.assertAlmostEqual(gradient[i], numeric, places=4)
+    
+    def test_learned_weights_follow_the_data(self):
+        """A formula that always holds gets a positive weight, a rare one a negative weight."""
+        pytest.importorskip("scipy")
+        people = ["alice", "bob", "carol", "dave"]
+        rules = [ConnectiveNode("IMPLIES", [self.atom("Smokes", name), self.atom("Cancer", name)],
+                                self.boolean_type) for name in people]
+        facts = [self.atom("Smokes", name) for name in people]
+        # One world: only alice smokes and only alice has cancer
+        self.add_training_worlds([[facts[0], self.atom("Cancer", "alice")]])
+        self.ksi.create_context("FORMULA_SKELETONS", context_type="rules")
+        for formula in rules + facts[1:]:
+            self.plm.add_weighted_formula(formula, 0.0, "FORMULA_SKELETONS")
+        
+        for params in ({"optimizer": "minibatch", "max_iterations": 100, "seed": 0},
+                       {"optimizer": "lbfgs", "max_iterations": 50}):
+            weights = self.plm.learn_weights("TRAINING_DB", "FORMULA_SKELETONS", params)
+            for formula in rules:
+                self.assertGreater(weights[formula], 0.2, params["optimizer"])
+            for formula in facts[1:]:
+                self.assertLess(weights[formula], -0.2, params["optimizer"])
+        
+        learner = self.plm._weight_learning_algorithms[self.plm.probabilistic_model_type]
+        self.assertTrue(learner.epoch_timings)
+        
+        with self.assertRaises(ValueError):
+            self.plm.learn_weights("TRAINING_DB", "FORMULA_SKELETONS", {"optimizer": "newton"})
+    
+    def test_lbfgs_requires_scipy(self):
+        """The lbfgs optimizer reports a missing SciPy before doing any work."""
+        self.add_training_worlds([[self.p], [self.q]])
+        self.ksi.create_context("FORMULA_SKELETONS", context_type="rules")
+        self.plm.add_weighted_formula(self.rule, 0.0, "FORMULA_SKELETONS")
+        
+        with patch("godelOS.core_kr.probabilistic_logic.module.minimize", None):
+            with self.assertRaises(ImportError):
+                self.plm.learn_weights("TRAINING_DB", "FORMULA_SKELETONS", {"optimizer": "lbfgs"})
+    
+    def test_statistics_are_reused(self):
+        """Learning again on the same skeletons reuses the statistics table."""
+        self.add_training_worlds([[self.p], [self.q]])
+        self.ksi.create_context("FORMULA_SKELETONS", context_type="rules")
+        self.plm.add_weighted_formula(self.rule, 0.0, "FORMULA_SKELETONS")
+        learner = GradientDescentWeightLearning(self.plm)
+        
+        learner.learn_weights("TRAINING_DB", "FORMULA_SKELETONS", {"max_iterations": 3, "seed": 0})
+        statistics = learner._statistics_for([self.rule])
+        self.assertEqual(len(statistics), 2)
+        self.assertEqual(len(learner.epoch_timings), 3)
+        
+        learner.learn_weights("TRAINING_DB", "FORMULA_SKELETONS", {"max_iterations": 3, "seed": 0})
+        self.assertIs(learner._statistics_for([self.rule]), statistics)
+        self.assertEqual(len(statistics), 2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
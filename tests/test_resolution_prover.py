@@ -13,11 +13,13 @@ from godelOS.core_kr.ast.nodes import (
     AST_Node, ConstantNode, VariableNode, ApplicationNode, ConnectiveNode, QuantifierNode
 )
 from godelOS.core_kr.knowledge_store.interface import KnowledgeStoreInterface
-from godelOS.core_kr.type_system.types import AtomicType
+from godelOS.core_kr.type_system.manager import TypeSystemManager
+from godelOS.core_kr.type_system.types import AtomicType, FunctionType
 from godelOS.core_kr.unification_engine.engine import UnificationEngine
 from godelOS.inference_engine.base_prover import ResourceLimits
 from godelOS.inference_engine.resolution_prover import (
-    ResolutionProver, CNFConverter, Clause, Literal, ResolutionStrategy
+    ResolutionProver, CNFConverter, Clause, Literal, ResolutionStrategy,
+    LiteralIndex, SubsumptionIndex
 )
 
 
@@ -342,5 +344,145 @@ class TestResolutionProver(unittest.TestCase):
         self.assertEqual(result.inference_engine_used, "ResolutionProver")
 
 
+class TestGivenClauseLoop(unittest.TestCase):
+    """Tests for the indexed given-clause loop of the ResolutionProver."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.type_system = TypeSystemManager()
+        self.entity_type = self.type_system.get_type("Entity")
+        self.bool_type = self.type_system.get_type("Boolean")
+        self.unary_type = FunctionType([self.entity_type], self.bool_type)
+        self.binary_type = FunctionType([self.entity_type, self.entity_type], self.bool_type)
+        
+        self.prover = ResolutionProver(MagicMock(spec=KnowledgeStoreInterface),
+                                       UnificationEngine(self.type_system))
+        
+        self.a = ConstantNode("a", self.entity_type)
+        self.b = ConstantNode("b", self.entity_type)
+        self.x = VariableNode("?x", 1, self.entity_type)
+        self.y = VariableNode("?y", 2, self.entity_type)
+    
+    def atom(self, name, *args):
+        """Build an atom over a predicate of the right arity."""
+        pred_type = self.unary_type if len(args) == 1 else self.binary_type
+        return ApplicationNode(ConstantNode(name, pred_type), list(args), self.bool_type)
+    
+    def clause(self, clause_id, *literals):
+        """Build a clause from (atom, is_negated) pairs."""
+        return Clause(frozenset(Literal(atom, negated) for atom, negated in literals),
+                      clause_id=clause_id)
+    
+    def rule(self, premise, conclusion):
+        """Build the formula forall x. premise(x) -> conclusion(x)."""
+        body = ConnectiveNode("IMPLIES", [self.atom(premise, self.x), self.atom(conclusion, self.x)],
+                              self.bool_type)
+        return QuantifierNode("FORALL", [self.x], body, self.bool_type)
+    
+    def chain_context(self, length):
+        """Build p_0(a) and the rules p_i(x) -> p_{i+1}(x)."""
+        context = [self.atom("p_0", self.a)]
+        context.extend(self.rule(f"p_{i}", f"p_{i + 1}") for i in range(length))
+        return context
+    
+    def test_chain_proof_with_every_strategy(self):
+        """Test that a chain of first-order rules is proved under each strategy."""
+        context = self.chain_context(20)
+        context.extend(self.rule(f"q_{i}", f"q_{i + 1}") for i in range(20))
+        goal = self.atom("p_20", self.a)
+        
+        for strategy in ResolutionStrategy:
+            with self.subTest(strategy=strategy):
+                result = self.prover.prove(goal, context, ResourceLimits(nodes_limit=200, strategy=strategy))
+                self.assertTrue(result.goal_achieved)
+                # Only the chain is ever touched, never the distractor rules
+                self.assertLessEqual(result.resources_consumed["iterations"], 42)
+    
+    def test_unprovable_goal_saturates(self):
+        """Test that an unprovable goal fails once the clause set is saturated."""
+        result = self.prover.prove(self.atom("p_5", self.b), self.chain_context(5))
+        
+        self.assertFalse(result.goal_achieved)
+        self.assertIn("Could not derive empty clause", result.status_message)
+        self.assertLess(result.resources_consumed["iterations"], 1000)
+    
+    def test_forward_subsumption_of_input_clauses(self):
+        """Test that instances of kept clauses are discarded."""
+        context = [QuantifierNode("FORALL", [self.x], self.atom("P", self.x), self.bool_type),
+                   self.atom("P", self.a)]
+        result = self.prover.prove(self.atom("Q", self.a), context)
+        
+        self.assertFalse(result.goal_achieved)
+        self.assertEqual(result.resources_consumed["forward_subsumed"], 1)
+    
+    def test_is_tautology(self):
+        """Test tautology detection."""
+        p_a = self.atom("P", self.a)
+        self.assertTrue(self.prover._is_tautology(self.clause(0, (p_a, False), (p_a, True))))
+        self.assertFalse(self.prover._is_tautology(
+            self.clause(1, (p_a, False), (self.atom("P", self.b), True))))
+    
+    def test_subsumes(self):
+        """Test clause subsumption by one-way matching."""
+        p_x = self.clause(0, (self.atom("P", self.x), False))
+        p_a_or_q_b = self.clause(1, (self.atom("P", self.a), False), (self.atom("Q", self.b), False))
+        r_x_x = self.clause(2, (self.atom("R", self.x, self.x), False))
+        
+        self.assertTrue(self.prover._subsumes(p_x, p_a_or_q_b))
+        self.assertFalse(self.prover._subsumes(p_a_or_q_b, p_x))
+        self.assertFalse(self.prover._subsumes(p_x, self.clause(3, (self.atom("P", self.a), True))))
+        self.assertTrue(self.prover._subsumes(r_x_x, self.clause(4, (self.atom("R", self.a, self.a), False))))
+        self.assertFalse(self.prover._subsumes(r_x_x, self.clause(5, (self.atom("R", self.a, self.b), False))))
+    
+    def test_literal_index_partners(self):
+        """Test that the literal index returns only compatible complementary literals."""
+        index = LiteralIndex()
+        p_a = self.clause(0, (self.atom("P", self.a), False))
+        p_b = self.clause(1, (self.atom("P", self.b), False))
+        not_p_a = self.clause(2, (self.atom("P", self.a), True), (self.atom("Q", self.a), False))
+        for clause in (p_a, p_b, not_p_a):
+            index.add(clause)
+        
+        partners = index.partners(Literal(self.atom("P", self.a), True))
+        self.assertEqual({clause.clause_id for clause, _ in partners}, {0})
+        
+        partners = index.partners(Literal(self.atom("P", self.x), True))
+        self.assertEqual({clause.clause_id for clause, _ in partners}, {0, 1})
+        
+        index.remove(p_a)
+        partners = index.partners(Literal(self.atom("P", self.x), True))
+        self.assertEqual({clause.clause_id for clause, _ in partners}, {1})
+    
+    def test_subsumption_index_candidates(self):
+        """Test candidate retrieval in both subsumption directions."""
+        index = SubsumptionIndex()
+        p_a_or_q_b = self.clause(0, (self.atom("P", self.a), False), (self.atom("Q", self.b), False))
+        not_p_a = self.clause(1, (self.atom("P", self.a), True))
+        index.add(p_a_or_q_b)
+        index.add(not_p_a)
+        
+        p_x = self.clause(2, (self.atom("P", self.x), False))
+        self.assertEqual([c.clause_id for c in index.subsumed_candidates(p_x)], [0])
+        self.assertEqual(index.subsumer_candidates(p_x), [])
+        self.assertEqual([c.clause_id for c in index.subsumer_candidates(
+            self.clause(3, (self.atom("P", self.a), True), (self.atom("Q", self.a), False)))], [1])
+        
+        index.remove(0)
+        self.assertEqual(index.subsumed_candidates(p_x), [])
+    
+    def test_unit_preference_priority(self):
+        """Test that unit preference ranks unit clauses before lighter non-units."""
+        unit = self.clause(5, (self.atom("R", self.a, self.b), False))
+        binary = self.clause(6, (ConstantNode("P", self.bool_type), False),
+                             (ConstantNode("Q", self.bool_type), True))
+        
+        unit_first = ResolutionStrategy.UNIT_PREFERENCE
+        self.assertLess(self.prover._clause_priority(unit, unit_first),
+                        self.prover._clause_priority(binary, unit_first))
+        by_weight = ResolutionStrategy.SET_OF_SUPPORT
+        self.assertLess(self.prover._clause_priority(binary, by_weight),
+                        self.prover._clause_priority(unit, by_weight))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
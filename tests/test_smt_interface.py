@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 import tempfile
 import os
 import subprocess
+import sys
 from typing import Dict, List, Optional, Set
 
 from godelOS.core_kr.ast.nodes import (
@@ -23,6 +24,8 @@ from godelOS.inference_engine.smt_interface import (
     SMTInterface, SMTSolverConfiguration, SMTResult
 )
 
+FAKE_SOLVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_smt_solver.py")
+
 
 class TestSMTInterface(unittest.TestCase):
     """Tests for the SMTInterface class."""
@@ -277,5 +280,103 @@ class TestSMTInterface(unittest.TestCase):
         mock_popen.assert_called_once()
 
 
+class TestSMTSolverSessions(unittest.TestCase):
+    """Tests for running queries in persistent solver sessions."""
+    
+    def setUp(self):
+        """Set up an interface backed by the fake interactive solver."""
+        log_file = tempfile.NamedTemporaryFile(suffix=".log", delete=False)
+        log_file.close()
+        self.log_path = log_file.name
+        self.addCleanup(os.unlink, self.log_path)
+        
+        self.solver_config = SMTSolverConfiguration(
+            solver_name="FakeSolver",
+            solver_path=sys.executable,
+            solver_options=[FAKE_SOLVER, "--log", self.log_path],
+            interactive_options=["-in"]
+        )
+        self.smt_interface = SMTInterface([self.solver_config], MagicMock(spec=TypeSystemManager))
+        self.addCleanup(self.smt_interface.close)
+        
+        bool_type = AtomicType("Boolean")
+        self.p = ConstantNode("p", bool_type)
+        self.q = ConstantNode("q", bool_type)
+        self.not_p = ConnectiveNode("NOT", [self.p], bool_type)
+    
+    def sent_commands(self) -> List[str]:
+        """Get the commands the fake solver has received."""
+        with open(self.log_path) as log:
+            return log.read().splitlines()
+    
+    def test_session_is_reused_across_queries(self):
+        """Queries share one solver process and the context's declarations."""
+        for _ in range(5):
+            result = self.smt_interface.check_satisfiability(
+                self.not_p, {self.p}, logic_theory="QF_UF", request_unsat_core=True
+            )
+            self.assertEqual(result.status, "unsat")
+            self.assertIn("formula", result.unsat_core_identifiers)
+            result = self.smt_interface.check_satisfiability(self.q, {self.p}, logic_theory="QF_UF")
+            self.assertEqual(result.status, "sat")
+        
+        self.assertEqual(self.smt_interface.session_pool.stats["started"], 1)
+        commands = self.sent_commands()
+        self.assertEqual(commands.count("(declare-const p Bool)"), 1)
+        self.assertEqual(sum(command.startswith("(assert (! p :named axiom_") for command in commands), 1)
+        self.assertEqual(commands.count("(check-sat)"), 10)
+    
+    def test_context_change(self):
+        """Changing the context set replaces the session's context level."""
+        self.assertEqual(self.smt_interface.check_satisfiability(self.not_p, {self.p}).status, "unsat")
+        self.assertEqual(self.smt_interface.check_satisfiability(self.not_p, {self.q}).status, "sat")
+        self.assertEqual(self.smt_interface.check_satisfiability(self.not_p, {self.p, self.q}).status, "unsat")
+        self.assertEqual(self.smt_interface.session_pool.stats["started"], 1)
+    
+    def test_prove_in_session(self):
+        """Proofs run through the session layer."""
+        self.assertTrue(self.smt_interface.prove(self.p, {self.p}).goal_achieved)
+        self.assertFalse(self.smt_interface.prove(self.q, {self.p}).goal_achieved)
+    
+    def test_model_and_core_requested_only_when_available(self):
+        """Models and cores are only requested for the status that has them."""
+        for _ in range(3):
+            result = self.smt_interface.check_satisfiability(
+                self.q, {self.p}, request_model=True, request_unsat_core=True
+            )
+            self.assertEqual(result.status, "sat")
+            result = self.smt_interface.check_satisfiability(
+                self.not_p, {self.p}, request_model=True, request_unsat_core=True
+            )
+            self.assertEqual(result.status, "unsat")
+            self.assertIn("formula", result.unsat_core_identifiers)
+            self.assertFalse(self.smt_interface.prove(self.q, {self.p}).goal_achieved)
+
+        self.assertEqual(self.smt_interface.session_pool.stats["started"], 1)
+        self.assertEqual(self.smt_interface.session_pool.stats["discarded"], 0)
+        commands = self.sent_commands()
+        self.assertEqual(commands.count("(get-model)"), 3)
+        self.assertEqual(commands.count("(get-unsat-core)"), 3)
+
+    def test_context_error_is_not_reused(self):
+        """A session whose context failed to load is not reused for that context."""
+        n = ConstantNode("n", AtomicType("Integer"))
+        
+        self.assertEqual(self.smt_interface.check_satisfiability(self.q, {n}).status, "error")
+        self.assertEqual(self.smt_interface.check_satisfiability(self.q, {n}).status, "error")
+        self.assertEqual(self.smt_interface.session_pool.stats["discarded"], 2)
+    
+    def test_dead_solver_is_discarded(self):
+        """A solver that exits is reported as an error and not reused."""
+        config = SMTSolverConfiguration("Broken", sys.executable, ["-c", "pass"], interactive_options=[])
+        smt_interface = SMTInterface([config], MagicMock(spec=TypeSystemManager))
+        self.addCleanup(smt_interface.close)
+        
+        self.assertEqual(smt_interface.check_satisfiability(self.p).status, "error")
+        self.assertEqual(smt_interface.check_satisfiability(self.p).status, "error")
+        self.assertEqual(smt_interface.session_pool.stats["started"], 2)
+        self.assertEqual(smt_interface.session_pool.stats["discarded"], 2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -585,6 +585,137 @@ class TestTemplateEvolutionModule(unittest.TestCase):
                             for template in evolved_population:
                                 self.assertIsInstance(template, AST_Node)
 
+    def test_fitness_memoized_across_generations(self):
+        """Test that templates already evaluated are not looked up again."""
+        population = [
+            self._create_template(["isHuman"], "isMortal", [["?x"]], ["?x"]),
+            self._create_template(["isBird"], "canFly", [["?x"]], ["?x"]),
+            self._create_template(["isFish"], "canSwim", [["?x"]], ["?x"])
+        ]
+        self.kr_system_interface.query_statements_match_pattern.return_value = []
+        
+        first_scores = self.tem._evaluate_population_fitness(population)
+        
+        # All metrics are fetched with a single query
+        self.assertEqual(self.kr_system_interface.query_statements_match_pattern.call_count, 1)
+        self.assertEqual(self.tem.fitness_cache_stats, {"hits": 0, "misses": 3})
+        
+        second_scores = self.tem._evaluate_population_fitness(population[:2])
+        
+        self.assertEqual(second_scores, first_scores[:2])
+        self.assertEqual(self.kr_system_interface.query_statements_match_pattern.call_count, 1)
+        self.assertEqual(self.tem.fitness_cache_stats, {"hits": 2, "misses": 3})
+    
+    def test_population_metrics_read_from_query_results(self):
+        """Test that the batched metrics query is parsed into each template's metrics."""
+        population = [
+            self._create_template(["isHuman"], "isMortal", [["?x"]], ["?x"]).with_metadata(template_id="template_1"),
+            self._create_template(["isBird"], "canFly", [["?x"]], ["?x"]).with_metadata(template_id="template_2")
+        ]
+        
+        def metrics_bindings(template_id, success_rate, utility_score, cost, times_used):
+            pattern = self.tem._create_metrics_query_pattern()
+            values = [template_id, success_rate, utility_score, cost, times_used]
+            entity_type = self._mock_get_type("Entity")
+            return {
+                var: ConstantNode(str(value), entity_type, value)
+                for var, value in zip(pattern.arguments, values)
+            }
+        
+        self.kr_system_interface.query_statements_match_pattern.return_value = [
+            metrics_bindings("template_2", 0.6, 0.5, 1.0, 10),
+            metrics_bindings("template_1", 0.8, 0.7, 0.5, 15)
+        ]
+        
+        fitness_scores = self.tem._evaluate_population_fitness(population)
+        
+        expected = [
+            TemplatePerformanceMetrics("template_1", 0.8, 0.7, 0.5, 15).calculate_fitness(),
+            TemplatePerformanceMetrics("template_2", 0.6, 0.5, 1.0, 10).calculate_fitness()
+        ]
+        self.assertEqual(fitness_scores, expected)
+        
+        # The batched query matches the metrics of any template
+        kwargs = self.kr_system_interface.query_statements_match_pattern.call_args.kwargs
+        pattern = kwargs["query_pattern_ast"]
+        self.assertIsInstance(pattern, ApplicationNode)
+        self.assertEqual(pattern.operator.name, TemplateEvolutionModule.METRICS_PREDICATE)
+        self.assertTrue(all(isinstance(arg, VariableNode) for arg in pattern.arguments))
+        self.assertEqual(kwargs["context_ids"], ["TEST_META_KNOWLEDGE"])
+    
+    def test_metrics_query_pattern_binds_template_id(self):
+        """Test that the metrics pattern for one template binds its ID."""
+        pattern = self.tem._create_metrics_query_pattern("template_1")
+        
+        self.assertIsInstance(pattern.arguments[0], ConstantNode)
+        self.assertEqual(pattern.arguments[0].value, "template_1")
+        self.assertTrue(all(isinstance(arg, VariableNode) for arg in pattern.arguments[1:]))
+    
+    def test_evolve_population_records_generation_stats(self):
+        """Test that each generation's wall time and cache hit rate are recorded."""
+        initial_population = [
+            self._create_template(["isHuman"], "isMortal", [["?x"]], ["?x"]),
+            self._create_template(["isBird"], "canFly", [["?x"]], ["?x"])
+        ]
+        self.kr_system_interface.query_statements_match_pattern.return_value = []
+        
+        with patch.object(self.tem, '_mutate', side_effect=lambda template, *args, **kwargs: template), \
+                patch.object(self.tem, '_crossover', side_effect=lambda parent1, parent2: parent1):
+            self.tem.evolve_population(initial_population, generations=3, population_size=2)
+        
+        stats = self.tem.get_generation_stats()
+        self.assertEqual([s["generation"] for s in stats], [1, 2, 3])
+        for generation_stats in stats:
+            self.assertGreaterEqual(generation_stats["wall_time"], 0.0)
+        
+        # Without variation, later generations only contain templates already evaluated
+        self.assertEqual(stats[0]["fitness_cache_misses"], 2)
+        self.assertEqual(stats[2]["fitness_cache_misses"], 0)
+        self.assertEqual(stats[2]["fitness_cache_hit_rate"], 1.0)
+
+
+
+class TestTemplateEvolutionMetricsStore(unittest.TestCase):
+    """Test cases for reading template metrics from a real knowledge store."""
+
+    def setUp(self):
+        """Set up a knowledge store holding template metrics."""
+        self.type_system = TypeSystemManager()
+        self.ksi = KnowledgeStoreInterface(self.type_system)
+        self.ksi.create_context("TEST_META_KNOWLEDGE", context_type="meta")
+        self.tem = TemplateEvolutionModule(
+            kr_system_interface=self.ksi,
+            type_system=self.type_system,
+            mkb_context_id="TEST_META_KNOWLEDGE"
+        )
+
+        self.stored_metrics = [
+            TemplatePerformanceMetrics("template_1", 0.8, 0.7, 0.5, 15),
+            TemplatePerformanceMetrics("template_2", 0.6, 0.5, 1.0, 10)
+        ]
+        for metrics in self.stored_metrics:
+            self.ksi.add_statement(self._metrics_fact(metrics), context_id="TEST_META_KNOWLEDGE")
+
+    def _metrics_fact(self, metrics):
+        """Create a TemplatePerformance fact from metrics."""
+        pattern = self.tem._create_metrics_query_pattern()
+        entity_type = self.type_system.get_type("Entity")
+        values = [metrics.template_id, metrics.success_rate, metrics.utility_score,
+                  metrics.computational_cost, metrics.times_used]
+        arguments = [ConstantNode(str(value), entity_type, value) for value in values]
+        return ApplicationNode(pattern.operator, arguments, pattern.type)
+
+    def test_population_metrics_read_from_store(self):
+        """Test that the batched query returns the stored metrics of every template."""
+        population_metrics = self.tem._query_population_metrics()
+
+        self.assertEqual(population_metrics, {m.template_id: m for m in self.stored_metrics})
+
+    def test_template_metrics_read_from_store(self):
+        """Test that the metrics of a single template are read from the store."""
+        metrics = self.tem._get_template_performance_metrics("template_2")
+
+        self.assertEqual(metrics, self.stored_metrics[1])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
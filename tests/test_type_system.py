@@ -266,6 +266,67 @@ class TestTypeSystemManager(unittest.TestCase):
         integer_type = self.type_system.get_type("Integer")
         errors = self.type_system.check_expression_type(human_socrates, integer_type, environment)
         self.assertGreater(len(errors), 0)
+    
+    def test_subtype_lattice(self):
+        """Test subtype checks against the compiled lattice."""
+        self.type_system.define_atomic_type("Person", ["Agent"])
+        self.type_system.define_atomic_type("Robot", ["Agent", "Event"])
+        self.type_system.define_atomic_type("Android", ["Robot", "Person"])
+        
+        for supertype in ("Android", "Robot", "Person", "Agent", "Entity", "Event"):
+            self.assertTrue(self.type_system.is_subtype("Android", supertype))
+        self.assertTrue(self.type_system.is_subtype(self.type_system.get_type("Robot"), "Event"))
+        self.assertFalse(self.type_system.is_subtype("Person", "Event"))
+        self.assertFalse(self.type_system.is_subtype("Robot", "Person"))
+        self.assertFalse(self.type_system.is_subtype("Entity", "Android"))
+        
+        # A failed definition leaves the lattice unchanged
+        with self.assertRaises(ValueError):
+            self.type_system.define_atomic_type("Cyborg", ["Person", "Undefined"])
+        self.assertIsNone(self.type_system.get_type("Cyborg"))
+    
+    def test_is_subtype_does_not_register_types(self):
+        """Test that subtype checks on unknown type names leave the registry unchanged."""
+        self.assertTrue(self.type_system.is_subtype("Unknown", "Unknown"))
+        self.assertFalse(self.type_system.is_subtype("Unknown", "Entity"))
+        self.assertFalse(self.type_system.is_subtype("Entity", "Unknown"))
+        self.assertIsNone(self.type_system.get_type("Unknown"))
+        
+        # Defining the type later makes its place in the hierarchy visible
+        self.type_system.define_atomic_type("Unknown", ["Entity"])
+        self.assertTrue(self.type_system.is_subtype("Unknown", "Entity"))
+    
+    def test_memoized_unification_and_inference(self):
+        """Test that unification and inference results are memoized."""
+        t_var = TypeVariable("T")
+        entity_type = self.type_system.get_type("Entity")
+        boolean_type = self.type_system.get_type("Boolean")
+        func1 = FunctionType([t_var], boolean_type)
+        func2 = FunctionType([entity_type], boolean_type)
+        
+        substitution = self.type_system.unify_types(func1, func2)
+        substitution[TypeVariable("U")] = boolean_type
+        self.assertEqual(self.type_system.unify_types(func1, func2), {t_var: entity_type})
+        self.assertIsNone(self.type_system.unify_types(func2, FunctionType([boolean_type], entity_type)))
+        self.assertEqual(self.type_system.memo_stats["unify"]["hits"], 1)
+        
+        # Inference is memoized per environment bindings
+        variable = VariableNode("?x", 1, entity_type)
+        environment = TypeEnvironment()
+        self.assertEqual(self.type_system.infer_expression_type(variable, environment)[0], entity_type)
+        self.assertEqual(self.type_system.infer_expression_type(variable, environment)[0], entity_type)
+        inner = environment.extend()
+        inner.set_type(variable, boolean_type)
+        self.assertEqual(self.type_system.infer_expression_type(variable, inner)[0], boolean_type)
+        
+        statistics = self.type_system.get_memo_statistics()["infer"]
+        self.assertEqual((statistics["hits"], statistics["misses"]), (1, 2))
+        self.assertAlmostEqual(statistics["hit_rate"], 1 / 3)
+        
+        # Defining types invalidates memoized inferences
+        self.type_system.define_atomic_type("Vehicle", ["Entity"])
+        self.assertEqual(self.type_system.get_memo_statistics()["infer"]["size"], 0)
+
 
 
 if __name__ == '__main__':